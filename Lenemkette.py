@@ -1,133 +1,52 @@
 import datetime
 import time
-import math
 import os
 import sys
 
-# --- I. TAHKMAHNELLE LINGUISTIC & CHRONOLOGICAL DATABASE ---
+# --- I. TAHKMAHNELLE LINGUISTIC & CHRONOLOGICAL DATABASE (tahkmahnelle_calendar) ---
 
-# Dictionary for naming conventions
-TAHKMAHNELLE_DICTIONARY = {
-    'a': 'ariatnah', 'b': 'batobwatchaeh', 'c': "c'illiatnah", 'd': 'diadowatchaeh', 'e': 'eecheechuwah',
-    'f': "f'illianarre", 'g': 'gagoikenne', 'h': "h'uilliatachaeh", 'i': 'illianarre', 'j': 'ampejinne',
-    'k': 'kajoinkenne', 'l': 'lenemketobontette', 'm': 'momaw', 'n': 'nona',
-    'o': 'oichenne', 'p': 'perfuvium', 'q': 'quaristenne',
-}
-ROOT_NAMES = [v for k, v in sorted(TAHKMAHNELLE_DICTIONARY.items(), key=lambda item: item[0])]
-
-# 7 Cycle Sets for Macro Time (Ariats, Batos, C'illias, etc. - based on first 7 roots)
-CYCLE_SETS = ROOT_NAMES[:7]
-
-# 4 Ages tied to Solstices/Equinoxes (New Year is Autumn Equinox)
-TAHKMAHNELLE_AGE_CYCLE = [
-    {'key': 'C', 'name': 'The Age of Precedent', 'date': (9, 22)}, # Autumn Equinox
-    {'key': 'D', 'name': 'The Age of Transition', 'date': (12, 21)}, # Winter Solstice
-    {'key': 'A', 'name': 'The Age of Genesis', 'date': (3, 20)},  # Spring Equinox
-    {'key': 'B', 'name': 'The Age of Zenith', 'date': (6, 21)}    # Summer Solstice
-]
+from tahkmahnelle_calendar import (
+    TAHKMAHNELLE_AGE_CYCLE, REFERENCE_YEAR_OFFSET,
+    T_WEEKS_PER_MONTH, T_MONTHS_PER_AGE, T_TICKS_PER_DAY,
+    AgeBoundaryCache, get_t_day_name, get_t_month_name, get_macro_cycle_name,
+    reference_t_date, split_t_day_ticks, t_ticks_from_ns, wall_clock_ns, FrameClock,
+)
+from frame_compositor import FrameCompositor
 
 # --- II. TIME SYSTEM CONSTANTS ---
 
-# Solar Clock (T-Hour, T-Minute, T-Second)
-T_SECONDS_PER_MINUTE = 9
-T_MINUTES_PER_HOUR = 7
-T_HOURS_PER_DAY = 8
-T_TICKS_PER_SECOND = 1000 # For 46ms precision visualization
-
-# Calendar Cycles
-T_DAYS_PER_WEEK = 5
-T_WEEKS_PER_MONTH = 9
-T_MONTHS_PER_AGE = 3 # 12 T-Months total (4 Ages * 3 Months)
-
-# Calculated constants
-DAYS_IN_T_MONTH = T_WEEKS_PER_MONTH * T_DAYS_PER_WEEK # 45 real days
-EARTH_SECONDS_PER_DAY = 86400
-T_SECONDS_PER_DAY = T_HOURS_PER_DAY * T_MINUTES_PER_HOUR * T_SECONDS_PER_MINUTE
-EARTH_SECONDS_PER_T_SECOND = EARTH_SECONDS_PER_DAY / T_SECONDS_PER_DAY
-T_TICK_SLEEP_TIME = 0.046 # 46ms refresh rate
-
-# T-Year offset (5849 is the reference T-Year, aligned with 2025)
-YEAR_OFFSET = 5849 - 2025
-T_YEAR_REFERENCE = 2025
+T_TICK_SLEEP_TIME = 0.046 # 46ms refresh rate (one frame per T-Tick)
 
 # --- III. CHRONOLOGICAL MAPPING FUNCTIONS ---
 
-def get_t_day_name(day_index):
-    """Names the 5 T-Days using roots A-E (Indices 0-4)."""
-    return ROOT_NAMES[day_index % T_DAYS_PER_WEEK]
-
-def get_t_month_name(month_index):
-    """Names the 3 T-Months using roots O-Q (Indices 14-16) across the 4 T-Ages."""
-    return ROOT_NAMES[(month_index % T_MONTHS_PER_AGE) + T_DAYS_PER_WEEK + T_WEEKS_PER_MONTH]
+# Lenemkette pins its T-Years to the reference year (T-Year 5849 = 2025).
+_AGE_CACHE = AgeBoundaryCache(TAHKMAHNELLE_AGE_CYCLE, REFERENCE_YEAR_OFFSET)
 
 def get_current_t_age_and_year(date: datetime.date):
     """Determines the current Tahkmahnelle Age and Year based on the date."""
-    current_year = date.year
     now = datetime.datetime(date.year, date.month, date.day)
-    age_starts = []
-    
-    for y in [current_year, current_year - 1]:
-        for age_data in TAHKMAHNELLE_AGE_CYCLE:
-            month, day = age_data['date']
-            try:
-                age_starts.append((datetime.datetime(y, month, day), age_data))
-            except ValueError:
-                continue
-        
-    age_starts.sort(key=lambda x: x[0])
-    current_age_data = None
-
-    for start_date, age_data in reversed(age_starts):
-        if start_date <= now:
-            current_age_data = age_data
-            break
-            
-    t_year = current_year + YEAR_OFFSET
+    current_age_data, _, t_year = _AGE_CACHE.lookup(now)
     return current_age_data['name'], t_year
 
-def get_macro_cycle_name(t_year, cycle_length):
-    """Returns the name (Ariat, Bato, etc.) for Stahoy, Vraen, or Tetnobausse."""
-    # Use modulo 7 on the cycle number to select the name from the 7 sets
-    cycle_index = (t_year // cycle_length) % 7
-    return CYCLE_SETS[cycle_index].capitalize()
-
 def calculate_t_time_components(now: datetime.datetime, current_t_year):
     """Calculates all solar, calendar, and macro time components."""
     
     # --- 1. Solar/Hourly Time ---
     
-    # Get Earth seconds since midnight (0 to 86399.999...)
-    real_seconds_of_day = (now - now.replace(hour=0, minute=0, second=0, microsecond=0)).total_seconds()
-    
-    # Convert real seconds to Tahkmahnelle seconds (0 to T_SECONDS_PER_DAY - 1)
-    t_seconds_absolute = real_seconds_of_day / EARTH_SECONDS_PER_T_SECOND
-    
-    t_hour = math.floor(t_seconds_absolute / (T_MINUTES_PER_HOUR * T_SECONDS_PER_MINUTE)) % T_HOURS_PER_DAY
-    remaining_seconds = t_seconds_absolute % (T_MINUTES_PER_HOUR * T_SECONDS_PER_MINUTE)
-    
-    t_minute = math.floor(remaining_seconds / T_SECONDS_PER_MINUTE) % T_MINUTES_PER_HOUR
-    remaining_seconds = remaining_seconds % T_SECONDS_PER_MINUTE
-    
-    t_second = math.floor(remaining_seconds) % T_SECONDS_PER_MINUTE
-    t_tick = math.floor((remaining_seconds - t_second) * T_TICKS_PER_SECOND) % T_TICKS_PER_SECOND
+    # Whole T-Ticks elapsed since midnight, from the shared integer tick engine
+    ticks_in_day = t_ticks_from_ns(wall_clock_ns(now)) % T_TICKS_PER_DAY
+    t_hour, t_minute, t_second, t_tick = split_t_day_ticks(ticks_in_day)
 
     # --- 2. Calendar Time (Day, Week, Month) ---
     
-    reference_date = datetime.date(T_YEAR_REFERENCE, 1, 1)
-    total_days_since_reference = (now.date() - reference_date).days 
-    
-    # T-Month Index (0-11)
-    t_month_index_absolute = math.floor(total_days_since_reference / DAYS_IN_T_MONTH) % 12
-    t_month_name = get_t_month_name(t_month_index_absolute)
-    
-    # Day Index within the current T-Month (0-44)
-    day_of_t_month_index = total_days_since_reference % DAYS_IN_T_MONTH
+    # T-Month Index (0-11), Day Index within the current T-Month (0-44), T-Week and T-Day
+    t_month_index_absolute, day_of_t_month_index, t_week_index, t_day_index = reference_t_date(now.toordinal())
+    t_month_name = get_t_month_name(t_month_index_absolute % T_MONTHS_PER_AGE)
     t_day_of_month = day_of_t_month_index + 1 # 1 to 45
     
     # T-Day and T-Week
-    t_day_index = day_of_t_month_index % T_DAYS_PER_WEEK
     t_day_name = get_t_day_name(t_day_index)
-    t_week_of_month = math.floor(day_of_t_month_index / T_DAYS_PER_WEEK) + 1
+    t_week_of_month = t_week_index + 1
     
     # --- 3. Macro Cycles (Stahoy, Vraen, Tetnobausse) ---
 
@@ -152,7 +71,7 @@ def clear_screen():
     """Clears the terminal screen."""
     os.system('cls' if os.name == 'nt' else 'clear')
 
-def draw_analog_clock(t_hour):
+def build_analog_clock(t_hour):
     """Draws a simple 8-hour ASCII analog clock face."""
     face = ['|', '/', '-', '\\', '|', '/', '-', '\\']
     pointer = face[t_hour % 8]
@@ -178,6 +97,13 @@ def draw_analog_clock(t_hour):
         
     return "\n".join(analog)
 
+# The face depends only on the T-Hour, so all 8 are drawn once.
+ANALOG_CLOCK_FACES = tuple(build_analog_clock(t_hour) for t_hour in range(8))
+
+def draw_analog_clock(t_hour):
+    """Returns the precomputed 8-hour ASCII analog clock face."""
+    return ANALOG_CLOCK_FACES[t_hour % 8]
+
 def display_lenemkette(time_data, spatial_coords):
     """Renders the entire Lenemkette display."""
     
@@ -230,7 +156,6 @@ def display_lenemkette(time_data, spatial_coords):
 | Press Ctrl+C at any time to adjust coordinates.         |
 """
     
-    clear_screen()
     print(time_display)
     print(calendar_display)
     print(macro_display)
@@ -251,8 +176,10 @@ def run_lenemkette():
         # Pass if tty/termios are unavailable (e.g., non-Linux/MacOS environment)
         pass
 
+    frame_clock = FrameClock(T_TICK_SLEEP_TIME)
+    compositor = FrameCompositor(frame_clock=frame_clock)
     try:
-        while True:
+        for _ in frame_clock:
             now = datetime.datetime.now()
             t_age, t_year = get_current_t_age_and_year(now.date())
             time_data = calculate_t_time_components(now, t_year)
@@ -260,13 +187,12 @@ def run_lenemkette():
             # Add T-Age to time_data for display
             time_data['T-Age'] = t_age
             
-            display_lenemkette(time_data, spatial_coords)
-            
-            # Sleep for 46ms to simulate the T-Tick rate
-            time.sleep(T_TICK_SLEEP_TIME)
+            with compositor.frame():
+                display_lenemkette(time_data, spatial_coords)
 
     except KeyboardInterrupt:
         # Pause clock to adjust spatial coordinates
+        compositor.close()
         clear_screen()
         print("\n--- LENEMKETTE PAUSED: COORDINATE ADJUSTMENT ---")
         print(f"Current Coordinates: X={spatial_coords['x']}, Y={spatial_coords['y']}, Z={spatial_coords['z']}")
@@ -0,0 +1,207 @@
+# analog_dial.py
+#
+# Precomputed analog dials for the Tahkmahnelle clock viewers.
+#
+# The 8-hour dial drawn by render_t_clock() depends only on the T-Hour and
+# T-Minute, so all 56 faces are built once at import and a frame is a tuple
+# lookup instead of rebuilding a 9x9 grid:
+#
+#     analog_out = dial_face(t_time['T-Hour'], t_time['T-Minute'])
+#
+# HiResDial is a larger face with hour, minute and a sweeping seconds hand.
+# Its 504 hour/minute/second faces are built when it is created, and the
+# seconds hand is stored as precomputed row spans for each sweep step, so a
+# frame costs a lookup plus a few string splices.
+#
+# To compare frame costs with the per-frame builders: python dial_bench.py
+
+import math
+
+from tahkmahnelle_calendar import T_HOURS_PER_DAY, T_MINUTES_PER_HOUR, T_SECONDS_PER_MINUTE, T_TICKS_PER_SECOND
+
+DIAL_INDENT = "       "
+
+# --- 8-Hour Dial (9x9) ---
+# The hours are arranged starting from 0 (top-middle), going clockwise.
+HOUR_POSITIONS = {
+    0: (0, 4), 1: (1, 6), 2: (4, 8), 3: (7, 6),
+    4: (8, 4), 5: (7, 2), 6: (4, 0), 7: (1, 2)
+}
+DIAL_SIZE = 9
+DIAL_CENTER = (4, 4)
+
+
+def build_dial_face(hour, minute):
+    """Draws the 9x9 dial for one T-Hour and T-Minute (the per-frame renderer the cache is built from)."""
+    face = [list(' ' * DIAL_SIZE) for _ in range(DIAL_SIZE)]
+
+    # Mark the dial points
+    for i in range(T_HOURS_PER_DAY):
+        r, c = HOUR_POSITIONS[i]
+        face[r][c] = str(i)
+
+    center_r, center_c = DIAL_CENTER
+    face[center_r][center_c] = 'X' # Center point
+
+    # Hour Hand: Mark current T-Hour with 'H'
+    hour_pos = HOUR_POSITIONS[hour]
+    face[hour_pos[0]][hour_pos[1]] = 'H'
+
+    # Minute progress: 'o' steps inward from the hour hand in the second half of the 7-minute hour
+    minute_symbol_row, minute_symbol_col = hour_pos
+    if minute > 3:
+        minute_symbol_col += (1 if hour_pos[1] < center_c else -1)
+        minute_symbol_row += (1 if hour_pos[0] < center_r else -1)
+
+    minute_symbol_row = max(0, min(DIAL_SIZE - 1, minute_symbol_row))
+    minute_symbol_col = max(0, min(DIAL_SIZE - 1, minute_symbol_col))
+
+    if face[minute_symbol_row][minute_symbol_col] == ' ':
+        face[minute_symbol_row][minute_symbol_col] = 'o'
+
+    return "\n".join([DIAL_INDENT + "".join(row) for row in face])
+
+
+# Every face of the 8-hour dial, indexed [T-Hour][T-Minute].
+DIAL_FACES = tuple(
+    tuple(build_dial_face(hour, minute) for minute in range(T_MINUTES_PER_HOUR))
+    for hour in range(T_HOURS_PER_DAY)
+)
+
+
+def dial_face(hour, minute):
+    """Returns the precomputed 8-hour dial for a T-Hour and T-Minute."""
+    return DIAL_FACES[hour][minute]
+
+
+# --- Hi-Res Dial with a Sweeping Seconds Hand ---
+# Terminal cells are about twice as tall as they are wide, so columns are
+# scaled by HIRES_ASPECT to keep the face round.
+HIRES_RADIUS = 8
+HIRES_ASPECT = 2
+HIRES_ROWS = 2 * HIRES_RADIUS + 1
+HIRES_COLUMNS = 2 * HIRES_ASPECT * HIRES_RADIUS + 1
+
+SWEEP_STEPS = 108  # Seconds-hand positions per revolution (12 per T-Second)
+
+HOUR_HAND_LENGTH = 0.45
+MINUTE_HAND_LENGTH = 0.7
+SECOND_HAND_LENGTH = 0.8
+NUMERAL_RADIUS = 1.0
+MINUTE_MARK_RADIUS = 0.9
+
+HOUR_HAND_CHAR = '█'
+MINUTE_HAND_CHAR = '▓'
+MINUTE_MARK_CHAR = '·'
+CENTER_CHAR = 'O'
+SECOND_HAND_TIP = 'o'
+
+MINUTES_PER_DAY = T_HOURS_PER_DAY * T_MINUTES_PER_HOUR
+SECONDS_PER_HOUR = T_MINUTES_PER_HOUR * T_SECONDS_PER_MINUTE
+TICKS_PER_MINUTE = T_SECONDS_PER_MINUTE * T_TICKS_PER_SECOND
+
+
+def _cell(fraction, radius):
+    """Returns the (row, column) of the point `radius` (0-1) out along a hand pointing at `fraction` of a turn."""
+    angle = 2 * math.pi * fraction
+    row = HIRES_RADIUS - radius * HIRES_RADIUS * math.cos(angle)
+    column = HIRES_ASPECT * HIRES_RADIUS + radius * HIRES_ASPECT * HIRES_RADIUS * math.sin(angle)
+    return int(round(row)), int(round(column))
+
+
+def _hand_cells(fraction, length):
+    """Returns the cells covered by a hand from the center out to `length`, in order."""
+    cells = []
+    steps = int(length * HIRES_ASPECT * HIRES_RADIUS * 2)
+    for i in range(1, steps + 1):
+        cell = _cell(fraction, length * i / steps)
+        if cell != (HIRES_RADIUS, HIRES_ASPECT * HIRES_RADIUS) and cell not in cells:
+            cells.append(cell)
+    return cells
+
+
+def _direction_char(fraction):
+    """Picks the line character closest to a hand's direction."""
+    return '|/-\\|/-\\'[int(round(fraction * 8)) % 8]
+
+
+def _blank_face():
+    """Returns the hi-res face with its minute marks and hour numerals but no hands."""
+    face = [[' '] * HIRES_COLUMNS for _ in range(HIRES_ROWS)]
+    for minute in range(MINUTES_PER_DAY):
+        if minute % T_MINUTES_PER_HOUR:
+            r, c = _cell(minute / MINUTES_PER_DAY, MINUTE_MARK_RADIUS)
+            face[r][c] = MINUTE_MARK_CHAR
+    for hour in range(T_HOURS_PER_DAY):
+        r, c = _cell(hour / T_HOURS_PER_DAY, NUMERAL_RADIUS)
+        face[r][c] = str(hour)
+    return face
+
+
+def _second_hand_spans(step):
+    """Returns the seconds hand at sweep `step` as (row, column, text) spans of adjacent cells."""
+    fraction = step / SWEEP_STEPS
+    cells = _hand_cells(fraction, SECOND_HAND_LENGTH)
+    chars = {cell: _direction_char(fraction) for cell in cells}
+    chars[cells[-1]] = SECOND_HAND_TIP
+
+    spans = []
+    for r, c in sorted(chars):
+        if spans and spans[-1][0] == r and spans[-1][1] + len(spans[-1][2]) == c:
+            spans[-1] = (r, spans[-1][1], spans[-1][2] + chars[(r, c)])
+        else:
+            spans.append((r, c, chars[(r, c)]))
+    return tuple(spans)
+
+
+def build_hires_face(hour, minute, second):
+    """Draws the hi-res face (without the seconds hand) as a tuple of rows."""
+    face = _blank_face()
+    minute_fraction = (minute * T_SECONDS_PER_MINUTE + second) / SECONDS_PER_HOUR
+    hour_fraction = (hour * T_MINUTES_PER_HOUR + minute) / MINUTES_PER_DAY
+    for r, c in _hand_cells(minute_fraction, MINUTE_HAND_LENGTH):
+        face[r][c] = MINUTE_HAND_CHAR
+    for r, c in _hand_cells(hour_fraction, HOUR_HAND_LENGTH):
+        face[r][c] = HOUR_HAND_CHAR
+    face[HIRES_RADIUS][HIRES_ASPECT * HIRES_RADIUS] = CENTER_CHAR
+    return tuple("".join(row) for row in face)
+
+
+def sweep_step(second, tick):
+    """Returns the seconds-hand sweep step for a T-Second and T-Tick."""
+    return (second * T_TICKS_PER_SECOND + tick) * SWEEP_STEPS // TICKS_PER_MINUTE
+
+
+def overlay_spans(rows, spans):
+    """Returns `rows` as a list with each (row, column, text) span written over it."""
+    rows = list(rows)
+    for r, c, text in spans:
+        row = rows[r]
+        rows[r] = row[:c] + text + row[c + len(text):]
+    return rows
+
+
+def render_hires_dial(hour, minute, second, tick):
+    """Draws a complete hi-res dial from scratch (the per-frame renderer HiResDial replaces)."""
+    rows = overlay_spans(build_hires_face(hour, minute, second), _second_hand_spans(sweep_step(second, tick)))
+    return "\n".join([DIAL_INDENT + row for row in rows])
+
+
+class HiResDial:
+    """The hi-res dial with every face and seconds-hand position precomputed."""
+
+    def __init__(self):
+        # Faces are indexed by the T-Second of the day: (hour * 7 + minute) * 9 + second.
+        self._faces = tuple(
+            build_hires_face(hour, minute, second)
+            for hour in range(T_HOURS_PER_DAY)
+            for minute in range(T_MINUTES_PER_HOUR)
+            for second in range(T_SECONDS_PER_MINUTE)
+        )
+        self._sweep = tuple(_second_hand_spans(step) for step in range(SWEEP_STEPS))
+
+    def render(self, hour, minute, second, tick):
+        """Returns the dial for a T-Hour, T-Minute, T-Second and T-Tick."""
+        face = self._faces[(hour * T_MINUTES_PER_HOUR + minute) * T_SECONDS_PER_MINUTE + second]
+        rows = overlay_spans(face, self._sweep[sweep_step(second, tick)])
+        return "\n".join([DIAL_INDENT + row for row in rows])
@@ -0,0 +1,363 @@
+# calendar_daemon.py
+#
+# One background process that computes every calendar once per tick and
+# publishes the states to any number of viewers.
+#
+# Start the daemon:
+# python calendar_daemon.py serve [--socket PATH] [--port 8765] [--tick 0.046]
+#
+# Subscribers pick the calendars they want and how often to receive them:
+#
+#   Unix socket  connect to the socket and send one JSON line such as
+#                {"calendars": ["ritual", "lenemkette"], "interval": 0.5}
+#                then read one JSON line per update (see subscribe()).
+#   HTTP (SSE)   GET /events?calendars=ritual,lenemkette&interval=0.5 streams
+#                Server-Sent Events for EventSource in the HTML pages.
+#                GET /calendars lists the calendars; GET /stats reports load.
+#
+# Each update is {"time": <UTC POSIX seconds>, "calendars": {name: state}}.
+# A calendar is computed at most once per tick, and only when a subscriber
+# that wants it is due; subscribers with the same interval are due together.
+# Its JSON is encoded once and shared, so adding viewers costs a socket write
+# each rather than another calendar loop. Slow readers skip updates instead
+# of growing the daemon's buffers.
+#
+# Watch from a terminal: python calendar_daemon.py watch [--calendars a,b] [--interval 1]
+
+import os
+import sys
+import json
+import time
+import math
+import signal
+import socket
+import asyncio
+import argparse
+import tempfile
+from datetime import datetime, timezone
+from urllib.parse import urlsplit, parse_qs
+
+import tahkmahnelle_calendar
+from tahkmahnelle_calendar import FrameClock
+import tahkmahnelle_index
+import Lenemkette
+import vraelvrae_scroll
+import ritual_clock
+import vslenemkette
+import solar_clock
+import Tahkmahnelle_SolarClock
+
+DEFAULT_SOCKET_PATH = os.path.join(os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir(),
+                                   "tahkmahnelle-calendars.sock")
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_TICK = 0.046  # The T-Tick cadence of the live clocks
+DEFAULT_INTERVAL = 1.0
+
+# A subscriber with more than this many bytes still unsent skips updates until it catches up.
+MAX_PENDING_BYTES = 256 * 1024
+
+
+# --- Calendars ---
+# Each calendar turns the tick's instant into a JSON-serializable state. The
+# instant is given both as naive local time (for the Tahkmahnelle clocks) and
+# as aware UTC (for the ritual and solar clocks).
+
+def _lenemkette_state(local_now, utc_now):
+    t_age, t_year = Lenemkette.get_current_t_age_and_year(local_now.date())
+    state = Lenemkette.calculate_t_time_components(local_now, t_year)
+    state['T-Age'] = t_age
+    return state
+
+def _index_state(local_now, utc_now):
+    state = tahkmahnelle_index.calculate_t_time(local_now)
+    holiday = tahkmahnelle_index.get_active_holiday(state['T_DayIndex'])
+    state['Holiday'] = holiday['name'] if holiday else None
+    return state
+
+def _vraelvrae_state(local_now, utc_now):
+    day_index = vraelvrae_scroll.get_day_index(local_now)
+    month, week, day = vraelvrae_scroll.get_calendar_position(day_index)
+    hour, minute, second, whik = vraelvrae_scroll.get_custom_time(local_now)
+    return {
+        'year': vraelvrae_scroll.get_lore_year(local_now), 'day_index': day_index,
+        'month': month, 'week': week, 'day': day,
+        'hour': hour, 'minute': minute, 'second': second, 'whik': whik,
+        'season': vraelvrae_scroll.SEASONAL_DAYS.get(day_index),
+        'event': vraelvrae_scroll.LORE_EVENTS.get(day_index),
+        'rituals': vraelvrae_scroll.ritual_trigger(day_index, whik),
+    }
+
+CALENDARS = {
+    'tahkmahnelle': lambda local_now, utc_now: tahkmahnelle_calendar.get_tahkmahnelle_time(local_now),
+    'index': _index_state,
+    'lenemkette': _lenemkette_state,
+    'vraelvrae': _vraelvrae_state,
+    'ritual': lambda local_now, utc_now: ritual_clock.get_time(utc_now.replace(tzinfo=None)),
+    'vslenemkette': lambda local_now, utc_now: vslenemkette.get_ritual_time(utc_now.replace(tzinfo=None)),
+    'solar': lambda local_now, utc_now: solar_clock.get_solar_time(utc_now),
+    'solarclock': lambda local_now, utc_now: Tahkmahnelle_SolarClock.get_tahkmahnelle_time(local_now),
+}
+
+
+def parse_selection(calendars, interval, tick):
+    """
+    Validates a subscriber's calendars (None for all) and interval in seconds.
+    Returns (calendar names, interval) or raises ValueError, whatever JSON
+    types the subscriber sent.
+    """
+    if calendars is None:
+        calendars = list(CALENDARS)
+    if not isinstance(calendars, list) or not all(isinstance(name, str) for name in calendars):
+        raise ValueError("calendars must be a list of calendar names")
+    unknown = [name for name in calendars if name not in CALENDARS]
+    if unknown:
+        raise ValueError(f"unknown calendars: {', '.join(unknown)} (choose from {', '.join(CALENDARS)})")
+    try:
+        interval = float(interval)
+    except TypeError:
+        raise ValueError("interval must be a number of seconds") from None
+    if not math.isfinite(interval) or interval <= 0:
+        raise ValueError("interval must be a positive, finite number of seconds")
+    # Nobody is updated faster than the daemon ticks.
+    return tuple(calendars), max(interval, tick)
+
+
+# --- Daemon ---
+
+class Subscriber:
+    """One connected viewer: its calendars, update interval and stream."""
+
+    def __init__(self, writer, calendars, interval, sse):
+        self.writer = writer
+        self.calendars = calendars
+        self.interval_ns = int(interval * 1000000000)
+        self.sse = sse
+        self.next_due_ns = 0  # The first update goes out on the next tick
+        self.skipped = 0
+
+
+class CalendarDaemon:
+    """Computes the subscribed calendars once per tick and fans the states out to every subscriber."""
+
+    def __init__(self, tick=DEFAULT_TICK):
+        self.tick = tick
+        self.frame_clock = FrameClock(tick)
+        self.subscribers = set()
+        self.states_computed = 0
+        self.updates_sent = 0
+
+    def stats(self):
+        return {
+            'subscribers': len(self.subscribers),
+            'ticks': self.frame_clock.frames,
+            'missed_ticks': self.frame_clock.missed,
+            'states_computed': self.states_computed,
+            'updates_sent': self.updates_sent,
+            'updates_skipped': sum(sub.skipped for sub in self.subscribers),
+        }
+
+    def publish(self, now_ns):
+        """Sends an update to every subscriber that is due at monotonic time `now_ns`."""
+        due = [sub for sub in self.subscribers if sub.next_due_ns <= now_ns]
+        if not due:
+            return
+
+        utc_now = datetime.now(timezone.utc)
+        local_now = utc_now.astimezone().replace(tzinfo=None)
+        time_json = json.dumps(utc_now.timestamp())
+        fragments = {}  # Calendar name -> '"name": {state}', encoded once per tick
+        payloads = {}   # (calendars, sse) -> bytes, shared by subscribers with the same selection
+
+        for sub in due:
+            # Due times sit on a grid of the interval, so subscribers asking for the
+            # same rate are served on the same ticks and share one computation.
+            sub.next_due_ns = (now_ns // sub.interval_ns + 1) * sub.interval_ns
+            if sub.writer.is_closing():
+                continue
+            if sub.writer.transport.get_write_buffer_size() > MAX_PENDING_BYTES:
+                sub.skipped += 1
+                continue
+
+            key = (sub.calendars, sub.sse)
+            payload = payloads.get(key)
+            if payload is None:
+                for name in sub.calendars:
+                    if name not in fragments:
+                        state = CALENDARS[name](local_now, utc_now)
+                        fragments[name] = f"{json.dumps(name)}: {json.dumps(state, ensure_ascii=False, default=str)}"
+                        self.states_computed += 1
+                line = '{"time": ' + time_json + ', "calendars": {' + ", ".join(fragments[n] for n in sub.calendars) + '}}'
+                payload = payloads[key] = (f"data: {line}\n\n" if sub.sse else line + "\n").encode("utf-8")
+            sub.writer.write(payload)
+            self.updates_sent += 1
+
+    async def run_ticks(self):
+        while True:
+            await asyncio.sleep(max(self.frame_clock.remaining_ns(), 0) / 1000000000)
+            self.frame_clock.begin_frame()
+            try:
+                self.publish(time.monotonic_ns())
+            except Exception as e:
+                print(f"[Error] Publishing failed: {e}", file=sys.stderr)
+
+    async def _serve(self, sub, reader):
+        """Keeps `sub` subscribed until its connection closes."""
+        self.subscribers.add(sub)
+        try:
+            while await reader.read(4096):
+                pass
+        except ConnectionError:
+            pass
+        finally:
+            self.subscribers.discard(sub)
+            sub.writer.close()
+
+    async def handle_unix(self, reader, writer):
+        """Unix-socket subscriber: one JSON request line, then JSON lines."""
+        try:
+            request = json.loads(await reader.readline() or "{}")
+            calendars, interval = parse_selection(request.get('calendars'), request.get('interval', DEFAULT_INTERVAL),
+                                                  self.tick)
+        except (ValueError, AttributeError) as e:
+            writer.write((json.dumps({'error': str(e)}) + "\n").encode("utf-8"))
+            writer.close()
+            return
+        await self._serve(Subscriber(writer, calendars, interval, sse=False), reader)
+
+    async def handle_http(self, reader, writer):
+        """HTTP client: /events streams SSE; /calendars and /stats return JSON."""
+        try:
+            request_line = (await reader.readline()).decode("latin-1").split()
+            while (await reader.readline()).strip():
+                pass  # Headers are not needed
+            if len(request_line) < 2 or request_line[0] != "GET":
+                return self._http_reply(writer, "405 Method Not Allowed", {'error': "only GET is supported"})
+            url = urlsplit(request_line[1])
+            query = parse_qs(url.query)
+        except (ConnectionError, UnicodeDecodeError):
+            writer.close()
+            return
+
+        if url.path == "/calendars":
+            return self._http_reply(writer, "200 OK", list(CALENDARS))
+        if url.path == "/stats":
+            return self._http_reply(writer, "200 OK", self.stats())
+        if url.path != "/events":
+            return self._http_reply(writer, "404 Not Found", {'error': f"no such path: {url.path}"})
+
+        try:
+            names = query['calendars'][0].split(",") if 'calendars' in query else None
+            calendars, interval = parse_selection(names, query.get('interval', [DEFAULT_INTERVAL])[0], self.tick)
+        except ValueError as e:
+            return self._http_reply(writer, "400 Bad Request", {'error': str(e)})
+
+        writer.write(b"HTTP/1.1 200 OK\r\n"
+                     b"Content-Type: text/event-stream; charset=utf-8\r\n"
+                     b"Cache-Control: no-cache\r\n"
+                     b"Connection: keep-alive\r\n"
+                     b"Access-Control-Allow-Origin: *\r\n\r\n")
+        await self._serve(Subscriber(writer, calendars, interval, sse=True), reader)
+
+    def _http_reply(self, writer, status, body):
+        data = json.dumps(body).encode("utf-8")
+        writer.write(f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\nContent-Length: {len(data)}\r\n"
+                     f"Access-Control-Allow-Origin: *\r\nConnection: close\r\n\r\n".encode("latin-1") + data)
+        writer.close()
+
+
+def _remove_stale_socket(path):
+    """Removes a socket file left behind by a daemon that is no longer running."""
+    if not os.path.exists(path):
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except OSError:
+        os.unlink(path)
+    else:
+        raise OSError(f"a calendar daemon is already listening on {path}")
+    finally:
+        probe.close()
+
+
+async def serve(socket_path=DEFAULT_SOCKET_PATH, host=DEFAULT_HOST, port=DEFAULT_PORT, tick=DEFAULT_TICK):
+    """Runs the daemon until cancelled. A `port` of None disables HTTP."""
+    daemon = CalendarDaemon(tick)
+    # Stop cleanly (removing the socket) when terminated as a service.
+    asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+    _remove_stale_socket(socket_path)
+    servers = [await asyncio.start_unix_server(daemon.handle_unix, path=socket_path)]
+    print(f"Publishing {len(CALENDARS)} calendars on {socket_path}", file=sys.stderr)
+    if port is not None:
+        servers.append(await asyncio.start_server(daemon.handle_http, host, port))
+        print(f"Server-Sent Events on http://{host}:{port}/events", file=sys.stderr)
+    try:
+        await daemon.run_ticks()
+    finally:
+        for server in servers:
+            server.close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+# --- Client ---
+
+def subscribe(calendars=None, interval=DEFAULT_INTERVAL, socket_path=DEFAULT_SOCKET_PATH):
+    """Yields {"time": ..., "calendars": {...}} updates from a running daemon."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall((json.dumps({'calendars': calendars, 'interval': interval}) + "\n").encode("utf-8"))
+        with sock.makefile("r", encoding="utf-8") as stream:
+            for line in stream:
+                update = json.loads(line)
+                if 'error' in update:
+                    raise ValueError(update['error'])
+                yield update
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Publish every Tahkmahnelle calendar from one process.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = commands.add_parser("serve", help="run the daemon")
+    serve_parser.add_argument("--socket", default=DEFAULT_SOCKET_PATH, help="Unix socket path")
+    serve_parser.add_argument("--host", default=DEFAULT_HOST, help="HTTP address (default 127.0.0.1)")
+    serve_parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="HTTP port; 0 disables HTTP")
+    serve_parser.add_argument("--tick", type=float, default=DEFAULT_TICK, help="seconds per tick (default 0.046)")
+
+    watch_parser = commands.add_parser("watch", help="print updates from a running daemon")
+    watch_parser.add_argument("--socket", default=DEFAULT_SOCKET_PATH, help="Unix socket path")
+    watch_parser.add_argument("--calendars", help="comma-separated calendars (default: all)")
+    watch_parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL, help="seconds between updates")
+
+    commands.add_parser("list", help="list the calendars")
+    options = parser.parse_args()
+
+    if options.command == "list":
+        print("\n".join(CALENDARS))
+    elif options.command == "serve":
+        try:
+            asyncio.run(serve(options.socket, options.host, options.port or None, options.tick))
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            print("\nCalendar daemon stopped.", file=sys.stderr)
+        except OSError as e:
+            print(f"[Error] {e}", file=sys.stderr)
+            return 1
+    else:
+        calendars = options.calendars.split(",") if options.calendars else None
+        try:
+            for update in subscribe(calendars, options.interval, options.socket):
+                print(json.dumps(update, ensure_ascii=False), flush=True)
+        except BrokenPipeError:
+            pass  # The output was closed, e.g. by head
+        except (OSError, ValueError) as e:
+            print(f"[Error] {e}", file=sys.stderr)
+            return 1
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
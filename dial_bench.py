@@ -0,0 +1,78 @@
+# dial_bench.py
+#
+# Frame cost of the analog clock dials, before and after precomputation.
+#
+# Run from the repository directory:
+# python dial_bench.py [--frames N]
+#
+# For each dial the runner times the per-frame renderer (which builds the
+# face from scratch, as the viewers used to every frame) against the cached
+# lookup the viewers use now, over the same stream of clock states, and
+# reports the cost per frame and the speedup. The one-off cost of building
+# the hi-res cache is reported separately.
+
+import sys
+import time
+import argparse
+
+from tahkmahnelle_calendar import T_MINUTES_PER_HOUR, T_SECONDS_PER_MINUTE, T_TICKS_PER_SECOND, T_TICKS_PER_DAY
+import analog_dial
+import Lenemkette
+
+DEFAULT_FRAMES = 20000
+FRAME_STRIDE = 269  # T-Ticks between benchmark frames; prime, so the states vary
+
+
+def make_states(count):
+    """Returns `count` (hour, minute, second, tick) clock states spread over the T-Day."""
+    states = []
+    for i in range(count):
+        seconds, tick = divmod(i * FRAME_STRIDE % T_TICKS_PER_DAY, T_TICKS_PER_SECOND)
+        minutes, second = divmod(seconds, T_SECONDS_PER_MINUTE)
+        hour, minute = divmod(minutes, T_MINUTES_PER_HOUR)
+        states.append((hour, minute, second, tick))
+    return states
+
+
+def time_frames(render, states):
+    """Returns the average nanoseconds per call of render(*state) over `states`."""
+    start = time.perf_counter_ns()
+    for state in states:
+        render(*state)
+    return (time.perf_counter_ns() - start) / len(states)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare analog dial frame costs before and after precomputation.")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES, help="frames per measurement")
+    options = parser.parse_args()
+
+    states = make_states(options.frames)
+
+    start = time.perf_counter_ns()
+    hires_dial = analog_dial.HiResDial()
+    build_ms = (time.perf_counter_ns() - start) / 1e6
+
+    dials = (
+        ("8-hour dial (render_t_clock)",
+         lambda h, m, s, t: analog_dial.build_dial_face(h, m),
+         lambda h, m, s, t: analog_dial.dial_face(h, m)),
+        ("Lenemkette dial (draw_analog_clock)",
+         lambda h, m, s, t: Lenemkette.build_analog_clock(h),
+         lambda h, m, s, t: Lenemkette.draw_analog_clock(h)),
+        ("hi-res sweeping dial",
+         analog_dial.render_hires_dial,
+         hires_dial.render),
+    )
+
+    print(f"{'dial':<36} {'before ns':>11} {'after ns':>10} {'speedup':>9}")
+    for name, before, after in dials:
+        before_ns = time_frames(before, states)
+        after_ns = time_frames(after, states)
+        print(f"{name:<36} {before_ns:>11,.0f} {after_ns:>10,.0f} {before_ns / after_ns:>8.1f}x")
+    print(f"Hi-res cache built in {build_ms:.1f} ms.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,270 @@
+# engine_bench.py
+#
+# Benchmark runner for every clock and calendar engine in the repository.
+#
+# Run from the repository directory:
+# python engine_bench.py [--engines NAME,...] [--calls N] [--repeats N] [--threshold 0.25] [--save]
+#
+# Each engine's module is imported (the live display loops only start under
+# __main__, so importing is safe) and its conversion function is called on a
+# stream of instants spaced like live frames. For every engine the runner
+# reports calls/sec, p50/p99 latency, and the bytes allocated per call
+# (tracemalloc peak above the starting point, averaged; CPython keeps no
+# allocation counter).
+#
+# Every measurement is repeated --repeats times and the best pass is reported
+# (highest calls/sec, lowest p50; the p99 is the median pass). A single pass
+# is too noisy to compare against a threshold: on a shared or throttled
+# machine back-to-back runs of the same code differ by half. So each pass is
+# bracketed by two passes of a fixed pure-Python reference loop, and the
+# baseline comparison uses the engine's cost relative to that loop (median
+# over the passes), which stays within a few percent while the machine's
+# speed drifts.
+#
+# Results are compared with the baselines in engine_bench_baseline.json, which
+# is machine-specific and not committed. A run fails (exit 1) when an engine's
+# relative cost per call or relative p50 latency grows by more than the
+# threshold. The baseline file is written on the first run and whenever
+# --save is given.
+
+import os
+import sys
+import json
+import time
+import argparse
+import datetime
+import platform
+import importlib
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE_PATH = os.path.join(HERE, "engine_bench_baseline.json")
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_CALLS = 20000
+DEFAULT_REPEATS = 5
+WARMUP_CALLS = 1000
+ALLOCATION_SAMPLES = 200
+
+FRAME_INTERVAL = datetime.timedelta(milliseconds=46)
+START_INSTANT = datetime.datetime(2025, 10, 17, 12, 0)
+
+
+def make_frames(count):
+    """Returns `count` naive datetimes spaced one live-clock frame apart."""
+    return [START_INSTANT + FRAME_INTERVAL * i for i in range(count)]
+
+
+# --- Engines ---
+# Each entry is (name, module, setup). setup(module, frames) returns the
+# function to time and the list of arguments to call it with, so argument
+# preparation is kept out of the measurement.
+
+def _setup_get_tahkmahnelle_time(module, frames):
+    return module.get_tahkmahnelle_time, frames
+
+def _setup_calculate_t_time(module, frames):
+    return module.calculate_t_time, frames
+
+def _setup_calculate_t_time_components(module, frames):
+    return (lambda now: module.calculate_t_time_components(now, 5849)), frames
+
+def _setup_get_custom_time(module, frames):
+    return module.get_custom_time, frames
+
+def _setup_ritual_get_time(module, frames):
+    return module.get_time, frames
+
+def _setup_get_ritual_time(module, frames):
+    return module.get_ritual_time, frames
+
+def _setup_find_current_age(module, frames):
+    utc_frames = [now.replace(tzinfo=datetime.timezone.utc) for now in frames]
+    return module.find_current_age, utc_frames
+
+ENGINES = (
+    ("get_tahkmahnelle_time", "tahkmahnelle_calendar", _setup_get_tahkmahnelle_time),
+    ("calculate_t_time", "tahkmahnelle_index", _setup_calculate_t_time),
+    ("calculate_t_time_components", "Lenemkette", _setup_calculate_t_time_components),
+    ("vraelvrae_scroll.get_custom_time", "vraelvrae_scroll", _setup_get_custom_time),
+    ("ritual_clock.get_time", "ritual_clock", _setup_ritual_get_time),
+    ("vslenemkette.get_ritual_time", "vslenemkette", _setup_get_ritual_time),
+    ("solar_clock.find_current_age", "solar_clock", _setup_find_current_age),
+)
+
+
+# --- Measurements ---
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def measure_throughput(func, args):
+    """Returns calls per second for one pass over `args`."""
+    start = time.perf_counter_ns()
+    for arg in args:
+        func(arg)
+    return len(args) / ((time.perf_counter_ns() - start) / 1e9)
+
+
+def measure_latency(func, args):
+    """Returns the p50 and p99 latency of single calls, in nanoseconds."""
+    clock = time.perf_counter_ns
+    samples = []
+    for arg in args:
+        start = clock()
+        func(arg)
+        samples.append(clock() - start)
+    samples.sort()
+    return percentile(samples, 0.50), percentile(samples, 0.99)
+
+
+def measure_allocations(func, args):
+    """Returns the average bytes allocated during one call (tracemalloc peak above the starting point)."""
+    tracemalloc.start()
+    try:
+        total = 0
+        for arg in args:
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            func(arg)
+            _, peak = tracemalloc.get_traced_memory()
+            total += peak - before
+    finally:
+        tracemalloc.stop()
+    return total / len(args)
+
+
+def _reference_work(now):
+    """A fixed mix of datetime arithmetic, division and formatting, like the engines do."""
+    delta = now - START_INSTANT
+    ticks, remainder = divmod(delta.microseconds + delta.seconds * 1000000, 171429)
+    return f"{ticks % 7}:{remainder // 1000:03d}"
+
+
+def median(values):
+    values = sorted(values)
+    return values[len(values) // 2]
+
+
+def bench_engine(name, module_name, setup, calls, repeats=DEFAULT_REPEATS):
+    """
+    Imports one engine and measures it `repeats` times; returns its result
+    dict: the best pass, plus the median cost relative to the reference loop.
+    """
+    module = importlib.import_module(module_name)
+    func, args = setup(module, make_frames(calls))
+    reference_args = make_frames(len(args))
+
+    for arg in args[:WARMUP_CALLS]:
+        func(arg)
+    throughputs, p50s, p99s, relative_costs, relative_p50s = [], [], [], [], []
+    for _ in range(max(1, repeats)):
+        reference_before = measure_throughput(_reference_work, reference_args)
+        throughput = measure_throughput(func, args)
+        p50, p99 = measure_latency(func, args)
+        reference_ns = 2e9 / (reference_before + measure_throughput(_reference_work, reference_args))
+        throughputs.append(throughput)
+        p50s.append(p50)
+        p99s.append(p99)
+        relative_costs.append(1e9 / throughput / reference_ns)
+        relative_p50s.append(p50 / reference_ns)
+    return {
+        "calls_per_sec": max(throughputs),
+        "p50_ns": min(p50s),
+        "p99_ns": median(p99s),
+        "relative_cost": median(relative_costs),
+        "relative_p50": median(relative_p50s),
+        "alloc_bytes_per_call": measure_allocations(func, args[:ALLOCATION_SAMPLES]),
+    }
+
+
+# --- Baselines ---
+
+def load_baseline(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_baseline(path, results):
+    baseline = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "engines": results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def find_regressions(results, baseline, threshold):
+    """
+    Returns a description of every engine whose cost relative to the reference
+    loop grew by more than `threshold` since the baseline.
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline["engines"].get(name)
+        if base is None or "relative_cost" not in base:
+            continue  # New engine, or a baseline from before relative costs; re-save it
+        if result["relative_cost"] > base["relative_cost"] * (1 + threshold):
+            regressions.append(f"{name}: {result['relative_cost']:.2f}x the reference loop per call vs baseline "
+                               f"{base['relative_cost']:.2f}x ({result['calls_per_sec']:,.0f} calls/s)")
+        if result["relative_p50"] > base["relative_p50"] * (1 + threshold):
+            regressions.append(f"{name}: p50 {result['relative_p50']:.2f}x the reference loop vs baseline "
+                               f"{base['relative_p50']:.2f}x ({result['p50_ns']:,} ns)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the clock and calendar engines.")
+    parser.add_argument("--engines", help="comma-separated engine names (default: all)")
+    parser.add_argument("--calls", type=int, default=DEFAULT_CALLS, help="calls per measurement")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS,
+                        help="passes per measurement; the best is kept (default 5)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown before a run fails, as a fraction (default 0.25)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_PATH, help="baseline JSON file")
+    parser.add_argument("--save", action="store_true", help="store this run as the new baseline")
+    options = parser.parse_args()
+
+    selected = options.engines.split(",") if options.engines else [name for name, _, _ in ENGINES]
+    unknown = set(selected) - {name for name, _, _ in ENGINES}
+    if unknown:
+        parser.error(f"unknown engines: {', '.join(sorted(unknown))}")
+
+    results = {}
+    print(f"{'engine':<34} {'calls/s':>12} {'p50 ns':>9} {'p99 ns':>9} {'vs ref':>7} {'alloc B/call':>13}")
+    for name, module_name, setup in ENGINES:
+        if name not in selected:
+            continue
+        try:
+            result = bench_engine(name, module_name, setup, options.calls, options.repeats)
+        except ImportError as e:
+            print(f"{name:<34} skipped ({e})")
+            continue
+        results[name] = result
+        print(f"{name:<34} {result['calls_per_sec']:>12,.0f} {result['p50_ns']:>9,} {result['p99_ns']:>9,} "
+              f"{result['relative_cost']:>6.2f}x {result['alloc_bytes_per_call']:>13,.0f}")
+
+    baseline = load_baseline(options.baseline)
+    if baseline is None or options.save:
+        if baseline is not None:
+            # Keep baselines for engines that were not part of this run.
+            results = {**baseline["engines"], **results}
+        save_baseline(options.baseline, results)
+        print(f"Baseline saved to {os.path.basename(options.baseline)}.")
+        return 0
+
+    regressions = find_regressions(results, baseline, options.threshold)
+    for regression in regressions:
+        print(f"[Regression] {regression}")
+    print(f"{len(regressions)} regressions beyond {options.threshold:.0%} of the baseline.")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,291 @@
+# frame_compositor.py
+#
+# Double-buffered terminal compositor for the live visualizers.
+#
+# Instead of clearing the screen (an os.system('clear') fork) and reprinting
+# every line each frame, a viewer prints its frame inside
+#
+#     with compositor.frame():
+#         print(...)
+#
+# and the compositor compares it with the previous frame, writing ANSI cursor
+# moves and text only for the cells that changed. Rows containing escape
+# sequences or wide characters (emoji, CJK) cannot be diffed cell by cell, so
+# a changed row of that kind is rewritten whole. Rows are cut to the terminal
+# width first: a row that wrapped would take two screen lines and throw every
+# later cursor move off by one. A stats line at the bottom
+# reports the frame rate, frame time and bytes written per second, plus the
+# jitter and missed deadlines of the viewer's FrameClock when one is given.
+#
+# `python frame_compositor.py` checks that frames wider than the terminal
+# still diff onto the right rows.
+
+import io
+import re
+import sys
+import time
+import shutil
+import unicodedata
+import contextlib
+
+CSI = "\x1b["
+HIDE_CURSOR = CSI + "?25l"
+SHOW_CURSOR = CSI + "?25h"
+CLEAR_SCREEN = CSI + "H" + CSI + "2J"
+CLEAR_TO_END_OF_LINE = CSI + "K"
+CLEAR_TO_END_OF_SCREEN = CSI + "J"
+
+# Rows made only of these characters occupy one terminal cell per character:
+# printable ASCII, Latin-1/Latin Extended letters, and box-drawing/block elements.
+_CELL_SAFE = re.compile(r"[\x20-\x7e\u00a0-\u024f\u2500-\u259f]*")
+_ESCAPE = re.compile(r"\x1b\[[0-9;?]*[ -/]*[@-~]")
+
+# Unchanged cells shorter than this between two changed runs are rewritten
+# rather than skipped, since a cursor move costs about as many bytes.
+RUN_MERGE_GAP = 6
+
+STATS_WINDOW = 1.0  # seconds per stats update
+
+
+def move_to(row, column):
+    """ANSI cursor move to a 0-based row and column."""
+    return f"{CSI}{row + 1};{column + 1}H"
+
+
+def clip_row(text, columns):
+    """Cuts a row to `columns` terminal cells. Escape sequences take no cells and are all kept."""
+    if len(text) <= columns and _CELL_SAFE.fullmatch(text):
+        return text
+    parts = []
+    cells = 0
+    position = 0
+    for match in _ESCAPE.finditer(text + "\x1b[m"):
+        for char in text[position:match.start()]:
+            if unicodedata.combining(char):
+                width = 0
+            else:
+                width = 2 if unicodedata.east_asian_width(char) in "WF" else 1
+            if cells + width > columns:
+                cells = columns + 1  # Full; nothing after the cut is shown
+                break
+            cells += width
+            parts.append(char)
+        if match.end() <= len(text):
+            parts.append(match.group())  # Colour resets after the cut still apply
+        position = match.end()
+    return "".join(parts)
+
+
+def diff_row(row, old, new):
+    """Returns the output that turns row `old` into row `new` on screen."""
+    if old == new:
+        return ""
+    if old is None or not (_CELL_SAFE.fullmatch(old) and _CELL_SAFE.fullmatch(new)):
+        # Clearing first: after a row that fills the last column, an erase would take that cell too.
+        return move_to(row, 0) + CLEAR_TO_END_OF_LINE + new
+
+    parts = []
+    common = min(len(old), len(new))
+    i = 0
+    while i < common:
+        if old[i] == new[i]:
+            i += 1
+            continue
+        # Extend the changed run until RUN_MERGE_GAP unchanged cells in a row.
+        start = i
+        end = j = i + 1
+        while j < common and j - end < RUN_MERGE_GAP:
+            if old[j] != new[j]:
+                end = j + 1
+            j += 1
+        parts.append(move_to(row, start) + new[start:end])
+        i = end
+
+    if len(new) > common:
+        parts.append(move_to(row, common) + new[common:])
+    elif len(old) > common:
+        parts.append(move_to(row, common) + CLEAR_TO_END_OF_LINE)
+    return "".join(parts)
+
+
+class FrameCompositor:
+    """Keeps the last frame on screen and redraws only what changed in the next one."""
+
+    def __init__(self, out=None, show_stats=True, frame_clock=None):
+        self.out = out or sys.stdout
+        self.show_stats = show_stats
+        self.frame_clock = frame_clock
+        self._previous = None  # Rows currently on screen; None forces a full redraw
+        self._size = None
+        self.stats_line = "stats: measuring..."
+        self._window_start = time.perf_counter()
+        self._window_frames = 0
+        self._window_bytes = 0
+        self._window_frame_time = 0.0
+        self._window_max_frame_time = 0.0
+
+    @contextlib.contextmanager
+    def frame(self):
+        """Captures everything printed in the block as the next frame, then draws it."""
+        started = time.perf_counter()
+        buffer = io.StringIO()
+        with contextlib.redirect_stdout(buffer):
+            yield
+        text = buffer.getvalue()
+        if text.endswith("\n"):
+            text = text[:-1]
+        self.render(text.split("\n"), started)
+
+    def render(self, lines, started=None):
+        """Draws a frame given as a list of rows."""
+        started = time.perf_counter() if started is None else started
+
+        size = shutil.get_terminal_size()
+        if size != self._size:
+            self._size = size
+            self._previous = None
+
+        rows = list(lines)
+        if self.show_stats:
+            rows.append(self.stats_line)
+        # Keep the bottom of a frame taller than the terminal, as scrolling would.
+        rows = [clip_row(row, size.columns) for row in rows[-size.lines:]]
+
+        if self._previous is None:
+            output = HIDE_CURSOR + CLEAR_SCREEN + "\r\n".join(rows)
+        else:
+            previous = self._previous
+            parts = [diff_row(row, previous[row] if row < len(previous) else None, new)
+                     for row, new in enumerate(rows)]
+            if len(previous) > len(rows):
+                parts.append(move_to(len(rows), 0) + CLEAR_TO_END_OF_SCREEN)
+            output = "".join(parts)
+        self._previous = rows
+
+        if output:
+            self.out.write(output)
+            self.out.flush()
+        self._record(len(output.encode("utf-8")), time.perf_counter() - started)
+
+    def _record(self, written, frame_time):
+        """Adds one frame to the stats window and refreshes the stats line once per window."""
+        self._window_frames += 1
+        self._window_bytes += written
+        self._window_frame_time += frame_time
+        self._window_max_frame_time = max(self._window_max_frame_time, frame_time)
+
+        elapsed = time.perf_counter() - self._window_start
+        if elapsed >= STATS_WINDOW:
+            self.stats_line = (
+                f"stats: {self._window_frames / elapsed:5.1f} fps | "
+                f"frame {self._window_frame_time / self._window_frames * 1000:6.2f} ms "
+                f"(max {self._window_max_frame_time * 1000:6.2f} ms) | "
+                f"{self._window_bytes / elapsed / 1024:8.1f} KiB/s written"
+            )
+            if self.frame_clock is not None:
+                clock = self.frame_clock
+                self.stats_line += (f" | jitter {clock.jitter_ms:5.2f} ms (max {clock.max_jitter_ms:5.2f} ms)"
+                                    f" | missed {clock.missed}")
+            self._window_start += elapsed
+            self._window_frames = 0
+            self._window_bytes = 0
+            self._window_frame_time = 0.0
+            self._window_max_frame_time = 0.0
+
+    def invalidate(self):
+        """Forces the next frame to be drawn in full (e.g. after other output)."""
+        self._previous = None
+
+    def close(self):
+        """Leaves the cursor visible on the line below the last frame."""
+        if self._previous is not None:
+            self.out.write(move_to(len(self._previous), 0) + SHOW_CURSOR)
+            self.out.flush()
+        self._previous = None
+
+
+# --- Self-check (python frame_compositor.py) ---
+
+class _Screen:
+    """A minimal terminal: the cursor moves and erases the compositor writes, with line wrap and scrolling."""
+
+    def __init__(self, columns, lines):
+        self.columns, self.lines = columns, lines
+        self.cells = [[" "] * columns for _ in range(lines)]
+        self.row = self.column = 0
+
+    def _newline(self):
+        self.row += 1
+        if self.row == self.lines:
+            self.cells = self.cells[1:] + [[" "] * self.columns]
+            self.row -= 1
+
+    def feed(self, text):
+        position = 0
+        for match in list(_ESCAPE.finditer(text)) + [None]:
+            for char in text[position:match.start() if match else len(text)]:
+                if char == "\r":
+                    self.column = 0
+                elif char == "\n":
+                    self._newline()
+                else:
+                    width = 2 if unicodedata.east_asian_width(char) in "WF" else 1
+                    if self.column + width > self.columns:  # Pending wrap, as on a real terminal
+                        self.column = 0
+                        self._newline()
+                    self.cells[self.row][self.column] = char
+                    if width == 2:
+                        self.cells[self.row][self.column + 1] = ""
+                    self.column += width
+            if match is None:
+                break
+            position = match.end()
+            sequence = match.group()
+            if sequence.endswith("H"):
+                row, _, column = sequence[2:-1].partition(";")
+                self.row, self.column = int(row or 1) - 1, int(column or 1) - 1
+            elif sequence == CLEAR_TO_END_OF_LINE:
+                start = min(self.column, self.columns - 1)  # At the right edge, the last cell goes too
+                self.cells[self.row][start:] = [" "] * (self.columns - start)
+            elif sequence == CSI + "2J":
+                self.cells = [[" "] * self.columns for _ in range(self.lines)]
+            elif sequence == CLEAR_TO_END_OF_SCREEN:
+                self.cells[self.row][self.column:] = [" "] * (self.columns - self.column)
+                for row in range(self.row + 1, self.lines):
+                    self.cells[row] = [" "] * self.columns
+
+    def text(self):
+        return ["".join(row).rstrip() for row in self.cells]
+
+
+def _check_wide_frames(columns=80, lines=24, width=90):
+    """Frames wider than the terminal must still be diffed onto the right rows, frame after frame."""
+    import os
+    os.environ["COLUMNS"], os.environ["LINES"] = str(columns), str(lines)
+    out = io.StringIO()
+    screen = _Screen(columns, lines)
+    compositor = FrameCompositor(out=out, show_stats=False)
+
+    def frame(tick):
+        return [
+            "=" * width,
+            f"tick {tick:04d} ".ljust(width, "."),
+            CSI + "93m" + f"colour {tick}".ljust(width, "#") + CSI + "0m",
+            ("日本" * width)[:width],
+            "|" + " " * (width - 2) + "|",
+            f"bottom {tick}",
+        ]
+
+    for tick in range(3):
+        compositor.render(frame(tick))
+        screen.feed(out.getvalue())
+        out.seek(0)
+        out.truncate()
+        expected = [_ESCAPE.sub("", clip_row(row, columns)).rstrip() for row in frame(tick)]
+        shown = screen.text()[:len(expected)]
+        assert shown == expected, f"frame {tick} is garbled:\n" + "\n".join(shown)
+    print(f"OK: {width}-column frames diff correctly on a {columns}x{lines} terminal.")
+
+
+if __name__ == "__main__":
+    _check_wide_frames()
@@ -0,0 +1,142 @@
+# loa_blobs.py
+#
+# Content-addressed store for LoA OS file bodies (loa_vfs.py, loa_os7_cpu.py).
+#
+# A file body is stored once, under the SHA-256 of its UTF-8 bytes, in
+# loa_blobs/<first two hex digits>/<rest of the hex digest>. Files with
+# identical contents share one blob, and the VFS tree records only the digest
+# and size of each file.
+#
+# Bodies are read from disk the first time they are needed (cat, running a
+# file) and kept in an LRU cache capped at max_bytes. The least recently used
+# bodies are evicted once the cap is exceeded. A body larger than the whole
+# cap is never cached.
+#
+# New blobs are written without fsync. sync() makes them durable and runs
+# just before a snapshot that refers to them is written; until then the
+# journal holds the same contents. collect() deletes blobs that no file
+# refers to any more.
+#
+# With directory=None the store keeps every body in memory (no eviction),
+# which is what a bare VirtualFS() uses.
+
+import os
+import hashlib
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+
+
+class BlobStore:
+    """SHA-256 addressed file bodies on disk with an LRU memory cache."""
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = DEFAULT_CACHE_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._cache: "OrderedDict[str, Tuple[str, int]]" = OrderedDict()  # digest -> (content, bytes)
+        self._memory: Dict[str, str] = {}  # Every blob, when there is no directory
+        self._unsynced: List[str] = []
+        self.cached_bytes = 0
+        self.hits = 0
+        self.loads = 0
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, digest: str) -> str:
+        return os.path.join(self.directory, digest[:2], digest[2:])
+
+    # --- Reading and Writing ---
+
+    def put(self, content: str) -> Tuple[str, int]:
+        """Stores `content` (once per distinct body); returns (digest, size in bytes)."""
+        data = content.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        if self.directory is None:
+            self._memory[digest] = content
+            return digest, len(data)
+
+        path = self._path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = path + ".tmp"
+            with open(temp_path, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, path)
+            self._unsynced.append(path)
+        self._remember(digest, content, len(data))
+        return digest, len(data)
+
+    def get(self, digest: str) -> Optional[str]:
+        """Returns the body stored under `digest`, or None if it is missing."""
+        if self.directory is None:
+            return self._memory.get(digest)
+
+        entry = self._cache.get(digest)
+        if entry is not None:
+            self._cache.move_to_end(digest)
+            self.hits += 1
+            return entry[0]
+        try:
+            with open(self._path(digest), "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        self.loads += 1
+        content = data.decode("utf-8")
+        self._remember(digest, content, len(data))
+        return content
+
+    def _remember(self, digest: str, content: str, size: int):
+        if digest in self._cache:
+            self._cache.move_to_end(digest)
+            return
+        if size > self.max_bytes:
+            return
+        self._cache[digest] = (content, size)
+        self.cached_bytes += size
+        self.evict()
+
+    def evict(self):
+        """Drops least recently used bodies until the cache fits in max_bytes."""
+        while self.cached_bytes > self.max_bytes and self._cache:
+            _, (_, size) = self._cache.popitem(last=False)
+            self.cached_bytes -= size
+
+    # --- Durability and Cleanup ---
+
+    def sync(self):
+        """Forces the blobs written since the last sync to disk."""
+        for path in self._unsynced:
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except OSError:
+                continue  # Collected meanwhile
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        self._unsynced = []
+
+    def collect(self, live: Iterable[str]) -> int:
+        """Deletes every blob whose digest is not in `live`; returns how many were removed."""
+        live = set(live)
+        if self.directory is None:
+            dead = [digest for digest in self._memory if digest not in live]
+            for digest in dead:
+                del self._memory[digest]
+            return len(dead)
+
+        removed = 0
+        for shard in os.listdir(self.directory):
+            shard_path = os.path.join(self.directory, shard)
+            if not os.path.isdir(shard_path):
+                continue
+            for name in os.listdir(shard_path):
+                if shard + name not in live:
+                    os.remove(os.path.join(shard_path, name))
+                    entry = self._cache.pop(shard + name, None)
+                    if entry is not None:
+                        self.cached_bytes -= entry[1]
+                    removed += 1
+        return removed
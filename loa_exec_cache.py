@@ -0,0 +1,279 @@
+# loa_exec_cache.py
+#
+# Execution and build cache for VFS files run through host tools in LoA OS
+# (`gcc prog.c`, `py script.py`, `node app.js`; see loa_os7_cpu.py).
+#
+# Sources: a host tool needs a real file, so the VFS file is written out once
+# per distinct body to loa_exec_cache/src/<blob digest>/<name>. The digest is
+# the one the blob store already keeps for the file (loa_blobs.py), so a
+# repeated run neither hashes nor writes anything; it just reuses the file.
+#
+# Builds: a successful gcc run is stored in loa_exec_cache/build/<key>/ (the
+# output file plus result.json with the compiler's stdout, stderr and exit
+# code, and the output's size and SHA-256). The key is the SHA-256 of the
+# toolchain (resolved path, size and mtime of the compiler binary), the
+# command line, and the source digest. A repeated build replays the recorded
+# messages and copies the stored output to where gcc would have written it,
+# so nothing is compiled. The copy is never linked to the stored file, so
+# writing to it cannot change the cache, and a stored output that no longer
+# matches its recorded hash is dropped and rebuilt. Headers from the host
+# are not part of the key; `cache clear` drops stale builds after changing
+# them.
+#
+# Entries (one source digest or one build) are evicted least recently used
+# first once their total size exceeds max_bytes. The order and the hit/miss
+# counters are kept in loa_exec_cache/index.json, written by close();
+# entries the index does not know about are picked up from disk.
+
+import os
+import json
+import shutil
+import hashlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+EXEC_CACHE_DIR = "loa_exec_cache"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+INDEX_FILE = "index.json"
+RESULT_FILE = "result.json"
+OUTPUT_FILE = "output"
+COUNTERS = ("source_hits", "source_misses", "build_hits", "build_misses", "evictions")
+
+
+def compiler_output(argv: List[str], source_name: str) -> Tuple[List[str], Optional[str]]:
+    """
+    Splits gcc's output file out of `argv`: returns (argv without -o, the
+    file gcc would write), where that file is None when the output goes to
+    stdout (-E).
+    """
+    rest, output = [], None
+    skip = False
+    for i, arg in enumerate(argv):
+        if skip:
+            skip = False
+        elif arg == '-o' and i + 1 < len(argv):
+            output, skip = argv[i + 1], True
+        elif arg.startswith('-o') and len(arg) > 2:
+            output = arg[2:]
+        else:
+            rest.append(arg)
+    if output is None:
+        stem = os.path.splitext(source_name)[0]
+        if '-E' in rest:
+            return rest, None
+        output = stem + '.o' if '-c' in rest else stem + '.s' if '-S' in rest else 'a.out'
+    return rest, output
+
+
+def _file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _tree_bytes(path: str) -> int:
+    total = 0
+    for root, _, names in os.walk(path):
+        for name in names:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+
+class ExecCache:
+    """Materialized VFS sources and compiled artifacts on disk, evicted LRU by total size."""
+
+    def __init__(self, directory: str = EXEC_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = os.path.abspath(directory)
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, int]" = OrderedDict()  # 'src/<digest>' or 'build/<key>' -> bytes, oldest use first
+        self._toolchains: Dict[str, Optional[str]] = {}
+        self.total_bytes = 0
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self._load()
+
+    # --- Index ---
+
+    def _load(self):
+        try:
+            with open(os.path.join(self.directory, INDEX_FILE), 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            index = {}
+        for name in COUNTERS:
+            self.counters[name] = index.get('counters', {}).get(name, 0)
+
+        on_disk = {}
+        for kind in ('src', 'build'):
+            kind_dir = os.path.join(self.directory, kind)
+            if os.path.isdir(kind_dir):
+                for entry in os.scandir(kind_dir):
+                    if entry.is_dir() and not entry.name.endswith('.tmp'):
+                        on_disk[f"{kind}/{entry.name}"] = entry.stat().st_mtime
+        known = {key: size for key, size in index.get('entries', []) if key in on_disk}
+        for key in sorted(set(on_disk) - set(known), key=on_disk.get):
+            self._entries[key] = _tree_bytes(os.path.join(self.directory, key))
+        for key, size in known.items():
+            self._entries[key] = size  # The index lists entries oldest use first
+        self.total_bytes = sum(self._entries.values())
+
+    def close(self):
+        """Saves the LRU order and the counters."""
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, INDEX_FILE)
+        temp_path = path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'entries': list(self._entries.items()), 'counters': self.counters}, f)
+        os.replace(temp_path, path)
+
+    def _touch(self, key: str, size: Optional[int] = None):
+        if size is not None:
+            self.total_bytes += size - self._entries.get(key, 0)
+            self._entries[key] = size
+        self._entries.move_to_end(key)
+
+    # --- Sources ---
+
+    def source(self, digest: str, name: str, read: Callable[[], Optional[str]]) -> Optional[str]:
+        """
+        Returns the host path of the file `name` with body `digest`, writing
+        it with `read()` only if it is not cached. None if `read()` fails.
+        """
+        key = f"src/{digest}"
+        path = os.path.join(self.directory, key, name)
+        if key in self._entries and os.path.exists(path):
+            self.counters['source_hits'] += 1
+            self._touch(key)
+            return path
+
+        content = read()
+        if content is None:
+            return None
+        self.counters['source_misses'] += 1
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(temp_path, path)
+        self._touch(key, self._entries.get(key, 0) + os.path.getsize(path))
+        return path
+
+    # --- Builds ---
+
+    def toolchain(self, command: str) -> Optional[str]:
+        """Identifies the host binary behind `command` (path, size, mtime); None if it is not installed."""
+        if command not in self._toolchains:
+            path = shutil.which(command)
+            if path is None:
+                return None
+            path = os.path.realpath(path)
+            stat = os.stat(path)
+            self._toolchains[command] = f"{path}:{stat.st_size}:{stat.st_mtime_ns}"
+        return self._toolchains[command]
+
+    @staticmethod
+    def build_key(toolchain: str, argv: List[str], source_digest: str) -> str:
+        return hashlib.sha256(json.dumps([toolchain, argv, source_digest]).encode('utf-8')).hexdigest()
+
+    def lookup_build(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns the stored result of a build ({'stdout', 'stderr', 'returncode'}),
+        or None. An entry whose output file no longer matches its recorded size
+        and hash is dropped.
+        """
+        entry = f"build/{key}"
+        if entry in self._entries:
+            try:
+                with open(os.path.join(self.directory, entry, RESULT_FILE), 'r', encoding='utf-8') as f:
+                    result = json.load(f)
+                if not self._output_intact(entry, result):
+                    result = None
+            except (OSError, ValueError):
+                result = None
+            if result is not None:
+                self.counters['build_hits'] += 1
+                self._touch(entry)
+                return result
+            self._remove(entry)
+        self.counters['build_misses'] += 1
+        return None
+
+    def _output_intact(self, entry: str, result: Dict[str, Any]) -> bool:
+        path = os.path.join(self.directory, entry, OUTPUT_FILE)
+        if not os.path.exists(path):
+            return 'output_sha256' not in result
+        return (os.path.getsize(path) == result.get('output_bytes')
+                and _file_sha256(path) == result.get('output_sha256'))
+
+    def build_directory(self, key: str) -> str:
+        """
+        A fresh scratch directory for a build, which writes its output file to
+        OUTPUT_FILE inside it; store_build() keeps it, discard_build() drops it.
+        """
+        path = os.path.join(self.directory, 'build', f"{key}.{os.getpid()}.tmp")
+        shutil.rmtree(path, ignore_errors=True)
+        os.makedirs(path)
+        return path
+
+    def store_build(self, key: str, scratch: str, result: Dict[str, Any]):
+        """Keeps a finished build: `scratch` holds its output file, `result` the messages to replay."""
+        output = os.path.join(scratch, OUTPUT_FILE)
+        if os.path.exists(output):
+            result = dict(result, output_bytes=os.path.getsize(output), output_sha256=_file_sha256(output))
+        with open(os.path.join(scratch, RESULT_FILE), 'w', encoding='utf-8') as f:
+            json.dump(result, f)
+        path = os.path.join(self.directory, 'build', key)
+        shutil.rmtree(path, ignore_errors=True)
+        os.replace(scratch, path)
+        self._touch(f"build/{key}", _tree_bytes(path))
+
+    @staticmethod
+    def discard_build(scratch: str):
+        shutil.rmtree(scratch, ignore_errors=True)
+
+    def install_output(self, key: str, target: str):
+        """Copies a stored build output to `target`, replacing whatever is there in one rename."""
+        stored = os.path.join(self.directory, 'build', key, OUTPUT_FILE)
+        temp_path = os.path.join(os.path.dirname(os.path.abspath(target)), f".{os.path.basename(target)}.{os.getpid()}.tmp")
+        try:
+            shutil.copy2(stored, temp_path)
+            os.replace(temp_path, target)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    # --- Eviction and Statistics ---
+
+    def _remove(self, key: str):
+        shutil.rmtree(os.path.join(self.directory, key), ignore_errors=True)
+        self.total_bytes -= self._entries.pop(key, 0)
+
+    def evict(self) -> int:
+        """Drops least recently used entries until the cache fits in max_bytes; returns how many went."""
+        removed = 0
+        while self.total_bytes > self.max_bytes and self._entries:
+            self._remove(next(iter(self._entries)))
+            removed += 1
+        self.counters['evictions'] += removed
+        return removed
+
+    def clear(self) -> int:
+        """Deletes every entry and resets the counters; returns how many entries there were."""
+        count = len(self._entries)
+        for key in list(self._entries):
+            self._remove(key)
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        return count
+
+    def stats(self) -> Dict[str, Any]:
+        """The counters plus the number of cached sources and builds and their total size."""
+        sources = sum(1 for key in self._entries if key.startswith('src/'))
+        stats = dict(self.counters)
+        stats.update(sources=sources, builds=len(self._entries) - sources,
+                     bytes=self.total_bytes, max_bytes=self.max_bytes)
+        return stats
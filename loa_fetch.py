@@ -0,0 +1,191 @@
+# loa_fetch.py
+#
+# Pooled, cached web queries for LoA OS `fetch-web` (loa_os7_cpu.py).
+#
+# All queries share one requests.Session, so connections to the endpoint are
+# kept alive and reused (up to POOL_SIZE at once). Failed requests (connection
+# errors, 429 and 5xx answers) are retried by urllib3 with exponential backoff.
+#
+# Answers are cached on disk in WEB_CACHE_DIR, one JSON file per query, named
+# by the SHA-256 of the endpoint and the normalized query (case-folded, with
+# runs of whitespace collapsed), so "What is  LoA?" and "what is loa?" share an
+# entry. An entry is used for ttl seconds after it was fetched; an expired
+# entry is deleted when it is looked up, and storing an answer sweeps out all
+# expired entries (at most once per ttl), so the directory does not grow
+# without bound. clear_cache() (`fetch-web --clear-cache`) deletes them all.
+#
+# fetch_many() runs several queries on a thread pool and yields the answers in
+# query order as soon as each (and every one before it) is ready.
+#
+# The endpoint is a parameter, so the whole path can be tested against a local
+# stub server that answers with the same JSON shape as the Gemini API.
+
+import os
+import re
+import json
+import time
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+WEB_CACHE_DIR = "loa_web_cache"
+DEFAULT_TTL = 3600  # seconds
+POOL_SIZE = 8
+TIMEOUT = 20  # seconds
+RETRIES = 2
+
+SYSTEM_PROMPT = "You are a concise, helpful research assistant in an experimental OS environment. Provide the answer in a single paragraph, and do not use greetings or sign-offs."
+
+
+def normalize_query(query: str) -> str:
+    return re.sub(r"\s+", " ", query).strip().casefold()
+
+
+def parse_answer(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Extracts {'text', 'sources'} from a generateContent response."""
+    candidate = (result.get('candidates') or [{}])[0]
+    text = (candidate.get('content', {}).get('parts') or [{}])[0].get('text', 'API response was empty.')
+    sources = []
+    grounding_metadata = candidate.get('groundingMetadata')
+    if grounding_metadata and grounding_metadata.get('groundingAttributions'):
+        sources = [
+            f"{s.get('web', {}).get('title')} ({s.get('web', {}).get('uri')})"
+            for s in grounding_metadata['groundingAttributions']
+        ]
+    return {'text': text, 'sources': sources}
+
+
+class WebFetcher:
+    """Sends grounded queries to a generateContent endpoint through a pooled session and a disk cache."""
+
+    def __init__(self, endpoint: str, cache_dir: Optional[str] = WEB_CACHE_DIR, ttl: float = DEFAULT_TTL,
+                 pool_size: int = POOL_SIZE):
+        self.endpoint = endpoint
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self._pruned_at = 0.0
+        self.pool_size = pool_size
+        self.session = requests.Session()
+        self.session.headers['Content-Type'] = 'application/json'
+        retry = Retry(total=RETRIES, backoff_factor=1, status_forcelist=(429, 500, 502, 503, 504),
+                      allowed_methods=None, raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    # --- Cache ---
+
+    def _cache_path(self, query: str) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        key = hashlib.sha256(f"{self.endpoint}\n{normalize_query(query)}".encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, key + ".json")
+
+    def cached(self, query: str) -> Optional[Dict[str, Any]]:
+        """Returns the cached answer for `query` if it is younger than the TTL."""
+        path = self._cache_path(query)
+        if path is None or self.ttl <= 0:
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - entry.get('fetched_at', 0) > self.ttl:
+            self._remove(path)
+            return None
+        return entry
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass  # Already gone (another thread got there first)
+
+    def _store(self, query: str, answer: Dict[str, Any]):
+        path = self._cache_path(query)
+        if path is None:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.{id(answer)}.tmp"  # Unique per thread, so concurrent stores do not collide
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(answer, f)
+        os.replace(temp_path, path)
+        if 0 < self.ttl < time.time() - self._pruned_at:
+            self.prune_cache()
+
+    def prune_cache(self) -> int:
+        """Deletes cached answers older than the TTL (by file modification time); returns how many went."""
+        self._pruned_at = now = time.time()
+        if not self.cache_dir or not os.path.isdir(self.cache_dir):
+            return 0
+        removed = 0
+        for entry in os.scandir(self.cache_dir):
+            try:
+                expired = entry.name.endswith('.json') and now - entry.stat().st_mtime > self.ttl
+            except OSError:
+                continue
+            if expired:
+                self._remove(entry.path)
+                removed += 1
+        return removed
+
+    def clear_cache(self) -> int:
+        """Deletes every cached answer; returns how many there were."""
+        if not self.cache_dir or not os.path.isdir(self.cache_dir):
+            return 0
+        names = [name for name in os.listdir(self.cache_dir) if name.endswith('.json')]
+        for name in names:
+            os.remove(os.path.join(self.cache_dir, name))
+        return len(names)
+
+    # --- Fetching ---
+
+    def fetch(self, query: str, use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Answers one query: {'query', 'text', 'sources', 'fetched_at', 'cached',
+        'elapsed'}, or {'query', 'error', 'elapsed'} if it failed.
+        """
+        start = time.perf_counter()
+        entry = self.cached(query) if use_cache else None
+        if entry is not None:
+            entry.update(query=query, cached=True, elapsed=time.perf_counter() - start)
+            return entry
+
+        payload = {
+            "contents": [{"parts": [{"text": query}]}],
+            "tools": [{"google_search": {}}],
+            "systemInstruction": {"parts": [{"text": SYSTEM_PROMPT}]}
+        }
+        try:
+            response = self.session.post(self.endpoint, json=payload, timeout=TIMEOUT)
+            response.raise_for_status()
+            answer = parse_answer(response.json())
+        except (requests.exceptions.RequestException, ValueError) as e:
+            return {'query': query, 'error': str(e), 'elapsed': time.perf_counter() - start}
+
+        answer['fetched_at'] = time.time()
+        try:
+            self._store(query, answer)
+        except OSError:
+            pass  # Caching is best effort
+        answer.update(query=query, cached=False, elapsed=time.perf_counter() - start)
+        return answer
+
+    def fetch_many(self, queries: List[str], jobs: int = 1, use_cache: bool = True) -> Iterator[Dict[str, Any]]:
+        """Answers several queries, up to `jobs` (at most the pool size) at a time, yielding them in query order."""
+        jobs = min(jobs, len(queries), self.pool_size)
+        if jobs <= 1:
+            for query in queries:
+                yield self.fetch(query, use_cache)
+            return
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            yield from executor.map(lambda query: self.fetch(query, use_cache), queries)
+
+    def close(self):
+        self.session.close()
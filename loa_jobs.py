@@ -0,0 +1,228 @@
+# loa_jobs.py
+#
+# Background job pool for LoA OS `run-bg` (loa_os7_cpu.py).
+#
+# Jobs are host processes started with subprocess.Popen, at most max_running
+# at a time; the rest wait in a FIFO queue. Each job runs in its own session,
+# so `kill` can signal its whole process group and Ctrl-C in the shell does not
+# reach it. stdout and stderr go to files in JOB_DIR (loa_jobs/<id>.out and
+# .err) rather than pipes, so a job keeps running and logging after the shell
+# exits, and the next shell picks it up again with adopt().
+#
+# One monitor thread reaps finished children with os.wait4() (which also gives
+# their CPU time), samples their RSS from /proc to record its peak (ru_maxrss
+# would count the Python process the child was forked from), watches adopted
+# processes through /proc, and starts queued jobs as slots free up. It never
+# touches shell state: changes are queued as events, and the shell applies
+# them with events() between commands.
+
+import os
+import signal
+import threading
+import subprocess
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+
+JOB_DIR = "loa_jobs"
+MAX_RUNNING = 4
+POLL_INTERVAL = 0.2  # seconds
+
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def read_proc_stats(pid: int) -> Optional[Dict[str, Any]]:
+    """
+    Reads state, CPU seconds (including waited-for children), RSS bytes and
+    start time (clock ticks after boot) from /proc/<pid>/stat. Returns None
+    if the process is gone or there is no /proc.
+    """
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as f:
+            stat = f.read().decode("ascii", "replace")
+    except OSError:
+        return None
+    fields = stat[stat.rindex(")") + 2:].split()  # fields[0] is field 3 (state) of proc(5)
+    return {
+        "state": fields[0],
+        "cpu_seconds": sum(int(value) for value in fields[11:15]) / CLOCK_TICKS,
+        "start_ticks": int(fields[19]),
+        "rss_bytes": int(fields[21]) * PAGE_SIZE,
+    }
+
+
+def exit_status(returncode: Optional[int]) -> str:
+    """Status text for a finished job: 'Done', 'Exit 2', 'SIGTERM', or 'Lost' when the code is unknown."""
+    if returncode is None:
+        return "Lost"
+    if returncode < 0:
+        try:
+            return signal.Signals(-returncode).name
+        except ValueError:
+            return f"Signal {-returncode}"
+    return "Done" if returncode == 0 else f"Exit {returncode}"
+
+
+class JobPool:
+    """Runs queued commands as host processes, a bounded number at a time."""
+
+    def __init__(self, directory: str = JOB_DIR, max_running: int = MAX_RUNNING,
+                 poll_interval: float = POLL_INTERVAL):
+        self.directory = directory
+        self.max_running = max_running
+        self.poll_interval = poll_interval
+
+        self._queue: "deque[Tuple[int, List[str]]]" = deque()
+        self._children: Dict[int, subprocess.Popen] = {}
+        self._adopted: Dict[int, Tuple[int, int]] = {}  # job ID -> (host PID, start ticks)
+        self._peak_rss: Dict[int, int] = {}  # job ID -> largest RSS seen
+        self._events: List[Tuple[int, Dict[str, Any]]] = []
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    def log_paths(self, job_id: int) -> Tuple[str, str]:
+        """The host files receiving a job's stdout and stderr."""
+        return (os.path.join(self.directory, f"{job_id}.out"),
+                os.path.join(self.directory, f"{job_id}.err"))
+
+    # --- Submitting and Signalling ---
+
+    def submit(self, job_id: int, argv: List[str]):
+        """Queues a command; it starts at once if a slot is free."""
+        with self._condition:
+            self._queue.append((job_id, argv))
+            self._start_ready()
+            self._ensure_thread()
+
+    def adopt(self, job_id: int, host_pid: int, start_ticks: int) -> bool:
+        """Watches a job started by an earlier shell. Returns False if that process is gone."""
+        stats = read_proc_stats(host_pid)
+        if stats is None or stats["start_ticks"] != start_ticks or stats["state"] == "Z":
+            return False  # Exited, or the PID now belongs to something else
+        with self._condition:
+            self._adopted[job_id] = (host_pid, start_ticks)
+            self._ensure_thread()
+        return True
+
+    def cancel(self, job_id: int) -> bool:
+        """Drops a job that is still queued."""
+        with self._condition:
+            for i, (queued_id, _) in enumerate(self._queue):
+                if queued_id == job_id:
+                    del self._queue[i]
+                    return True
+        return False
+
+    def send_signal(self, job_id: int, sig: int) -> Optional[int]:
+        """Sends `sig` to a running job's process group; returns the host PID, or None if it is not running."""
+        with self._condition:
+            if job_id in self._children:
+                host_pid = self._children[job_id].pid
+            elif job_id in self._adopted:
+                host_pid = self._adopted[job_id][0]
+            else:
+                return None
+        try:
+            os.killpg(host_pid, sig)
+        except ProcessLookupError:
+            return None
+        except PermissionError:
+            os.kill(host_pid, sig)  # Not a group leader we may signal; the process alone
+        return host_pid
+
+    def events(self) -> List[Tuple[int, Dict[str, Any]]]:
+        """Returns and clears the (job ID, changed fields) events since the last call."""
+        with self._condition:
+            events, self._events = self._events, []
+        return events
+
+    def shutdown(self):
+        """Stops the monitor thread. Running jobs carry on; a later shell can adopt them."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+        for child in self._children.values():
+            child.returncode = 0  # Not ours to wait for any more; keeps Popen from warning
+
+    # --- Monitor Thread ---
+
+    def _ensure_thread(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="loa-jobs", daemon=True)
+            self._thread.start()
+
+    def _start_ready(self):
+        """Starts queued jobs while slots are free (lock held)."""
+        while self._queue and len(self._children) + len(self._adopted) < self.max_running:
+            job_id, argv = self._queue.popleft()
+            out_path, err_path = self.log_paths(job_id)
+            os.makedirs(self.directory, exist_ok=True)
+            with open(out_path, "ab") as out, open(err_path, "ab") as err:
+                try:
+                    child = subprocess.Popen(argv, stdin=subprocess.DEVNULL, stdout=out, stderr=err,
+                                             start_new_session=True)
+                except OSError as e:
+                    err.write(f"{argv[0]}: {e.strerror}\n".encode("utf-8"))
+                    self._events.append((job_id, {"status": exit_status(127), "returncode": 127, "end_time": time.time()}))
+                    continue
+            self._children[job_id] = child
+            stats = read_proc_stats(child.pid)
+            self._events.append((job_id, {
+                "status": "Running",
+                "host_pid": child.pid,
+                "start_ticks": stats["start_ticks"] if stats else None,
+                "started_at": time.time(),
+            }))
+
+    def _run(self):
+        while True:
+            with self._condition:
+                if self._closed:
+                    return
+                self._condition.wait(self.poll_interval)
+                if self._closed:
+                    return
+                self._reap()
+                self._start_ready()
+
+    def _reap(self):
+        """Records jobs that have finished (lock held)."""
+        for job_id, child in list(self._children.items()):
+            try:
+                pid, status, usage = os.wait4(child.pid, os.WNOHANG)
+            except ChildProcessError:
+                pid, status, usage = child.pid, None, None
+            if pid == 0:
+                self._sample(job_id, child.pid)
+                continue
+            del self._children[job_id]
+            returncode = os.waitstatus_to_exitcode(status) if status is not None else None
+            child.returncode = returncode if returncode is not None else 0
+            changes = {"status": exit_status(returncode), "returncode": returncode, "end_time": time.time()}
+            if usage is not None:
+                changes["cpu_seconds"] = usage.ru_utime + usage.ru_stime
+            if job_id in self._peak_rss:
+                changes["max_rss_bytes"] = self._peak_rss.pop(job_id)
+            self._events.append((job_id, changes))
+
+        for job_id, (host_pid, start_ticks) in list(self._adopted.items()):
+            stats = read_proc_stats(host_pid)
+            if stats is None or stats["start_ticks"] != start_ticks or stats["state"] == "Z":
+                # Not our child, so the exit code went to whoever reaped it.
+                del self._adopted[job_id]
+                changes = {"status": "Finished", "returncode": None, "end_time": time.time()}
+                if job_id in self._peak_rss:
+                    changes["max_rss_bytes"] = self._peak_rss.pop(job_id)
+                self._events.append((job_id, changes))
+            else:
+                self._sample(job_id, host_pid, stats)
+
+    def _sample(self, job_id: int, host_pid: int, stats: Optional[Dict[str, Any]] = None):
+        """Updates a running job's peak RSS from /proc."""
+        stats = stats or read_proc_stats(host_pid)
+        if stats is not None and stats["rss_bytes"] > self._peak_rss.get(job_id, 0):
+            self._peak_rss[job_id] = stats["rss_bytes"]
@@ -0,0 +1,178 @@
+# loa_journal.py
+#
+# Write-ahead journal for LoA OS state (loa_os7_cpu.py).
+#
+# Every state change (mkdir, rm, edit, cd, setvar, run-bg, kill) is appended
+# to loa_state.journal as one JSON line carrying a sequence number; job logs,
+# whose bodies are already in the blob store, are recorded by digest and size
+# (edit-blob). Each line is handed to the OS as soon as it is written, so it
+# survives the shell crashing. A background thread fsyncs the journal in batches (every
+# SYNC_RECORDS lines or SYNC_INTERVAL seconds), so a power loss costs at most
+# that window, and no command waits for the disk.
+#
+# The state files (loa_vfs_state.json, loa_env_state.json, loa_proc_state.json)
+# are the snapshot. When the journal grows past COMPACT_RATIO of the snapshot
+# size, the shell writes a new snapshot and empties the journal. Each file is
+# written to a temporary name, fsynced, and renamed over the old one. The
+# process file carries the sequence number the snapshot includes and is
+# renamed last. On startup only journal lines newer than that number are
+# replayed. Every operation sets a path or key to a value, so replaying a
+# line over a state that already contains it changes nothing. A crash in the
+# middle of compaction therefore loses nothing.
+#
+# A torn final line (a crash mid-write) is dropped when the journal is opened.
+
+import os
+import json
+import atexit
+import threading
+from typing import Any, Dict, List
+
+JOURNAL_FILE = "loa_state.journal"
+SYNC_RECORDS = 64
+SYNC_INTERVAL = 1.0  # seconds
+COMPACT_MIN_BYTES = 256 * 1024
+COMPACT_RATIO = 0.5  # Compact once the journal is this large relative to the snapshot
+
+
+def write_atomic(path: str, text: str):
+    """Replaces `path` with `text` so readers see either the old file or the complete new one."""
+    temp_path = path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+def fsync_directory(path: str):
+    """Makes renames inside the directory of `path` durable (a no-op where directories cannot be opened)."""
+    try:
+        fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class StateJournal:
+    """Append-only JSON-lines journal with batched fsync."""
+
+    def __init__(self, path: str = JOURNAL_FILE, sync_records: int = SYNC_RECORDS,
+                 sync_interval: float = SYNC_INTERVAL):
+        self.path = path
+        self.sync_records = sync_records
+        self.sync_interval = sync_interval
+        self.seq = 0
+
+        self._file = None
+        self._condition = threading.Condition()
+        self._unsynced = 0
+        self._closed = False
+        self._thread = None
+
+    # --- Opening and Replay ---
+
+    def open(self, snapshot_seq: int) -> List[Dict[str, Any]]:
+        """
+        Opens the journal for appending and returns the records newer than
+        `snapshot_seq`, oldest first. A torn final line is cut off.
+        """
+        records = []
+        self.seq = snapshot_seq
+        good_bytes = 0
+        if os.path.exists(self.path):
+            with open(self.path, "rb") as f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        break
+                    good_bytes += len(line)
+                    if record["seq"] > snapshot_seq:
+                        records.append(record)
+                        self.seq = record["seq"]
+
+        self._file = open(self.path, "ab")
+        if self._file.tell() > good_bytes:
+            self._file.truncate(good_bytes)
+        self._thread = threading.Thread(target=self._run, name="journal:loa_state", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+        return records
+
+    # --- Appending ---
+
+    def append(self, op: str, **fields: Any) -> int:
+        """Writes one record and returns its sequence number; fsync happens in the background."""
+        with self._condition:
+            self.seq += 1
+            record = {"seq": self.seq, "op": op}
+            record.update(fields)
+            self._file.write((json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8"))
+            self._file.flush()
+            self._unsynced += 1
+            if self._unsynced >= self.sync_records:
+                self._condition.notify_all()
+            return self.seq
+
+    def sync(self):
+        """Forces every appended record to disk before returning."""
+        with self._condition:
+            if self._file is None or self._file.closed:
+                return
+            self._unsynced = 0
+            os.fsync(self._file.fileno())
+
+    @property
+    def size(self) -> int:
+        """Bytes currently in the journal."""
+        with self._condition:
+            return self._file.tell() if self._file else 0
+
+    def needs_compaction(self, snapshot_bytes: int) -> bool:
+        return self.size >= max(COMPACT_MIN_BYTES, COMPACT_RATIO * snapshot_bytes)
+
+    def reset(self):
+        """Empties the journal once a snapshot including every record is safely on disk."""
+        with self._condition:
+            self._file.truncate(0)
+            self._file.seek(0)
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+
+    def close(self):
+        """Syncs the remaining records and stops the background thread."""
+        with self._condition:
+            if self._closed or self._file is None:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+        with self._condition:
+            os.fsync(self._file.fileno())
+            self._file.close()
+        atexit.unregister(self.close)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                if not self._closed and self._unsynced < self.sync_records:
+                    self._condition.wait(self.sync_interval)
+                if self._closed:
+                    return
+                if not self._unsynced:
+                    continue
+                self._unsynced = 0
+                fd = self._file.fileno()
+            # Outside the lock, so commands keep appending while the disk catches up.
+            try:
+                os.fsync(fd)
+            except OSError:
+                pass  # The file was closed meanwhile; close() syncs it itself.
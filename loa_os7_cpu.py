@@ -1,10 +1,17 @@
 import json
 import os
+import re
+import signal
 import subprocess
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import time
-import requests # Required for the fetch-web command simulation
-import fnmatch # For wildcard matching in 'find'
+
+from loa_vfs import VirtualFS, Inode, resolve_path
+from loa_journal import StateJournal, JOURNAL_FILE, write_atomic, fsync_directory
+from loa_blobs import BlobStore, DEFAULT_CACHE_BYTES
+from loa_jobs import JobPool, JOB_DIR, MAX_RUNNING, read_proc_stats
+from loa_fetch import WebFetcher, WEB_CACHE_DIR, DEFAULT_TTL
+from loa_exec_cache import ExecCache, EXEC_CACHE_DIR, DEFAULT_MAX_BYTES, OUTPUT_FILE, compiler_output
 
 # --- Configuration and Persistence ---
 APP_NAME = "LoA OS 9ehd (Python)"
@@ -13,6 +20,19 @@ PROMPT_CHAR = "λ"
 VFS_SAVE_FILE = "loa_vfs_state.json"
 ENV_SAVE_FILE = "loa_env_state.json"
 PROC_SAVE_FILE = "loa_proc_state.json" # New file for process persistence
+# The three files above are the snapshot; changes since then are in JOURNAL_FILE (see loa_journal.py).
+BLOB_DIR = "loa_blobs" # File bodies, by SHA-256 (see loa_blobs.py)
+BLOB_CACHE_VAR = "BLOB_CACHE_MB" # Environment variable capping the memory used by cached file bodies
+JOB_SLOTS_VAR = "JOB_SLOTS" # Environment variable: how many run-bg jobs may run at once
+JOB_LOG_DIR = "/var/log" # VFS directory receiving run-bg output (job-<PID>.out / .err)
+JOB_LOG_PATTERN = re.compile(re.escape(JOB_LOG_DIR) + r"/job-(\d+)\.(?:out|err)")
+JOB_LOG_LIMIT = 256 * 1024 # Only the last this many bytes of a job's output are kept in the VFS
+MAX_FINISHED_JOBS = 20 # Finished jobs listed by 'ps' before the oldest are dropped
+ACTIVE_JOB_STATUSES = ('Queued', 'Running')
+FETCH_URL_VAR = "FETCH_URL" # Environment variable overriding the fetch-web endpoint (e.g. a local stub server)
+WEB_CACHE_TTL_VAR = "WEB_CACHE_TTL" # Environment variable: seconds a cached fetch-web answer stays fresh (0 disables the cache)
+EXEC_CACHE_VAR = "EXEC_CACHE_MB" # Environment variable capping the disk used by cached sources and builds (see loa_exec_cache.py)
+RESOURCE_VARS = (BLOB_CACHE_VAR, JOB_SLOTS_VAR, FETCH_URL_VAR, WEB_CACHE_TTL_VAR, EXEC_CACHE_VAR) # Applied by _apply_resource_limits()
 
 # Gemini API Configuration Placeholder
 # The API key is left empty as per the guidelines, relying on the canvas environment.
@@ -41,7 +61,8 @@ class LoAOS:
     simulated process management.
     """
     def __init__(self):
-        self.vfs: Dict[str, Any] = {}
+        self.blobs = BlobStore(BLOB_DIR)
+        self.vfs = VirtualFS(self.blobs)
         self.env: Dict[str, str] = {}
         self.processes: Dict[int, Dict[str, Any]] = {} # PID -> Process details
         self._next_pid_counter = 100 
@@ -53,6 +74,12 @@ class LoAOS:
             "py": "python3"
         }
         self.is_running = True
+        self.journal = StateJournal(JOURNAL_FILE)
+        self.job_pool = JobPool(JOB_DIR)
+        self.fetcher = WebFetcher(API_URL_TEMPLATE, WEB_CACHE_DIR)
+        self.exec_cache = ExecCache(EXEC_CACHE_DIR)
+        self._log_sizes: Dict[Tuple[int, str], int] = {}  # (PID, 'out'/'err') -> host log size last copied to the VFS
+        self._snapshot_bytes = 0
         
         self._initialize_state()
 
@@ -68,31 +95,19 @@ class LoAOS:
                 print(f"{Colors.FAIL}Warning: Could not load {filename}. Error: {e}{Colors.ENDC}")
         return default_val if default_val is not None else {}
 
-    def _save_state(self, data: Any, filename: str):
-        """Saves state to a JSON file."""
-        try:
-            with open(filename, 'w') as f:
-                json.dump(data, f, indent=4)
-        except IOError as e:
-            print(f"{Colors.FAIL}Error: Could not save {filename}. Error: {e}{Colors.ENDC}")
-
     def _initialize_state(self):
         """Sets up default VFS, environment, and processes or loads persistence."""
         
         # 1. Load VFS
         loaded_vfs = self._load_state(VFS_SAVE_FILE)
+        new_snapshot = not loaded_vfs
         if loaded_vfs:
-            self.vfs = loaded_vfs
+            self.vfs = VirtualFS.from_tree(loaded_vfs, self.blobs)
             print(f"{Colors.OKGREEN}VFS loaded from {VFS_SAVE_FILE}.{Colors.ENDC}")
         else:
-            self.vfs = {
-                '/': {'type': 'dir', 'contents': {
-                    'home': {'type': 'dir', 'contents': {}},
-                    'bin': {'type': 'dir', 'contents': {}},
-                    'etc': {'type': 'dir', 'contents': {}}
-                }}
-            }
-            self._get_dir_node('/home')['contents']['user'] = {'type': 'dir', 'contents': {}}
+            self.vfs = VirtualFS(self.blobs)
+            for directory in ('/home', '/bin', '/etc', '/home/user'):
+                self.vfs.mkdir(directory)
             self._create_vfs_file("/home/user/readme.txt", f"Welcome to {APP_NAME} {VERSION}!")
             self._create_vfs_file("/home/user/long_task.py", "# Simulated long-running script\nimport time\nprint('Starting long task...')\ntime.sleep(60)\nprint('Task complete.')")
             print(f"{Colors.WARNING}Creating new VFS file: {VFS_SAVE_FILE}.{Colors.ENDC}")
@@ -107,6 +122,7 @@ class LoAOS:
                 "VERSION": VERSION
             }
             print(f"{Colors.WARNING}Creating new ENV file: {ENV_SAVE_FILE}.{Colors.ENDC}")
+        self._apply_resource_limits()
         
         # 3. Load Processes and PID counter
         loaded_proc = self._load_state(PROC_SAVE_FILE, default_val={'processes': {}, 'next_pid': 100})
@@ -115,86 +131,139 @@ class LoAOS:
         
         # 4. Load/Set Current Path
         self.current_path = self.env.get("CURRENT_PATH", "/home/user")
-        
-    def save_all_state(self):
-        """Saves VFS, ENV, and Process state."""
+
+        # 5. Replay the journal written since the snapshot
+        self._snapshot_bytes = sum(os.path.getsize(f) for f in (VFS_SAVE_FILE, ENV_SAVE_FILE, PROC_SAVE_FILE) if os.path.exists(f))
+        records = self.journal.open(loaded_proc.get('journal_seq', 0))
+        for record in records:
+            self._apply_record(record)
+        if records:
+            print(f"{Colors.OKGREEN}Replayed {len(records)} change(s) from {JOURNAL_FILE}.{Colors.ENDC}")
+        if new_snapshot or self.vfs.upgraded:
+            # A first snapshot, or one that stores file bodies as blobs rather than inline
+            self.compact_state()
+
+        # 6. Pick up background jobs left by the previous session
+        self._resume_jobs()
+
+    def _apply_resource_limits(self):
+        """
+        Applies BLOB_CACHE_MB (memory for cached file bodies), JOB_SLOTS
+        (concurrent run-bg jobs), FETCH_URL / WEB_CACHE_TTL (fetch-web), and
+        EXEC_CACHE_MB (disk for cached sources and builds).
+        """
+        try:
+            self.blobs.max_bytes = int(float(self.env[BLOB_CACHE_VAR]) * 1024 * 1024)
+        except (KeyError, ValueError):
+            self.blobs.max_bytes = DEFAULT_CACHE_BYTES
+        self.blobs.evict()
+        try:
+            self.job_pool.max_running = max(1, int(self.env[JOB_SLOTS_VAR]))
+        except (KeyError, ValueError):
+            self.job_pool.max_running = MAX_RUNNING
+        self.fetcher.endpoint = self.env.get(FETCH_URL_VAR) or API_URL_TEMPLATE
+        try:
+            self.fetcher.ttl = float(self.env[WEB_CACHE_TTL_VAR])
+        except (KeyError, ValueError):
+            self.fetcher.ttl = DEFAULT_TTL
+        try:
+            self.exec_cache.max_bytes = int(float(self.env[EXEC_CACHE_VAR]) * 1024 * 1024)
+        except (KeyError, ValueError):
+            self.exec_cache.max_bytes = DEFAULT_MAX_BYTES
+        self.exec_cache.evict()
+
+    def _journal(self, op: str, **fields: Any):
+        """Records a state change in the journal, compacting it into a snapshot when it has grown large."""
+        try:
+            self.journal.append(op, **fields)
+            if self.journal.needs_compaction(self._snapshot_bytes):
+                self.compact_state()
+        except (IOError, OSError) as e:
+            print(f"{Colors.FAIL}Error: Could not write {JOURNAL_FILE}. Error: {e}{Colors.ENDC}")
+
+    def _apply_record(self, record: Dict[str, Any]):
+        """Re-applies one journal record on startup."""
+        op = record['op']
+        if op == 'mkdir':
+            self.vfs.mkdir(record['path'])
+        elif op == 'edit':
+            self.vfs.write_file(record['path'], record['content'])
+        elif op == 'edit-blob':
+            self.vfs.write_blob(record['path'], record['blob'], record['size'])
+        elif op == 'rm':
+            self.vfs.remove(record['path'])
+        elif op == 'cd':
+            self.current_path = record['path']
+        elif op == 'setvar':
+            self.env[record['key']] = record['value']
+            if record['key'] in RESOURCE_VARS:
+                self._apply_resource_limits()
+        elif op in ('run-bg', 'job'):
+            proc = record['proc']
+            self.processes[proc['pid']] = proc
+            self._next_pid_counter = max(self._next_pid_counter, proc['pid'] + 1)
+        elif op in ('reap', 'kill'):  # 'kill' removed the entry in journals from before real jobs
+            self.processes.pop(record['pid'], None)
+
+    def compact_state(self) -> bool:
+        """Writes VFS, ENV, and Process state as a new snapshot and empties the journal."""
         self.env["CURRENT_PATH"] = self.current_path
-        self._save_state(self.vfs, VFS_SAVE_FILE)
-        self._save_state(self.env, ENV_SAVE_FILE)
-        
-        # Save process state
         proc_state = {
             'processes': self.processes,
-            'next_pid': self._next_pid_counter
+            'next_pid': self._next_pid_counter,
+            'journal_seq': self.journal.seq
         }
-        self._save_state(proc_state, PROC_SAVE_FILE)
+        snapshot = [
+            (VFS_SAVE_FILE, json.dumps(self.vfs.to_tree())),
+            (ENV_SAVE_FILE, json.dumps(self.env, indent=4)),
+            (PROC_SAVE_FILE, json.dumps(proc_state, indent=4))  # Last: its journal_seq marks the snapshot complete
+        ]
+        try:
+            self.blobs.sync()
+            for filename, text in snapshot:
+                write_atomic(filename, text)
+            fsync_directory(PROC_SAVE_FILE)
+            self.journal.reset()
+            self.blobs.collect(self.vfs.live_blobs())
+        except (IOError, OSError) as e:
+            print(f"{Colors.FAIL}Error: Could not write snapshot. Error: {e}{Colors.ENDC}")
+            return False
+        self._snapshot_bytes = sum(len(text) for _, text in snapshot)
+        return True
+
+    def save_all_state(self):
+        """Saves VFS, ENV, and Process state: syncs the journal, compacting it if it is due."""
+        self._collect_jobs()
+        self.job_pool.shutdown()
+        self.fetcher.close()
+        try:
+            self.exec_cache.close()
+        except OSError as e:
+            print(f"{Colors.FAIL}Warning: Could not save the {EXEC_CACHE_DIR} index. Error: {e}{Colors.ENDC}")
+        if self.journal.needs_compaction(self._snapshot_bytes):
+            self.compact_state()
+        self.journal.close()
 
     # --- VFS Utilities ---
 
     def _resolve_path(self, path_str: str) -> str:
         """Converts relative paths to absolute, resolving '..', '.'."""
-        if path_str.startswith('/'):
-            target_path = path_str
-        else:
-            target_path = os.path.join(self.current_path, path_str)
-
-        target_path = os.path.normpath(target_path)
-        
-        if target_path == '.':
-            target_path = '/' if self.current_path == '/' else self.current_path
-        elif not target_path.startswith('/'):
-             target_path = '/' + target_path
-             
-        return target_path
-
-    def _get_node(self, path: str) -> Optional[Dict[str, Any]]:
-        """Traverses the VFS dictionary to find a node."""
-        path = self._resolve_path(path).strip('/')
-        if path == "":
-            return self.vfs.get('/')
-        
-        current_node = self.vfs.get('/')
-        if not current_node: return None
+        return resolve_path(self.current_path, path_str)
 
-        components = path.split('/')
-        
-        for comp in components:
-            if comp in current_node.get('contents', {}):
-                current_node = current_node['contents'][comp]
-            else:
-                return None
-        return current_node
+    def _get_node(self, path: str) -> Optional[Inode]:
+        """Finds a VFS node through the inode table's path cache."""
+        return self.vfs.node(self._resolve_path(path))
 
-    def _get_dir_node(self, path: str) -> Optional[Dict[str, Any]]:
+    def _get_dir_node(self, path: str) -> Optional[Inode]:
         """Returns a VFS node if it exists and is a directory."""
         node = self._get_node(path)
-        if node and node.get('type') == 'dir':
+        if node and node.is_dir:
             return node
         return None
 
-    def _get_parent_and_name(self, path: str) -> Optional[tuple[Dict[str, Any], str]]:
-        """Returns the parent directory node and the name of the target item."""
-        path = self._resolve_path(path)
-        parent_path = os.path.dirname(path)
-        name = os.path.basename(path)
-        
-        if parent_path == '/':
-            parent_node = self.vfs.get('/')
-        else:
-            parent_node = self._get_dir_node(parent_path)
-        
-        if parent_node and parent_node.get('type') == 'dir' and name:
-            return parent_node, name
-        return None
-
     def _create_vfs_file(self, path: str, content: str):
-        """Helper to create or overwrite a file."""
-        result = self._get_parent_and_name(path)
-        if result:
-            parent_node, name = result
-            parent_node['contents'][name] = {'type': 'file', 'content': content}
-            return True
-        return False
+        """Helper to create or overwrite a file (a directory is never overwritten)."""
+        return self.vfs.write_file(self._resolve_path(path), content) is not None
         
     # --- VFS Commands (Retained from A5) ---
 
@@ -206,6 +275,7 @@ class LoAOS:
 
         if target_node:
             self.current_path = resolved_path
+            self._journal('cd', path=resolved_path)
             print(f"{Colors.OKGREEN}VFS directory changed to: {Colors.OKBLUE}{self.current_path}{Colors.ENDC}")
         else:
             print(f"{Colors.FAIL}Error: VFS directory not found or is a file: {target_path}{Colors.ENDC}")
@@ -216,17 +286,15 @@ class LoAOS:
         if args:
             path_to_list = self._resolve_path(args[0])
 
-        target_node = self._get_dir_node(path_to_list)
+        self._refresh_job_logs(path_to_list)
+        items = self.vfs.listdir(path_to_list)
 
-        if target_node:
+        if items is not None:
             print(f"{Colors.UNDERLINE}Contents of VFS {path_to_list}:{Colors.ENDC}")
-            contents = target_node.get('contents', {})
-            items = sorted(contents.items())
-            
             for name, node in items:
-                if node.get('type') == 'dir':
+                if node.is_dir:
                     print(f"{Colors.OKBLUE}{name}/{Colors.ENDC}")
-                elif node.get('type') == 'file':
+                else:
                     print(f"{Colors.OKGREEN}{name}{Colors.ENDC}")
             print(f"{Colors.HEADER}------------------------------------------------------------{Colors.ENDC}")
         else:
@@ -245,10 +313,8 @@ class LoAOS:
             print(f"{Colors.WARNING}Warning: VFS item '{dirname}' already exists.{Colors.ENDC}")
             return
         
-        result = self._get_parent_and_name(full_path)
-        if result:
-            parent_node, name = result
-            parent_node['contents'][name] = {'type': 'dir', 'contents': {}}
+        if self.vfs.mkdir(full_path) is not None:
+            self._journal('mkdir', path=full_path)
             print(f"{Colors.OKGREEN}Directory '{dirname}' created in VFS.{Colors.ENDC}")
         else:
             print(f"{Colors.FAIL}Error: Cannot create directory in the parent path.{Colors.ENDC}")
@@ -262,30 +328,28 @@ class LoAOS:
         target_name = args[0]
         full_path = self._resolve_path(os.path.join(self.current_path, target_name))
 
-        result = self._get_parent_and_name(full_path)
-        if not result:
+        if full_path == '/':
             print(f"{Colors.FAIL}Error: VFS item '{target_name}' not found or is root.{Colors.ENDC}")
             return
-        
-        parent_node, name = result
-        target_node = parent_node['contents'].get(name)
+
+        target_node = self.vfs.node(full_path)
 
         if not target_node:
             print(f"{Colors.FAIL}Error: VFS item '{target_name}' not found.{Colors.ENDC}")
             return
 
-        if target_node.get('type') == 'dir':
-            if target_node['contents']:
+        if target_node.is_dir:
+            if target_node.children:
                 print(f"{Colors.FAIL}Error: Directory '{target_name}' is not empty. Cannot remove.{Colors.ENDC}")
                 return
             else:
-                del parent_node['contents'][name]
+                self.vfs.remove(full_path)
+                self._journal('rm', path=full_path)
                 print(f"{Colors.OKGREEN}VFS directory '{target_name}' removed.{Colors.ENDC}")
-        elif target_node.get('type') == 'file':
-            del parent_node['contents'][name]
-            print(f"{Colors.OKGREEN}VFS file '{target_name}' removed.{Colors.ENDC}")
         else:
-             print(f"{Colors.FAIL}Error: Unknown item type for '{target_name}'.{Colors.ENDC}")
+            self.vfs.remove(full_path)
+            self._journal('rm', path=full_path)
+            print(f"{Colors.OKGREEN}VFS file '{target_name}' removed.{Colors.ENDC}")
 
     def cmd_cat(self, args: List[str]):
         """Display contents of a VFS file (cat)."""
@@ -295,18 +359,23 @@ class LoAOS:
         
         filename = args[0]
         full_path = self._resolve_path(os.path.join(self.current_path, filename))
+        self._refresh_job_logs(full_path)
         target_node = self._get_node(full_path)
         
         if not target_node:
             print(f"{Colors.FAIL}Error: VFS item '{filename}' not found.{Colors.ENDC}")
             return
             
-        if target_node.get('type') == 'dir':
+        if target_node.is_dir:
             print(f"{Colors.FAIL}Error: Cannot 'cat' a directory.{Colors.ENDC}")
             return
         
         print(f"{Colors.OKCYAN}--- VFS File: {filename} ---{Colors.ENDC}")
-        print(target_node.get('content', ''))
+        content = self.vfs.read(target_node)
+        if content is None:
+            print(f"{Colors.FAIL}Error: Contents of '{filename}' are missing from {BLOB_DIR}.{Colors.ENDC}")
+        else:
+            print(content)
         print(f"{Colors.OKCYAN}--------------------------{Colors.ENDC}")
 
     def cmd_edit(self, args: List[str]):
@@ -321,77 +390,221 @@ class LoAOS:
         full_path = self._resolve_path(os.path.join(self.current_path, filename))
 
         if self._create_vfs_file(full_path, content):
+            self._journal('edit', path=full_path, content=content)
             print(f"{Colors.OKGREEN}VFS file '{filename}' created/updated successfully.{Colors.ENDC}")
         else:
             print(f"{Colors.FAIL}Error: Could not edit file at path: {full_path}{Colors.ENDC}")
             
-    def _vfs_walk(self, node: Dict[str, Any], current_path: str, pattern: str, results: List[str]):
-        """Recursively walks the VFS to find nodes matching a pattern."""
-        if 'contents' in node:
-            for name, child_node in node['contents'].items():
-                full_path = os.path.join(current_path, name)
-                
-                if fnmatch.fnmatch(name, pattern):
-                    if child_node['type'] == 'dir':
-                        results.append(f"{Colors.OKBLUE}{full_path}/{Colors.ENDC}")
-                    else:
-                        results.append(f"{Colors.OKGREEN}{full_path}{Colors.ENDC}")
-                
-                if child_node['type'] == 'dir':
-                    self._vfs_walk(child_node, full_path, pattern, results)
-
+    FIND_USAGE = "Usage: find [path] [name_pattern] [-name P] [-type f|d] [-path P] [-maxdepth N] [-size [+|-]N[c|k|M|G]]"
+    SIZE_UNITS = {'c': 1, 'k': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+
+    def _parse_size_test(self, text: str):
+        """Turns a find -size argument (+N more than, -N less than, N about; c/k/M/G units, bytes by default) into a test."""
+        sign = text[0] if text[:1] in ('+', '-') else ''
+        number = text[len(sign):]
+        unit = self.SIZE_UNITS.get(number[-1:], None)
+        if unit is None:
+            unit = 1
+        else:
+            number = number[:-1]
+        count = int(number)
+        if sign == '+':
+            return lambda size: size > count * unit
+        if sign == '-':
+            return lambda size: size < count * unit
+        return lambda size: -(-size // unit) == count  # Rounded up to whole units, as find does
 
     def cmd_find(self, args: List[str]):
-        """Recursively searches the VFS for files/directories matching a name pattern."""
+        """Searches the VFS through its name index, printing matches as they are found."""
         if not args:
-            print(f"{Colors.FAIL}Usage: find <name_pattern> (e.g., find *.py or find user){Colors.ENDC}")
+            print(f"{Colors.FAIL}{self.FIND_USAGE} (e.g., find *.py or find /home -type f -size +1k){Colors.ENDC}")
             return
-        
-        pattern = args[0]
-        
-        print(f"{Colors.WARNING}Searching VFS for items matching '{pattern}'...{Colors.ENDC}")
-        
-        results: List[str] = []
-        self._vfs_walk(self.vfs.get('/'), "/", pattern, results)
-        
-        if results:
-            for result in sorted(results):
-                print(result)
-        else:
-            print(f"{Colors.WARNING}No VFS items found matching '{pattern}'.{Colors.ENDC}")
+
+        start, name = None, None
+        options: Dict[str, Any] = {}
+        try:
+            i = 0
+            while i < len(args):
+                arg = args[i]
+                if arg in ('-name', '-type', '-path', '-maxdepth', '-size'):
+                    value = args[i + 1]
+                    i += 2
+                    if arg == '-name':
+                        name = value
+                    elif arg == '-type':
+                        options['node_type'] = {'f': 'file', 'd': 'dir'}[value]
+                    elif arg == '-path':
+                        options['path_pattern'] = value
+                    elif arg == '-maxdepth':
+                        options['max_depth'] = int(value)
+                    else:
+                        options['size_test'] = self._parse_size_test(value)
+                elif start is None and name is None and ('/' in arg or arg in ('.', '..')):
+                    # A basename never contains '/', so this is where to search from
+                    start = arg
+                    i += 1
+                elif name is None:
+                    name = arg
+                    i += 1
+                else:
+                    raise ValueError(arg)
+        except (IndexError, KeyError, ValueError):
+            print(f"{Colors.FAIL}{self.FIND_USAGE}{Colors.ENDC}")
+            return
+
+        start_path = self._resolve_path(start) if start else "/"
+        if not self._get_dir_node(start_path):
+            print(f"{Colors.FAIL}Error: VFS directory not found or is a file: {start}{Colors.ENDC}")
+            return
+
+        print(f"{Colors.WARNING}Searching VFS {start_path} for items matching '{name or '*'}'...{Colors.ENDC}")
+        found = 0
+        for full_path, node in self.vfs.find(start_path, name, **options):
+            found += 1
+            if node.is_dir:
+                print(f"{Colors.OKBLUE}{full_path}/{Colors.ENDC}")
+            else:
+                print(f"{Colors.OKGREEN}{full_path}{Colors.ENDC}")
+
+        if not found:
+            print(f"{Colors.WARNING}No VFS items found matching '{name or '*'}'.{Colors.ENDC}")
         print(f"{Colors.HEADER}------------------------------------------------------------{Colors.ENDC}")
 
 
     # --- Process Management Commands (NEW in V7) ---
 
     def cmd_run_bg(self, args: List[str]):
-        """Simulates running a VFS file or command in the background."""
+        """Runs a command or VFS file as a background job on the host (see loa_jobs.py)."""
         if not args:
             print(f"{Colors.FAIL}Usage: run-bg <command_and_args>{Colors.ENDC}")
             return
 
+        command, command_args = args[0], args[1:]
+        host_command, tool_name, vfs_file = self._route_external_tool(command, command_args)
         pid = self._next_pid_counter
+        argv = [host_command] + command_args
+        script = None
+        if vfs_file:
+            # The job outlives this command (and maybe this shell), so the file goes next to its logs.
+            os.makedirs(JOB_DIR, exist_ok=True)
+            script = os.path.abspath(os.path.join(JOB_DIR, f"{pid}_{os.path.basename(vfs_file)}"))
+            if not self._materialize_vfs_file(vfs_file, script):
+                return
+            argv = self._command_with_file(argv, vfs_file, script)
         self._next_pid_counter += 1
-        
-        command_str = " ".join(args)
-        
-        # Check if the command is an internal command alias for a VFS file (e.g., 'py long_task.py')
-        # This is a simulation: the command won't *actually* run, but we track it.
-        
+
         self.processes[pid] = {
             'pid': pid,
             'user': self.env.get('USER', 'loa_user'),
-            'command': command_str,
-            'status': 'Running',
-            'start_time': time.time()
+            'command': " ".join(args),
+            'status': 'Queued',
+            'start_time': time.time(),
+            'argv': argv,
+            'script': script
         }
-        
-        print(f"{Colors.OKGREEN}Process launched in background: PID {pid}{Colors.ENDC}")
-        print(f"{Colors.WARNING}Use 'ps' to view and 'kill {pid}' to terminate the simulated process.{Colors.ENDC}")
+        self._journal('run-bg', proc=self.processes[pid])
+        self.job_pool.submit(pid, argv)
+        self._collect_jobs()
+
+        status = self.processes[pid]['status']
+        print(f"{Colors.OKGREEN}Process launched in background ({tool_name}): PID {pid} [{status}]{Colors.ENDC}")
+        print(f"{Colors.WARNING}Output goes to {JOB_LOG_DIR}/job-{pid}.out and .err. Use 'ps' to view and 'kill {pid}' to terminate it.{Colors.ENDC}")
+
+    def _collect_jobs(self):
+        """Applies job status changes from the pool and copies the output of finished jobs into the VFS."""
+        for pid, changes in self.job_pool.events():
+            proc = self.processes.get(pid)
+            if proc is not None:
+                proc.update(changes)
+                self._journal('job', proc=proc)
+
+        for pid, proc in list(self.processes.items()):
+            if proc.get('status') not in ACTIVE_JOB_STATUSES:
+                # A running job's output is copied only when read (see _refresh_job_logs).
+                self._sync_job_logs(pid)
+                # Final output is in the VFS now; the host files are no longer needed.
+                for path in self.job_pool.log_paths(pid) + (proc.get('script'),):
+                    if path and os.path.exists(path):
+                        os.remove(path)
+                self._log_sizes.pop((pid, 'out'), None)
+                self._log_sizes.pop((pid, 'err'), None)
+
+        finished = sorted(pid for pid, proc in self.processes.items() if proc.get('status') not in ACTIVE_JOB_STATUSES)
+        for pid in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self.processes[pid]
+            self._journal('reap', pid=pid)
+
+    def _refresh_job_logs(self, path: str):
+        """Brings the logs of running jobs up to date before `path` (a log, or JOB_LOG_DIR itself) is read."""
+        match = JOB_LOG_PATTERN.fullmatch(path)
+        if match is None and path != JOB_LOG_DIR:
+            return
+        pids = [int(match.group(1))] if match else list(self.processes)
+        for pid in pids:
+            if self.processes.get(pid, {}).get('status') == 'Running':
+                self._sync_job_logs(pid)
+
+    def _sync_job_logs(self, pid: int):
+        """
+        Copies a job's host stdout/stderr files (their last JOB_LOG_LIMIT bytes)
+        into the VFS when they have grown. The body goes to the blob store
+        anyway, so the journal records only its digest and size.
+        """
+        for stream, host_path in zip(('out', 'err'), self.job_pool.log_paths(pid)):
+            try:
+                size = os.path.getsize(host_path)
+            except OSError:
+                continue
+            if self._log_sizes.get((pid, stream)) == size:
+                continue
+            with open(host_path, 'rb') as f:
+                if size > JOB_LOG_LIMIT:
+                    f.seek(size - JOB_LOG_LIMIT)
+                content = f.read(JOB_LOG_LIMIT).decode('utf-8', 'replace')
+            self._log_sizes[(pid, stream)] = size
+
+            self._make_vfs_dirs(JOB_LOG_DIR)
+            log_path = f"{JOB_LOG_DIR}/job-{pid}.{stream}"
+            ino = self.vfs.write_file(log_path, content)
+            if ino is not None:
+                node = self.vfs.inodes[ino]
+                self.blobs.sync()  # The record must not outlive the blob it names
+                self._journal('edit-blob', path=log_path, blob=node.blob, size=node.size)
+
+    def _make_vfs_dirs(self, path: str):
+        """Creates a VFS directory and any missing parents (like mkdir -p)."""
+        current = ''
+        for name in path.strip('/').split('/'):
+            current += '/' + name
+            if self.vfs.node(current) is None and self.vfs.mkdir(current) is not None:
+                self._journal('mkdir', path=current)
+
+    def _resume_jobs(self):
+        """Re-attaches jobs still running from the previous session and restarts the queue."""
+        for pid, proc in sorted(self.processes.items()):
+            if proc.get('status') != 'Running':
+                continue
+            if not (proc.get('host_pid') and self.job_pool.adopt(pid, proc['host_pid'], proc.get('start_ticks'))):
+                # Ended while the shell was down (or was simulated by an older version): its exit code is gone.
+                proc.update({'status': 'Finished' if proc.get('host_pid') else 'Lost', 'end_time': time.time()})
+                self._journal('job', proc=proc)
+        for pid, proc in sorted(self.processes.items()):
+            if proc.get('status') == 'Queued' and proc.get('argv'):
+                self.job_pool.submit(pid, proc['argv'])
+        self._collect_jobs()
+
+    def _format_bytes(self, count: Optional[float]) -> str:
+        if count is None:
+            return '-'
+        for unit in ('B', 'K', 'M', 'G'):
+            if count < 1024 or unit == 'G':
+                return f"{count:.0f}{unit}" if unit == 'B' else f"{count:.1f}{unit}"
+            count /= 1024
 
     def cmd_ps(self, args: List[str]):
-        """Lists currently running simulated processes."""
-        print(f"{Colors.UNDERLINE}Simulated Process Status:{Colors.ENDC}")
+        """Lists background jobs with CPU time and memory read from /proc (or recorded when they exited)."""
+        self._collect_jobs()
+        print(f"{Colors.UNDERLINE}Background Process Status:{Colors.ENDC}")
         
         if not self.processes:
             print(f"{Colors.WARNING}No background processes currently running.{Colors.ENDC}")
@@ -399,38 +612,72 @@ class LoAOS:
             return
 
         # Header
-        print(f"{Colors.BOLD}{'PID':<5} {'USER':<10} {'STATUS':<10} {'RUNTIME':<10} {'COMMAND'}{Colors.ENDC}")
+        print(f"{Colors.BOLD}{'PID':<5} {'HOST':<8} {'USER':<10} {'STATUS':<10} {'CPU':>8} {'RSS':>7} {'RUNTIME':<8} {'COMMAND'}{Colors.ENDC}")
         
+        now = time.time()
         for pid, proc in sorted(self.processes.items()):
-            runtime_seconds = int(time.time() - proc['start_time'])
+            status = proc['status']
+            cpu_seconds = proc.get('cpu_seconds')
+            rss = proc.get('max_rss_bytes')
+            if status == 'Running' and proc.get('host_pid'):
+                stats = read_proc_stats(proc['host_pid'])
+                if stats is not None:
+                    cpu_seconds, rss = stats['cpu_seconds'], stats['rss_bytes']
+                    if stats['state'] == 'T':
+                        status = 'Stopped'
+
+            started = proc.get('started_at', proc['start_time'])
+            runtime_seconds = 0 if status == 'Queued' else int(proc.get('end_time', now) - started)
             runtime_str = f"{runtime_seconds // 60:02d}:{runtime_seconds % 60:02d}"
+            cpu_str = '-' if cpu_seconds is None else f"{cpu_seconds:.2f}s"
+            color = Colors.OKGREEN if status in ('Running', 'Done') else Colors.WARNING if status in ('Queued', 'Stopped') else Colors.FAIL
             
             print(
                 f"{proc['pid']:<5} "
+                f"{str(proc.get('host_pid') or '-'):<8} "
                 f"{proc['user']:<10} "
-                f"{Colors.OKGREEN}{proc['status']:<10}{Colors.ENDC} "
-                f"{runtime_str:<10} "
+                f"{color}{status:<10}{Colors.ENDC} "
+                f"{cpu_str:>8} "
+                f"{self._format_bytes(rss):>7} "
+                f"{runtime_str:<8} "
                 f"{Colors.OKCYAN}{proc['command']}{Colors.ENDC}"
             )
         print(f"{Colors.HEADER}------------------------------------------------------------{Colors.ENDC}")
 
     def cmd_kill(self, args: List[str]):
-        """Terminates a simulated process by PID."""
+        """Sends a signal (SIGTERM by default) to a background job, or cancels it if it is still queued."""
         if not args:
-            print(f"{Colors.FAIL}Usage: kill <PID>{Colors.ENDC}")
+            print(f"{Colors.FAIL}Usage: kill [-SIGNAL] <PID>  (e.g., kill 100, kill -9 100, kill -STOP 100){Colors.ENDC}")
             return
+
+        sig = signal.SIGTERM
+        if len(args) > 1 and args[0].startswith('-'):
+            name = args[0][1:].upper()
+            try:
+                sig = signal.Signals(int(name)) if name.isdigit() else signal.Signals[name if name.startswith('SIG') else 'SIG' + name]
+            except (KeyError, ValueError):
+                print(f"{Colors.FAIL}Error: Unknown signal '{args[0][1:]}'.{Colors.ENDC}")
+                return
+            args = args[1:]
             
         try:
             pid_to_kill = int(args[0])
         except ValueError:
             print(f"{Colors.FAIL}Error: PID must be a number.{Colors.ENDC}")
             return
-            
-        if pid_to_kill in self.processes:
-            del self.processes[pid_to_kill]
-            print(f"{Colors.OKGREEN}Successfully terminated simulated process with PID {pid_to_kill}.{Colors.ENDC}")
-        else:
+
+        self._collect_jobs()
+        proc = self.processes.get(pid_to_kill)
+        if proc is None:
             print(f"{Colors.FAIL}Error: Process with PID {pid_to_kill} not found.{Colors.ENDC}")
+        elif proc['status'] == 'Queued' and self.job_pool.cancel(pid_to_kill):
+            proc.update({'status': 'Cancelled', 'end_time': time.time()})
+            self._journal('job', proc=proc)
+            print(f"{Colors.OKGREEN}Cancelled queued process with PID {pid_to_kill}.{Colors.ENDC}")
+        elif proc['status'] == 'Running' and self.job_pool.send_signal(pid_to_kill, sig) is not None:
+            print(f"{Colors.OKGREEN}Sent {sig.name} to PID {pid_to_kill} (host PID {proc['host_pid']}).{Colors.ENDC}")
+        else:
+            print(f"{Colors.WARNING}Process with PID {pid_to_kill} is not running ({proc['status']}).{Colors.ENDC}")
 
     # --- Environment Commands (Retained from A5) ---
 
@@ -445,6 +692,9 @@ class LoAOS:
         value = key_value[1]
         
         self.env[key] = value
+        self._journal('setvar', key=key, value=value)
+        if key in RESOURCE_VARS:
+            self._apply_resource_limits()
         print(f"{Colors.OKGREEN}Set environment variable {key}={value} (will persist){Colors.ENDC}")
 
 
@@ -455,6 +705,11 @@ class LoAOS:
             print(f"{Colors.OKCYAN}{key}={value}{Colors.ENDC}")
         print(f"{Colors.HEADER}------------------------------------------------------------{Colors.ENDC}")
 
+    def cmd_sync(self, args: List[str]):
+        """Compacts the journal into a fresh snapshot now."""
+        if self.compact_state():
+            print(f"{Colors.OKGREEN}Snapshot written to {VFS_SAVE_FILE}, {ENV_SAVE_FILE}, and {PROC_SAVE_FILE}; journal emptied.{Colors.ENDC}")
+
     def cmd_whoami(self, args: List[str]):
         """Displays the current VFS user."""
         print(f"{Colors.OKGREEN}{self.env.get('USER', 'unknown_user')}{Colors.ENDC}")
@@ -463,100 +718,186 @@ class LoAOS:
         """Displays the VFS hostname."""
         print(f"{Colors.OKGREEN}{self.env.get('HOSTNAME', 'localhost')}{Colors.ENDC}")
         
+    def cmd_cache(self, args: List[str]):
+        """Shows the execution cache's size and hit/miss counters (cache stats), or empties it (cache clear)."""
+        if args == ['clear']:
+            count = self.exec_cache.clear()
+            print(f"{Colors.OKGREEN}Removed {count} cached source(s) and build(s) from {EXEC_CACHE_DIR}.{Colors.ENDC}")
+            return
+        if args not in ([], ['stats']):
+            print(f"{Colors.FAIL}Usage: cache [stats|clear]{Colors.ENDC}")
+            return
+
+        stats = self.exec_cache.stats()
+        print(f"{Colors.BOLD}Execution cache ({EXEC_CACHE_DIR}):{Colors.ENDC} {stats['sources']} source(s), {stats['builds']} build(s), "
+              f"{self._format_bytes(stats['bytes'])} of {self._format_bytes(stats['max_bytes'])} ({EXEC_CACHE_VAR})")
+        for label, kind in (("Sources", "source"), ("Builds", "build")):
+            hits, misses = stats[f'{kind}_hits'], stats[f'{kind}_misses']
+            rate = f"{100 * hits / (hits + misses):.0f}%" if hits + misses else "-"
+            print(f"  {label:<8} {Colors.OKGREEN}{hits} hit(s){Colors.ENDC}, {Colors.WARNING}{misses} miss(es){Colors.ENDC} (hit rate {rate})")
+        print(f"  {'Evicted':<8} {stats['evictions']} entr{'y' if stats['evictions'] == 1 else 'ies'}")
+
     # --- Network/API Command (Retained from A5) ---
 
     def cmd_fetch_web(self, args: List[str]):
-        """Fetches grounded text from the Gemini API (simulated network access)."""
-        if not args:
-            print(f"{Colors.FAIL}Usage: fetch-web <query for Google Search/Gemini>{Colors.ENDC}")
+        """
+        Fetches grounded text from the Gemini API (simulated network access).
+        fetch-web [-j N] [-f] q1 ; q2 ; ... runs up to N queries at once;
+        -f ignores cached answers. Answers are cached for WEB_CACHE_TTL seconds.
+        fetch-web --clear-cache deletes every cached answer.
+        """
+        if args == ['--clear-cache']:
+            count = self.fetcher.clear_cache()
+            print(f"{Colors.OKGREEN}Removed {count} cached answer(s) from {WEB_CACHE_DIR}.{Colors.ENDC}")
             return
-            
-        user_query = " ".join(args)
-        
-        print(f"{Colors.WARNING}Sending grounded query to LoA Nexus (Gemini API)...{Colors.ENDC}")
-        print(f"{Colors.OKCYAN}Query: {user_query}{Colors.ENDC}")
-        
-        system_prompt = "You are a concise, helpful research assistant in an experimental OS environment. Provide the answer in a single paragraph, and do not use greetings or sign-offs."
-        
-        payload = {
-            "contents": [{"parts": [{"text": user_query}]}],
-            "tools": [{"google_search": {} }],
-            "systemInstruction": {"parts": [{"text": system_prompt}]}
-        }
-        
-        headers = {'Content-Type': 'application/json'}
-        
+
+        jobs, use_cache = 1, True
+        while args and args[0].startswith('-'):
+            if args[0] == '-f':
+                use_cache = False
+                args = args[1:]
+            elif args[0] == '-j' and len(args) > 1 and args[1].isdigit() and int(args[1]) > 0:
+                jobs = int(args[1])
+                args = args[2:]
+            else:
+                break
+
+        queries = [query.strip() for query in " ".join(args).split(';') if query.strip()]
+        if not queries:
+            print(f"{Colors.FAIL}Usage: fetch-web [-j N] [-f] <query for Google Search/Gemini> [; <query> ...] | fetch-web --clear-cache{Colors.ENDC}")
+            return
+
+        print(f"{Colors.WARNING}Sending {len(queries)} grounded quer{'y' if len(queries) == 1 else 'ies'} to LoA Nexus (Gemini API)...{Colors.ENDC}")
         try:
-            for attempt in range(3):
-                time.sleep(2**attempt if attempt > 0 else 0) 
-                
-                response = requests.post(API_URL_TEMPLATE, headers=headers, json=payload, timeout=20)
-                response.raise_for_status()
-                
-                result = response.json()
-                candidate = result.get('candidates', [{}])[0]
-                text = candidate.get('content', {}).get('parts', [{}])[0].get('text', 'API response was empty.')
-                
-                sources = []
-                grounding_metadata = candidate.get('groundingMetadata')
-                if grounding_metadata and grounding_metadata.get('groundingAttributions'):
-                    sources = [
-                        f"{s.get('web', {}).get('title')} ({s.get('web', {}).get('uri')})"
-                        for s in grounding_metadata['groundingAttributions']
-                    ]
-
-                print(f"\n{Colors.OKGREEN}--- Web Search Results ---{Colors.ENDC}")
-                print(text)
-                
-                if sources:
+            for answer in self.fetcher.fetch_many(queries, jobs, use_cache):
+                print(f"{Colors.OKCYAN}Query: {answer['query']}{Colors.ENDC}")
+                if 'error' in answer:
+                    print(f"{Colors.FAIL}Network Error: Could not get an answer from the API endpoint. ({answer['error']}){Colors.ENDC}")
+                    continue
+
+                origin = "cache" if answer['cached'] else "network"
+                print(f"\n{Colors.OKGREEN}--- Web Search Results ({origin}, {answer['elapsed'] * 1000:.0f} ms) ---{Colors.ENDC}")
+                print(answer['text'])
+
+                if answer['sources']:
                     print(f"\n{Colors.WARNING}Sources Used:{Colors.ENDC}")
-                    for src in sources:
+                    for src in answer['sources']:
                         print(f"  - {src}")
                 print(f"{Colors.OKGREEN}--------------------------{Colors.ENDC}")
-                return
-
-            print(f"{Colors.FAIL}Error: API failed after multiple retries. Check connectivity or API key status.{Colors.ENDC}")
-            
-        except requests.exceptions.RequestException as e:
-            print(f"{Colors.FAIL}Network Error: Could not connect to the API endpoint. ({e}){Colors.ENDC}")
         except Exception as e:
             print(f"{Colors.FAIL}An unexpected error occurred during API processing: {e}{Colors.ENDC}")
 
 
     # --- External Tool Execution (Retained from A5) ---
 
+    def _find_vfs_file(self, vfs_file: str) -> Optional[Inode]:
+        """Looks up the VFS file handed to a host tool, reporting it if it is missing."""
+        full_path = self._resolve_path(os.path.join(self.current_path, vfs_file))
+        self._refresh_job_logs(full_path)
+        node = self._get_node(full_path)
+
+        if not node or node.is_dir:
+            print(f"{Colors.FAIL}Error: VFS file '{vfs_file}' not found or is not a file.{Colors.ENDC}")
+            return None
+        return node
+
+    def _materialize_vfs_file(self, vfs_file: str, host_path: str) -> bool:
+        """Writes a VFS file's contents to a host file so a host tool can read it."""
+        node = self._find_vfs_file(vfs_file)
+        if node is None:
+            return False
+
+        content = self.vfs.read(node)
+        if content is None:
+            print(f"{Colors.FAIL}Error: Contents of '{vfs_file}' are missing from {BLOB_DIR}.{Colors.ENDC}")
+            return False
+
+        with open(host_path, 'w') as f:
+            f.write(content)
+        return True
+
+    def _command_with_file(self, full_command: List[str], vfs_file: str, host_path: str) -> List[str]:
+        """Points the command at the host copy of a VFS file."""
+        full_command = list(full_command)
+        try:
+            index = full_command.index(vfs_file)
+            full_command[index] = host_path
+        except ValueError:
+            full_command.append(host_path)
+        return full_command
+
+    def _cached_vfs_file(self, vfs_file: str) -> Optional[Tuple[str, str]]:
+        """Returns (host path, blob digest) of a VFS file's copy in the execution cache, writing it only if it changed."""
+        node = self._find_vfs_file(vfs_file)
+        if node is None:
+            return None
+        host_path = self.exec_cache.source(node.blob, os.path.basename(vfs_file), lambda: self.vfs.read(node))
+        if host_path is None:
+            print(f"{Colors.FAIL}Error: Contents of '{vfs_file}' are missing from {BLOB_DIR}.{Colors.ENDC}")
+            return None
+        return host_path, node.blob
+
+    def _run_build(self, full_command: List[str], source: str, digest: str) -> subprocess.CompletedProcess:
+        """
+        Runs gcc through the execution cache: an unchanged build (same compiler,
+        arguments and source) replays the stored messages and output file.
+        """
+        argv, output = compiler_output(full_command, os.path.basename(source))
+        toolchain = self.exec_cache.toolchain(argv[0])
+        host_inputs = [arg for arg in argv[1:] if arg != source and not arg.startswith('-') and os.path.isfile(arg)]
+        if toolchain is None or host_inputs:
+            # An unknown compiler, or host files the cache key cannot see
+            return subprocess.run(full_command, capture_output=True, text=True, check=False)
+
+        key = self.exec_cache.build_key(toolchain, argv, digest)
+        result = self.exec_cache.lookup_build(key)
+        if result is not None:
+            print(f"{Colors.OKGREEN}Build unchanged; reusing the cached output ({EXEC_CACHE_DIR}).{Colors.ENDC}")
+        else:
+            scratch = self.exec_cache.build_directory(key)
+            command = argv + (['-o', os.path.join(scratch, OUTPUT_FILE)] if output else [])
+            try:
+                completed = subprocess.run(command, capture_output=True, text=True, check=False)
+            except OSError:
+                self.exec_cache.discard_build(scratch)
+                raise
+            if completed.returncode != 0:
+                self.exec_cache.discard_build(scratch)
+                return completed
+            result = {'stdout': completed.stdout, 'stderr': completed.stderr, 'returncode': completed.returncode}
+            self.exec_cache.store_build(key, scratch, result)
+
+        if output is not None:
+            try:
+                self.exec_cache.install_output(key, output)
+            except OSError as e:
+                return subprocess.CompletedProcess(full_command, 1, result['stdout'],
+                                                   f"{result['stderr']}Error: could not write {output}: {e.strerror}")
+        return subprocess.CompletedProcess(full_command, result['returncode'], result['stdout'], result['stderr'])
+
     def _execute_external_tool(self, command: str, args: List[str], tool_name: str, vfs_file: Optional[str] = None):
-        """Handles running host system commands."""
+        """Handles running host system commands; VFS files go through the execution cache."""
         
         full_command = [command] + args
         print(f"{Colors.WARNING}Running external tool ({tool_name}): {' '.join(full_command)}{Colors.ENDC}")
         
-        temp_file = None
+        cached = None
         if vfs_file:
-            full_path = self._resolve_path(os.path.join(self.current_path, vfs_file))
-            node = self._get_node(full_path)
-            
-            if not node or node.get('type') != 'file':
-                print(f"{Colors.FAIL}Error: VFS file '{vfs_file}' not found or is not a file.{Colors.ENDC}")
+            cached = self._cached_vfs_file(vfs_file)
+            if cached is None:
                 return
-            
-            temp_file = f"/tmp/loa_os_exec_{os.getpid()}_{os.path.basename(vfs_file)}"
-            with open(temp_file, 'w') as f:
-                f.write(node['content'])
-            
-            try:
-                index = full_command.index(vfs_file)
-                full_command[index] = temp_file
-            except ValueError:
-                full_command.append(temp_file)
+            full_command = self._command_with_file(full_command, vfs_file, cached[0])
 
         try:
-            result = subprocess.run(
-                full_command, 
-                capture_output=True, 
-                text=True, 
-                check=False
-            )
+            if cached and tool_name == "GCC":
+                result = self._run_build(full_command, *cached)
+            else:
+                result = subprocess.run(
+                    full_command, 
+                    capture_output=True, 
+                    text=True, 
+                    check=False
+                )
             
             if result.stdout:
                 print(f"{Colors.OKCYAN}--- Output ({tool_name}) ---{Colors.ENDC}")
@@ -576,32 +917,31 @@ class LoAOS:
         except FileNotFoundError:
             print(f"{Colors.FAIL}Error: Host command '{command}' not found. Check system PATH.{Colors.ENDC}")
         finally:
-            if temp_file and os.path.exists(temp_file):
-                os.remove(temp_file)
+            self.exec_cache.evict()
 
-    def _determine_external_tool(self, command: str, args: List[str]):
-        """Routes commands to external tools based on aliases and file extensions."""
+    def _route_external_tool(self, command: str, args: List[str]) -> Tuple[str, str, Optional[str]]:
+        """Picks (host command, tool name, VFS file to hand it) based on aliases and file extensions."""
         
         file_arg = next((a for a in args if '.' in a and not a.startswith('-')), None)
         
         if file_arg:
             if file_arg.endswith('.py') or command in ["python", "py"]:
-                self._execute_external_tool("python3", args, "Python", file_arg)
-                return
+                return "python3", "Python", file_arg
             elif file_arg.endswith('.c') or command in ["gcc", "g++"]:
                 print(f"{Colors.HEADER}--- Copyright LoA Corp. SLPOE_ in c. ---{Colors.ENDC}")
-                self._execute_external_tool("gcc", args, "GCC", file_arg)
-                return
+                return "gcc", "GCC", file_arg
             elif file_arg.endswith('.js') or command in ["node", "npm"]:
-                self._execute_external_tool("node", args, "Node.js", file_arg)
-                return
+                return "node", "Node.js", file_arg
         
         if command in self.tool_aliases:
-            host_cmd = self.tool_aliases[command]
-            self._execute_external_tool(host_cmd, args, command)
-            return
+            return self.tool_aliases[command], command, None
 
-        self._execute_external_tool(command, args, command)
+        return command, command, None
+
+    def _determine_external_tool(self, command: str, args: List[str]):
+        """Routes commands to external tools based on aliases and file extensions."""
+        host_command, tool_name, vfs_file = self._route_external_tool(command, args)
+        self._execute_external_tool(host_command, args, tool_name, vfs_file)
 
 
     # --- Command Router and Main Loop ---
@@ -612,7 +952,7 @@ class LoAOS:
         print(f"{Colors.HEADER}============================================================{Colors.ENDC}")
         print(f"{Colors.BOLD}*** {APP_NAME} | VFS & Multi-Environment Shell Emulator ***{Colors.ENDC}")
         print(f"Version {VERSION}. Type '{Colors.OKCYAN}help{Colors.ENDC}' for command list or '{Colors.FAIL}exit{Colors.ENDC}' to quit.")
-        print(f"{Colors.WARNING}State is persistent in {VFS_SAVE_FILE}, {ENV_SAVE_FILE}, and {PROC_SAVE_FILE}.{Colors.ENDC}")
+        print(f"{Colors.WARNING}State is persistent in {VFS_SAVE_FILE}, {ENV_SAVE_FILE}, and {PROC_SAVE_FILE} (changes journaled to {JOURNAL_FILE}).{Colors.ENDC}")
         print(f"{Colors.HEADER}============================================================{Colors.ENDC}")
         
     def cmd_help(self, args: List[str]):
@@ -620,16 +960,19 @@ class LoAOS:
         print(f"{Colors.UNDERLINE}Available Environments & Aliases ({VERSION}):{Colors.ENDC}")
         print(f"  - {Colors.OKGREEN}gcc, py, node, npm{Colors.ENDC}: Execute VFS files with host tools.")
         print(f"  - {Colors.OKGREEN}sh_git, cmake-debian{Colors.ENDC} : Standard tool routing (Aliased).")
+        print(f"  - {Colors.OKCYAN}cache [stats|clear]{Colors.ENDC}: Show or empty the cache of materialized sources and gcc builds ({EXEC_CACHE_VAR}).")
         print(f"{Colors.UNDERLINE}Process Management (NEW in V7):{Colors.ENDC}")
-        print(f"  - {Colors.OKCYAN}run-bg <cmd>{Colors.ENDC}: Simulate running a command/file in the background.")
-        print(f"  - {Colors.OKCYAN}ps{Colors.ENDC}             : List all running simulated background processes.")
-        print(f"  - {Colors.OKCYAN}kill <PID>{Colors.ENDC}     : Terminate a simulated background process.")
+        print(f"  - {Colors.OKCYAN}run-bg <cmd>{Colors.ENDC}: Run a command/file in the background (output in {JOB_LOG_DIR}; {JOB_SLOTS_VAR} at once).")
+        print(f"  - {Colors.OKCYAN}ps{Colors.ENDC}             : List background processes with CPU time and memory.")
+        print(f"  - {Colors.OKCYAN}kill [-SIG] <PID>{Colors.ENDC}: Signal a background process (SIGTERM by default).")
         print(f"{Colors.UNDERLINE}System Introspection & Network:{Colors.ENDC}")
         print(f"  - {Colors.OKCYAN}whoami, hostname, env{Colors.ENDC}: Display system details and variables.")
-        print(f"  - {Colors.OKCYAN}fetch-web <query>{Colors.ENDC}: Grounded web search using Gemini API.")
+        print(f"  - {Colors.OKCYAN}fetch-web [-j N] [-f] <q1> [; <q2> ...]{Colors.ENDC}: Grounded web search using Gemini API; N queries at once, cached for {WEB_CACHE_TTL_VAR} s (-f skips the cache, --clear-cache empties it, {FETCH_URL_VAR} sets the endpoint).")
         print(f"  - {Colors.OKCYAN}setvar KEY=VALUE{Colors.ENDC}: Set persistent VFS environment variables.")
+        print(f"  - {Colors.OKCYAN}sync{Colors.ENDC}            : Compact the state journal into the state files now.")
         print(f"{Colors.UNDERLINE}VFS File System Commands (V7):{Colors.ENDC}")
         print(f"  - {Colors.OKCYAN}ls, cd, mkdir, rm, cat, edit, find{Colors.ENDC}: VFS management.")
+        print(f"  - {Colors.OKCYAN}find [path] [pattern] [-type f|d] [-path P] [-maxdepth N] [-size +1k]{Colors.ENDC}: Indexed search.")
         print(f"  - {Colors.OKCYAN}history, clear, exit{Colors.ENDC}: Standard shell commands.")
         print(f"{Colors.HEADER}------------------------------------------------------------{Colors.ENDC}")
 
@@ -655,6 +998,8 @@ class LoAOS:
             "env": self.cmd_env,
             "whoami": self.cmd_whoami,
             "hostname": self.cmd_hostname,
+            "sync": self.cmd_sync,
+            "cache": self.cmd_cache,
             
             # Process Management (NEW)
             "run-bg": self.cmd_run_bg,
@@ -667,6 +1012,7 @@ class LoAOS:
         
         while self.is_running:
             try:
+                self._collect_jobs()
                 prompt = (
                     f"{Colors.OKGREEN}{self.env.get('USER', 'user')}{Colors.ENDC}"
                     f"@{Colors.OKBLUE}{self.current_path}{Colors.ENDC} {PROMPT_CHAR} "
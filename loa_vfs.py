@@ -0,0 +1,409 @@
+# loa_vfs.py
+#
+# Inode-based virtual file system for LoA OS (loa_os7_cpu.py).
+#
+# Every file and directory is an Inode with an integer ID, kept in one flat
+# table (VirtualFS.inodes). A directory maps child names to inode IDs, so
+# nodes are never copied or nested inside each other.
+#
+# Resolved absolute paths are cached as path -> inode ID. A lookup that hits
+# the cache is one dict read; a miss walks down from the nearest cached
+# ancestor and caches every directory it passes. The cache only holds paths
+# that exist, so creating a node never invalidates anything, and editing a
+# file keeps its inode. Removing a node drops the cached paths of that node
+# and everything under it, and nothing else.
+#
+# Paths given to VirtualFS are absolute and normalized ('/home/user');
+# resolve_path() produces them from what the user typed.
+#
+# A basename index (name -> inode IDs) is kept up to date as nodes come and
+# go, so find() looks names up instead of walking the tree. A glob with a
+# literal prefix ('file1*') scans only the names in that range of a sorted
+# name list; other globs ('*.py') match a compiled regex against the
+# distinct names, which are far fewer than the nodes.
+#
+# File bodies live in a BlobStore (loa_blobs.py); a file inode holds only the
+# digest and size of its body, and read() fetches the body when needed.
+#
+# The on-disk form is the nested {'/': {'type': 'dir', 'contents': {...}}}
+# tree LoA OS has always saved, with {'type': 'file', 'blob': digest,
+# 'size': n} for files: see VirtualFS.from_tree() and to_tree(). Trees from
+# earlier versions, with the body inline as 'content', still load.
+#
+# To time the common commands on large trees: python loa_vfs_bench.py
+
+import os
+import re
+import fnmatch
+from bisect import bisect_left, insort
+from typing import Callable, Dict, Any, List, Optional, Iterator, Set, Tuple
+
+from loa_blobs import BlobStore
+
+ROOT_INO = 1
+GLOB_CHARS = "*?["
+
+
+class Inode:
+    """One file or directory. Directories have `children` (name -> inode ID); files have a `blob` digest and `size`."""
+
+    __slots__ = ('ino', 'type', 'parent', 'name', 'children', 'blob', 'size')
+
+    def __init__(self, ino: int, node_type: str, parent: int, name: str, blob: Optional[str] = None, size: int = 0):
+        self.ino = ino
+        self.type = node_type
+        self.parent = parent
+        self.name = name
+        self.children: Optional[Dict[str, int]] = {} if node_type == 'dir' else None
+        self.blob = blob
+        self.size = size
+
+    @property
+    def is_dir(self) -> bool:
+        return self.type == 'dir'
+
+
+def split_path(path: str) -> Tuple[str, str]:
+    """Splits a normalized absolute path into (parent path, name): '/a/b' -> ('/a', 'b')."""
+    parent, _, name = path.rpartition('/')
+    return parent or '/', name
+
+
+def join_path(parent: str, name: str) -> str:
+    return parent + name if parent == '/' else parent + '/' + name
+
+
+def glob_prefix(pattern: str) -> str:
+    """The literal text a glob starts with: 'file1*.txt' -> 'file1'."""
+    for i, char in enumerate(pattern):
+        if char in GLOB_CHARS:
+            return pattern[:i]
+    return pattern
+
+
+def resolve_path(current_path: str, path_str: str) -> str:
+    """Converts a path typed at the shell to a normalized absolute path, resolving '..' and '.'."""
+    target_path = path_str if path_str.startswith('/') else join_path(current_path, path_str)
+    # Most paths are already normal (no '.', '..', '//' or trailing '/'), and normpath is the costly part.
+    if '/.' not in target_path and '//' not in target_path and (target_path == '/' or target_path[-1] != '/'):
+        return target_path
+
+    target_path = os.path.normpath(target_path)
+    if target_path.startswith('//'):
+        # normpath keeps a leading '//'; the path cache needs one spelling per path.
+        target_path = '/' + target_path.lstrip('/')
+    return target_path
+
+
+class VirtualFS:
+    """A flat inode table plus a resolved-path -> inode cache."""
+
+    def __init__(self, blobs: Optional[BlobStore] = None):
+        self.blobs = blobs if blobs is not None else BlobStore()
+        self.upgraded = False  # Set when from_tree() moved inline file contents into the blob store
+        self.inodes: Dict[int, Inode] = {ROOT_INO: Inode(ROOT_INO, 'dir', ROOT_INO, '')}
+        self._next_ino = ROOT_INO + 1
+        self._path_cache: Dict[str, int] = {'/': ROOT_INO}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._names: Dict[str, Set[int]] = {}  # Basename index
+        self._sorted_names: Optional[List[str]] = None  # Built on the first find(), then kept sorted
+
+    # --- Persistence (nested tree format) ---
+
+    @classmethod
+    def from_tree(cls, tree: Dict[str, Any], blobs: Optional[BlobStore] = None) -> "VirtualFS":
+        """Builds the inode table from the nested {'/': {...}} tree; no file body is read."""
+        vfs = cls(blobs)
+        root = tree.get('/', {})
+        pending = [(ROOT_INO, root.get('contents', {}))]
+        while pending:
+            parent_ino, contents = pending.pop()
+            for name, node in contents.items():
+                if node.get('type') == 'dir':
+                    pending.append((vfs._add(parent_ino, name, 'dir'), node.get('contents', {})))
+                elif node.get('type') == 'file':
+                    if 'blob' in node:
+                        vfs._add(parent_ino, name, 'file', node['blob'], node.get('size', 0))
+                    else:
+                        vfs._add(parent_ino, name, 'file', *vfs.blobs.put(node.get('content', '')))
+                        vfs.upgraded = True
+        return vfs
+
+    def to_tree(self, inline: bool = False) -> Dict[str, Any]:
+        """
+        Returns the file system as the nested tree LoA OS saves to disk. With
+        `inline`, file bodies are included as 'content', as earlier versions
+        saved them.
+        """
+        # Built iteratively, children before their parents, so deep trees do not hit the recursion limit.
+        built: Dict[int, Dict[str, Any]] = {}
+        for ino in self._postorder(ROOT_INO):
+            node = self.inodes[ino]
+            if node.is_dir:
+                built[ino] = {'type': 'dir', 'contents': {name: built.pop(child) for name, child in node.children.items()}}
+            elif inline:
+                built[ino] = {'type': 'file', 'content': self.read(node)}
+            else:
+                built[ino] = {'type': 'file', 'blob': node.blob, 'size': node.size}
+        return {'/': built[ROOT_INO]}
+
+    def _postorder(self, ino: int) -> List[int]:
+        """Returns the inode IDs under `ino` (inclusive), every node after all of its children."""
+        order, stack = [], [ino]
+        while stack:
+            current = stack.pop()
+            order.append(current)
+            children = self.inodes[current].children
+            if children:
+                stack.extend(children.values())
+        order.reverse()
+        return order
+
+    # --- Lookup ---
+
+    def lookup(self, path: str) -> Optional[int]:
+        """Returns the inode ID at a normalized absolute path, or None."""
+        ino = self._path_cache.get(path)
+        if ino is not None:
+            self.cache_hits += 1
+            return ino
+        self.cache_misses += 1
+
+        # Climb to the nearest cached ancestor ('/' always is), then walk back down.
+        prefix, names = path, []
+        while True:
+            prefix, _, name = prefix.rpartition('/')
+            names.append(name)
+            ino = self._path_cache.get(prefix or '/')
+            if ino is not None:
+                break
+
+        current = prefix
+        inodes = self.inodes
+        for name in reversed(names):
+            children = inodes[ino].children
+            if children is None:
+                return None  # A file in the middle of the path
+            ino = children.get(name)
+            if ino is None:
+                return None
+            current = current + '/' + name
+            self._path_cache[current] = ino
+        return ino
+
+    def node(self, path: str) -> Optional[Inode]:
+        """Returns the Inode at a normalized absolute path, or None."""
+        ino = self.lookup(path)
+        return None if ino is None else self.inodes[ino]
+
+    def path_of(self, ino: int) -> str:
+        """Rebuilds the absolute path of an inode from its parent links."""
+        names = []
+        while ino != ROOT_INO:
+            node = self.inodes[ino]
+            names.append(node.name)
+            ino = node.parent
+        return '/' + '/'.join(reversed(names))
+
+    def listdir(self, path: str) -> Optional[List[Tuple[str, Inode]]]:
+        """Returns the sorted (name, Inode) entries of a directory, or None if it is not one."""
+        node = self.node(path)
+        if node is None or not node.is_dir:
+            return None
+        return [(name, self.inodes[ino]) for name, ino in sorted(node.children.items())]
+
+    def walk(self, path: str = '/') -> Iterator[Tuple[str, Inode]]:
+        """Yields (path, Inode) for everything below `path` (not `path` itself), depth first."""
+        ino = self.lookup(path)
+        if ino is not None:
+            yield from self._walk_from(path, ino)
+
+    def _walk_from(self, path: str, ino: int, max_depth: Optional[int] = None) -> Iterator[Tuple[str, Inode]]:
+        stack = [(path, ino, 1)]
+        while stack:
+            dir_path, dir_ino, depth = stack.pop()
+            children = self.inodes[dir_ino].children
+            if not children:
+                continue
+            for name, child in children.items():
+                child_path = join_path(dir_path, name)
+                node = self.inodes[child]
+                yield child_path, node
+                if node.is_dir and (max_depth is None or depth < max_depth):
+                    stack.append((child_path, child, depth + 1))
+
+    # --- Search ---
+
+    def match_names(self, pattern: str) -> Iterator[str]:
+        """Yields the distinct basenames matching a glob, in sorted order."""
+        prefix = glob_prefix(pattern)
+        if prefix == pattern:
+            if pattern in self._names:
+                yield pattern
+            return
+
+        if self._sorted_names is None:
+            self._sorted_names = sorted(self._names)
+        names = self._sorted_names
+        matches = re.compile(fnmatch.translate(pattern)).match
+        for i in range(bisect_left(names, prefix), len(names)):
+            name = names[i]
+            if not name.startswith(prefix):
+                break
+            if matches(name):
+                yield name
+
+    def find(self, path: str = '/', name: Optional[str] = None, node_type: Optional[str] = None,
+             path_pattern: Optional[str] = None, max_depth: Optional[int] = None,
+             size_test: Optional[Callable[[int], bool]] = None) -> Iterator[Tuple[str, Inode]]:
+        """
+        Yields (path, Inode) for the nodes below `path` that pass every given
+        test, as they are found: basename glob `name`, `node_type` ('file' or
+        'dir'), glob `path_pattern` on the full path, at most `max_depth`
+        levels down, and `size_test(size)` (files only).
+        """
+        start_ino = self.lookup(path)
+        if start_ino is None or not self.inodes[start_ino].is_dir or max_depth == 0:
+            return
+        path_matches = re.compile(fnmatch.translate(path_pattern)).match if path_pattern else None
+
+        if name is None:
+            candidates = self._walk_from(path, start_ino, max_depth)
+        else:
+            candidates = self._indexed(name, path, start_ino, max_depth)
+        for node_path, node in candidates:
+            if node_type is not None and node.type != node_type:
+                continue
+            if size_test is not None and (node.is_dir or not size_test(node.size)):
+                continue
+            if path_matches is not None and not path_matches(node_path):
+                continue
+            yield node_path, node
+
+    def _indexed(self, pattern: str, path: str, start_ino: int, max_depth: Optional[int]) -> Iterator[Tuple[str, Inode]]:
+        """Yields the nodes under `start_ino` whose basename matches `pattern`, through the name index."""
+        inodes = self.inodes
+        # Directory inode -> (path, depth below the start), or None outside it; shared by every match.
+        located: Dict[int, Optional[Tuple[str, int]]] = {start_ino: (path, 0)}
+        if start_ino != ROOT_INO:
+            located[ROOT_INO] = None
+
+        def locate(dir_ino: int) -> Optional[Tuple[str, int]]:
+            chain, current = [], dir_ino
+            while current not in located:
+                chain.append(current)
+                current = inodes[current].parent
+            place = located[current]
+            for ino in reversed(chain):
+                if place is not None:
+                    place = (join_path(place[0], inodes[ino].name), place[1] + 1)
+                located[ino] = place
+            return place
+
+        for name in self.match_names(pattern):
+            for ino in sorted(self._names[name]):
+                node = inodes[ino]
+                place = locate(node.parent)
+                if place is None or ino == start_ino or (max_depth is not None and place[1] >= max_depth):
+                    continue
+                yield join_path(place[0], name), node
+
+    def read(self, node: Inode) -> Optional[str]:
+        """Returns a file's body, loading it from the blob store if needed (None if the blob is missing)."""
+        return self.blobs.get(node.blob)
+
+    def live_blobs(self) -> Set[str]:
+        """The digests of every file body still in use."""
+        return {node.blob for node in self.inodes.values() if node.blob is not None}
+
+    def __len__(self) -> int:
+        return len(self.inodes)
+
+    # --- Mutation ---
+
+    def _add(self, parent_ino: int, name: str, node_type: str, blob: Optional[str] = None, size: int = 0) -> int:
+        ino = self._next_ino
+        self._next_ino += 1
+        self.inodes[ino] = Inode(ino, node_type, parent_ino, name, blob, size)
+        self.inodes[parent_ino].children[name] = ino
+        same_name = self._names.get(name)
+        if same_name is None:
+            self._names[name] = {ino}
+            if self._sorted_names is not None:
+                insort(self._sorted_names, name)
+        else:
+            same_name.add(ino)
+        return ino
+
+    def _unindex(self, node: Inode):
+        same_name = self._names[node.name]
+        same_name.discard(node.ino)
+        if not same_name:
+            del self._names[node.name]
+            if self._sorted_names is not None:
+                del self._sorted_names[bisect_left(self._sorted_names, node.name)]
+
+    def _parent_dir(self, path: str) -> Optional[Tuple[Inode, str]]:
+        """Returns (parent directory Inode, name) for a path whose parent is an existing directory."""
+        parent_path, name = split_path(path)
+        parent = self.node(parent_path)
+        if parent is None or not parent.is_dir or not name:
+            return None
+        return parent, name
+
+    def mkdir(self, path: str) -> Optional[int]:
+        """Creates a directory; returns its inode ID, or None if the parent is missing or the name is taken."""
+        result = self._parent_dir(path)
+        if result is None or result[1] in result[0].children:
+            return None
+        parent, name = result
+        return self._add(parent.ino, name, 'dir')
+
+    def write_file(self, path: str, content: str) -> Optional[int]:
+        """
+        Creates a file or replaces an existing file's content (keeping its inode).
+        Returns the inode ID, or None if the parent is missing or `path` is a directory.
+        """
+        return self._write(path, content=content)
+
+    def write_blob(self, path: str, blob: str, size: int) -> Optional[int]:
+        """Like write_file, for a body already in the blob store under `blob`."""
+        return self._write(path, blob=blob, size=size)
+
+    def _write(self, path: str, content: Optional[str] = None, blob: Optional[str] = None,
+               size: int = 0) -> Optional[int]:
+        result = self._parent_dir(path)
+        if result is None:
+            return None
+        parent, name = result
+        ino = parent.children.get(name)
+        if ino is not None and self.inodes[ino].is_dir:
+            return None
+        if content is not None:
+            blob, size = self.blobs.put(content)
+        if ino is None:
+            return self._add(parent.ino, name, 'file', blob, size)
+        node = self.inodes[ino]
+        node.blob, node.size = blob, size
+        return ino
+
+    def remove(self, path: str) -> bool:
+        """
+        Removes the node at `path` and everything under it, dropping exactly
+        their cached paths. Returns False if there is nothing to remove.
+        """
+        ino = self.lookup(path)
+        if ino is None or ino == ROOT_INO:
+            return False
+        node = self.inodes[ino]
+        cache = self._path_cache
+        cache.pop(path, None)
+        if node.is_dir and node.children:
+            for child_path, _ in self._walk_from(path, ino):
+                cache.pop(child_path, None)
+
+        del self.inodes[node.parent].children[node.name]
+        for removed in self._postorder(ino):
+            self._unindex(self.inodes.pop(removed))
+        return True
@@ -0,0 +1,301 @@
+# loa_vfs_bench.py
+#
+# Lookup cost of the LoA OS virtual file system, before and after the inode
+# table and path cache (loa_vfs.py).
+#
+# Run from the repository directory:
+# python loa_vfs_bench.py [--nodes N] [--depth D] [--ops N]
+#
+# The runner builds a VFS of about --nodes files and directories: a bushy
+# tree plus one chain --depth directories deep. It then replays the same
+# random stream of cd, ls, cat, edit, mkdir and rm operations (mostly on a
+# working set of HOT_PATHS paths, including the deepest ones) against the
+# original nested-dict walk (reproduced below) and against VirtualFS, checks
+# both give the same answers, and reports the cost per operation. Terminal
+# output is left out of both sides; only path resolution and the VFS work
+# are timed. Finally it times a few `find` queries: the original recursive
+# fnmatch walk against the name index.
+
+import os
+import sys
+import time
+import random
+import fnmatch
+import argparse
+
+from loa_vfs import VirtualFS, join_path, resolve_path
+
+DEFAULT_NODES = 100000
+DEFAULT_DEPTH = 300
+DEFAULT_OPS = 20000
+HOT_PATHS = 2000  # A session keeps returning to a working set of paths
+HOT_SHARE = 0.9
+FIND_QUERIES = ["*.txt", "file3.txt", "deep*", "dir7", "*.py"]
+FIND_RUNS = 5
+FAN_OUT = 8
+FILES_PER_DIR = 8
+
+
+# --- The original nested-dict VFS walk (LoAOS before the inode table) ---
+
+def legacy_find(node, current_path, pattern, results):
+    """The original recursive `find`: fnmatch every entry, collect, then sort."""
+    if node.get('type') == 'dir':
+        for name, child in node.get('contents', {}).items():
+            full_path = os.path.join(current_path, name)
+            if fnmatch.fnmatch(name, pattern):
+                results.append(full_path)
+            legacy_find(child, full_path, pattern, results)
+    return results
+
+def legacy_resolve_path(current_path, path_str):
+    target_path = path_str if path_str.startswith('/') else os.path.join(current_path, path_str)
+    target_path = os.path.normpath(target_path)
+    if target_path == '.':
+        target_path = '/' if current_path == '/' else current_path
+    elif not target_path.startswith('/'):
+        target_path = '/' + target_path
+    return target_path
+
+
+def legacy_get_node(tree, current_path, path):
+    path = legacy_resolve_path(current_path, path).strip('/')
+    if path == "":
+        return tree.get('/')
+    current_node = tree.get('/')
+    for comp in path.split('/'):
+        if comp in current_node.get('contents', {}):
+            current_node = current_node['contents'][comp]
+        else:
+            return None
+    return current_node
+
+
+def legacy_get_dir_node(tree, current_path, path):
+    node = legacy_get_node(tree, current_path, path)
+    if node and node.get('type') == 'dir':
+        return node
+    return None
+
+
+def legacy_get_parent_and_name(tree, current_path, path):
+    path = legacy_resolve_path(current_path, path)
+    parent_path = os.path.dirname(path)
+    name = os.path.basename(path)
+    parent_node = tree.get('/') if parent_path == '/' else legacy_get_dir_node(tree, current_path, parent_path)
+    if parent_node and parent_node.get('type') == 'dir' and name:
+        return parent_node, name
+    return None
+
+
+class LegacyVFS:
+    """The command bodies of the original LoAOS, minus their output."""
+
+    def __init__(self, tree):
+        self.tree = tree
+        self.current_path = '/'
+
+    def cd(self, path):
+        resolved = legacy_resolve_path(self.current_path, path)
+        return legacy_get_dir_node(self.tree, self.current_path, resolved) is not None
+
+    def ls(self, path):
+        node = legacy_get_dir_node(self.tree, self.current_path, path)
+        return None if node is None else [name for name, _ in sorted(node['contents'].items())]
+
+    def cat(self, path):
+        node = legacy_get_node(self.tree, self.current_path, path)
+        return None if node is None or node['type'] == 'dir' else node['content']
+
+    def edit(self, path, content):
+        result = legacy_get_parent_and_name(self.tree, self.current_path, path)
+        if result is None or result[0]['contents'].get(result[1], {}).get('type') == 'dir':
+            return False  # (The original overwrote directories; both sides refuse here to stay comparable.)
+        result[0]['contents'][result[1]] = {'type': 'file', 'content': content}
+        return True
+
+    def mkdir(self, path):
+        if legacy_get_node(self.tree, self.current_path, path):
+            return False
+        result = legacy_get_parent_and_name(self.tree, self.current_path, path)
+        if result is None:
+            return False
+        result[0]['contents'][result[1]] = {'type': 'dir', 'contents': {}}
+        return True
+
+    def rm(self, path):
+        result = legacy_get_parent_and_name(self.tree, self.current_path, path)
+        if result is None or result[1] not in result[0]['contents']:
+            return False
+        node = result[0]['contents'][result[1]]
+        if node['type'] == 'dir' and node['contents']:
+            return False
+        del result[0]['contents'][result[1]]
+        return True
+
+
+class InodeVFS:
+    """The same command bodies on VirtualFS, resolving paths as LoAOS._resolve_path does."""
+
+    def __init__(self, vfs):
+        self.vfs = vfs
+        self.current_path = '/'
+
+    def _resolve(self, path):
+        return resolve_path(self.current_path, path)
+
+    def cd(self, path):
+        node = self.vfs.node(self._resolve(path))
+        return node is not None and node.is_dir
+
+    def ls(self, path):
+        items = self.vfs.listdir(self._resolve(path))
+        return None if items is None else [name for name, _ in items]
+
+    def cat(self, path):
+        node = self.vfs.node(self._resolve(path))
+        return None if node is None or node.is_dir else self.vfs.read(node)
+
+    def edit(self, path, content):
+        return self.vfs.write_file(self._resolve(path), content) is not None
+
+    def mkdir(self, path):
+        return self.vfs.mkdir(self._resolve(path)) is not None
+
+    def rm(self, path):
+        resolved = self._resolve(path)
+        node = self.vfs.node(resolved)
+        if node is None or resolved == '/' or (node.is_dir and node.children):
+            return False
+        return self.vfs.remove(resolved)
+
+
+# --- Tree and Workload ---
+
+def build_vfs(node_count, depth):
+    """Builds a VirtualFS with a bushy tree of about `node_count` nodes plus a `depth`-deep chain."""
+    vfs = VirtualFS()
+    dirs, files = ['/'], []
+    chain = '/'
+    for i in range(depth):
+        chain = join_path(chain, f"level{i}")
+        vfs.mkdir(chain)
+        dirs.append(chain)
+    for j in range(FILES_PER_DIR):
+        path = join_path(chain, f"deep{j}.txt")
+        vfs.write_file(path, f"deep file {j}")
+        files.append(path)
+
+    queue = ['/']
+    while queue and len(vfs) < node_count:
+        parent = queue.pop(0)
+        for k in range(FAN_OUT):
+            path = join_path(parent, f"dir{k}")
+            vfs.mkdir(path)
+            dirs.append(path)
+            queue.append(path)
+        for k in range(FILES_PER_DIR):
+            path = join_path(parent, f"file{k}.txt")
+            vfs.write_file(path, f"{path} contents")
+            files.append(path)
+    return vfs, dirs, files
+
+
+def make_ops(dirs, files, depth, count, rng):
+    """Returns `count` (command, path, argument) operations, weighted towards reads."""
+    # The deep chain is listed first, so the hot sets always include its bottom end.
+    hot_dirs = dirs[-HOT_PATHS // 2:] + dirs[1 + depth // 2:1 + depth]
+    hot_files = files[:FILES_PER_DIR] + rng.sample(files, min(HOT_PATHS, len(files)))
+
+    def pick(paths, hot):
+        return rng.choice(hot) if rng.random() < HOT_SHARE else rng.choice(paths)
+
+    ops = []
+    for i in range(count):
+        roll = rng.random()
+        if roll < 0.25:
+            ops.append(('cd', pick(dirs, hot_dirs), None))
+        elif roll < 0.45:
+            ops.append(('ls', pick(dirs, hot_dirs), None))
+        elif roll < 0.75:
+            ops.append(('cat', pick(files, hot_files), None))
+        elif roll < 0.85:
+            ops.append(('edit', pick(files, hot_files), f"edit {i}"))
+        elif roll < 0.93:
+            new_dir = join_path(pick(dirs, hot_dirs), f"new{i}")
+            ops.append(('mkdir', new_dir, None))
+            ops.append(('rm', new_dir, None))
+        else:
+            ops.append(('cat', pick(dirs, hot_dirs) + "/missing.txt", None))
+    return ops
+
+
+def replay(target, ops):
+    """Runs every operation; returns (results, {command: (total ns, calls)})."""
+    results = []
+    per_command = {}
+    for command, path, argument in ops:
+        method = getattr(target, command)
+        start = time.perf_counter_ns()
+        result = method(path) if argument is None else method(path, argument)
+        elapsed = time.perf_counter_ns() - start
+        results.append(result)
+        total, calls = per_command.get(command, (0, 0))
+        per_command[command] = (total + elapsed, calls + 1)
+    return results, per_command
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare LoA OS VFS lookups before and after the inode table.")
+    parser.add_argument("--nodes", type=int, default=DEFAULT_NODES, help="approximate number of VFS nodes")
+    parser.add_argument("--depth", type=int, default=DEFAULT_DEPTH, help="depth of the deep directory chain")
+    parser.add_argument("--ops", type=int, default=DEFAULT_OPS, help="operations to replay")
+    options = parser.parse_args()
+
+    rng = random.Random(9)
+    start = time.perf_counter()
+    vfs, dirs, files = build_vfs(options.nodes, options.depth)
+    build_s = time.perf_counter() - start
+    tree = vfs.to_tree()
+    start = time.perf_counter()
+    vfs = VirtualFS.from_tree(tree, vfs.blobs)
+    load_s = time.perf_counter() - start
+    tree = vfs.to_tree(inline=True)
+
+    ops = make_ops(dirs, files, options.depth, options.ops, rng)
+    print(f"VFS with {len(vfs):,} nodes (chain depth {options.depth}); built in {build_s:.2f} s, "
+          f"loaded from the saved tree in {load_s:.2f} s; {len(ops):,} operations.")
+
+    before_results, before = replay(LegacyVFS(tree), ops)
+    after_results, after = replay(InodeVFS(vfs), ops)
+    assert before_results == after_results, "the inode VFS disagrees with the original walk"
+
+    print(f"{'command':<8} {'calls':>7} {'before ns':>11} {'after ns':>10} {'speedup':>9}")
+    for command in ('cd', 'ls', 'cat', 'edit', 'mkdir', 'rm'):
+        (before_ns, calls), (after_ns, _) = before[command], after[command]
+        print(f"{command:<8} {calls:>7,} {before_ns / calls:>11,.0f} {after_ns / calls:>10,.0f} "
+              f"{before_ns / after_ns:>8.1f}x")
+    total_before = sum(ns for ns, _ in before.values())
+    total_after = sum(ns for ns, _ in after.values())
+    print(f"{'all':<8} {len(ops):>7,} {total_before / len(ops):>11,.0f} {total_after / len(ops):>10,.0f} "
+          f"{total_before / total_after:>8.1f}x")
+    print(f"Path cache: {vfs.cache_hits:,} hits, {vfs.cache_misses:,} misses.")
+
+    print(f"{'find':<12} {'matches':>8} {'before ms':>10} {'after ms':>9} {'speedup':>9}")
+    for pattern in FIND_QUERIES:
+        list(vfs.find('/', pattern))  # Builds the sorted name list on first use
+        start = time.perf_counter()
+        for _ in range(FIND_RUNS):
+            expected = sorted(legacy_find(tree['/'], '/', pattern, []))
+        before_ms = (time.perf_counter() - start) * 1000 / FIND_RUNS
+        start = time.perf_counter()
+        for _ in range(FIND_RUNS):
+            found = [path for path, _ in vfs.find('/', pattern)]
+        after_ms = (time.perf_counter() - start) * 1000 / FIND_RUNS
+        assert sorted(found) == expected, f"find {pattern} disagrees with the original walk"
+        print(f"{pattern:<12} {len(found):>8,} {before_ms:>10.2f} {after_ms:>9.2f} {before_ms / after_ms:>8.0f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
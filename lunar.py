@@ -0,0 +1,206 @@
+# lunar.py
+#
+# Lunar phase engine for ritual_clock.py.
+#
+# The Moon's phase is the elongation of the Moon from the Sun: 0 degrees at
+# New Moon, 90 at First Quarter, 180 at Full Moon and 270 at Last Quarter.
+# It is computed from truncated series for the ecliptic longitudes of the
+# Moon (Meeus, Astronomical Algorithms, chapter 47, the largest terms) and
+# the Sun (chapter 25), which puts phase events within a few minutes.
+#
+# Every function takes UTC POSIX seconds, either a single number or a NumPy
+# array of them, and evaluates a whole array in one vectorized pass.
+# find_phase_events() solves for the exact instants of the principal phases
+# by Newton iteration rather than by sampling. moon_age() of a single instant
+# (ritual_clock.py asks once per tick) bisects New Moons solved once for the
+# lunations around it instead of solving again on every call.
+
+import math
+from bisect import bisect_right
+
+from solar_ephemeris import delta_t_seconds, JD_UNIX_EPOCH, SECONDS_PER_DAY
+
+# NumPy is only needed for arrays and the phase-event search; single instants work without it.
+try:
+    import numpy as np
+    _numpy_available = True
+except ImportError:
+    _numpy_available = False
+
+SYNODIC_MONTH = 29.530588853  # Mean length of a lunation in days
+SYNODIC_MONTH_SECONDS = SYNODIC_MONTH * SECONDS_PER_DAY
+
+# Mean New Moon of lunation 0 (2000 January 6), in POSIX seconds (Meeus 49.1).
+MEAN_NEW_MOON_EPOCH = (2451550.09766 - JD_UNIX_EPOCH) * SECONDS_PER_DAY
+
+PHASE_EVENTS = ("🌑 New Moon", "🌓 First Quarter", "🌕 Full Moon", "🌗 Last Quarter")
+PHASE_EVENT_DEGREES = 90.0
+
+J2000 = 2451545.0
+DAYS_PER_CENTURY = 36525
+SECONDS_PER_YEAR = 365.2425 * SECONDS_PER_DAY
+
+# Newton iteration settings for find_phase_events()
+PHASE_SEARCH_TOLERANCE = 0.001  # seconds
+PHASE_SEARCH_MAX_ITERATIONS = 20
+PHASE_RATE_STEP = 60.0  # seconds either side for the numerical derivative
+
+# moon_age() of a single instant looks up New Moons solved over this many
+# lunations either side of it, and solves again only once an instant falls
+# outside them. 1.5 covers the longest lunation (about 29.9 days).
+NEW_MOON_WINDOW_LUNATIONS = 1.5
+_new_moons = ()  # Sorted POSIX seconds of the cached New Moons
+
+# --- Series for the Moon's longitude (Meeus table 47.A) ---
+# Multiples of D, M, M', F and the sine coefficient in millionths of a degree.
+# Terms involving M are scaled by E (once per multiple of M).
+MOON_LONGITUDE_TERMS = (
+    (0, 0, 1, 0, 6288774), (2, 0, -1, 0, 1274027), (2, 0, 0, 0, 658314),
+    (0, 0, 2, 0, 213618), (0, 1, 0, 0, -185116), (0, 0, 0, 2, -114332),
+    (2, 0, -2, 0, 58793), (2, -1, -1, 0, 57066), (2, 0, 1, 0, 53322),
+    (2, -1, 0, 0, 45758), (0, 1, -1, 0, -40923), (1, 0, 0, 0, -34720),
+    (0, 1, 1, 0, -30383), (2, 0, 0, -2, 15327), (0, 0, 1, 2, -12528),
+    (0, 0, 1, -2, 10980), (4, 0, -1, 0, 10675), (0, 0, 3, 0, 10034),
+    (4, 0, -2, 0, 8548), (2, 1, -1, 0, -7888), (2, 1, 0, 0, -6766),
+    (1, 0, -1, 0, -5163), (1, 1, 0, 0, 4987), (2, -1, 1, 0, 4036),
+    (2, 0, 2, 0, 3994), (4, 0, 0, 0, 3861), (2, 0, -3, 0, 3665),
+    (0, 1, -2, 0, -2689), (2, 0, -1, 2, -2602), (2, -1, -2, 0, 2390),
+    (1, 0, 1, 0, -2348), (2, -2, 0, 0, 2236), (0, 1, 2, 0, -2120),
+    (0, 2, 0, 0, -2069),
+)
+
+# --- NumPy helpers ---
+
+def _require_numpy():
+    """Raises a helpful error when the array API is used without NumPy installed."""
+    if not _numpy_available:
+        raise ImportError("The vectorized lunar API requires NumPy. Please install it using: pip install numpy")
+
+def _is_array(timestamps):
+    return _numpy_available and isinstance(timestamps, np.ndarray)
+
+def _as_float_or_array(timestamps):
+    """Passes single numbers through as floats and converts sequences to float64 arrays."""
+    if isinstance(timestamps, (int, float)):
+        return float(timestamps)
+    _require_numpy()
+    return np.asarray(timestamps, dtype=np.float64)
+
+def _delta_t(timestamps):
+    """Returns TT - UT in seconds. Arrays interpolate a yearly table built for their range."""
+    years = 1970 + timestamps / SECONDS_PER_YEAR
+    if not _is_array(timestamps):
+        return delta_t_seconds(years)
+
+    # Delta T changes by well under a second per year, so yearly samples are plenty.
+    grid = np.arange(math.floor(years.min()), math.floor(years.max()) + 2, dtype=np.float64)
+    return np.interp(years, grid, [delta_t_seconds(y) for y in grid])
+
+# --- Phase Functions ---
+
+def moon_elongation(timestamps):
+    """
+    Returns the Moon's elongation from the Sun in degrees (0-360) for UTC
+    POSIX seconds: a float for a single instant, an array for an array.
+    """
+    timestamps = _as_float_or_array(timestamps)
+    sin = np.sin if _is_array(timestamps) else math.sin
+    rad = math.pi / 180
+
+    jde = (timestamps + _delta_t(timestamps)) / SECONDS_PER_DAY + JD_UNIX_EPOCH
+    t = (jde - J2000) / DAYS_PER_CENTURY
+
+    # Fundamental arguments (Meeus 47.1-47.6), in degrees
+    moon_mean_longitude = 218.3164477 + 481267.88123421 * t - 0.0015786 * t ** 2 + t ** 3 / 538841
+    d = 297.8501921 + 445267.1114034 * t - 0.0018819 * t ** 2 + t ** 3 / 545868
+    m = 357.5291092 + 35999.0502909 * t - 0.0001536 * t ** 2
+    m_moon = 134.9633964 + 477198.8675055 * t + 0.0087414 * t ** 2 + t ** 3 / 69699
+    f = 93.2720950 + 483202.0175233 * t - 0.0036539 * t ** 2
+    a1 = 119.75 + 131.849 * t
+    a2 = 53.09 + 479264.290 * t
+    e = 1 - 0.002516 * t - 0.0000074 * t ** 2
+
+    sigma_l = 3958 * sin(a1 * rad) + 1962 * sin((moon_mean_longitude - f) * rad) + 318 * sin(a2 * rad)
+    for d_mult, m_mult, m_moon_mult, f_mult, coefficient in MOON_LONGITUDE_TERMS:
+        term = coefficient * sin((d_mult * d + m_mult * m + m_moon_mult * m_moon + f_mult * f) * rad)
+        sigma_l = sigma_l + (term * e ** abs(m_mult) if m_mult else term)
+    moon_longitude = moon_mean_longitude + sigma_l / 1000000
+
+    # The Sun's apparent longitude (Meeus chapter 25, low accuracy). Nutation
+    # shifts both longitudes equally, so only the aberration is applied.
+    sun_mean_longitude = 280.46646 + 36000.76983 * t + 0.0003032 * t ** 2
+    sun_center = ((1.914602 - 0.004817 * t - 0.000014 * t ** 2) * sin(m * rad)
+                  + (0.019993 - 0.000101 * t) * sin(2 * m * rad)
+                  + 0.000289 * sin(3 * m * rad))
+    sun_longitude = sun_mean_longitude + sun_center - 0.00569
+
+    return (moon_longitude - sun_longitude) % 360
+
+def phase_fraction(timestamps):
+    """Returns how far through the lunation each instant is: 0 at New Moon, 0.5 at Full Moon."""
+    return moon_elongation(timestamps) / 360
+
+def illuminated_fraction(timestamps):
+    """Returns the illuminated fraction of the Moon's disc (0 new, 1 full), to within about 1%."""
+    elongation = moon_elongation(timestamps)
+    cos = np.cos if _is_array(elongation) else math.cos
+    return (1 - cos(elongation * (math.pi / 180))) / 2
+
+def moon_age(timestamps):
+    """Returns the days since the most recent New Moon, for one instant or an array of them."""
+    timestamps = _as_float_or_array(timestamps)
+    if _numpy_available and not _is_array(timestamps):
+        return (timestamps - _last_new_moon(timestamps)) / SECONDS_PER_DAY
+    # Step back by the mean lunation fraction, then solve for the New Moon exactly.
+    estimates = timestamps - phase_fraction(timestamps) * SYNODIC_MONTH_SECONDS
+    return (timestamps - _solve_phase_times(estimates, 0.0)) / SECONDS_PER_DAY
+
+def _last_new_moon(timestamp):
+    """The most recent New Moon at or before one instant, from the cached New Moons."""
+    global _new_moons
+    if not (_new_moons and _new_moons[0] <= timestamp < _new_moons[-1]):
+        margin = NEW_MOON_WINDOW_LUNATIONS * SYNODIC_MONTH_SECONDS
+        times, kinds = find_phase_events(timestamp - margin, timestamp + margin)
+        _new_moons = tuple(times[kinds == 0].tolist())
+    return _new_moons[bisect_right(_new_moons, timestamp) - 1]
+
+# --- Phase Event Search ---
+
+def _solve_phase_times(estimates, target_degrees):
+    """
+    Refines estimated instants to where the elongation equals `target_degrees`,
+    by Newton iteration on every element at once. The elongation grows
+    monotonically, so each estimate converges to the event nearest it.
+    """
+    times = estimates
+    for _ in range(PHASE_SEARCH_MAX_ITERATIONS):
+        # Signed distance to the target, wrapped into [-180, 180) degrees.
+        error = (moon_elongation(times) - target_degrees + 180) % 360 - 180
+        rate = ((moon_elongation(times + PHASE_RATE_STEP) - moon_elongation(times - PHASE_RATE_STEP)) % 360
+                / (2 * PHASE_RATE_STEP))
+        step = error / rate
+        times = times - step
+        largest_step = float(np.abs(step).max()) if _is_array(step) else abs(step)
+        if largest_step < PHASE_SEARCH_TOLERANCE:
+            break
+    return times
+
+def find_phase_events(start_ts, end_ts):
+    """
+    Returns (times, kinds) for every New Moon, First Quarter, Full Moon and
+    Last Quarter with start_ts <= time < end_ts. `times` are UTC POSIX
+    seconds; `kinds` index PHASE_EVENTS.
+    """
+    _require_numpy()
+
+    # One mean quarter-lunation per candidate event, with a margin at both ends.
+    first_quarter = math.floor((start_ts - MEAN_NEW_MOON_EPOCH) / SYNODIC_MONTH_SECONDS * 4) - 1
+    last_quarter = math.ceil((end_ts - MEAN_NEW_MOON_EPOCH) / SYNODIC_MONTH_SECONDS * 4) + 1
+    quarters = np.arange(first_quarter, last_quarter + 1)
+    kinds = quarters % 4
+
+    estimates = MEAN_NEW_MOON_EPOCH + quarters * (SYNODIC_MONTH_SECONDS / 4)
+    times = _solve_phase_times(estimates, kinds * PHASE_EVENT_DEGREES)
+
+    in_range = (times >= start_ts) & (times < end_ts)
+    return times[in_range], kinds[in_range]
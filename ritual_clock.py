@@ -1,5 +1,9 @@
+import sys
 import time
-from datetime import datetime
+from datetime import datetime, timezone
+
+from lunar import moon_age, find_phase_events, PHASE_EVENTS
+from tahkmahnelle_calendar import FrameClock
 
 # Calendar structure
 MONTHS, WEEKS, DAYS = 14, 6, 5
@@ -12,7 +16,6 @@ WHIKS_PER_YEAR = MONTHS * WEEKS * DAYS * WHIKS_PER_DAY
 
 # Anchor date: Oct 14, 2025 UTC
 ANCHOR = datetime(2025, 10, 14, 0, 0, 0)
-KNOWN_NEW_MOON = datetime(2024, 10, 2, 18, 49)
 
 # Phonology
 phonology = {
@@ -28,8 +31,13 @@ months = [phonology[c] for c in 'abcdefghijklmn']
 weeks = [phonology[c] for c in 'opqrst']
 days = [phonology[c] for c in 'uvwxy']
 
+def utc_timestamp(now):
+    """POSIX seconds for a naive UTC datetime."""
+    return now.replace(tzinfo=timezone.utc).timestamp()
+
 def lunar_phase(now):
-    age = ((now - KNOWN_NEW_MOON).total_seconds()) / 86400 % 29.53059
+    # Days since the true (not mean) New Moon, from the lunar engine
+    age = moon_age(utc_timestamp(now))
     if age < 1.5: return "🌑 New Moon"
     elif age < 7.4: return "🌒 Waxing Crescent"
     elif age < 8.9: return "🌓 First Quarter"
@@ -39,8 +47,8 @@ def lunar_phase(now):
     elif age < 23.6: return "🌗 Last Quarter"
     else: return "🌘 Waning Crescent"
 
-def get_time():
-    now = datetime.utcnow()
+def get_date(now):
+    """Returns the calendar date and time of day of a naive UTC datetime."""
     whiks = int((now - ANCHOR).total_seconds() * WHIKS_PER_SECOND)
     year = whiks // WHIKS_PER_YEAR
     rem = whiks % WHIKS_PER_YEAR
@@ -57,17 +65,48 @@ def get_time():
         "week": weeks[w],
         "day": days[d],
         "hour": h, "minute": mi, "second": s, "whik": wk,
-        "arc": solar_arc(h, mi, wk),
-        "moon": lunar_phase(now)
     }
 
+def get_time(now=None):
+    now = now or datetime.utcnow()
+    t = get_date(now)
+    t["arc"] = solar_arc(t["hour"], t["minute"], t["whik"])
+    t["moon"] = lunar_phase(now)
+    return t
+
 def solar_arc(hour, minute, whik):
     total = hour * WHIKS_PER_HOUR + minute * WHIKS_PER_MINUTE + whik
     position = int(total / WHIKS_PER_DAY * 30)
     return "☀" + "—" * position + "◉" + "—" * (30 - position)
 
-while True:
-    t = get_time()
-    print(f"\r{t['arc']} | {t['moon']} | Year {t['year']} | Month: {t['month']} | Week: {t['week']} | Day: {t['day']} | "
-          f"{t['hour']:02}:{t['minute']:02}:{t['second']:02}:{t['whik']:03}", end="")
-    time.sleep(1)
+def print_almanac(start_year, years):
+    """Prints every principal lunar phase from Jan 1 of start_year, for `years` years, with its ritual date."""
+    began = time.perf_counter()
+    start = datetime(start_year, 1, 1)
+    end = datetime(start_year + years, 1, 1)
+    times, kinds = find_phase_events(utc_timestamp(start), utc_timestamp(end))
+
+    lines = []
+    for ts, kind in zip(times.tolist(), kinds.tolist()):
+        when = datetime.fromtimestamp(ts, timezone.utc).replace(tzinfo=None)
+        d = get_date(when)
+        lines.append(f"{when:%Y-%m-%d %H:%M} UTC | {PHASE_EVENTS[kind]:<17} | Year {d['year']} | Month: {d['month']} | "
+                     f"Week: {d['week']} | Day: {d['day']} | {d['hour']:02}:{d['minute']:02}:{d['second']:02}:{d['whik']:03}")
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
+    print(f"{len(times)} lunar phases over {years} years in {time.perf_counter() - began:.3f} s", file=sys.stderr)
+
+def run_clock():
+    for _ in FrameClock(1):
+        t = get_time()
+        print(f"\r{t['arc']} | {t['moon']} | Year {t['year']} | Month: {t['month']} | Week: {t['week']} | Day: {t['day']} | "
+              f"{t['hour']:02}:{t['minute']:02}:{t['second']:02}:{t['whik']:03}", end="", flush=True)
+
+# Usage: python ritual_clock.py                          (live clock)
+#        python ritual_clock.py almanac [start_year] [years]
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "almanac":
+        print_almanac(int(sys.argv[2]) if len(sys.argv) > 2 else datetime.utcnow().year,
+                      int(sys.argv[3]) if len(sys.argv) > 3 else 100)
+    else:
+        run_clock()
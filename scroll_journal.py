@@ -0,0 +1,307 @@
+# scroll_journal.py
+#
+# Buffered, rotating journal for the scroll and ritual logs.
+#
+# Lines written to a ScrollJournal are batched in memory and appended to the
+# file by a background thread once FLUSH_LINES are waiting or FLUSH_INTERVAL
+# seconds have passed, instead of opening and closing the file per line.
+#
+# Every line carries the T-date (year, month, day) it belongs to. The active
+# file rotates to a numbered segment (scroll.0001.txt, ...) when the T-month
+# changes or it would grow past max_bytes; closed segments can be gzipped.
+#
+# Each segment has a sparse index (<segment>.idx) with one entry per T-date:
+# the byte offset of the block of lines for that date. find() reads just
+# those blocks. Gzipped segments store each block as its own gzip member, so
+# a block can be decompressed on its own and the file still works with zcat.
+#
+# Look up a T-date from the command line:
+# python scroll_journal.py find vraelvrae_scroll.txt 222111-1-4
+
+import os
+import re
+import sys
+import gzip
+import atexit
+import threading
+
+FLUSH_LINES = 512
+FLUSH_INTERVAL = 1.0  # seconds
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+INDEX_SUFFIX = ".idx"
+GZIP_SUFFIX = ".gz"
+INDEX_HEADER_PLAIN = "# plain"
+INDEX_HEADER_GZIP = "# gzip"
+
+
+def format_t_date(t_date):
+    return "-".join(str(part) for part in t_date)
+
+
+def parse_t_date(text):
+    return tuple(int(part) for part in text.split("-"))
+
+
+def read_index(index_path):
+    """Returns (compressed, [(t_date, offset), ...]) from a segment index."""
+    with open(index_path, encoding="utf-8") as f:
+        compressed = f.readline().strip() == INDEX_HEADER_GZIP
+        entries = []
+        for line in f:
+            t_date, offset = line.split()
+            entries.append((parse_t_date(t_date), int(offset)))
+    return compressed, entries
+
+
+def write_index(index_path, compressed, entries):
+    """Writes a complete segment index, replacing any existing one atomically."""
+    temp_path = index_path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        f.write((INDEX_HEADER_GZIP if compressed else INDEX_HEADER_PLAIN) + "\n")
+        f.writelines(f"{format_t_date(t_date)} {offset}\n" for t_date, offset in entries)
+    os.replace(temp_path, index_path)
+
+
+def compress_segment(segment_path):
+    """
+    Gzips a closed segment one index block per gzip member, rewrites its
+    index with the compressed offsets, and removes the plain file.
+    """
+    index_path = segment_path + INDEX_SUFFIX
+    _, entries = read_index(index_path)
+    with open(segment_path, "rb") as f:
+        data = f.read()
+
+    bounds = [offset for _, offset in entries] + [len(data)]
+    if not entries or entries[0][1] > 0:
+        # Lines written before the index existed become a block of their own.
+        bounds.insert(0, 0)
+    compressed_entries = []
+    temp_path = segment_path + GZIP_SUFFIX + ".tmp"
+    with open(temp_path, "wb") as out:
+        for start, end in zip(bounds, bounds[1:]):
+            for t_date, offset in entries:
+                if offset == start:
+                    compressed_entries.append((t_date, out.tell()))
+            out.write(gzip.compress(data[start:end]))
+    os.replace(temp_path, segment_path + GZIP_SUFFIX)
+    write_index(index_path, True, compressed_entries)
+    os.remove(segment_path)
+
+
+def segment_path(path, number):
+    """Returns the name of closed segment `number` of the journal at `path`."""
+    base, ext = os.path.splitext(path)
+    return f"{base}.{number:04d}{ext}"
+
+
+def segment_numbers(path, suffixes=(INDEX_SUFFIX,)):
+    """Returns the numbers of the segments of the journal at `path` with a file ending in one of `suffixes`, sorted."""
+    base, ext = os.path.splitext(os.path.basename(path))
+    pattern = re.compile(re.escape(base) + r"\.(\d{4,})" + re.escape(ext)
+                         + "(?:" + "|".join(map(re.escape, suffixes)) + ")$")
+    directory = os.path.dirname(os.path.abspath(path))
+    return sorted({int(match.group(1)) for match in map(pattern.match, os.listdir(directory)) if match})
+
+
+def list_segments(path):
+    """Returns the closed segments of the journal at `path`, oldest first, by their uncompressed names."""
+    return [segment_path(path, number) for number in segment_numbers(path)]
+
+
+def find_entries(path, t_date):
+    """Returns every line of the journal at `path` for `t_date`, across all segments, oldest first."""
+    lines = []
+    for segment in list_segments(path) + [path]:
+        lines.extend(read_blocks(segment, tuple(t_date)))
+    return lines
+
+
+def read_blocks(segment_path, t_date):
+    """Yields the lines of `segment_path` indexed under `t_date`."""
+    index_path = segment_path + INDEX_SUFFIX
+    if not os.path.exists(index_path):
+        return
+    compressed, entries = read_index(index_path)
+    data_path = segment_path + GZIP_SUFFIX if compressed else segment_path
+    with open(data_path, "rb") as f:
+        for i, (entry_date, offset) in enumerate(entries):
+            if entry_date != t_date:
+                continue
+            f.seek(offset)
+            block = f.read(entries[i + 1][1] - offset) if i + 1 < len(entries) else f.read()
+            if compressed:
+                block = gzip.decompress(block)
+            yield from block.decode("utf-8").splitlines()
+
+
+class ScrollJournal:
+    """Appends T-dated lines to a rotating log file from a background thread."""
+
+    def __init__(self, path, max_bytes=DEFAULT_MAX_BYTES, rotate_monthly=True, compress=False,
+                 flush_lines=FLUSH_LINES, flush_interval=FLUSH_INTERVAL):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.rotate_monthly = rotate_monthly
+        self.compress = compress
+        self.flush_lines = flush_lines
+        self.flush_interval = flush_interval
+
+        self._pending = []
+        self._condition = threading.Condition()
+        self._flush_requested = 0
+        self._flushes_done = 0
+        self._closed = False
+
+        # File state, only touched by the writer thread once it starts.
+        self._file = open(path, "ab")
+        self._size = self._file.tell()
+        self._index_file = None
+        self._last_t_date = None
+        index_path = path + INDEX_SUFFIX
+        if os.path.exists(index_path):
+            _, entries = read_index(index_path)
+            if entries:
+                self._last_t_date = entries[-1][0]
+        self._open_index()
+
+        self._thread = threading.Thread(target=self._run, name=f"journal:{os.path.basename(path)}", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    # --- Writing ---
+
+    def write(self, text, t_date):
+        """Queues one line for the T-date (year, month, day) it belongs to."""
+        with self._condition:
+            if self._closed:
+                raise ValueError(f"journal {self.path} is closed")
+            self._pending.append((text, tuple(t_date)))
+            if len(self._pending) >= self.flush_lines:
+                self._condition.notify_all()
+
+    def flush(self):
+        """Writes every queued line to disk before returning."""
+        with self._condition:
+            if self._closed:
+                return
+            self._flush_requested += 1
+            target = self._flush_requested
+            self._condition.notify_all()
+            while self._flushes_done < target and self._thread.is_alive():
+                self._condition.wait()
+
+    def close(self):
+        """Flushes the remaining lines and stops the writer thread."""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+        atexit.unregister(self.close)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                if not (self._closed or self._flush_requested > self._flushes_done
+                        or len(self._pending) >= self.flush_lines):
+                    self._condition.wait(self.flush_interval)
+                batch, self._pending = self._pending, []
+                target = self._flush_requested
+                closing = self._closed
+            try:
+                self._write_batch(batch)
+            except OSError as e:
+                print(f"[Error] Could not write to {self.path}: {e}", file=sys.stderr)
+            with self._condition:
+                self._flushes_done = target
+                self._condition.notify_all()
+            if closing:
+                self._file.close()
+                self._index_file.close()
+                return
+
+    def _write_batch(self, batch):
+        if not batch:
+            return
+        chunk = []
+        for text, t_date in batch:
+            line = (text + "\n").encode("utf-8")
+            if self._needs_rotation(t_date, len(line)):
+                self._write_chunk(chunk)
+                chunk = []
+                self._rotate()
+            if t_date != self._last_t_date:
+                # A new block starts here; pending lines must be on disk first so the offset is right.
+                self._write_chunk(chunk)
+                chunk = []
+                self._index_file.write(f"{format_t_date(t_date)} {self._size}\n")
+                self._last_t_date = t_date
+            chunk.append(line)
+            self._size += len(line)  # Logical size, counting lines not yet written
+        self._write_chunk(chunk)
+        self._file.flush()
+        self._index_file.flush()
+
+    def _write_chunk(self, chunk):
+        if chunk:
+            self._file.write(b"".join(chunk))
+
+    # --- Rotation ---
+
+    def _needs_rotation(self, t_date, line_size):
+        if self._size == 0:
+            return False
+        if self.rotate_monthly and self._last_t_date is not None and t_date[:2] != self._last_t_date[:2]:
+            return True
+        return self._size + line_size > self.max_bytes
+
+    def _open_index(self):
+        index_path = self.path + INDEX_SUFFIX
+        if not os.path.exists(index_path):
+            write_index(index_path, False, [])
+        self._index_file = open(index_path, "a", encoding="utf-8")
+
+    def _rotate(self):
+        """
+        Closes the active file as the segment numbered one past the highest on
+        disk (older segments may have been deleted) and starts a new one.
+        """
+        numbers = segment_numbers(self.path, ("", GZIP_SUFFIX, INDEX_SUFFIX))
+        segment = segment_path(self.path, max(numbers, default=0) + 1)
+        for existing in (segment, segment + GZIP_SUFFIX, segment + INDEX_SUFFIX):
+            if os.path.exists(existing):
+                raise FileExistsError(f"segment {existing} already exists; not replacing it")
+        self._file.close()
+        self._index_file.close()
+        os.replace(self.path + INDEX_SUFFIX, segment + INDEX_SUFFIX)
+        os.replace(self.path, segment)
+        if self.compress:
+            compress_segment(segment)
+
+        self._file = open(self.path, "ab")
+        self._size = 0
+        self._last_t_date = None
+        self._open_index()
+
+    def segments(self):
+        """Returns the closed segments, oldest first, by their uncompressed names."""
+        return list_segments(self.path)
+
+    # --- Lookup ---
+
+    def find(self, t_date):
+        """Returns every journal line for `t_date`, across all segments, oldest first."""
+        self.flush()
+        return find_entries(self.path, t_date)
+
+
+# Usage: python scroll_journal.py find PATH YEAR-MONTH-DAY
+if __name__ == "__main__":
+    if len(sys.argv) != 4 or sys.argv[1] != "find":
+        print("Usage: python scroll_journal.py find PATH YEAR-MONTH-DAY", file=sys.stderr)
+        sys.exit(2)
+    for entry in find_entries(sys.argv[2], parse_t_date(sys.argv[3])):
+        print(entry)
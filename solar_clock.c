@@ -4,6 +4,8 @@
  * A C implementation of the conceptual solar clock.
  *
  * This program requires a C compiler (like GCC) and the standard C library.
+ * Solstice and equinox times come from solar_ephemeris.h (1800-2300), which is
+ * generated by solar_ephemeris.py and must sit next to this file.
  *
  * How to Compile and Run:
  * 1. Save this file as solar_clock.c
@@ -24,6 +26,8 @@
 #include <signal.h> // For signal handling (Ctrl+C)
 #include <stdlib.h> // For exit()
 
+#include "solar_ephemeris.h" // SOLAR_EVENTS[year][4], UTC timestamps
+
 // --- Define the custom time system ---
 const int WICKS_PER_MINUTE = 9;
 const int MINUTES_PER_HOUR = 7;
@@ -40,13 +44,31 @@ const long WICKS_PER_MONTH = WICKS_PER_WEEK * WEEKS_PER_MONTH;
 const long WICKS_PER_AGE = WICKS_PER_MONTH * MONTHS_PER_AGE;
 
 
-// Converts a date string (like "2025-03-20T09:01:00Z") to a time_t timestamp.
-time_t get_utc_timestamp(const char* date_string) {
-    struct tm tm = {0};
-    // strptime parses the string into the tm struct
-    strptime(date_string, "%Y-%m-%dT%H:%M:%SZ", &tm);
-    // timegm converts the tm struct to a UTC timestamp
-    return timegm(&tm);
+// Age names, indexed like the events that start them (March equinox first).
+static const char* AGE_NAMES[4] = {"Spring", "Summer", "Autumn", "Winter"};
+
+// Finds the solar event at or before now_ts, flattening SOLAR_EVENTS into one
+// chronological list. Returns its index, or -1 when now_ts is outside the table.
+long find_age_start_event(time_t now_ts) {
+    const long long* events = &SOLAR_EVENTS[0][0];
+    const long event_count = SOLAR_EPHEMERIS_YEARS * 4L;
+
+    struct tm now_tm;
+    gmtime_r(&now_ts, &now_tm);
+    long year_index = (now_tm.tm_year + 1900) - SOLAR_EPHEMERIS_FIRST_YEAR;
+    if (year_index < 0 || year_index >= SOLAR_EPHEMERIS_YEARS) {
+        return -1;
+    }
+
+    // Start at this year's December solstice and step back at most four events.
+    long i = year_index * 4 + 3;
+    while (i >= 0 && events[i] > now_ts) {
+        i--;
+    }
+    if (i < 0 || i + 1 >= event_count) {
+        return -1;
+    }
+    return i;
 }
 
 // Function to handle Ctrl+C for a clean exit
@@ -59,16 +81,7 @@ int main() {
     // Register the signal handler for Ctrl+C
     signal(SIGINT, handle_sigint);
 
-    // --- Celestial Event Timestamps for 2025/2026 (in UTC) ---
-    // These are the key moments that define the "Ages".
-    const time_t DEC_SOLSTICE_2024_TS = get_utc_timestamp("2024-12-21T09:20:00Z");
-    const time_t MAR_EQUINOX_2025_TS = get_utc_timestamp("2025-03-20T09:01:00Z");
-    const time_t JUN_SOLSTICE_2025_TS = get_utc_timestamp("2025-06-21T02:42:00Z");
-    const time_t SEP_EQUINOX_2025_TS = get_utc_timestamp("2025-09-22T18:19:00Z");
-    const time_t DEC_SOLSTICE_2025_TS = get_utc_timestamp("2025-12-21T14:03:00Z");
-    const time_t MAR_EQUINOX_2026_TS = get_utc_timestamp("2026-03-20T14:45:00Z");
-
-    printf("Initializing Solar Clock for 2025...\n");
+    printf("Initializing Solar Clock (%d-%d)...\n", SOLAR_EPHEMERIS_FIRST_YEAR, SOLAR_EPHEMERIS_LAST_YEAR);
     printf("Press Ctrl+C to stop.\n");
 
     // Main loop
@@ -83,32 +96,16 @@ int main() {
         time_t age_end_ts;
 
         // --- Determine the current age ---
-        if (now_ts < MAR_EQUINOX_2025_TS) {
-            age_name = "Winter";
-            age_num = 4;
-            age_start_ts = DEC_SOLSTICE_2024_TS;
-            age_end_ts = MAR_EQUINOX_2025_TS;
-        } else if (now_ts >= MAR_EQUINOX_2025_TS && now_ts < JUN_SOLSTICE_2025_TS) {
-            age_name = "Spring";
-            age_num = 1;
-            age_start_ts = MAR_EQUINOX_2025_TS;
-            age_end_ts = JUN_SOLSTICE_2025_TS;
-        } else if (now_ts >= JUN_SOLSTICE_2025_TS && now_ts < SEP_EQUINOX_2025_TS) {
-            age_name = "Summer";
-            age_num = 2;
-            age_start_ts = JUN_SOLSTICE_2025_TS;
-            age_end_ts = SEP_EQUINOX_2025_TS;
-        } else if (now_ts >= SEP_EQUINOX_2025_TS && now_ts < DEC_SOLSTICE_2025_TS) {
-            age_name = "Autumn";
-            age_num = 3;
-            age_start_ts = SEP_EQUINOX_2025_TS;
-            age_end_ts = DEC_SOLSTICE_2025_TS;
-        } else {
-            age_name = "Winter";
-            age_num = 4;
-            age_start_ts = DEC_SOLSTICE_2025_TS;
-            age_end_ts = MAR_EQUINOX_2026_TS;
+        long event_index = find_age_start_event(now_ts);
+        if (event_index < 0) {
+            printf("\nThe current date is outside the solar ephemeris (%d-%d).\n",
+                   SOLAR_EPHEMERIS_FIRST_YEAR, SOLAR_EPHEMERIS_LAST_YEAR);
+            return 1;
         }
+        age_name = AGE_NAMES[event_index % 4];
+        age_num = (int)(event_index % 4) + 1;
+        age_start_ts = (time_t)(&SOLAR_EVENTS[0][0])[event_index];
+        age_end_ts = (time_t)(&SOLAR_EVENTS[0][0])[event_index + 1];
 
         // --- Calculate the custom time ---
         double total_age_duration_sec = difftime(age_end_ts, age_start_ts);
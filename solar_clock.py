@@ -2,24 +2,34 @@
 #
 # A Python script for a conceptual solar clock.
 #
-# To run this script, you first need to install the 'astral' library:
-# pip install astral
+# Solstice and equinox times come from the precomputed ephemeris table
+# (solar_ephemeris.bin, covering 1800-2300), so no astronomy library is needed.
+# To regenerate the table, run: python solar_ephemeris.py
 #
-# Then, execute the script from your terminal:
+# Execute the script from your terminal:
 # python solar_clock.py
 #
 # The clock will start running and updating in place. Press Ctrl+C to stop.
+#
+# The ephemeris is read once into a sorted array of age boundaries. The live
+# loop finds the current age by bisecting it (and only again when the age
+# ends) and counts wicks in integer microseconds. get_solar_time_batch()
+# does the same for whole arrays of instants with NumPy.
 
-import time
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 import sys
+import time
+import bisect
+
+from solar_ephemeris import SolarEphemeris, DEFAULT_TABLE_PATH
+from tahkmahnelle_calendar import FrameClock
 
 try:
-    # astral is used to get precise dates for solstices and equinoxes
-    from astral.sun import equinoxes_and_solstices
-except ImportError:
-    print("Error: The 'astral' library is required.")
-    print("Please install it using: pip install astral")
+    # The ephemeris table is memory-mapped once; each lookup is a fixed-offset read.
+    EPHEMERIS = SolarEphemeris(DEFAULT_TABLE_PATH)
+except (OSError, ValueError) as e:
+    print(f"Error: Could not open the solar ephemeris table: {e}")
+    print("Please generate it using: python solar_ephemeris.py")
     sys.exit(1)
 
 # --- Define the custom time system based on the prompt ---
@@ -45,106 +55,177 @@ def get_celestial_events(year):
     Gets the UTC datetimes for the equinoxes and solstices of a given year.
     The events are returned in chronological order.
     """
-    # The astral library provides the four key moments of the solar year.
-    events = equinoxes_and_solstices(year)
-    return sorted(events, key=lambda x: x.timestamp())
+    # The ephemeris table stores the four key moments of each solar year in order.
+    return EPHEMERIS.events(year)
+
+
+# --- Age Boundaries ---
+# Every solar event in the ephemeris starts an age, so the whole table is one
+# sorted array of age boundaries. It is read once, as integer microseconds
+# since the epoch, and an instant's age is found with a bisect.
+AGE_NAMES = ("Spring", "Summer", "Autumn", "Winter")  # Indexed like the events that start them
+AGE_BOUNDARIES_US = tuple(timestamp * 1000000 for timestamp in EPHEMERIS.timestamps())
 
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+ONE_MICROSECOND = timedelta(microseconds=1)
 
-def find_current_age(now, events_this_year, events_next_year):
+def utc_microseconds(now):
+    """Converts an aware datetime to integer microseconds since the epoch, exactly."""
+    return (now - EPOCH) // ONE_MICROSECOND
+
+
+def find_age_index(now_us):
     """
-    Determines the current age (season), its number, start time, and end time.
-    Handles the transition between years seamlessly.
+    Returns the index in AGE_BOUNDARIES_US of the event that started the age
+    containing `now_us`. Raises ValueError outside the ephemeris table.
     """
-    all_events = events_this_year + [events_next_year[0]]
-
-    # Case 1: Before the first event of the year (Vernal Equinox).
-    # This means we are in the 'Winter' age that began in the previous year.
-    if now < all_events[0]:
-        events_last_year = get_celestial_events(now.year - 1)
-        start_event = events_last_year[3]  # Previous year's Winter Solstice
-        end_event = all_events[0]          # This year's Vernal Equinox
-        age_name = "Winter"
-        age_number = 4
-    # Case 2: Between Vernal Equinox and Summer Solstice.
-    elif all_events[0] <= now < all_events[1]:
-        age_name = "Spring"
-        age_number = 1
-        start_event = all_events[0]
-        end_event = all_events[1]
-    # Case 3: Between Summer Solstice and Autumnal Equinox.
-    elif all_events[1] <= now < all_events[2]:
-        age_name = "Summer"
-        age_number = 2
-        start_event = all_events[1]
-        end_event = all_events[2]
-    # Case 4: Between Autumnal Equinox and Winter Solstice.
-    elif all_events[2] <= now < all_events[3]:
-        age_name = "Autumn"
-        age_number = 3
-        start_event = all_events[2]
-        end_event = all_events[3]
-    # Case 5: After the Winter Solstice.
-    else:
-        age_name = "Winter"
-        age_number = 4
-        start_event = all_events[3]
-        end_event = all_events[4]  # The Vernal Equinox of the next year.
+    i = bisect.bisect_right(AGE_BOUNDARIES_US, now_us) - 1
+    if not 0 <= i < len(AGE_BOUNDARIES_US) - 1:
+        raise ValueError(f"{now_us // 1000000} is outside the solar ephemeris table "
+                         f"({EPHEMERIS.first_year}-{EPHEMERIS.last_year})")
+    return i
 
-    return age_name, age_number, start_event, end_event
 
+class AgeTracker:
+    """
+    Remembers the age containing the last looked-up instant. While lookups stay
+    inside it, a lookup is two comparisons; the boundary array is only bisected
+    again once the age ends.
+    """
 
-def main():
-    """Main function to run the solar clock."""
-    print("Initializing Solar Clock...")
-    last_year_checked = -1
-    events_this_year = None
-    events_next_year = None
+    def __init__(self):
+        self._start_us = 0
+        self._end_us = 0
+        self._age = None
+        self.start = None  # The age's start and end as UTC datetimes
+        self.end = None
+
+    def lookup(self, now_us):
+        """Returns (age_name, age_number, start_us, end_us) for the age containing `now_us`."""
+        if not self._start_us <= now_us < self._end_us:
+            i = find_age_index(now_us)
+            self._start_us = AGE_BOUNDARIES_US[i]
+            self._end_us = AGE_BOUNDARIES_US[i + 1]
+            self._age = (AGE_NAMES[i % 4], i % 4 + 1, self._start_us, self._end_us)
+            self.start = EPOCH + timedelta(microseconds=self._start_us)
+            self.end = EPOCH + timedelta(microseconds=self._end_us)
+        return self._age
+
+
+_AGE_TRACKER = AgeTracker()
+
+
+def find_current_age(now):
+    """
+    Determines the current age (season) of an aware datetime. Returns
+    (age_name, age_number, start, end, progress): the age's start and end as
+    UTC datetimes and the fraction of it that has passed (0 <= progress < 1).
+    """
+    now_us = utc_microseconds(now)
+    age_name, age_number, start_us, end_us = _AGE_TRACKER.lookup(now_us)
+    return age_name, age_number, _AGE_TRACKER.start, _AGE_TRACKER.end, (now_us - start_us) / (end_us - start_us)
+
+
+# --- Wick Decomposition ---
+
+def decompose_wicks(total_wicks):
+    """
+    Splits the wicks elapsed in an age into (months, weeks, days, hours,
+    minutes, wicks). Months, Weeks and Days are 1-based; the rest are 0-based.
+    """
+    months, remaining_wicks = divmod(total_wicks, WICKS_PER_MONTH)
+    weeks, remaining_wicks = divmod(remaining_wicks, WICKS_PER_WEEK)
+    days, remaining_wicks = divmod(remaining_wicks, WICKS_PER_DAY)
+    hours, remaining_wicks = divmod(remaining_wicks, WICKS_PER_HOUR)
+    minutes, wicks = divmod(remaining_wicks, WICKS_PER_MINUTE)
+    return months + 1, weeks + 1, days + 1, hours, minutes, wicks
+
+
+def age_wicks(elapsed_us, age_us):
+    """Whole wicks passed after `elapsed_us` of an age lasting `age_us`, in integer math (no rounding at boundaries)."""
+    return elapsed_us * WICKS_PER_AGE // age_us
+
+
+def get_solar_time(now):
+    """Returns the solar clock reading for an aware UTC datetime as a dict."""
+    now_us = utc_microseconds(now)
+    age_name, age_num, start_us, end_us = _AGE_TRACKER.lookup(now_us)
+    months, weeks, days, hours, minutes, wicks = decompose_wicks(age_wicks(now_us - start_us, end_us - start_us))
+    return {
+        'age': age_name, 'age_number': age_num,
+        'month': months, 'week': weeks, 'day': days, 'hour': hours, 'minute': minutes, 'wick': wicks,
+        'time': f"{age_num}.{months}.{weeks}.{days}.{hours}.{minutes}.{wicks}",
+    }
 
+
+# --- Batch Decomposition (NumPy) ---
+
+def _require_numpy():
+    """
+    Imports NumPy for the batch API, raising a helpful error when it is not
+    installed. It is imported on first use, so the live clock never loads it.
+    """
     try:
-        while True:
-            now = datetime.now(timezone.utc)
+        import numpy
+    except ImportError:
+        raise ImportError("The batch solar time API requires NumPy. Please install it using: pip install numpy") from None
+    return numpy
 
-            # To save resources, only fetch the celestial events when the year changes.
-            if now.year != last_year_checked:
-                print(f"Calibrating for the year {now.year}...")
-                last_year_checked = now.year
-                events_this_year = get_celestial_events(now.year)
-                events_next_year = get_celestial_events(now.year + 1)
 
-            # Determine the current age and its start/end boundaries.
-            age_name, age_num, age_start, age_end = find_current_age(now, events_this_year, events_next_year)
+def get_solar_time_batch(timestamps):
+    """
+    Vectorized form of get_solar_time for an array of instants: POSIX
+    timestamps or UTC datetime64 values. Returns a dict of NumPy arrays with
+    'age_number', 'month', 'week', 'day', 'hour', 'minute', 'wick' (the same
+    fields as get_solar_time) and 'progress', the fraction of the age passed.
+    """
+    np = _require_numpy()
+    timestamps = np.asarray(timestamps)
+    if np.issubdtype(timestamps.dtype, np.datetime64):
+        now_us = timestamps.astype('datetime64[us]').astype(np.int64)
+    else:
+        now_us = np.round(timestamps.astype(np.float64) * 1e6).astype(np.int64)
+
+    boundaries = np.array(AGE_BOUNDARIES_US, dtype=np.int64)
+    index = np.searchsorted(boundaries, now_us, side='right') - 1
+    if index.size and (index.min() < 0 or index.max() >= len(boundaries) - 1):
+        raise ValueError(f"timestamps outside the solar ephemeris table ({EPHEMERIS.first_year}-{EPHEMERIS.last_year})")
+    start_us = boundaries[index]
+    age_us = boundaries[index + 1] - start_us
+    elapsed_us = now_us - start_us
+
+    # The same integer divmod chain as decompose_wicks, column-wise.
+    total_wicks = elapsed_us * WICKS_PER_AGE // age_us
+    months, remaining = np.divmod(total_wicks, WICKS_PER_MONTH)
+    weeks, remaining = np.divmod(remaining, WICKS_PER_WEEK)
+    days, remaining = np.divmod(remaining, WICKS_PER_DAY)
+    hours, remaining = np.divmod(remaining, WICKS_PER_HOUR)
+    minutes, wicks = np.divmod(remaining, WICKS_PER_MINUTE)
+
+    return {
+        'age_number': (index % 4 + 1).astype(np.int8),
+        'month': (months + 1).astype(np.int8), 'week': (weeks + 1).astype(np.int8),
+        'day': (days + 1).astype(np.int8), 'hour': hours.astype(np.int8),
+        'minute': minutes.astype(np.int8), 'wick': wicks.astype(np.int8),
+        'progress': elapsed_us / age_us,
+    }
 
-            # Calculate the total duration of the current age in real-world seconds.
-            total_age_duration_sec = (age_end - age_start).total_seconds()
-            # Calculate how many real-world seconds have passed in this age.
-            elapsed_sec_in_age = (now - age_start).total_seconds()
 
-            # Find what fraction of the age has been completed.
-            age_proportion = elapsed_sec_in_age / total_age_duration_sec
+def main():
+    """Main function to run the solar clock."""
+    print("Initializing Solar Clock...")
+    tracker = AgeTracker()
 
-            # Convert the proportion of the age passed into the total number of "wicks" passed.
-            total_wicks = int(age_proportion * WICKS_PER_AGE)
+    try:
+        # Nine frames a second, on fixed deadlines so the running clock does not drift.
+        # Each frame is one integer clock read and an interval check; the ephemeris
+        # is only bisected again when the current age ends.
+        for _ in FrameClock(1/9):
+            now_us = time.time_ns() // 1000
+            age_name, age_num, age_start_us, age_end_us = tracker.lookup(now_us)
+            months, weeks, days, hours, minutes, wicks = decompose_wicks(
+                age_wicks(now_us - age_start_us, age_end_us - age_start_us))
 
-            # Deconstruct the total wicks into the custom time units using division and modulo.
-            remaining_wicks = total_wicks
-            
-            # Note: Months, Weeks, and Days are 1-based (start from 1).
-            months = (remaining_wicks // WICKS_PER_MONTH) + 1
-            remaining_wicks %= WICKS_PER_MONTH
-            
-            weeks = (remaining_wicks // WICKS_PER_WEEK) + 1
-            remaining_wicks %= WICKS_PER_WEEK
-            
-            days = (remaining_wicks // WICKS_PER_DAY) + 1
-            remaining_wicks %= WICKS_PER_DAY
-            
-            # Note: Hours, Minutes, and Wicks are 0-based (start from 0).
-            hours = remaining_wicks // WICKS_PER_HOUR
-            remaining_wicks %= WICKS_PER_HOUR
-            
-            minutes = remaining_wicks // WICKS_PER_MINUTE
-            wicks = remaining_wicks % WICKS_PER_MINUTE
-            
             # --- Format and display the output ---
             # Format: AgeNumber.Month.Week.Day.Hour.Minute.Wick
             time_str = f"{age_num}.{months}.{weeks}.{days}.{hours}.{minutes}.{wicks}"
@@ -155,9 +236,6 @@ def main():
             sys.stdout.write(display_string)
             sys.stdout.flush()
 
-            # Sleep for a fraction of a second to create a running clock effect.
-            time.sleep(1/9)
-
     except KeyboardInterrupt:
         print("\nSolar clock stopped.")
     except Exception as e:
@@ -0,0 +1,521 @@
+/*
+ * solar_ephemeris.h
+ *
+ * Generated by solar_ephemeris.py - do not edit by hand.
+ * UTC POSIX timestamps of the March equinox, June solstice, September
+ * equinox and December solstice of each year (Meeus, Astronomical
+ * Algorithms, chapter 27).
+ */
+
+#ifndef SOLAR_EPHEMERIS_H
+#define SOLAR_EPHEMERIS_H
+
+#define SOLAR_EPHEMERIS_FIRST_YEAR 1800
+#define SOLAR_EPHEMERIS_LAST_YEAR 2300
+#define SOLAR_EPHEMERIS_YEARS 501
+
+static const long long SOLAR_EVENTS[SOLAR_EPHEMERIS_YEARS][4] = {
+    {-5357850491LL, -5349823710LL, -5341739668LL, -5333989415LL}, /* 1800 */
+    {-5326293875LL, -5318266695LL, -5310182819LL, -5302432691LL}, /* 1801 */
+    {-5294736728LL, -5286709489LL, -5278625889LL, -5270875777LL}, /* 1802 */
+    {-5263179986LL, -5255153514LL, -5247069395LL, -5239319045LL}, /* 1803 */
+    {-5231623368LL, -5223596627LL, -5215512037LL, -5207762165LL}, /* 1804 */
+    {-5200066548LL, -5192039437LL, -5183955047LL, -5176205202LL}, /* 1805 */
+    {-5168509684LL, -5160482997LL, -5152398735LL, -5144648149LL}, /* 1806 */
+    {-5136952695LL, -5128925945LL, -5120841501LL, -5113090754LL}, /* 1807 */
+    {-5105395825LL, -5097369249LL, -5089284529LL, -5081533814LL}, /* 1808 */
+    {-5073838701LL, -5065812195LL, -5057727481LL, -5049976925LL}, /* 1809 */
+    {-5042281171LL, -5034254689LL, -5026170207LL, -5018419570LL}, /* 1810 */
+    {-5010724036LL, -5002698234LL, -4994613593LL, -4986862495LL}, /* 1811 */
+    {-4979167256LL, -4971141072LL, -4963056274LL, -4955305425LL}, /* 1812 */
+    {-4947610222LL, -4939583554LL, -4931499141LL, -4923748390LL}, /* 1813 */
+    {-4916053055LL, -4908027023LL, -4899942838LL, -4892191725LL}, /* 1814 */
+    {-4884496164LL, -4876470105LL, -4868385489LL, -4860634594LL}, /* 1815 */
+    {-4852939455LL, -4844913366LL, -4836828441LL, -4829077792LL}, /* 1816 */
+    {-4821382797LL, -4813356620LL, -4805271726LL, -4797521007LL}, /* 1817 */
+    {-4789825813LL, -4781799426LL, -4773714651LL, -4765963554LL}, /* 1818 */
+    {-4758268887LL, -4750243335LL, -4742158377LL, -4734406691LL}, /* 1819 */
+    {-4726712187LL, -4718686661LL, -4710601330LL, -4702849918LL}, /* 1820 */
+    {-4695155090LL, -4687129365LL, -4679044297LL, -4671293061LL}, /* 1821 */
+    {-4663597867LL, -4655572887LL, -4647488218LL, -4639736513LL}, /* 1822 */
+    {-4632041125LL, -4624015917LL, -4615931047LL, -4608179338LL}, /* 1823 */
+    {-4600484488LL, -4592458896LL, -4584374023LL, -4576622442LL}, /* 1824 */
+    {-4568927692LL, -4560901979LL, -4552817323LL, -4545065814LL}, /* 1825 */
+    {-4537370624LL, -4529344683LL, -4521259911LL, -4513508423LL}, /* 1826 */
+    {-4505813516LL, -4497788339LL, -4489703183LL, -4481951526LL}, /* 1827 */
+    {-4474256818LL, -4466231544LL, -4458145830LL, -4450394514LL}, /* 1828 */
+    {-4442699861LL, -4434674085LL, -4426588496LL, -4418837095LL}, /* 1829 */
+    {-4411142576LL, -4403117496LL, -4395032315LL, -4387280091LL}, /* 1830 */
+    {-4379585623LL, -4371560621LL, -4363475103LL, -4355722724LL}, /* 1831 */
+    {-4348028621LL, -4340003604LL, -4331917925LL, -4324165702LL}, /* 1832 */
+    {-4316471301LL, -4308446611LL, -4300361266LL, -4292609180LL}, /* 1833 */
+    {-4284914149LL, -4276889327LL, -4268804015LL, -4261051808LL}, /* 1834 */
+    {-4253357066LL, -4245332712LL, -4237247426LL, -4229494892LL}, /* 1835 */
+    {-4221800473LL, -4213775906LL, -4205690507LL, -4197938258LL}, /* 1836 */
+    {-4190243793LL, -4182218562LL, -4174133310LL, -4166381196LL}, /* 1837 */
+    {-4158686590LL, -4150662082LL, -4142577204LL, -4134824776LL}, /* 1838 */
+    {-4127130032LL, -4119105580LL, -4111020083LL, -4103267877LL}, /* 1839 */
+    {-4095573577LL, -4087548751LL, -4079462836LL, -4071710860LL}, /* 1840 */
+    {-4064016721LL, -4055991993LL, -4047906383LL, -4040154262LL}, /* 1841 */
+    {-4032460022LL, -4024435108LL, -4016349294LL, -4008596682LL}, /* 1842 */
+    {-4000902943LL, -3992878667LL, -3984792632LL, -3977039556LL}, /* 1843 */
+    {-3969345970LL, -3961322037LL, -3953235752LL, -3945482950LL}, /* 1844 */
+    {-3937788956LL, -3929764673LL, -3921678368LL, -3913925610LL}, /* 1845 */
+    {-3906231287LL, -3898207778LL, -3890122135LL, -3882368875LL}, /* 1846 */
+    {-3874674471LL, -3866650922LL, -3858565052LL, -3850811707LL}, /* 1847 */
+    {-3843117745LL, -3835093555LL, -3827007597LL, -3819254429LL}, /* 1848 */
+    {-3811560461LL, -3803536392LL, -3795451018LL, -3787697954LL}, /* 1849 */
+    {-3780003503LL, -3771979297LL, -3763893617LL, -3756140556LL}, /* 1850 */
+    {-3748446373LL, -3740422627LL, -3732336571LL, -3724583489LL}, /* 1851 */
+    {-3716889550LL, -3708865892LL, -3700779578LL, -3693026857LL}, /* 1852 */
+    {-3685332965LL, -3677308665LL, -3669222234LL, -3661469345LL}, /* 1853 */
+    {-3653775627LL, -3645751977LL, -3637666104LL, -3629912491LL}, /* 1854 */
+    {-3622218892LL, -3614195558LL, -3606109300LL, -3598355577LL}, /* 1855 */
+    {-3590662255LL, -3582638651LL, -3574551992LL, -3566798506LL}, /* 1856 */
+    {-3559104900LL, -3551081721LL, -3542995671LL, -3535242262LL}, /* 1857 */
+    {-3527548119LL, -3519524885LL, -3511438685LL, -3503685033LL}, /* 1858 */
+    {-3495991296LL, -3487968250LL, -3479881921LL, -3472127967LL}, /* 1859 */
+    {-3464434542LL, -3456411482LL, -3448325244LL, -3440571565LL}, /* 1860 */
+    {-3432878014LL, -3424854372LL, -3416768011LL, -3409014371LL}, /* 1861 */
+    {-3401320642LL, -3393297623LL, -3385211625LL, -3377457654LL}, /* 1862 */
+    {-3369763810LL, -3361741091LL, -3353654617LL, -3345900843LL}, /* 1863 */
+    {-3338207409LL, -3330184098LL, -3322097029LL, -3314343387LL}, /* 1864 */
+    {-3306650040LL, -3298626836LL, -3290540430LL, -3282786597LL}, /* 1865 */
+    {-3275093131LL, -3267069968LL, -3258983376LL, -3251229043LL}, /* 1866 */
+    {-3243536002LL, -3235513191LL, -3227426209LL, -3219671583LL}, /* 1867 */
+    {-3211978573LL, -3203956186LL, -3195869308LL, -3188115118LL}, /* 1868 */
+    {-3180421670LL, -3172398947LL, -3164311935LL, -3156557773LL}, /* 1869 */
+    {-3148864089LL, -3140841832LL, -3132755420LL, -3125000809LL}, /* 1870 */
+    {-3117307196LL, -3109285076LL, -3101198625LL, -3093444054LL}, /* 1871 */
+    {-3085750952LL, -3077728079LL, -3069641189LL, -3061886778LL}, /* 1872 */
+    {-3054193640LL, -3046170872LL, -3038084675LL, -3030330407LL}, /* 1873 */
+    {-3022636914LL, -3014614363LL, -3006527818LL, -2998773465LL}, /* 1874 */
+    {-2991080309LL, -2983057960LL, -2974970686LL, -2967216252LL}, /* 1875 */
+    {-2959523384LL, -2951501247LL, -2943414059LL, -2935659924LL}, /* 1876 */
+    {-2927967094LL, -2919944511LL, -2911857096LL, -2904102563LL}, /* 1877 */
+    {-2896409854LL, -2888387770LL, -2880300788LL, -2872545523LL}, /* 1878 */
+    {-2864852868LL, -2856831340LL, -2848744219LL, -2840988918LL}, /* 1879 */
+    {-2833296381LL, -2825274506LL, -2817186787LL, -2809431684LL}, /* 1880 */
+    {-2801738762LL, -2793717114LL, -2785630190LL, -2777875139LL}, /* 1881 */
+    {-2770181723LL, -2762160198LL, -2754073306LL, -2746317975LL}, /* 1882 */
+    {-2738624985LL, -2730603350LL, -2722516035LL, -2714760464LL}, /* 1883 */
+    {-2707067717LL, -2699046032LL, -2690959103LL, -2683203960LL}, /* 1884 */
+    {-2675511008LL, -2667488934LL, -2659401830LL, -2651646724LL}, /* 1885 */
+    {-2643953606LL, -2635931915LL, -2627844940LL, -2620089601LL}, /* 1886 */
+    {-2612396477LL, -2604375162LL, -2596287950LL, -2588532901LL}, /* 1887 */
+    {-2580840251LL, -2572818332LL, -2564730368LL, -2556975401LL}, /* 1888 */
+    {-2549282933LL, -2541260990LL, -2533173696LL, -2525418468LL}, /* 1889 */
+    {-2517725944LL, -2509704358LL, -2501617018LL, -2493861308LL}, /* 1890 */
+    {-2486169265LL, -2478148023LL, -2470059945LL, -2462303951LL}, /* 1891 */
+    {-2454611864LL, -2446590990LL, -2438503196LL, -2430747641LL}, /* 1892 */
+    {-2423055101LL, -2415034191LL, -2406946415LL, -2399190745LL}, /* 1893 */
+    {-2391498030LL, -2383477378LL, -2375389929LL, -2367633691LL}, /* 1894 */
+    {-2359941033LL, -2351920560LL, -2343833369LL, -2336077266LL}, /* 1895 */
+    {-2328385029LL, -2320363922LL, -2312276207LL, -2304520227LL}, /* 1896 */
+    {-2296827816LL, -2288806586LL, -2280719463LL, -2272963615LL}, /* 1897 */
+    {-2265270815LL, -2257249963LL, -2249162728LL, -2241406856LL}, /* 1898 */
+    {-2233714440LL, -2225693648LL, -2217605391LL, -2209849411LL}, /* 1899 */
+    {-2202157250LL, -2194136396LL, -2186048358LL, -2178292695LL}, /* 1900 */
+    {-2170600566LL, -2162579521LL, -2154491469LL, -2146735384LL}, /* 1901 */
+    {-2139043393LL, -2131022688LL, -2122934674LL, -2115177870LL}, /* 1902 */
+    {-2107485880LL, -2099465699LL, -2091377762LL, -2083621171LL}, /* 1903 */
+    {-2075929302LL, -2067908930LL, -2059820380LL, -2052063963LL}, /* 1904 */
+    {-2044371731LL, -2036351306LL, -2028263385LL, -2020506967LL}, /* 1905 */
+    {-2012814424LL, -2004794294LL, -1996706677LL, -1988950004LL}, /* 1906 */
+    {-1981258014LL, -1973237812LL, -1965149465LL, -1957392510LL}, /* 1907 */
+    {-1949700754LL, -1941680418LL, -1933592472LL, -1925835975LL}, /* 1908 */
+    {-1918143975LL, -1910123628LL, -1902035711LL, -1894279163LL}, /* 1909 */
+    {-1886587018LL, -1878567062LL, -1870478951LL, -1862722068LL}, /* 1910 */
+    {-1855029922LL, -1847010268LL, -1838922141LL, -1831165571LL}, /* 1911 */
+    {-1823473845LL, -1815453781LL, -1807365101LL, -1799608500LL}, /* 1912 */
+    {-1791916885LL, -1783896611LL, -1775808444LL, -1768051493LL}, /* 1913 */
+    {-1760359742LL, -1752339889LL, -1744251946LL, -1736494649LL}, /* 1914 */
+    {-1728803305LL, -1720783820LL, -1712694957LL, -1704937453LL}, /* 1915 */
+    {-1697245974LL, -1689226525LL, -1681137890LL, -1673380886LL}, /* 1916 */
+    {-1665688945LL, -1657669541LL, -1649581188LL, -1641824043LL}, /* 1917 */
+    {-1634132046LL, -1626112818LL, -1618024457LL, -1610266711LL}, /* 1918 */
+    {-1602574832LL, -1594555574LL, -1586467462LL, -1578709963LL}, /* 1919 */
+    {-1571018449LL, -1562998779LL, -1554910286LL, -1547152961LL}, /* 1920 */
+    {-1539461294LL, -1531441437LL, -1523353216LL, -1515595927LL}, /* 1921 */
+    {-1507903892LL, -1499884391LL, -1491796213LL, -1484038976LL}, /* 1922 */
+    {-1476347464LL, -1468328214LL, -1460238987LL, -1452481585LL}, /* 1923 */
+    {-1444790364LL, -1436770824LL, -1428681678LL, -1420924477LL}, /* 1924 */
+    {-1413233269LL, -1405213797LL, -1397125008LL, -1389367376LL}, /* 1925 */
+    {-1381676334LL, -1373657405LL, -1365568396LL, -1357809979LL}, /* 1926 */
+    {-1350118830LL, -1342100268LL, -1334011361LL, -1326253284LL}, /* 1927 */
+    {-1318562155LL, -1310543617LL, -1302454472LL, -1294696568LL}, /* 1928 */
+    {-1287005066LL, -1278986355LL, -1270897658LL, -1263139612LL}, /* 1929 */
+    {-1255447806LL, -1247429214LL, -1239341010LL, -1231582833LL}, /* 1930 */
+    {-1223891616LL, -1215873088LL, -1207784191LL, -1200025819LL}, /* 1931 */
+    {-1192334764LL, -1184315821LL, -1176227032LL, -1168469146LL}, /* 1932 */
+    {-1160777791LL, -1152758892LL, -1144670364LL, -1136912527LL}, /* 1933 */
+    {-1129221147LL, -1121202743LL, -1113113707LL, -1105355440LL}, /* 1934 */
+    {-1097664123LL, -1089645716LL, -1081556501LL, -1073798580LL}, /* 1935 */
+    {-1066107745LL, -1058089106LL, -1049999633LL, -1042241592LL}, /* 1936 */
+    {-1034550875LL, -1026532073LL, -1018442827LL, -1010684272LL}, /* 1937 */
+    {-1002993406LL, -994974978LL, -986885992LL, -979127190LL}, /* 1938 */
+    {-971436679LL, -963418832LL, -955329027LL, -947570053LL}, /* 1939 */
+    {-939879366LL, -931861405LL, -923771660LL, -916013105LL}, /* 1940 */
+    {-908321947LL, -900304002LL, -892214831LL, -884456107LL}, /* 1941 */
+    {-876764984LL, -868747436LL, -860658206LL, -852898833LL}, /* 1942 */
+    {-845207833LL, -837190062LL, -829100910LL, -821341848LL}, /* 1943 */
+    {-813651089LL, -805633064LL, -797543906LL, -789785092LL}, /* 1944 */
+    {-782094137LL, -774076071LL, -765987038LL, -758228169LL}, /* 1945 */
+    {-750536837LL, -742518913LL, -734429929LL, -726671197LL}, /* 1946 */
+    {-718980417LL, -710962837LL, -702873065LL, -695114224LL}, /* 1947 */
+    {-687423762LL, -679405755LL, -671315890LL, -663557184LL}, /* 1948 */
+    {-655866692LL, -647848631LL, -639759250LL, -632000190LL}, /* 1949 */
+    {-624309891LL, -616292626LL, -608202961LL, -600443208LL}, /* 1950 */
+    {-592752827LL, -584735702LL, -576645778LL, -568886394LL}, /* 1951 */
+    {-561195986LL, -553178842LL, -545088964LL, -537329779LL}, /* 1952 */
+    {-529639144LL, -521622010LL, -513532444LL, -505772888LL}, /* 1953 */
+    {-498082002LL, -490064740LL, -481975450LL, -474215749LL}, /* 1954 */
+    {-466525470LL, -458508477LL, -450418742LL, -442658910LL}, /* 1955 */
+    {-434968730LL, -426951354LL, -418861475LL, -411101993LL}, /* 1956 */
+    {-403411391LL, -395393953LL, -387304434LL, -379545042LL}, /* 1957 */
+    {-371854461LL, -363837777LL, -355747858LL, -347987996LL}, /* 1958 */
+    {-340297492LL, -332280610LL, -324190291LL, -316430727LL}, /* 1959 */
+    {-308740641LL, -300723469LL, -292633271LL, -284873627LL}, /* 1960 */
+    {-277183646LL, -269166587LL, -261076649LL, -253316420LL}, /* 1961 */
+    {-245626212LL, -237609327LL, -229519442LL, -221759108LL}, /* 1962 */
+    {-214069202LL, -206052953LL, -197962587LL, -190202272LL}, /* 1963 */
+    {-182512199LL, -174495809LL, -166405390LL, -158645410LL}, /* 1964 */
+    {-150954895LL, -142938254LL, -134848435LL, -127088361LL}, /* 1965 */
+    {-119398037LL, -111381986LL, -103292191LL, -95531512LL}, /* 1966 */
+    {-87841367LL, -79825003LL, -71734917LL, -63974595LL}, /* 1967 */
+    {-56284682LL, -48268001LL, -40178018LL, -32417983LL}, /* 1968 */
+    {-24727910LL, -16711490LL, -8621594LL, -861358LL}, /* 1969 */
+    {6828986LL, 14845378LL, 22935549LL, 30695743LL}, /* 1970 */
+    {38385502LL, 46401561LL, 54492276LL, 62252634LL}, /* 1971 */
+    {69942072LL, 77958352LL, 86049157LL, 93809583LL}, /* 1972 */
+    {101499166LL, 109515643LL, 117606067LL, 125366890LL}, /* 1973 */
+    {133056397LL, 141071853LL, 149162331LL, 156923746LL}, /* 1974 */
+    {164613422LL, 172628771LL, 180719693LL, 188480744LL}, /* 1975 */
+    {196170580LL, 204186246LL, 212276915LL, 220037720LL}, /* 1976 */
+    {227727763LL, 235743237LL, 243833366LL, 251594580LL}, /* 1977 */
+    {259284819LL, 267300603LL, 275390751LL, 283152050LL}, /* 1978 */
+    {290841724LL, 298857382LL, 306947781LL, 314709002LL}, /* 1979 */
+    {322398582LL, 330414409LL, 338504913LL, 346265774LL}, /* 1980 */
+    {353955775LL, 361971886LL, 370062286LL, 377823048LL}, /* 1981 */
+    {385512933LL, 393528189LL, 401618774LL, 409379893LL}, /* 1982 */
+    {417069528LL, 425084909LL, 433176088LL, 440937015LL}, /* 1983 */
+    {448626248LL, 456642151LL, 464733199LL, 472494196LL}, /* 1984 */
+    {480183259LL, 488198662LL, 496289255LL, 504050882LL}, /* 1985 */
+    {511740175LL, 519755404LL, 527846348LL, 535608111LL}, /* 1986 */
+    {543297137LL, 551311851LL, 559403111LL, 567164779LL}, /* 1987 */
+    {574853945LL, 582868586LL, 590959757LL, 598721294LL}, /* 1988 */
+    {606410914LL, 614425982LL, 622516776LL, 630278521LL}, /* 1989 */
+    {637967942LL, 645982360LL, 654072932LL, 661835225LL}, /* 1990 */
+    {669524532LL, 677539118LL, 685630078LL, 693392035LL}, /* 1991 */
+    {701081290LL, 709096460LL, 717187372LL, 724948996LL}, /* 1992 */
+    {732638469LL, 740653208LL, 748743754LL, 756505569LL}, /* 1993 */
+    {764195289LL, 772210083LL, 780301176LL, 788062969LL}, /* 1994 */
+    {795752084LL, 803766867LL, 811858389LL, 819620231LL}, /* 1995 */
+    {827308993LL, 835323817LL, 843415221LL, 851177177LL}, /* 1996 */
+    {858866107LL, 866881207LL, 874972534LL, 882734837LL}, /* 1997 */
+    {890423667LL, 898437747LL, 906529053LL, 914291790LL}, /* 1998 */
+    {921980756LL, 929994550LL, 938086294LL, 945848655LL}, /* 1999 */
+    {953537724LL, 961552063LL, 969643670LL, 977405860LL}, /* 2000 */
+    {985095060LL, 993109065LL, 1001199871LL, 1008962502LL}, /* 2001 */
+    {1016651776LL, 1024665893LL, 1032756934LL, 1040519686LL}, /* 2002 */
+    {1048208426LL, 1056222642LL, 1064314021LL, 1072076639LL}, /* 2003 */
+    {1079765327LL, 1087779410LL, 1095870600LL, 1103632906LL}, /* 2004 */
+    {1111322024LL, 1119336372LL, 1127427763LL, 1135190124LL}, /* 2005 */
+    {1142879126LL, 1150892740LL, 1158984219LL, 1166746921LL}, /* 2006 */
+    {1174435643LL, 1182449167LL, 1190541059LL, 1198303665LL}, /* 2007 */
+    {1205992105LL, 1214006366LL, 1222098277LL, 1229861026LL}, /* 2008 */
+    {1237549439LL, 1245563135LL, 1253654322LL, 1261417603LL}, /* 2009 */
+    {1269106319LL, 1277119709LL, 1285211364LL, 1292974706LL}, /* 2010 */
+    {1300663247LL, 1308676584LL, 1316768679LL, 1324531813LL}, /* 2011 */
+    {1332220469LL, 1340233705LL, 1348325343LL, 1356088307LL}, /* 2012 */
+    {1363777312LL, 1371791032LL, 1379882623LL, 1387645872LL}, /* 2013 */
+    {1395334613LL, 1403347894LL, 1411439365LL, 1419202986LL}, /* 2014 */
+    {1426891512LL, 1434904671LL, 1442996425LL, 1450759691LL}, /* 2015 */
+    {1458448207LL, 1466462053LL, 1474554060LL, 1482317058LL}, /* 2016 */
+    {1490005731LL, 1498019043LL, 1506110487LL, 1513873690LL}, /* 2017 */
+    {1521562506LL, 1529575622LL, 1537667641LL, 1545430932LL}, /* 2018 */
+    {1553119107LL, 1561132446LL, 1569224991LL, 1576988358LL}, /* 2019 */
+    {1584676198LL, 1592689405LL, 1600781449LL, 1608544969LL}, /* 2020 */
+    {1616233049LL, 1624246316LL, 1632338454LL, 1640102358LL}, /* 2021 */
+    {1647790398LL, 1655802823LL, 1663895045LL, 1671659277LL}, /* 2022 */
+    {1679347480LL, 1687359457LL, 1695451802LL, 1703215652LL}, /* 2023 */
+    {1710903990LL, 1718916650LL, 1727009018LL, 1734772820LL}, /* 2024 */
+    {1742461291LL, 1750473737LL, 1758565168LL, 1766329384LL}, /* 2025 */
+    {1774017930LL, 1782030289LL, 1790121924LL, 1797886207LL}, /* 2026 */
+    {1805574288LL, 1813587036LL, 1821679272LL, 1829443331LL}, /* 2027 */
+    {1837131422LL, 1845144087LL, 1853235901LL, 1860999599LL}, /* 2028 */
+    {1868688095LL, 1876700894LL, 1884793068LL, 1892556856LL}, /* 2029 */
+    {1900245106LL, 1908257474LL, 1916350026LL, 1924114165LL}, /* 2030 */
+    {1931802059LL, 1939814226LL, 1947906918LL, 1955670956LL}, /* 2031 */
+    {1963358524LL, 1971371316LL, 1979464240LL, 1987228563LL}, /* 2032 */
+    {1994916173LL, 2002928454LL, 2011020701LL, 2018785532LL}, /* 2033 */
+    {2026473449LL, 2034485062LL, 2042577578LL, 2050342431LL}, /* 2034 */
+    {2058030198LL, 2066041963LL, 2074135122LL, 2081899848LL}, /* 2035 */
+    {2089587756LL, 2097599488LL, 2105691805LL, 2113456361LL}, /* 2036 */
+    {2121144579LL, 2129156531LL, 2137248757LL, 2145013656LL}, /* 2037 */
+    {2152701627LL, 2160713363LL, 2168805743LL, 2176570921LL}, /* 2038 */
+    {2184258720LL, 2192270227LL, 2200362553LL, 2208127244LL}, /* 2039 */
+    {2215815091LL, 2223827181LL, 2231919880LL, 2239684379LL}, /* 2040 */
+    {2247372405LL, 2255384168LL, 2263476396LL, 2271241090LL}, /* 2041 */
+    {2278929177LL, 2286940555LL, 2295033092LL, 2302797845LL}, /* 2042 */
+    {2310485265LL, 2318497066LL, 2326590379LL, 2334355280LL}, /* 2043 */
+    {2342042423LL, 2350054228LL, 2358146852LL, 2365911816LL}, /* 2044 */
+    {2373599223LL, 2381610812LL, 2389703546LL, 2397468880LL}, /* 2045 */
+    {2405156268LL, 2413167275LL, 2421260504LL, 2429026087LL}, /* 2046 */
+    {2436713560LL, 2444724169LL, 2452817267LL, 2460582442LL}, /* 2047 */
+    {2468270003LL, 2476281207LL, 2484374427LL, 2492139716LL}, /* 2048 */
+    {2499827324LL, 2507838443LL, 2515930951LL, 2523696712LL}, /* 2049 */
+    {2531384370LL, 2539395173LL, 2547487701LL, 2555253498LL}, /* 2050 */
+    {2562940733LL, 2570951878LL, 2579045198LL, 2586810826LL}, /* 2051 */
+    {2594498152LL, 2602509340LL, 2610602128LL, 2618367433LL}, /* 2052 */
+    {2626055198LL, 2634066225LL, 2642159137LL, 2649924567LL}, /* 2053 */
+    {2657612040LL, 2665622791LL, 2673716341LL, 2681482163LL}, /* 2054 */
+    {2689169299LL, 2697179952LL, 2705273305LL, 2713038942LL}, /* 2055 */
+    {2720725831LL, 2728736875LL, 2736830350LL, 2744596269LL}, /* 2056 */
+    {2752283269LL, 2760293939LL, 2768386994LL, 2776153346LL}, /* 2057 */
+    {2783840682LL, 2791850630LL, 2799943694LL, 2807709906LL}, /* 2058 */
+    {2815397041LL, 2823407179LL, 2831500965LL, 2839267075LL}, /* 2059 */
+    {2846954293LL, 2854964702LL, 2863057687LL, 2870823670LL}, /* 2060 */
+    {2878511146LL, 2886521543LL, 2894614249LL, 2902380512LL}, /* 2061 */
+    {2910067638LL, 2918077861LL, 2926171172LL, 2933937740LL}, /* 2062 */
+    {2941624734LL, 2949634886LL, 2957728076LL, 2965494068LL}, /* 2063 */
+    {2973181094LL, 2981191520LL, 2989284990LL, 2997050901LL}, /* 2064 */
+    {3004738077LL, 3012748322LL, 3020841719LL, 3028607991LL}, /* 2065 */
+    {3036295165LL, 3044304967LL, 3052398401LL, 3060164728LL}, /* 2066 */
+    {3067851218LL, 3075861321LL, 3083955558LL, 3091722193LL}, /* 2067 */
+    {3099408531LL, 3107418800LL, 3115512415LL, 3123279144LL}, /* 2068 */
+    {3130965874LL, 3138975660LL, 3147069088LL, 3154836111LL}, /* 2069 */
+    {3162522888LL, 3170532125LL, 3178626279LL, 3186393550LL}, /* 2070 */
+    {3194080462LL, 3202089614LL, 3210183446LL, 3217950220LL}, /* 2071 */
+    {3225637233LL, 3233646815LL, 3241740453LL, 3249507334LL}, /* 2072 */
+    {3257194382LL, 3265204016LL, 3273297287LL, 3281064618LL}, /* 2073 */
+    {3288751702LL, 3296761083LL, 3304854196LL, 3312621319LL}, /* 2074 */
+    {3320307963LL, 3328317570LL, 3336411484LL, 3344178409LL}, /* 2075 */
+    {3351865122LL, 3359874987LL, 3367968584LL, 3375735185LL}, /* 2076 */
+    {3383422224LL, 3391431787LL, 3399525308LL, 3407292034LL}, /* 2077 */
+    {3414978634LL, 3422987855LL, 3431082264LL, 3438849470LL}, /* 2078 */
+    {3446535636LL, 3454544935LL, 3462639181LL, 3470406234LL}, /* 2079 */
+    {3478092229LL, 3486101626LL, 3494195765LL, 3501963127LL}, /* 2080 */
+    {3509649260LL, 3517658165LL, 3525752243LL, 3533520124LL}, /* 2081 */
+    {3541206635LL, 3549214961LL, 3557308966LL, 3565076668LL}, /* 2082 */
+    {3572762978LL, 3580771364LL, 3588865873LL, 3596633560LL}, /* 2083 */
+    {3604319946LL, 3612328801LL, 3620422731LL, 3628190457LL}, /* 2084 */
+    {3635877166LL, 3643885952LL, 3651979378LL, 3659747312LL}, /* 2085 */
+    {3667433689LL, 3675442142LL, 3683536307LL, 3691304548LL}, /* 2086 */
+    {3698990890LL, 3706999549LL, 3715093693LL, 3722861313LL}, /* 2087 */
+    {3730547804LL, 3738556607LL, 3746650670LL, 3754418159LL}, /* 2088 */
+    {3762104769LL, 3770113357LL, 3778207586LL, 3785975511LL}, /* 2089 */
+    {3793662088LL, 3801670526LL, 3809764743LL, 3817532613LL}, /* 2090 */
+    {3825218483LL, 3833227080LL, 3841321801LL, 3849089884LL}, /* 2091 */
+    {3856775603LL, 3864784456LL, 3872878874LL, 3880647082LL}, /* 2092 */
+    {3888333238LL, 3896341609LL, 3904435713LL, 3912204017LL}, /* 2093 */
+    {3919890074LL, 3927897695LL, 3935992584LL, 3943761172LL}, /* 2094 */
+    {3951447279LL, 3959455104LL, 3967549867LL, 3975318025LL}, /* 2095 */
+    {3983004163LL, 3991012233LL, 3999106459LL, 4006874751LL}, /* 2096 */
+    {4014560873LL, 4022568769LL, 4030662915LL, 4038431801LL}, /* 2097 */
+    {4046117987LL, 4054125762LL, 4062219828LL, 4069988428LL}, /* 2098 */
+    {4077674237LL, 4085682057LL, 4093776630LL, 4101545046LL}, /* 2099 */
+    {4109230989LL, 4117239092LL, 4125333581LL, 4133101833LL}, /* 2100 */
+    {4140788128LL, 4148796049LL, 4156890347LL, 4164658715LL}, /* 2101 */
+    {4172344527LL, 4180351966LL, 4188447045LL, 4196215949LL}, /* 2102 */
+    {4203901373LL, 4211909125LL, 4220004242LL, 4227773023LL}, /* 2103 */
+    {4235458436LL, 4243466240LL, 4251560955LL, 4259329928LL}, /* 2104 */
+    {4267015567LL, 4275022704LL, 4283117514LL, 4290887007LL}, /* 2105 */
+    {4298573043LL, 4306579937LL, 4314674789LL, 4322443980LL}, /* 2106 */
+    {4330129784LL, 4338136797LL, 4346231799LL, 4354000912LL}, /* 2107 */
+    {4361686728LL, 4369694227LL, 4377788857LL, 4385558055LL}, /* 2108 */
+    {4393244123LL, 4401251695LL, 4409345922LL, 4417115214LL}, /* 2109 */
+    {4424800878LL, 4432807909LL, 4440902811LL, 4448672310LL}, /* 2110 */
+    {4456357833LL, 4464365114LL, 4472460296LL, 4480229255LL}, /* 2111 */
+    {4487914938LL, 4495922348LL, 4504017280LL, 4511786134LL}, /* 2112 */
+    {4519471811LL, 4527478626LL, 4535573716LL, 4543343175LL}, /* 2113 */
+    {4551028751LL, 4559035577LL, 4567130852LL, 4574900358LL}, /* 2114 */
+    {4582585305LL, 4590592180LL, 4598687526LL, 4606457196LL}, /* 2115 */
+    {4614142093LL, 4622148997LL, 4630244139LL, 4638014044LL}, /* 2116 */
+    {4645699533LL, 4653706142LL, 4661801046LL, 4669570959LL}, /* 2117 */
+    {4677256360LL, 4685262146LL, 4693357555LL, 4701127688LL}, /* 2118 */
+    {4708813107LL, 4716819283LL, 4724914756LL, 4732684563LL}, /* 2119 */
+    {4740370083LL, 4748376702LL, 4756471520LL, 4764241393LL}, /* 2120 */
+    {4771926881LL, 4779933053LL, 4788027775LL, 4795798226LL}, /* 2121 */
+    {4803483799LL, 4811490085LL, 4819585095LL, 4827355221LL}, /* 2122 */
+    {4835040487LL, 4843046909LL, 4851142128LL, 4858911922LL}, /* 2123 */
+    {4866597278LL, 4874603825LL, 4882699061LL, 4890468839LL}, /* 2124 */
+    {4898154515LL, 4906161141LL, 4914256395LL, 4922026262LL}, /* 2125 */
+    {4929711307LL, 4937717344LL, 4945813127LL, 4953583490LL}, /* 2126 */
+    {4961268112LL, 4969274431LL, 4977370477LL, 4985140796LL}, /* 2127 */
+    {4992825476LL, 5000831873LL, 5008927489LL, 5016697925LL}, /* 2128 */
+    {5024382836LL, 5032388221LL, 5040483826LL, 5048254821LL}, /* 2129 */
+    {5055940077LL, 5063945311LL, 5072041164LL, 5079811920LL}, /* 2130 */
+    {5087496938LL, 5095502418LL, 5103598085LL, 5111368754LL}, /* 2131 */
+    {5119053796LL, 5127059482LL, 5135154661LL, 5142925519LL}, /* 2132 */
+    {5150610862LL, 5158616754LL, 5166711767LL, 5174482669LL}, /* 2133 */
+    {5182167658LL, 5190172989LL, 5198268410LL, 5206039360LL}, /* 2134 */
+    {5213724239LL, 5221729776LL, 5229825580LL, 5237596032LL}, /* 2135 */
+    {5245281125LL, 5253287033LL, 5261382654LL, 5269152980LL}, /* 2136 */
+    {5276838008LL, 5284843167LL, 5292938789LL, 5300709745LL}, /* 2137 */
+    {5308394576LL, 5316399840LL, 5324495919LL, 5332266963LL}, /* 2138 */
+    {5339951209LL, 5347956736LL, 5356052794LL, 5363823924LL}, /* 2139 */
+    {5371508196LL, 5379513457LL, 5387609225LL, 5395380593LL}, /* 2140 */
+    {5403065451LL, 5411070550LL, 5419166454LL, 5426937861LL}, /* 2141 */
+    {5434622602LL, 5442627034LL, 5450723231LL, 5458494770LL}, /* 2142 */
+    {5466179396LL, 5474184077LL, 5482280336LL, 5490051682LL}, /* 2143 */
+    {5497736436LL, 5505741755LL, 5513837578LL, 5521609028LL}, /* 2144 */
+    {5529293729LL, 5537298313LL, 5545393836LL, 5553165806LL}, /* 2145 */
+    {5560850562LL, 5568855164LL, 5576951225LL, 5584722945LL}, /* 2146 */
+    {5592407484LL, 5600412412LL, 5608508565LL, 5616279904LL}, /* 2147 */
+    {5623964538LL, 5631969269LL, 5640065146LL, 5647836582LL}, /* 2148 */
+    {5655521525LL, 5663526406LL, 5671622528LL, 5679394145LL}, /* 2149 */
+    {5687078461LL, 5695082897LL, 5703179269LL, 5710951252LL}, /* 2150 */
+    {5718635188LL, 5726639690LL, 5734736177LL, 5742508104LL}, /* 2151 */
+    {5750192265LL, 5758197034LL, 5766293324LL, 5774065283LL}, /* 2152 */
+    {5781749700LL, 5789753393LL, 5797849438LL, 5805621807LL}, /* 2153 */
+    {5813306464LL, 5821310045LL, 5829406511LL, 5837178698LL}, /* 2154 */
+    {5844863080LL, 5852867273LL, 5860963596LL, 5868735631LL}, /* 2155 */
+    {5876419957LL, 5884424121LL, 5892519791LL, 5900292070LL}, /* 2156 */
+    {5907976679LL, 5915981036LL, 5924076956LL, 5931849312LL}, /* 2157 */
+    {5939533522LL, 5947537466LL, 5955633786LL, 5963406112LL}, /* 2158 */
+    {5971090212LL, 5979094154LL, 5987190748LL, 5994962682LL}, /* 2159 */
+    {6002647010LL, 6010651400LL, 6018748073LL, 6026520017LL}, /* 2160 */
+    {6034204245LL, 6042207865LL, 6050304358LL, 6058076973LL}, /* 2161 */
+    {6065760965LL, 6073764502LL, 6081861437LL, 6089634206LL}, /* 2162 */
+    {6097317724LL, 6105321740LL, 6113418746LL, 6121191570LL}, /* 2163 */
+    {6128875263LL, 6136878783LL, 6144975169LL, 6152748174LL}, /* 2164 */
+    {6160432489LL, 6168435779LL, 6176532477LL, 6184305552LL}, /* 2165 */
+    {6191989731LL, 6199992702LL, 6208089605LL, 6215862712LL}, /* 2166 */
+    {6223546743LL, 6231549832LL, 6239646464LL, 6247419355LL}, /* 2167 */
+    {6255103537LL, 6263107324LL, 6271203783LL, 6278976768LL}, /* 2168 */
+    {6286660912LL, 6294664038LL, 6302760139LL, 6310533474LL}, /* 2169 */
+    {6318217614LL, 6326220567LL, 6334317175LL, 6342090178LL}, /* 2170 */
+    {6349774076LL, 6357777637LL, 6365874608LL, 6373647250LL}, /* 2171 */
+    {6381331199LL, 6389334468LL, 6397430921LL, 6405203667LL}, /* 2172 */
+    {6412887743LL, 6420890978LL, 6428987898LL, 6436761002LL}, /* 2173 */
+    {6444444396LL, 6452447467LL, 6460544801LL, 6468318263LL}, /* 2174 */
+    {6476001279LL, 6484004107LL, 6492101264LL, 6499874695LL}, /* 2175 */
+    {6507558065LL, 6515561074LL, 6523658365LL, 6531431968LL}, /* 2176 */
+    {6539115652LL, 6547117686LL, 6555214656LL, 6562988638LL}, /* 2177 */
+    {6570672516LL, 6578674287LL, 6586771475LL, 6594545363LL}, /* 2178 */
+    {6602229033LL, 6610231670LL, 6618328887LL, 6626102679LL}, /* 2179 */
+    {6633786373LL, 6641788936LL, 6649885237LL, 6657659218LL}, /* 2180 */
+    {6665343241LL, 6673345793LL, 6681442426LL, 6689216481LL}, /* 2181 */
+    {6696900152LL, 6704902627LL, 6712999833LL, 6720773741LL}, /* 2182 */
+    {6728457322LL, 6736459701LL, 6744556804LL, 6752330259LL}, /* 2183 */
+    {6760014081LL, 6768016870LL, 6776114240LL, 6783887802LL}, /* 2184 */
+    {6791571460LL, 6799573681LL, 6807670873LL, 6815445014LL}, /* 2185 */
+    {6823128354LL, 6831130317LL, 6839227722LL, 6847001950LL}, /* 2186 */
+    {6854684881LL, 6862687426LL, 6870785147LL, 6878559359LL}, /* 2187 */
+    {6886242488LL, 6894244530LL, 6902341515LL, 6910115830LL}, /* 2188 */
+    {6917799515LL, 6925801128LL, 6933898435LL, 6941672843LL}, /* 2189 */
+    {6949356217LL, 6957357797LL, 6965455565LL, 6973230053LL}, /* 2190 */
+    {6980913213LL, 6988914862LL, 6997012092LL, 7004786399LL}, /* 2191 */
+    {7012469701LL, 7020471755LL, 7028568986LL, 7036343521LL}, /* 2192 */
+    {7044026809LL, 7052028331LL, 7060125443LL, 7067900352LL}, /* 2193 */
+    {7075583677LL, 7083584818LL, 7091682137LL, 7099456691LL}, /* 2194 */
+    {7107139852LL, 7115141644LL, 7123239513LL, 7131013850LL}, /* 2195 */
+    {7138697152LL, 7146698801LL, 7154796017LL, 7162570495LL}, /* 2196 */
+    {7170253913LL, 7178255330LL, 7186352825LL, 7194127689LL}, /* 2197 */
+    {7201810446LL, 7209811981LL, 7217910148LL, 7225685333LL}, /* 2198 */
+    {7233367842LL, 7241369191LL, 7249466906LL, 7257241898LL}, /* 2199 */
+    {7264924849LL, 7272926160LL, 7281024050LL, 7288799200LL}, /* 2200 */
+    {7296482438LL, 7304483092LL, 7312580929LL, 7320356423LL}, /* 2201 */
+    {7328039744LL, 7336040116LL, 7344137810LL, 7351913086LL}, /* 2202 */
+    {7359596119LL, 7367597346LL, 7375695261LL, 7383470521LL}, /* 2203 */
+    {7391153597LL, 7399154868LL, 7407251932LL, 7415027293LL}, /* 2204 */
+    {7422710601LL, 7430711529LL, 7438808779LL, 7446584171LL}, /* 2205 */
+    {7454267075LL, 7462268076LL, 7470366257LL, 7478141533LL}, /* 2206 */
+    {7485824294LL, 7493825212LL, 7501923064LL, 7509697890LL}, /* 2207 */
+    {7517380846LL, 7525381856LL, 7533479945LL, 7541255082LL}, /* 2208 */
+    {7548937807LL, 7556938367LL, 7565036545LL, 7572812364LL}, /* 2209 */
+    {7580494774LL, 7588494960LL, 7596593023LL, 7604368895LL}, /* 2210 */
+    {7612051067LL, 7620051655LL, 7628150082LL, 7635926004LL}, /* 2211 */
+    {7643608546LL, 7651608789LL, 7659706546LL, 7667482569LL}, /* 2212 */
+    {7675165715LL, 7683165431LL, 7691263185LL, 7699039261LL}, /* 2213 */
+    {7706722079LL, 7714722016LL, 7722820434LL, 7730596611LL}, /* 2214 */
+    {7738279248LL, 7746279511LL, 7754377258LL, 7762153145LL}, /* 2215 */
+    {7769835984LL, 7777836440LL, 7785934131LL, 7793710208LL}, /* 2216 */
+    {7801393011LL, 7809393113LL, 7817491103LL, 7825267490LL}, /* 2217 */
+    {7832950275LL, 7840950092LL, 7849048121LL, 7856824034LL}, /* 2218 */
+    {7864506642LL, 7872506963LL, 7880605552LL, 7888381308LL}, /* 2219 */
+    {7896063963LL, 7904064287LL, 7912162442LL, 7919938457LL}, /* 2220 */
+    {7927621151LL, 7935621098LL, 7943719251LL, 7951495606LL}, /* 2221 */
+    {7959177554LL, 7967177527LL, 7975276528LL, 7983053233LL}, /* 2222 */
+    {7990735024LL, 7998734946LL, 8006833500LL, 8014609954LL}, /* 2223 */
+    {8022292246LL, 8030291773LL, 8038390242LL, 8046166849LL}, /* 2224 */
+    {8053849342LL, 8061848307LL, 8069947057LL, 8077724134LL}, /* 2225 */
+    {8085406652LL, 8093405474LL, 8101503826LL, 8109280623LL}, /* 2226 */
+    {8116962864LL, 8124962282LL, 8133060718LL, 8140837581LL}, /* 2227 */
+    {8148519951LL, 8156519509LL, 8164617372LL, 8172394396LL}, /* 2228 */
+    {8180077062LL, 8188076196LL, 8196173968LL, 8203950897LL}, /* 2229 */
+    {8211633175LL, 8219632367LL, 8227731170LL, 8235508009LL}, /* 2230 */
+    {8243190215LL, 8251189652LL, 8259288198LL, 8267064583LL}, /* 2231 */
+    {8274746989LL, 8282746361LL, 8290844855LL, 8298621537LL}, /* 2232 */
+    {8306303625LL, 8314302652LL, 8322401626LL, 8330179070LL}, /* 2233 */
+    {8337860846LL, 8345859710LL, 8353958514LL, 8361735828LL}, /* 2234 */
+    {8369417415LL, 8377416420LL, 8385515487LL, 8393292856LL}, /* 2235 */
+    {8400974858LL, 8408973630LL, 8417072387LL, 8424849936LL}, /* 2236 */
+    {8432532428LL, 8440530688LL, 8448629202LL, 8456406770LL}, /* 2237 */
+    {8464088835LL, 8472087247LL, 8480186443LL, 8487964199LL}, /* 2238 */
+    {8495646075LL, 8503644954LL, 8511743599LL, 8519521086LL}, /* 2239 */
+    {8527203230LL, 8535202054LL, 8543300381LL, 8551078023LL}, /* 2240 */
+    {8558760121LL, 8566758463LL, 8574857331LL, 8582635315LL}, /* 2241 */
+    {8590317392LL, 8598315649LL, 8606414525LL, 8614191969LL}, /* 2242 */
+    {8621873920LL, 8629872458LL, 8637971557LL, 8645748885LL}, /* 2243 */
+    {8653430863LL, 8661429419LL, 8669528320LL, 8677306069LL}, /* 2244 */
+    {8684988073LL, 8692986339LL, 8701085024LL, 8708863019LL}, /* 2245 */
+    {8716544323LL, 8724542465LL, 8732641884LL, 8740420168LL}, /* 2246 */
+    {8748101440LL, 8756099714LL, 8764198889LL, 8771976877LL}, /* 2247 */
+    {8779658752LL, 8787656629LL, 8795755468LL, 8803533511LL}, /* 2248 */
+    {8811215486LL, 8819212805LL, 8827312094LL, 8835090634LL}, /* 2249 */
+    {8842772518LL, 8850770069LL, 8858869131LL, 8866647350LL}, /* 2250 */
+    {8874328976LL, 8882326982LL, 8890425901LL, 8898204117LL}, /* 2251 */
+    {8905885810LL, 8913883847LL, 8921982609LL, 8929761129LL}, /* 2252 */
+    {8937443109LL, 8945440872LL, 8953539599LL, 8961317950LL}, /* 2253 */
+    {8968999464LL, 8976997057LL, 8985096656LL, 8992874967LL}, /* 2254 */
+    {9000556409LL, 9008554370LL, 9016653983LL, 9024432044LL}, /* 2255 */
+    {9032113711LL, 9040111531LL, 9048210782LL, 9055989151LL}, /* 2256 */
+    {9063670444LL, 9071667697LL, 9079767461LL, 9087546685LL}, /* 2257 */
+    {9095227757LL, 9103225046LL, 9111324759LL, 9119103757LL}, /* 2258 */
+    {9126784810LL, 9134782067LL, 9142881644LL, 9150660576LL}, /* 2259 */
+    {9158342095LL, 9166339027LL, 9174438457LL, 9182217669LL}, /* 2260 */
+    {9189899634LL, 9197896351LL, 9205995492LL, 9213774623LL}, /* 2261 */
+    {9221456081LL, 9229452858LL, 9237552375LL, 9245331621LL}, /* 2262 */
+    {9253012904LL, 9261010241LL, 9269109494LL, 9276888518LL}, /* 2263 */
+    {9284570123LL, 9292567430LL, 9300666236LL, 9308445259LL}, /* 2264 */
+    {9316126746LL, 9324123386LL, 9332222805LL, 9340002175LL}, /* 2265 */
+    {9347683602LL, 9355680417LL, 9363780118LL, 9371558918LL}, /* 2266 */
+    {9379240189LL, 9387237239LL, 9395336898LL, 9403115605LL}, /* 2267 */
+    {9410796837LL, 9418793739LL, 9426893394LL, 9434672721LL}, /* 2268 */
+    {9442353883LL, 9450350660LL, 9458450264LL, 9466229838LL}, /* 2269 */
+    {9473910347LL, 9481906853LL, 9490006970LL, 9497786787LL}, /* 2270 */
+    {9505467352LL, 9513463890LL, 9521563986LL, 9529343638LL}, /* 2271 */
+    {9537024891LL, 9545021157LL, 9553120846LL, 9560900582LL}, /* 2272 */
+    {9568581886LL, 9576577432LL, 9584677378LL, 9592457656LL}, /* 2273 */
+    {9600138848LL, 9608134821LL, 9616234747LL, 9624014748LL}, /* 2274 */
+    {9631695833LL, 9639692281LL, 9647791757LL, 9655571630LL}, /* 2275 */
+    {9663252851LL, 9671249073LL, 9679348413LL, 9687128614LL}, /* 2276 */
+    {9694810136LL, 9702806343LL, 9710905842LL, 9718685764LL}, /* 2277 */
+    {9726366827LL, 9734362895LL, 9742462927LL, 9750242659LL}, /* 2278 */
+    {9757923597LL, 9765919979LL, 9774020142LL, 9781799729LL}, /* 2279 */
+    {9789480851LL, 9797477302LL, 9805577157LL, 9813357027LL}, /* 2280 */
+    {9821037673LL, 9829033347LL, 9837133530LL, 9844914151LL}, /* 2281 */
+    {9852594531LL, 9860590288LL, 9868690761LL, 9876471164LL}, /* 2282 */
+    {9884151648LL, 9892147440LL, 9900247623LL, 9908027837LL}, /* 2283 */
+    {9915708698LL, 9923703868LL, 9931803868LL, 9939584509LL}, /* 2284 */
+    {9947265711LL, 9955260935LL, 9963360958LL, 9971141587LL}, /* 2285 */
+    {9978822208LL, 9986817485LL, 9994917590LL, 10002698271LL}, /* 2286 */
+    {10010378733LL, 10018374363LL, 10026474374LL, 10034255016LL}, /* 2287 */
+    {10041935888LL, 10049931597LL, 10058031335LL, 10065811978LL}, /* 2288 */
+    {10073492720LL, 10081487585LL, 10089587735LL, 10097368727LL}, /* 2289 */
+    {10105049437LL, 10113044511LL, 10121145147LL, 10128925690LL}, /* 2290 */
+    {10136606353LL, 10144601825LL, 10152702239LL, 10160482697LL}, /* 2291 */
+    {10168163343LL, 10176158417LL, 10184258610LL, 10192039778LL}, /* 2292 */
+    {10199720391LL, 10207715524LL, 10215815915LL, 10223597271LL}, /* 2293 */
+    {10231277345LL, 10239272323LL, 10247372934LL, 10255154278LL}, /* 2294 */
+    {10262834498LL, 10270829364LL, 10278929944LL, 10286711130LL}, /* 2295 */
+    {10294392025LL, 10302386887LL, 10310487242LL, 10318268447LL}, /* 2296 */
+    {10325949213LL, 10333943370LL, 10342043769LL, 10349825433LL}, /* 2297 */
+    {10357505961LL, 10365500504LL, 10373601084LL, 10381382483LL}, /* 2298 */
+    {10389062895LL, 10397058001LL, 10405158204LL, 10412939441LL}, /* 2299 */
+    {10420619978LL, 10428614528LL, 10436714461LL, 10444496051LL}, /* 2300 */
+};
+
+#endif /* SOLAR_EPHEMERIS_H */
@@ -0,0 +1,227 @@
+# solar_ephemeris.py
+#
+# Solstice and equinox ephemeris shared by solar_clock.py and solar_clock.c.
+#
+# The four solar events of every year from FIRST_YEAR to LAST_YEAR are
+# computed once with Meeus' algorithm (Astronomical Algorithms, chapter 27,
+# accurate to about a minute) and written to two files:
+#
+#   solar_ephemeris.bin - a compact binary table that solar_clock.py
+#                         memory-maps for O(1) lookups
+#   solar_ephemeris.h   - the same table as a C header for solar_clock.c
+#
+# Both files are checked in, so neither clock needs astral or a rebuild to
+# stay correct. To regenerate them (e.g. for a different range of years):
+# python solar_ephemeris.py [first_year last_year]
+
+import os
+import sys
+import math
+import mmap
+import struct
+from datetime import datetime, timezone
+
+FIRST_YEAR = 1800
+LAST_YEAR = 2300
+
+EVENT_NAMES = ("March Equinox", "June Solstice", "September Equinox", "December Solstice")
+EVENTS_PER_YEAR = len(EVENT_NAMES)
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_TABLE_PATH = os.path.join(HERE, "solar_ephemeris.bin")
+DEFAULT_HEADER_PATH = os.path.join(HERE, "solar_ephemeris.h")
+
+# --- Binary table layout ---
+# Header: magic, first year, year count. Then EVENTS_PER_YEAR little-endian
+# int64 UTC POSIX timestamps per year, in chronological order.
+TABLE_MAGIC = b"SOLEPH1\0"
+HEADER_FORMAT = "<8sHH"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+EVENT_FORMAT = "<q"
+EVENT_SIZE = struct.calcsize(EVENT_FORMAT)
+
+# --- Meeus, Astronomical Algorithms, chapter 27 ---
+
+# Table 27.B: mean event instants (JDE) for the years 1000-3000, as polynomials in Y = (year - 2000) / 1000.
+MEAN_EVENT_TERMS = (
+    (2451623.80984, 365242.37404, 0.05169, -0.00411, -0.00057),   # March equinox
+    (2451716.56767, 365241.62603, 0.00325, 0.00888, -0.00030),    # June solstice
+    (2451810.21715, 365242.01767, -0.11575, 0.00337, 0.00078),    # September equinox
+    (2451900.05952, 365242.74049, -0.06223, -0.00823, 0.00032),   # December solstice
+)
+
+# Table 27.C: periodic terms (A, B, C) of the correction sum S = sum(A * cos(B + C * T)).
+PERIODIC_TERMS = (
+    (485, 324.96, 1934.136), (203, 337.23, 32964.467), (199, 342.08, 20.186),
+    (182, 27.85, 445267.112), (156, 73.14, 45036.886), (136, 171.52, 22518.443),
+    (77, 222.54, 65928.934), (74, 296.72, 3034.906), (70, 243.58, 9037.513),
+    (58, 119.81, 33718.147), (52, 297.17, 150.678), (50, 21.02, 2281.226),
+    (45, 247.54, 29929.562), (44, 325.15, 31555.956), (29, 60.93, 4443.417),
+    (18, 155.12, 67555.328), (17, 288.79, 4562.452), (16, 198.04, 62894.029),
+    (14, 199.76, 31436.921), (12, 95.39, 14577.848), (12, 287.11, 31931.756),
+    (12, 320.81, 34777.259), (9, 227.73, 1222.114), (8, 15.45, 16859.074),
+)
+
+JD_UNIX_EPOCH = 2440587.5
+SECONDS_PER_DAY = 86400
+
+
+def event_jde(year, event_index):
+    """Returns the Julian Ephemeris Day (Terrestrial Time) of one solar event of `year`."""
+    y = (year - 2000) / 1000
+    jde0 = sum(coefficient * y ** power for power, coefficient in enumerate(MEAN_EVENT_TERMS[event_index]))
+
+    t = (jde0 - 2451545.0) / 36525
+    w = math.radians(35999.373 * t - 2.47)
+    delta_lambda = 1 + 0.0334 * math.cos(w) + 0.0007 * math.cos(2 * w)
+    s = sum(a * math.cos(math.radians(b + c * t)) for a, b, c in PERIODIC_TERMS)
+    return jde0 + 0.00001 * s / delta_lambda
+
+
+def delta_t_seconds(decimal_year):
+    """
+    Returns TT - UT in seconds, from the Espenak & Meeus polynomial fits
+    (valid here for 1800 onwards; later years are extrapolated).
+    """
+    y = decimal_year
+    if y < 1860:
+        t = y - 1800
+        return (13.72 - 0.332447 * t + 0.0068612 * t ** 2 + 0.0041116 * t ** 3 - 0.00037436 * t ** 4
+                + 0.0000121272 * t ** 5 - 0.0000001699 * t ** 6 + 0.000000000875 * t ** 7)
+    if y < 1900:
+        t = y - 1860
+        return 7.62 + 0.5737 * t - 0.251754 * t ** 2 + 0.01680668 * t ** 3 - 0.0004473624 * t ** 4 + t ** 5 / 233174
+    if y < 1920:
+        t = y - 1900
+        return -2.79 + 1.494119 * t - 0.0598939 * t ** 2 + 0.0061966 * t ** 3 - 0.000197 * t ** 4
+    if y < 1941:
+        t = y - 1920
+        return 21.20 + 0.84493 * t - 0.076100 * t ** 2 + 0.0020936 * t ** 3
+    if y < 1961:
+        t = y - 1950
+        return 29.07 + 0.407 * t - t ** 2 / 233 + t ** 3 / 2547
+    if y < 1986:
+        t = y - 1975
+        return 45.45 + 1.067 * t - t ** 2 / 260 - t ** 3 / 718
+    if y < 2005:
+        t = y - 2000
+        return (63.86 + 0.3345 * t - 0.060374 * t ** 2 + 0.0017275 * t ** 3 + 0.000651814 * t ** 4
+                + 0.00002373599 * t ** 5)
+    if y < 2050:
+        t = y - 2000
+        return 62.92 + 0.32217 * t + 0.005589 * t ** 2
+    u = (y - 1820) / 100
+    if y < 2150:
+        return -20 + 32 * u ** 2 - 0.5628 * (2150 - y)
+    return -20 + 32 * u ** 2
+
+
+def event_timestamp(year, event_index):
+    """Returns the UTC POSIX timestamp (whole seconds) of one solar event of `year`."""
+    jde = event_jde(year, event_index)
+    # Events fall in months 3, 6, 9 and 12; Delta T is evaluated mid-month.
+    delta_t = delta_t_seconds(year + (3 * event_index + 2.5) / 12)
+    return round((jde - JD_UNIX_EPOCH) * SECONDS_PER_DAY - delta_t)
+
+
+def compute_events(first_year=FIRST_YEAR, last_year=LAST_YEAR):
+    """Returns the flat, chronological list of event timestamps for the years first_year..last_year."""
+    return [event_timestamp(year, index)
+            for year in range(first_year, last_year + 1)
+            for index in range(EVENTS_PER_YEAR)]
+
+
+# --- Table and header writers ---
+
+def write_table(path, first_year, timestamps):
+    """Writes the binary ephemeris table, replacing any existing file atomically."""
+    year_count = len(timestamps) // EVENTS_PER_YEAR
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(struct.pack(HEADER_FORMAT, TABLE_MAGIC, first_year, year_count))
+        f.write(struct.pack(f"<{len(timestamps)}q", *timestamps))
+    os.replace(temp_path, path)
+
+
+def write_c_header(path, first_year, timestamps):
+    """Writes the ephemeris as a C header defining SOLAR_EVENTS[][4]."""
+    year_count = len(timestamps) // EVENTS_PER_YEAR
+    lines = [
+        "/*",
+        " * solar_ephemeris.h",
+        " *",
+        " * Generated by solar_ephemeris.py - do not edit by hand.",
+        " * UTC POSIX timestamps of the March equinox, June solstice, September",
+        " * equinox and December solstice of each year (Meeus, Astronomical",
+        " * Algorithms, chapter 27).",
+        " */",
+        "",
+        "#ifndef SOLAR_EPHEMERIS_H",
+        "#define SOLAR_EPHEMERIS_H",
+        "",
+        f"#define SOLAR_EPHEMERIS_FIRST_YEAR {first_year}",
+        f"#define SOLAR_EPHEMERIS_LAST_YEAR {first_year + year_count - 1}",
+        f"#define SOLAR_EPHEMERIS_YEARS {year_count}",
+        "",
+        "static const long long SOLAR_EVENTS[SOLAR_EPHEMERIS_YEARS][4] = {",
+    ]
+    for i in range(year_count):
+        row = ", ".join(f"{ts}LL" for ts in timestamps[i * EVENTS_PER_YEAR:(i + 1) * EVENTS_PER_YEAR])
+        lines.append(f"    {{{row}}}, /* {first_year + i} */")
+    lines += ["};", "", "#endif /* SOLAR_EPHEMERIS_H */", ""]
+
+    with open(path, "w") as f:
+        f.write("\n".join(lines))
+
+
+# --- Memory-mapped lookup ---
+
+class SolarEphemeris:
+    """
+    Read-only view of solar_ephemeris.bin. The table is memory-mapped, so
+    opening it is cheap and every lookup is a single fixed-offset read.
+    """
+
+    def __init__(self, path=DEFAULT_TABLE_PATH):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.first_year, year_count = struct.unpack_from(HEADER_FORMAT, self._map)
+        if magic != TABLE_MAGIC or len(self._map) != HEADER_SIZE + year_count * EVENTS_PER_YEAR * EVENT_SIZE:
+            self._map.close()
+            raise ValueError(f"{path} is not a solar ephemeris table")
+        self.last_year = self.first_year + year_count - 1
+        self.event_count = year_count * EVENTS_PER_YEAR
+
+    def close(self):
+        self._map.close()
+
+    def timestamp(self, event_number):
+        """Returns the timestamp of event `event_number`, counted from the first event in the table."""
+        if not 0 <= event_number < self.event_count:
+            raise IndexError(f"solar event {event_number} is outside the table "
+                             f"({self.first_year}-{self.last_year})")
+        return struct.unpack_from(EVENT_FORMAT, self._map, HEADER_SIZE + event_number * EVENT_SIZE)[0]
+
+    def timestamps(self):
+        """Returns every timestamp in the table, oldest first, read in one pass."""
+        return struct.unpack_from(f"<{self.event_count}{EVENT_FORMAT[1:]}", self._map, HEADER_SIZE)
+
+    def event_number(self, year, event_index):
+        """Returns the table position of one solar event of `year`."""
+        return (year - self.first_year) * EVENTS_PER_YEAR + event_index
+
+    def events(self, year):
+        """Returns the four solar events of `year` as chronological UTC datetimes."""
+        first = self.event_number(year, 0)
+        return [datetime.fromtimestamp(self.timestamp(first + i), timezone.utc) for i in range(EVENTS_PER_YEAR)]
+
+
+if __name__ == "__main__":
+    first = int(sys.argv[1]) if len(sys.argv) > 1 else FIRST_YEAR
+    last = int(sys.argv[2]) if len(sys.argv) > 2 else LAST_YEAR
+
+    events = compute_events(first, last)
+    write_table(DEFAULT_TABLE_PATH, first, events)
+    write_c_header(DEFAULT_HEADER_PATH, first, events)
+    print(f"Wrote {len(events)} solar events for {first}-{last} to "
+          f"{os.path.basename(DEFAULT_TABLE_PATH)} and {os.path.basename(DEFAULT_HEADER_PATH)}.")
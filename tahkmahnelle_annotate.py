@@ -0,0 +1,409 @@
+# tahkmahnelle_annotate.py
+#
+# Streams a CSV or JSONL log from stdin to stdout, appending the Tahkmahnelle
+# calendar fields of one timestamp column to every record.
+#
+# Run from the repository directory:
+# python tahkmahnelle_annotate.py --column timestamp [--format csv|jsonl] [--names]
+#        [--epoch-unit s|ms|us|ns] [--utc-offset SECONDS] [-j N] < in.csv > out.csv
+#
+# The input is read in chunks of about --chunk-bytes, always cut at a record
+# boundary, so memory stays bounded however large the log is. Each chunk's
+# column is parsed and converted in one vectorized pass with the batch API
+# (tahkmahnelle_calendar.batch, which needs NumPy); with -j N the chunks are
+# converted by N worker processes and written back in their original order.
+#
+# The column may hold POSIX epoch numbers (in --epoch-unit) or ISO-8601 text.
+# Epochs and ISO times with a zone ('Z', '+02:00') are shown in local time, or
+# shifted by --utc-offset when given; ISO times without a zone are taken as
+# wall-clock times already. Records whose value cannot be parsed, or whose
+# epoch is outside datetime's years 1 to 9999 (a millisecond epoch read as
+# seconds, say), get empty fields (CSV) or nulls (JSONL).
+#
+# CSV input must have a header row; quoted fields may span lines. JSONL
+# records are one object per line, and the column is the first occurrence of
+# the key in the line, read without decoding the whole object.
+
+import os
+import re
+import sys
+import csv
+import json
+import argparse
+import datetime
+import warnings
+import collections
+import concurrent.futures
+
+from tahkmahnelle_calendar import wall_clock_ns
+from tahkmahnelle_calendar.batch import (_numpy_available, to_wall_microseconds, get_tahkmahnelle_time_batch,
+                                         get_t_names_batch, MIN_TIMESTAMP, MAX_TIMESTAMP)
+
+if _numpy_available:
+    import numpy as np
+
+DEFAULT_CHUNK_BYTES = 4 * 1024 * 1024
+CHUNKS_IN_FLIGHT_PER_JOB = 2  # With -j N, at most N * this chunks are held in memory
+
+EPOCH_UNITS = {'s': 1, 'ms': 1000, 'us': 1000000, 'ns': 1000000000}
+
+T_FIELDS = ('T-Year', 'T-Age', 'T-Month', 'T-Week', 'T-Day', 'T-Hour', 'T-Minute', 'T-Second', 'T-Tick')
+T_NAME_FIELDS = ('T-Day-Name', 'T-Week-Name', 'T-Month-Name')
+
+
+# --- Timestamp Parsing ---
+
+def _parse_one(value, epoch_unit):
+    """
+    Parses one value the vectorized pass could not. Returns ('epoch', seconds),
+    ('wall', microseconds) or None when the value is not a timestamp.
+    """
+    value = value.strip()
+    try:
+        seconds = float(value) / EPOCH_UNITS[epoch_unit]
+    except ValueError:
+        pass
+    else:
+        return ('epoch', seconds) if MIN_TIMESTAMP <= seconds <= MAX_TIMESTAMP else None
+    try:
+        # fromisoformat only accepts a trailing 'Z' from Python 3.11 on.
+        parsed = datetime.datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith(("Z", "z")) else value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        return 'epoch', parsed.timestamp()
+    return 'wall', wall_clock_ns(parsed) // 1000
+
+
+def parse_timestamps(values, epoch_unit='s', utc_offset=None):
+    """
+    Converts a list of timestamp strings to naive wall-clock microseconds.
+    Returns (wall_us, valid): two NumPy arrays, with wall_us meaningless where
+    valid is False.
+    """
+    # Fast paths: the whole chunk is epoch numbers, or zone-less ISO-8601 text.
+    try:
+        numbers = np.array(values, dtype=np.float64)
+    except ValueError:
+        pass
+    else:
+        with np.errstate(invalid='ignore'):
+            seconds = numbers / EPOCH_UNITS[epoch_unit]
+            valid = (seconds >= MIN_TIMESTAMP) & (seconds <= MAX_TIMESTAMP)  # False for NaN and inf too
+        return to_wall_microseconds(np.where(valid, seconds, 0.0), utc_offset), valid
+    try:
+        with warnings.catch_warnings():
+            # NumPy only warns about zone offsets, then drops them; treat that as a failure.
+            warnings.simplefilter("error")
+            stamps = np.array(values, dtype='datetime64[us]')
+    except (ValueError, UserWarning, DeprecationWarning):
+        pass
+    else:
+        return stamps.astype(np.int64), ~np.isnat(stamps)
+
+    # Mixed or zoned values: parse one by one, then convert the epochs together.
+    wall_us = np.zeros(len(values), dtype=np.int64)
+    valid = np.zeros(len(values), dtype=bool)
+    epoch_rows, epoch_seconds = [], []
+    for i, value in enumerate(values):
+        parsed = _parse_one(value, epoch_unit)
+        if parsed is None:
+            continue
+        kind, number = parsed
+        valid[i] = True
+        if kind == 'epoch':
+            epoch_rows.append(i)
+            epoch_seconds.append(number)
+        else:
+            wall_us[i] = number
+    if epoch_rows:
+        wall_us[epoch_rows] = to_wall_microseconds(np.array(epoch_seconds, dtype=np.float64), utc_offset)
+    return wall_us, valid
+
+
+def t_field_columns(wall_us, valid, with_names=False):
+    """
+    Converts wall-clock microseconds to T-time and returns the appended fields
+    as a list of string lists, one per field in T_FIELDS (+ T_NAME_FIELDS).
+    """
+    # Invalid rows borrow a valid timestamp so the day table stays small; their fields are blanked later.
+    if valid.any() and not valid.all():
+        wall_us = np.where(valid, wall_us, wall_us[valid][0])
+    t_times = get_tahkmahnelle_time_batch(wall_us.astype('datetime64[us]'))
+    names = get_t_names_batch(t_times)
+
+    columns = []
+    for field in T_FIELDS + (T_NAME_FIELDS if with_names else ()):
+        if field in names:
+            columns.append(names[field].tolist())
+        else:
+            # Each column has at most a thousand distinct values, so format each value once.
+            values = t_times[field].tolist()
+            text = {value: str(value) for value in set(values)}
+            columns.append([text[value] for value in values])
+    return columns
+
+
+# --- Record Formats ---
+
+def _quote_name_columns(columns, quoted, quote):
+    """
+    Quotes the Age and name columns in place. There are only a few dozen
+    distinct names, so each is quoted once and remembered in `quoted`.
+    """
+    for i, field in enumerate(T_FIELDS + T_NAME_FIELDS):
+        if i < len(columns) and (field == 'T-Age' or field in T_NAME_FIELDS):
+            for name in set(columns[i]) - quoted.keys():
+                quoted[name] = quote(name)
+            columns[i] = [quoted[name] for name in columns[i]]
+    return columns
+
+
+class CsvFormat:
+    """Appends the T-fields as extra columns after the last field of each record."""
+
+    def __init__(self, column, delimiter=",", with_names=False):
+        self.column = column
+        self.delimiter = delimiter
+        self.with_names = with_names
+        self.column_index = None
+        fields = T_FIELDS + (T_NAME_FIELDS if with_names else ())
+        self.empty_suffix = delimiter * len(fields)
+        self.template = (delimiter + "%s") * len(fields)
+        # Names are fixed, so they are quoted for the delimiter once, not per row.
+        self.quoted = {}
+
+    def _quote(self, text):
+        if any(c in text for c in (self.delimiter, '"', "\n", "\r")):
+            return '"' + text.replace('"', '""') + '"'
+        return text
+
+    def header(self, line):
+        """Finds the column in the header line and returns the header to write."""
+        row = next(csv.reader([line], delimiter=self.delimiter))
+        if self.column in row:
+            self.column_index = row.index(self.column)
+        elif self.column.isdigit() and int(self.column) < len(row):
+            self.column_index = int(self.column)
+        else:
+            raise ValueError(f"column {self.column!r} is not in the CSV header")
+        fields = T_FIELDS + (T_NAME_FIELDS if self.with_names else ())
+        return line + self.delimiter + self.delimiter.join(self._quote(field) for field in fields)
+
+    def split_records(self, lines, quoted=True):
+        """
+        Groups the lines into records and returns (records, column values).
+        Without quoted fields every line is one record, split on the delimiter.
+        """
+        index = self.column_index
+        if not quoted:
+            delimiter = self.delimiter
+            values = [parts[index] if len(parts) > index else None
+                      for parts in (line.split(delimiter, index + 1) if line else () for line in lines)]
+            return lines, values
+
+        records, values = [], []
+        reader = csv.reader(lines, delimiter=self.delimiter)
+        start = 0
+        for row in reader:
+            end = reader.line_num
+            records.append(lines[start] if end == start + 1 else "\n".join(lines[start:end]))
+            values.append(row[index] if index < len(row) else None)
+            start = end
+        return records, values
+
+    def annotate(self, records, suffixes):
+        """Appends each record's suffix. Records without the column get empty fields, to keep the columns aligned."""
+        empty = self.empty_suffix
+        return [record + suffix if suffix is not None else (record + empty if record else record)
+                for record, suffix in zip(records, suffixes)]
+
+    def quote_columns(self, columns):
+        """Quotes the Age (and name) columns where the delimiter requires it."""
+        return _quote_name_columns(columns, self.quoted, self._quote)
+
+
+# Characters before a final '}' that may mean an empty object ("{}", "{ }").
+_SLOW_JSON_ENDINGS = ("{", " ", "\t", "")
+
+# "key": "string value" or "key": number, for the first occurrence of the key.
+def _json_value_pattern(key):
+    return re.compile('"' + re.escape(key) + r'"\s*:\s*(?:"((?:[^"\\]|\\.)*)"|(-?\d+(?:\.\d*)?(?:[eE][-+]?\d+)?))')
+
+
+class JsonlFormat:
+    """Inserts the T-fields as extra keys before the closing brace of each object."""
+
+    def __init__(self, column, with_names=False):
+        self.column = column
+        self.with_names = with_names
+        self.pattern = _json_value_pattern(column)
+        fields = T_FIELDS + (T_NAME_FIELDS if with_names else ())
+        self.template = "".join(f", {json.dumps(field)}: %s" for field in fields)
+        self.empty_suffix = self.template % (("null",) * len(fields))
+        self.quoted = {}
+
+    def header(self, line):
+        return None
+
+    def split_records(self, lines, quoted=True):
+        values = []
+        search = self.pattern.search
+        for line in lines:
+            match = search(line)
+            if match is None:
+                values.append(None)
+            elif match.group(1) is not None:
+                value = match.group(1)
+                values.append(json.loads('"' + value + '"') if "\\" in value else value)
+            else:
+                values.append(match.group(2))
+        return lines, values
+
+    def annotate(self, records, suffixes):
+        """Inserts each record's suffix; records without the key, or that are not objects, pass through."""
+        # Most records end in a plain "...}" and take the fast branch.
+        return [record[:-1] + suffix + "}" if suffix is not None and record[-2:-1] not in _SLOW_JSON_ENDINGS
+                and record[-1:] == "}" else self._annotate_one(record, suffix)
+                for record, suffix in zip(records, suffixes)]
+
+    @staticmethod
+    def _annotate_one(record, suffix):
+        body = record.rstrip()
+        if suffix is None or not body.endswith("}"):
+            return record  # Blank or not an object
+        if body[:-1].rstrip().endswith("{"):
+            suffix = suffix[2:]  # Empty object: no leading comma
+        return body[:-1] + suffix + "}"
+
+    def quote_columns(self, columns):
+        return _quote_name_columns(columns, self.quoted, json.dumps)
+
+
+def make_format(options):
+    if options.format == "csv":
+        return CsvFormat(options.column, options.delimiter, options.names)
+    return JsonlFormat(options.column, options.names)
+
+
+# --- Chunk Conversion ---
+
+def annotate_chunk(data, record_format, epoch_unit='s', utc_offset=None):
+    """Annotates one chunk of whole records (bytes) and returns the output bytes."""
+    text = data.decode("utf-8", errors="surrogateescape")
+    lines = text.split("\n")
+    trailing_newline = lines[-1] == ""
+    if trailing_newline:
+        lines.pop()
+    # Keep '\r\n' line endings: strip the '\r' for parsing and put it back on output.
+    crlf = bool(lines) and lines[0].endswith("\r")
+    if crlf:
+        lines = [line[:-1] if line.endswith("\r") else line for line in lines]
+
+    records, values = record_format.split_records(lines, quoted='"' in text)
+    rows = [i for i, value in enumerate(values) if value is not None]
+    suffixes = [None] * len(records)  # None: the record has no value in the column
+    if rows:
+        wall_us, valid = parse_timestamps([values[i] for i in rows], epoch_unit, utc_offset)
+        columns = record_format.quote_columns(t_field_columns(wall_us, valid, record_format.with_names))
+        template, empty = record_format.template, record_format.empty_suffix
+        for i, fields, ok in zip(rows, zip(*columns), valid.tolist()):
+            suffixes[i] = template % fields if ok else empty
+    out = record_format.annotate(records, suffixes)
+
+    result = "\n".join(out) + ("\n" if trailing_newline else "")
+    if crlf:
+        result = result.replace("\n", "\r\n")  # Also restores line breaks inside multi-line records
+    return result.encode("utf-8", errors="surrogateescape")
+
+
+def read_chunks(stream, chunk_bytes, quoted_records=False):
+    """
+    Yields chunks of about `chunk_bytes` that end at a line break. With
+    quoted_records (CSV), a chunk never ends inside a quoted field: an odd
+    number of '"' means one is still open, so more lines are read.
+    """
+    while True:
+        data = stream.read(chunk_bytes)
+        if not data:
+            return
+        if not data.endswith(b"\n"):
+            data += stream.readline()
+        if quoted_records:
+            while data.count(b'"') % 2:
+                line = stream.readline()
+                if not line:
+                    break
+                data += line
+        yield data
+
+
+def convert_stream(source, sink, options):
+    """Annotates every record from `source` (binary) onto `sink` (binary). Returns the record format used."""
+    record_format = make_format(options)
+
+    if options.format == "csv":
+        header = source.readline()
+        if not header:
+            return record_format
+        text = header.decode("utf-8", errors="surrogateescape")
+        ending = text[len(text.rstrip("\r\n")):]
+        sink.write((record_format.header(text.rstrip("\r\n")) + ending).encode("utf-8", errors="surrogateescape"))
+
+    chunks = read_chunks(source, options.chunk_bytes, quoted_records=options.format == "csv")
+    arguments = (record_format, options.epoch_unit, options.utc_offset)
+
+    if options.jobs <= 1:
+        for data in chunks:
+            sink.write(annotate_chunk(data, *arguments))
+        return record_format
+
+    # Keep a bounded window of chunks in flight, writing results in input order.
+    with concurrent.futures.ProcessPoolExecutor(max_workers=options.jobs) as pool:
+        pending = collections.deque()
+        for data in chunks:
+            pending.append(pool.submit(annotate_chunk, data, *arguments))
+            if len(pending) >= options.jobs * CHUNKS_IN_FLIGHT_PER_JOB:
+                sink.write(pending.popleft().result())
+        while pending:
+            sink.write(pending.popleft().result())
+    return record_format
+
+
+# --- Command Line ---
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Append Tahkmahnelle calendar fields for a timestamp column to a CSV or JSONL stream.")
+    parser.add_argument("--column", required=True, help="timestamp column: CSV header name (or 0-based index) or JSON key")
+    parser.add_argument("--format", choices=("csv", "jsonl"), default="csv", help="record format (default csv)")
+    parser.add_argument("--delimiter", default=",", help="CSV delimiter (default ',')")
+    parser.add_argument("--names", action="store_true", help="also append the T-Day, T-Week and T-Month names")
+    parser.add_argument("--epoch-unit", choices=tuple(EPOCH_UNITS), default="s", help="unit of numeric timestamps (default s)")
+    parser.add_argument("--utc-offset", type=float, default=None,
+                        help="seconds east of UTC for epochs and zoned times (default: the local time zone)")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="worker processes (default 1: convert in-process)")
+    parser.add_argument("--chunk-bytes", type=int, default=DEFAULT_CHUNK_BYTES, help="bytes read per chunk")
+    options = parser.parse_args(argv)
+
+    if not _numpy_available:
+        print("[Error] tahkmahnelle_annotate.py requires NumPy. Please install it using: pip install numpy", file=sys.stderr)
+        return 1
+    if len(options.delimiter) != 1:
+        parser.error("--delimiter must be a single character")
+
+    sink = sys.stdout.buffer
+    try:
+        convert_stream(sys.stdin.buffer, sink, options)
+        sink.flush()
+    except ValueError as e:
+        print(f"[Error] {e}", file=sys.stderr)
+        return 1
+    except BrokenPipeError:
+        # The output was closed, e.g. by head; point stdout at /dev/null so the exit flush stays quiet.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
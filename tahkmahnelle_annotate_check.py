@@ -0,0 +1,89 @@
+# tahkmahnelle_annotate_check.py
+#
+# Checks for the timestamp annotator (tahkmahnelle_annotate.py).
+#
+# Run from the repository directory:
+# python tahkmahnelle_annotate_check.py
+#
+# Small CSV and JSONL streams go through convert_stream() with --utc-offset 0.
+# Good epochs must get the fields get_tahkmahnelle_time gives for the same
+# UTC wall-clock time. Values that are not timestamps, or epochs outside
+# datetime's years 1 to 9999 (a millisecond epoch in a seconds column), must
+# get empty fields (CSV) or nulls (JSONL) without holding up the rest of the
+# stream. An alarm fails the check if a case takes longer than CASE_SECONDS.
+
+import io
+import sys
+import json
+import signal
+import argparse
+import datetime
+
+import tahkmahnelle_calendar as tcal
+import tahkmahnelle_annotate as annotate
+
+CASE_SECONDS = 10
+GOOD_EPOCH = 1750000000
+GOOD_ISO = "2025-06-15T15:06:40Z"  # The same instant
+FIELD_KEYS = ('T-Year', 'T-Age', 'T-Month', 'T-Week', 'T-Day', 'T-Hour', 'T-Minute', 'T-Second', 'T-Tick')
+
+
+def expected_fields(epoch):
+    """The T-fields, as annotate writes them, for an epoch read as UTC."""
+    wall = datetime.datetime(1970, 1, 1) + datetime.timedelta(seconds=epoch)
+    t_time = tcal.get_tahkmahnelle_time(wall)
+    return [str(t_time[key]) for key in FIELD_KEYS]
+
+
+def timed_out(signum, frame):
+    raise AssertionError(f"a case took longer than {CASE_SECONDS} s")
+
+
+def run(text, **overrides):
+    """Annotates `text` and returns the output text."""
+    options = argparse.Namespace(column="ts", format="csv", delimiter=",", names=False, epoch_unit="s",
+                                 utc_offset=0.0, jobs=1, chunk_bytes=annotate.DEFAULT_CHUNK_BYTES)
+    for key, value in overrides.items():
+        setattr(options, key, value)
+    sink = io.BytesIO()
+    signal.alarm(CASE_SECONDS)
+    try:
+        annotate.convert_stream(io.BytesIO(text.encode("utf-8")), sink, options)
+    finally:
+        signal.alarm(0)
+    return sink.getvalue().decode("utf-8")
+
+
+def check_csv(title, values):
+    """GOOD_EPOCH and GOOD_ISO must get their fields; every other value empty ones."""
+    lines = run("ts\n" + "".join(f"{value}\n" for value in values)).splitlines()[1:]
+    assert len(lines) == len(values), f"{title}: {len(lines)} rows for {len(values)} values"
+    for value, line in zip(values, lines):
+        fields = line.split(",")[1:]
+        expected = expected_fields(GOOD_EPOCH) if value in (str(GOOD_EPOCH), GOOD_ISO) else [""] * len(FIELD_KEYS)
+        assert fields == expected, f"{title}: {value} gave {fields}, expected {expected}"
+    print(f"OK: {title}")
+
+
+def main():
+    if not annotate._numpy_available:
+        print("[Error] the annotator requires NumPy. Please install it using: pip install numpy", file=sys.stderr)
+        return 1
+    signal.signal(signal.SIGALRM, timed_out)
+
+    # Millisecond epoch in a seconds column: the vectorized epoch path.
+    check_csv("millisecond epoch in a seconds column", [str(GOOD_EPOCH), str(GOOD_EPOCH * 1000)])
+    check_csv("non-finite and far-past epochs", [str(GOOD_EPOCH), "nan", "inf", "-1e20"])
+    # Mixed with ISO text and junk: the one-by-one path.
+    check_csv("out-of-range epoch among ISO text", [str(GOOD_EPOCH), str(GOOD_EPOCH * 1000), GOOD_ISO, "abc"])
+
+    lines = run(f'{{"ts": {GOOD_EPOCH * 1000}}}\n{{"ts": {GOOD_EPOCH}}}\n', format="jsonl").splitlines()
+    records = [json.loads(line) for line in lines]
+    assert all(records[0][key] is None for key in FIELD_KEYS), f"JSONL: out-of-range epoch gave {records[0]}"
+    assert [str(records[1][key]) for key in FIELD_KEYS] == expected_fields(GOOD_EPOCH), f"JSONL: {records[1]}"
+    print("OK: JSONL nulls for an out-of-range epoch")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
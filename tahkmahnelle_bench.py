@@ -0,0 +1,148 @@
+# tahkmahnelle_bench.py
+#
+# Microbenchmarks for the Tahkmahnelle clock engines.
+#
+# Run from the repository directory:
+# python tahkmahnelle_bench.py
+#
+# Each benchmark replays a stream of frames spaced like the live visualizers
+# (one every 46 ms) and reports the average cost per frame. The import cost
+# of tahkmahnelle_calendar is checked against IMPORT_TIME_BUDGET_MS, and the
+# script exits non-zero when it is over budget.
+
+import sys
+import time
+import random
+import datetime
+import collections
+import operator
+import tracemalloc
+import subprocess
+
+import tahkmahnelle_calendar as tcal
+from tahkmahnelle_fuzz import legacy_get_current_t_age_and_year
+
+FRAME_INTERVAL = datetime.timedelta(milliseconds=46)
+
+# `import tahkmahnelle_calendar` must stay under this many milliseconds (best of several runs).
+IMPORT_TIME_BUDGET_MS = 25
+
+
+def make_frames(start, count):
+    """Returns `count` datetimes spaced one live-clock frame apart."""
+    return [start + FRAME_INTERVAL * i for i in range(count)]
+
+
+def time_per_frame(func, frames):
+    """Calls `func` once per frame and returns the average cost in nanoseconds."""
+    start = time.perf_counter_ns()
+    for now in frames:
+        func(now)
+    return (time.perf_counter_ns() - start) / len(frames)
+
+
+def bench_age_lookup(frame_count=200000):
+    """Compares the uncached and cached Age lookups, including a New Year crossing."""
+    print("--- Age lookup per frame (get_current_t_age_and_year) ---")
+    scenarios = [
+        ("steady (inside one Age)", datetime.datetime(2025, 10, 17, 12, 0)),
+        ("crossing New Year's Day", datetime.datetime(2025, 12, 31, 23, 59) - FRAME_INTERVAL * (frame_count // 2)),
+    ]
+
+    for label, start in scenarios:
+        frames = make_frames(start, frame_count)
+
+        # The cache must agree with the original search on every frame.
+        for now in frames[::997]:
+            assert tcal.get_current_t_age_and_year(now) == legacy_get_current_t_age_and_year(now)
+
+        before = time_per_frame(legacy_get_current_t_age_and_year, frames)
+        after = time_per_frame(tcal.get_current_t_age_and_year, frames)
+        print(f"{label:<26} before: {before:8.0f} ns | after: {after:8.0f} ns | {before / after:5.1f}x faster")
+
+
+def bench_boundaries(boundary_count=1000000):
+    """Times listing T-Day/Week/Month boundaries with iter_t_boundaries."""
+    print("--- Boundary enumeration (iter_t_boundaries) ---")
+    start = datetime.datetime(1000, 1, 1)
+    end = start + datetime.timedelta(days=boundary_count)
+
+    for unit in ("day", "week", "month"):
+        began = time.perf_counter()
+        found = sum(1 for _ in tcal.iter_t_boundaries(start, end, unit))
+        elapsed = time.perf_counter() - began
+        print(f"{unit:<6} {found:>9} boundaries in {elapsed:6.3f} s")
+
+
+def bytes_per_item(build, items):
+    """Returns the traced memory per object of build(item) over `items`."""
+    tracemalloc.start()
+    built = [build(item) for item in items]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size / len(built)
+
+
+def bench_value_types(count=200000):
+    """Sorts and buckets T-timestamps held as T-time dicts and as TInstants, and compares their memory."""
+    print("--- Sorting and bucketing T-timestamps by T-Hour (dict vs TInstant) ---")
+    rng = random.Random(5849)
+    all_ticks = [rng.randrange(tcal.T_TICKS_PER_DAY * 20000, tcal.T_TICKS_PER_DAY * 21000) for _ in range(count)]
+    hour = tcal.TDuration.of(hours=1)
+
+    began = time.perf_counter()
+    dicts = [tcal.t_time_from_ticks(ticks) for ticks in all_ticks]
+    dict_build = time.perf_counter() - began
+    began = time.perf_counter()
+    dicts.sort(key=lambda t: (t['T-Year'], t['T-Age'], t['T-Month'], t['T-Week'], t['T-Day'],
+                              t['T-Hour'], t['T-Minute'], t['T-Second'], t['T-Tick']))
+    dict_buckets = collections.Counter((t['T-Year'], t['T-Age'], t['T-Month'], t['T-Week'], t['T-Day'], t['T-Hour'])
+                                       for t in dicts)
+    dict_work = time.perf_counter() - began
+    del dicts
+
+    began = time.perf_counter()
+    instants = [tcal.TInstant(ticks) for ticks in all_ticks]
+    instant_build = time.perf_counter() - began
+    began = time.perf_counter()
+    instants.sort(key=operator.attrgetter('ticks'))
+    instant_buckets = collections.Counter(instant.floor(hour) for instant in instants)
+    instant_work = time.perf_counter() - began
+
+    assert sorted(dict_buckets.values()) == sorted(instant_buckets.values())
+    sample = all_ticks[:10000]
+    print(f"{count} timestamps    {'build s':>8} {'sort+bucket s':>14} {'bytes each':>11}")
+    print(f"{'dict':<20} {dict_build:8.3f} {dict_work:14.3f} {bytes_per_item(tcal.t_time_from_ticks, sample):11.0f}")
+    print(f"{'TInstant':<20} {instant_build:8.3f} {instant_work:14.3f} {bytes_per_item(tcal.TInstant, sample):11.0f}")
+
+
+def measure_import_ms(module, runs=5):
+    """Returns the best cumulative `python -X importtime` cost of `module`, in milliseconds, over fresh interpreters."""
+    best = None
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                                capture_output=True, text=True, check=True)
+        for line in result.stderr.splitlines():
+            # "import time: self [us] | cumulative | imported package"
+            fields = line.split("|")
+            if len(fields) == 3 and fields[2].strip() == module:
+                cumulative_ms = int(fields[1]) / 1000
+                best = cumulative_ms if best is None else min(best, cumulative_ms)
+    return best
+
+
+def bench_import_time(budget_ms=IMPORT_TIME_BUDGET_MS):
+    """Measures the import cost of the shared calendar package; returns False when over budget."""
+    print("--- Import time (tahkmahnelle_calendar) ---")
+    cost = measure_import_ms("tahkmahnelle_calendar")
+    within = cost <= budget_ms
+    print(f"import tahkmahnelle_calendar: {cost:6.2f} ms (budget {budget_ms} ms) {'OK' if within else 'OVER BUDGET'}")
+    return within
+
+
+if __name__ == "__main__":
+    within_budget = bench_import_time()
+    bench_age_lookup()
+    bench_boundaries()
+    bench_value_types()
+    sys.exit(0 if within_budget else 1)
@@ -0,0 +1,48 @@
+"""
+tahkmahnelle_calendar - the shared Tahkmahnelle calendar core.
+
+The Chronologer, the visualizers, the Solar Clock, Lenemkette and the LoA
+Index all import their constants, name tables and T-time conversions from
+here, so every clock runs the same integer T-Tick engine and Age cache.
+
+    from tahkmahnelle_calendar import get_tahkmahnelle_time
+    t_time = get_tahkmahnelle_time(datetime.datetime.now())
+
+The NumPy batch API lives in tahkmahnelle_calendar.batch, and the bulk
+macro-cycle tables and exporter in tahkmahnelle_calendar.macro. Neither is
+imported here, which keeps `import tahkmahnelle_calendar` cheap (see the import-time
+budget in tahkmahnelle_bench.py).
+"""
+
+from .names import (
+    TAHKMAHNELLE_DICTIONARY, ROOT_NAMES, T_DAY_NAMES, T_WEEK_NAMES, T_MONTH_NAMES,
+    LONG_TERM_SETS, CYCLE_SETS,
+    get_t_day_name, get_t_week_name, get_t_month_name,
+)
+from .core import (
+    # Constants
+    T_SECONDS_PER_MINUTE, T_MINUTES_PER_HOUR, T_HOURS_PER_DAY, T_DAYS_PER_WEEK,
+    T_WEEKS_PER_MONTH, T_MONTHS_PER_AGE, T_TICKS_PER_SECOND, T_DAYS_PER_MONTH,
+    T_TICKS_PER_MINUTE, T_TICKS_PER_HOUR, T_TICKS_PER_DAY,
+    REAL_SECONDS_PER_DAY, TOTAL_T_SECONDS_PER_DAY, REAL_SECONDS_PER_T_SECOND,
+    MICROSECONDS_PER_DAY, NANOSECONDS_PER_DAY, TICKS_PER_NS_NUMERATOR, TICKS_PER_NS_DENOMINATOR,
+    EPOCH_ORDINAL, YEAR_OFFSET, TAHKMAHNELLE_AGE_CYCLE, T_BOUNDARY_STEPS,
+    # Age lookup
+    AgeBoundaryCache, get_current_t_age_and_year,
+    # Integer tick engine
+    wall_clock_ns, current_wall_clock_ns, t_ticks_from_ns, split_t_day_ticks,
+    decompose_t_ticks, t_time_dict, t_time_from_ticks, current_t_ticks, get_tahkmahnelle_time,
+    # Value types
+    TInstant, TDuration,
+    # Reverse conversion and boundaries
+    t_date_to_ordinal, t_date_to_ticks, ns_from_t_ticks, t_date_to_datetime, t_date_to_utc,
+    iter_t_boundary_ordinals, iter_t_boundaries,
+    # Macro cycles
+    calculate_long_term_cycles, get_macro_cycle_name,
+    # Reference calendar
+    T_YEAR_REFERENCE, REFERENCE_YEAR_OFFSET, T_MONTHS_PER_YEAR, REFERENCE_ORDINAL, reference_t_date,
+    next_reference_day,
+)
+from .scheduler import (
+    EventScheduler, ScheduledEvent, FrameClock, periodic_instants, local_midnight_instants, local_midnight_ns,
+)
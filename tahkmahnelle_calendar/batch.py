@@ -0,0 +1,163 @@
+"""
+Vectorized (NumPy) T-time conversion for whole columns of timestamps.
+
+Import this module explicitly; `import tahkmahnelle_calendar` does not load
+NumPy, so the live clocks start without paying for it.
+"""
+
+import time
+
+from .core import (
+    TAHKMAHNELLE_AGE_CYCLE, YEAR_OFFSET,
+    T_DAYS_PER_WEEK, T_WEEKS_PER_MONTH, T_MONTHS_PER_AGE, T_TICKS_PER_SECOND,
+    T_TICKS_PER_MINUTE, T_TICKS_PER_HOUR, MICROSECONDS_PER_DAY,
+    TICKS_PER_NS_NUMERATOR, TICKS_PER_NS_DENOMINATOR,
+)
+from .names import get_t_day_name, get_t_week_name, get_t_month_name
+
+# NumPy is only needed for the batch conversion API; the live clock runs without it.
+try:
+    import numpy as np
+    _numpy_available = True
+except ImportError:
+    _numpy_available = False
+
+# POSIX seconds of datetime.min and datetime.max (years 1 to 9999); anything
+# outside cannot be a datetime, so the batch API rejects it like fromtimestamp does.
+MIN_TIMESTAMP = -62135596800
+MAX_TIMESTAMP = 253402300799
+
+# --- Batch Conversion Functions (NumPy) ---
+
+def _require_numpy():
+    """Raises a helpful error when the batch API is used without NumPy installed."""
+    if not _numpy_available:
+        raise ImportError("The batch T-time API requires NumPy. Please install it using: pip install numpy")
+
+def _local_utc_offsets(seconds):
+    """
+    Returns the local UTC offset (in seconds) for an array of POSIX seconds.
+    The offset is looked up once per distinct real hour among the inputs,
+    since daylight-saving transitions happen on the hour.
+    """
+    hours = seconds // 3600
+    distinct_hours = np.unique(hours)
+    offset_table = np.array(
+        [time.localtime(int(h) * 3600).tm_gmtoff for h in distinct_hours],
+        dtype=np.int64
+    )
+    return offset_table[np.searchsorted(distinct_hours, hours)]
+
+def to_wall_microseconds(timestamps, utc_offset=None):
+    """
+    Converts POSIX timestamps or datetime64 values to naive wall-clock microseconds.
+    Raises ValueError for timestamps outside datetime's years 1 to 9999 (or NaN).
+    """
+    _require_numpy()
+    timestamps = np.asarray(timestamps)
+
+    # datetime64 values are already naive wall-clock times, like the datetimes the clock uses.
+    if np.issubdtype(timestamps.dtype, np.datetime64):
+        return timestamps.astype('datetime64[us]').astype(np.int64)
+
+    if not np.all((timestamps >= MIN_TIMESTAMP) & (timestamps <= MAX_TIMESTAMP)):
+        raise ValueError(f"timestamp out of range for datetime (POSIX seconds {MIN_TIMESTAMP} to {MAX_TIMESTAMP})")
+
+    # Round fractional seconds exactly like datetime.fromtimestamp (half-even on the fraction).
+    if np.issubdtype(timestamps.dtype, np.integer):
+        seconds = timestamps.astype(np.int64)
+        micros = seconds * 1000000
+    else:
+        whole = np.trunc(timestamps)
+        seconds = whole.astype(np.int64)
+        micros = seconds * 1000000 + np.round((timestamps - whole) * 1e6).astype(np.int64)
+
+    if seconds.size == 0:
+        return micros
+    if utc_offset is None:
+        return micros + _local_utc_offsets(seconds) * 1000000
+    return micros + int(utc_offset * 1000000)
+
+def _t_date_table(days):
+    """
+    Builds the Year/Age/Month/Week/Day columns for each of a sorted array of
+    distinct day numbers (days since 1970-01-01). The calendar part of T-time
+    only changes at midnight, so batch conversions gather from this table
+    instead of redoing the Age search for every timestamp.
+    """
+    day_dates = days.astype('datetime64[D]')
+    year_start = day_dates.astype('datetime64[Y]')
+
+    age_start_day = np.full(days.shape, np.iinfo(np.int64).min, dtype=np.int64)
+    age_index = np.zeros(days.shape, dtype=np.int8)
+    for i, age_data in enumerate(TAHKMAHNELLE_AGE_CYCLE):
+        month, day = age_data['date']
+        start = ((year_start.astype('datetime64[M]') + np.timedelta64(month - 1, 'M')).astype('datetime64[D]')
+                 + np.timedelta64(day - 1, 'D')).astype(np.int64)
+        previous = ((year_start - np.timedelta64(1, 'Y')).astype('datetime64[M]') + np.timedelta64(month - 1, 'M'))
+        previous = (previous.astype('datetime64[D]') + np.timedelta64(day - 1, 'D')).astype(np.int64)
+        start = np.where(start <= days, start, previous)
+
+        is_latest = start > age_start_day
+        age_start_day = np.where(is_latest, start, age_start_day)
+        age_index[is_latest] = i
+
+    # Whole days since the Age began, counted exactly as decompose_t_ticks does.
+    days_in_age = days - age_start_day
+    days_in_month = T_WEEKS_PER_MONTH * T_DAYS_PER_WEEK
+    days_since_month_start = days_in_age % days_in_month
+
+    return {
+        'T-Day': (days_since_month_start % T_DAYS_PER_WEEK + 1).astype(np.int8),
+        'T-Week': (days_since_month_start // T_DAYS_PER_WEEK % T_WEEKS_PER_MONTH + 1).astype(np.int8),
+        'T-Month': (days_in_age // days_in_month % T_MONTHS_PER_AGE + 1).astype(np.int8),
+        'T-Age': age_index,
+        'T-Year': year_start.astype(np.int64) + 1970 + YEAR_OFFSET
+    }
+
+def get_tahkmahnelle_time_batch(timestamps, utc_offset=None):
+    """
+    Vectorized form of get_tahkmahnelle_time for whole columns of timestamps.
+
+    `timestamps` is an array of POSIX timestamps (converted to local time, or shifted by
+    `utc_offset` seconds when given) or of naive datetime64 wall-clock values. Returns a
+    dict of NumPy arrays keyed like get_tahkmahnelle_time; 'T-Age' holds the index into
+    TAHKMAHNELLE_AGE_CYCLE and names are resolved with get_t_names_batch().
+    """
+    _require_numpy()
+    wall_us = to_wall_microseconds(timestamps, utc_offset)
+
+    # --- Calendar part: one table row per distinct real day, gathered per timestamp ---
+    day_number = wall_us // MICROSECONDS_PER_DAY
+    distinct_days = np.unique(day_number)
+    date_table = _t_date_table(distinct_days)
+    table_index = np.searchsorted(distinct_days, day_number)
+    t_times = {key: column[table_index] for key, column in date_table.items()}
+
+    # --- Clock part: the integer tick engine's divmod chain, column-wise ---
+    micros_in_day = wall_us - day_number * MICROSECONDS_PER_DAY
+    ticks_in_day = micros_in_day * 1000 * TICKS_PER_NS_NUMERATOR // TICKS_PER_NS_DENOMINATOR
+    t_hour, remaining = np.divmod(ticks_in_day, T_TICKS_PER_HOUR)
+    t_minute, remaining = np.divmod(remaining, T_TICKS_PER_MINUTE)
+    t_second, t_tick = np.divmod(remaining, T_TICKS_PER_SECOND)
+
+    t_times['T-Tick'] = t_tick.astype(np.int16)
+    t_times['T-Second'] = t_second.astype(np.int8)
+    t_times['T-Minute'] = t_minute.astype(np.int8)
+    t_times['T-Hour'] = t_hour.astype(np.int8)
+    return t_times
+
+def get_t_names_batch(t_times):
+    """Resolves the Age, Day, Week and Month names for a result of get_tahkmahnelle_time_batch."""
+    _require_numpy()
+    age_names = np.array([age_data['name'] for age_data in TAHKMAHNELLE_AGE_CYCLE], dtype=object)
+    day_names = np.array([get_t_day_name(i) for i in range(T_DAYS_PER_WEEK)], dtype=object)
+    week_names = np.array([get_t_week_name(i) for i in range(T_WEEKS_PER_MONTH)], dtype=object)
+    month_names = np.array([get_t_month_name(i) for i in range(T_MONTHS_PER_AGE)], dtype=object)
+
+    return {
+        'T-Age': age_names[t_times['T-Age']],
+        'T-Day-Name': day_names[t_times['T-Day'] - 1],
+        'T-Week-Name': week_names[t_times['T-Week'] - 1],
+        'T-Month-Name': month_names[t_times['T-Month'] - 1]
+    }
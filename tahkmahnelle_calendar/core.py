@@ -0,0 +1,641 @@
+"""
+Tahkmahnelle calendar core: time constants, the Age cycle, and the integer
+T-Tick engine that converts between wall-clock time and T-time.
+"""
+
+import time
+import datetime
+import math
+import bisect
+
+from .names import get_t_day_name, get_t_week_name, get_t_month_name, LONG_TERM_SETS, CYCLE_SETS
+
+# --- Tahkmahnelle Time System Constants ---
+
+T_SECONDS_PER_MINUTE = 9
+T_MINUTES_PER_HOUR = 7
+T_HOURS_PER_DAY = 8
+T_DAYS_PER_WEEK = 5
+T_WEEKS_PER_MONTH = 9
+T_MONTHS_PER_AGE = 3
+T_TICKS_PER_SECOND = 1000 # Used for 46ms precision display
+T_DAYS_PER_MONTH = T_WEEKS_PER_MONTH * T_DAYS_PER_WEEK
+
+REAL_SECONDS_PER_DAY = 86400
+TOTAL_T_SECONDS_PER_DAY = (T_SECONDS_PER_MINUTE * T_MINUTES_PER_HOUR * T_HOURS_PER_DAY)
+REAL_SECONDS_PER_T_SECOND = REAL_SECONDS_PER_DAY / TOTAL_T_SECONDS_PER_DAY
+
+# Year offset: Current T-Year is 5849
+YEAR_OFFSET = 5849 - datetime.datetime.now().year
+
+# Age structure definitions
+# The New Year starts *after* the Summer Solstice, meaning the cycle begins with the Autumn Equinox.
+TAHKMAHNELLE_AGE_CYCLE = [
+    # T-Year starts here (Autumn Equinox)
+    {'key': 'C', 'name': 'The Age of Precedent (New Year)', 'date': (9, 22)},
+    {'key': 'D', 'name': 'The Age of Transition', 'date': (12, 21)},
+    {'key': 'A', 'name': 'The Age of Genesis', 'date': (3, 20)},
+    {'key': 'B', 'name': 'The Age of Zenith', 'date': (6, 21)}
+]
+
+# --- Age Lookup ---
+
+class AgeBoundaryCache:
+    """
+    Remembers the Age interval that contains the last looked-up instant.
+
+    Ages start at midnight, so the cache works on proleptic day ordinals. The
+    sorted Age starts are built once per real year; while a lookup stays inside
+    the cached interval it costs two comparisons, and the cache only refreshes
+    when the next Age boundary (or New Year's Day, which moves the T-Year) is
+    crossed.
+    """
+
+    def __init__(self, age_cycle, year_offset):
+        self.age_cycle = age_cycle
+        self.year_offset = year_offset
+        self._table_year = None
+        self._starts = []
+        self._ages = []
+        self._valid_from = 0
+        self._valid_until = 0
+        self._result = None
+        self._ordinal_result = None
+
+    def _build_year(self, year):
+        """Sorts the Age starts of the previous, current and next real year."""
+        age_starts = []
+        for y in (year - 1, year, year + 1):
+            for age_data in self.age_cycle:
+                month, day = age_data['date']
+                age_starts.append((datetime.date(y, month, day).toordinal(), age_data))
+        age_starts.sort(key=lambda x: x[0])
+
+        self._table_year = year
+        self._starts = [start for start, _ in age_starts]
+        self._ages = [age_data for _, age_data in age_starts]
+
+    def _refresh(self, ordinal):
+        """Finds the Age containing `ordinal` and caches its validity interval."""
+        year = datetime.date.fromordinal(ordinal).year
+        if year != self._table_year:
+            self._build_year(year)
+
+        i = bisect.bisect_right(self._starts, ordinal) - 1
+        age_start = self._starts[i]
+        self._valid_from = max(age_start, datetime.date(year, 1, 1).toordinal())
+        self._valid_until = min(self._starts[i + 1], datetime.date(year + 1, 1, 1).toordinal())
+
+        t_year = year + self.year_offset
+        self._ordinal_result = (self._ages[i], age_start, t_year)
+        self._result = (self._ages[i], datetime.datetime.fromordinal(age_start), t_year)
+
+    def lookup(self, now):
+        """Returns (age_data, age_start_date, t_year) for the given datetime."""
+        ordinal = now.toordinal()
+        if not self._valid_from <= ordinal < self._valid_until:
+            self._refresh(ordinal)
+        return self._result
+
+    def lookup_ordinal(self, ordinal):
+        """Returns (age_data, age_start_ordinal, t_year) for a proleptic day ordinal."""
+        if not self._valid_from <= ordinal < self._valid_until:
+            self._refresh(ordinal)
+        return self._ordinal_result
+
+
+_AGE_CACHE = AgeBoundaryCache(TAHKMAHNELLE_AGE_CYCLE, YEAR_OFFSET)
+
+def get_current_t_age_and_year(now):
+    """Determines the current Tahkmahnelle Age and Year based on the date."""
+    # The T-Year is the real year plus YEAR_OFFSET; the Age is the most recent
+    # Age start (current or previous real year) at or before `now`.
+    current_age_data, age_start_date, t_year = _AGE_CACHE.lookup(now)
+    return current_age_data['name'], age_start_date, t_year
+
+# --- Integer Tick Engine ---
+
+# All T-time is counted in whole T-Ticks since the wall-clock epoch (local
+# 1970-01-01 00:00). One T-Day is exactly one real day, so T-Ticks per real day
+# is an integer and every unit falls out of a divmod chain without floats.
+T_TICKS_PER_MINUTE = T_SECONDS_PER_MINUTE * T_TICKS_PER_SECOND
+T_TICKS_PER_HOUR = T_MINUTES_PER_HOUR * T_TICKS_PER_MINUTE
+T_TICKS_PER_DAY = T_HOURS_PER_DAY * T_TICKS_PER_HOUR
+MICROSECONDS_PER_DAY = REAL_SECONDS_PER_DAY * 1000000
+NANOSECONDS_PER_DAY = REAL_SECONDS_PER_DAY * 1000000000
+
+# ticks = ns * T_TICKS_PER_DAY / NANOSECONDS_PER_DAY, reduced to lowest terms (7 / 1.2e9)
+_TICK_GCD = math.gcd(T_TICKS_PER_DAY, NANOSECONDS_PER_DAY)
+TICKS_PER_NS_NUMERATOR = T_TICKS_PER_DAY // _TICK_GCD
+TICKS_PER_NS_DENOMINATOR = NANOSECONDS_PER_DAY // _TICK_GCD
+
+EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+def wall_clock_ns(now):
+    """Converts a naive (wall-clock) datetime to integer nanoseconds since the epoch."""
+    seconds = (now.toordinal() - EPOCH_ORDINAL) * REAL_SECONDS_PER_DAY + now.hour * 3600 + now.minute * 60 + now.second
+    return seconds * 1000000000 + now.microsecond * 1000
+
+def current_wall_clock_ns():
+    """Returns the local wall-clock time as integer nanoseconds, read from time.time_ns()."""
+    ns = time.time_ns()
+    return ns + time.localtime(ns // 1000000000).tm_gmtoff * 1000000000
+
+def t_ticks_from_ns(wall_ns):
+    """Converts wall-clock nanoseconds to whole T-Ticks since the epoch (floor)."""
+    return wall_ns * TICKS_PER_NS_NUMERATOR // TICKS_PER_NS_DENOMINATOR
+
+def split_t_day_ticks(ticks_in_day):
+    """Splits the T-Ticks elapsed in a day into (hour, minute, second, tick)."""
+    t_hour, remaining = divmod(ticks_in_day, T_TICKS_PER_HOUR)
+    t_minute, remaining = divmod(remaining, T_TICKS_PER_MINUTE)
+    t_second, t_tick = divmod(remaining, T_TICKS_PER_SECOND)
+    return t_hour, t_minute, t_second, t_tick
+
+def decompose_t_ticks(ticks):
+    """
+    Decomposes an absolute T-Tick count into T-time units.
+    Returns (age_data, t_year, month_index, week_index, day_index, hour, minute, second, tick),
+    with the Month/Week/Day indices 0-based.
+    """
+    day_number, ticks_in_day = divmod(ticks, T_TICKS_PER_DAY)
+    age_data, age_start_ordinal, t_year = _AGE_CACHE.lookup_ordinal(day_number + EPOCH_ORDINAL)
+
+    days_in_age = day_number + EPOCH_ORDINAL - age_start_ordinal
+    t_month_index, days_since_month_start = divmod(days_in_age, T_DAYS_PER_MONTH)
+    t_week_index, t_day_index = divmod(days_since_month_start, T_DAYS_PER_WEEK)
+
+    return (age_data, t_year, t_month_index % T_MONTHS_PER_AGE, t_week_index, t_day_index) + split_t_day_ticks(ticks_in_day)
+
+def t_time_dict(fields):
+    """Builds the T-time dictionary used by the displays from decompose_t_ticks() fields."""
+    (age_data, t_year, t_month_index, t_week_index, t_day_index,
+     t_hour, t_minute, t_second, t_tick) = fields
+
+    return {
+        'T-Tick': t_tick, 'T-Second': t_second, 'T-Minute': t_minute, 'T-Hour': t_hour,
+        'T-Day': t_day_index + 1, 'T-Week': t_week_index + 1, 'T-Month': t_month_index + 1,
+        'T-Age': age_data['name'], 'T-Year': t_year,
+        'T-Day-Name': get_t_day_name(t_day_index), 'T-Week-Name': get_t_week_name(t_week_index),
+        'T-Month-Name': get_t_month_name(t_month_index)
+    }
+
+def t_time_from_ticks(ticks):
+    """Builds the T-time dictionary used by the displays from an absolute T-Tick count."""
+    return t_time_dict(decompose_t_ticks(ticks))
+
+def current_t_ticks():
+    """Returns the current absolute T-Tick count."""
+    return t_ticks_from_ns(current_wall_clock_ns())
+
+def get_tahkmahnelle_time(now):
+    """Calculates all Tahkmahnelle time units."""
+    return t_time_from_ticks(t_ticks_from_ns(wall_clock_ns(now)))
+
+# --- T-Time Value Types ---
+
+# A TInstant or TDuration is one integer T-Tick count in a slotted object, so
+# millions of them sort, hash and bucket without a dict per timestamp. The
+# calendar fields of an instant are only worked out (and then kept) the first
+# time one of them is read.
+
+_DURATION_UNITS = ('d', 'h', 'm', 's')
+
+class TDuration:
+    """An immutable span of T-time, counted in whole T-Ticks (may be negative)."""
+
+    __slots__ = ('ticks',)
+
+    def __init__(self, ticks=0):
+        object.__setattr__(self, 'ticks', int(ticks))
+
+    @classmethod
+    def of(cls, days=0, hours=0, minutes=0, seconds=0, ticks=0):
+        """Builds a duration from T-units, e.g. TDuration.of(hours=2, minutes=3)."""
+        return cls(days * T_TICKS_PER_DAY + hours * T_TICKS_PER_HOUR + minutes * T_TICKS_PER_MINUTE
+                   + seconds * T_TICKS_PER_SECOND + ticks)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    __delattr__ = __setattr__
+
+    def __reduce__(self):
+        return (type(self), (self.ticks,))
+
+    # --- Fields ---
+
+    def split(self):
+        """Returns (days, hours, minutes, seconds, ticks) of the absolute length, without a sign."""
+        days, ticks_in_day = divmod(abs(self.ticks), T_TICKS_PER_DAY)
+        return (days,) + split_t_day_ticks(ticks_in_day)
+
+    @property
+    def ns(self):
+        """The length in real nanoseconds (rounded toward zero)."""
+        ns = abs(self.ticks) * TICKS_PER_NS_DENOMINATOR // TICKS_PER_NS_NUMERATOR
+        return -ns if self.ticks < 0 else ns
+
+    def __repr__(self):
+        return f"TDuration({self.ticks})"
+
+    def __str__(self):
+        """Formats as e.g. '1d 2h 3m 4s 005t', leaving out leading zero units."""
+        *values, ticks = self.split()
+        parts = []
+        for unit, value in zip(_DURATION_UNITS, values):
+            if value or parts:
+                parts.append(f"{value}{unit}")
+        parts.append(f"{ticks:03d}t")
+        return ("-" if self.ticks < 0 else "") + " ".join(parts)
+
+    # --- Comparison and Arithmetic ---
+
+    def __eq__(self, other):
+        return type(other) is TDuration and self.ticks == other.ticks
+
+    def __lt__(self, other):
+        return self.ticks < other.ticks if type(other) is TDuration else NotImplemented
+
+    def __le__(self, other):
+        return self.ticks <= other.ticks if type(other) is TDuration else NotImplemented
+
+    def __gt__(self, other):
+        return self.ticks > other.ticks if type(other) is TDuration else NotImplemented
+
+    def __ge__(self, other):
+        return self.ticks >= other.ticks if type(other) is TDuration else NotImplemented
+
+    def __hash__(self):
+        return hash(self.ticks)
+
+    def __bool__(self):
+        return self.ticks != 0
+
+    def __add__(self, other):
+        if type(other) is TDuration:
+            return TDuration(self.ticks + other.ticks)
+        if type(other) is TInstant:
+            return TInstant(other.ticks + self.ticks)
+        return NotImplemented
+
+    def __sub__(self, other):
+        return TDuration(self.ticks - other.ticks) if type(other) is TDuration else NotImplemented
+
+    def __neg__(self):
+        return TDuration(-self.ticks)
+
+    def __abs__(self):
+        return TDuration(abs(self.ticks))
+
+    def __mul__(self, factor):
+        return TDuration(self.ticks * factor) if type(factor) is int else NotImplemented
+
+    __rmul__ = __mul__
+
+    def __floordiv__(self, other):
+        """Duration // Duration counts whole spans; Duration // int splits into equal parts."""
+        if type(other) is TDuration:
+            return self.ticks // other.ticks
+        if type(other) is int:
+            return TDuration(self.ticks // other)
+        return NotImplemented
+
+    def __mod__(self, other):
+        return TDuration(self.ticks % other.ticks) if type(other) is TDuration else NotImplemented
+
+
+class TInstant:
+    """
+    An immutable point in T-time: whole T-Ticks since the wall-clock epoch.
+
+    Instants compare, hash and subtract by their tick count alone; adding or
+    subtracting a TDuration gives a new TInstant. The calendar fields (year,
+    age, month, ...) are decomposed on first access and cached on the object.
+    For large lists, sort with key=operator.attrgetter('ticks'), which skips
+    the Python-level __lt__.
+    """
+
+    __slots__ = ('ticks', '_fields')
+
+    def __init__(self, ticks):
+        object.__setattr__(self, 'ticks', int(ticks))
+        object.__setattr__(self, '_fields', None)
+
+    @classmethod
+    def from_ns(cls, wall_ns):
+        """The instant containing wall-clock nanosecond `wall_ns`."""
+        return cls(t_ticks_from_ns(wall_ns))
+
+    @classmethod
+    def from_datetime(cls, now):
+        """The instant containing a naive (wall-clock) datetime."""
+        return cls(t_ticks_from_ns(wall_clock_ns(now)))
+
+    @classmethod
+    def now(cls):
+        """The current instant."""
+        return cls(current_t_ticks())
+
+    @classmethod
+    def from_t_date(cls, t_year, age, month, week, day, hour=0, minute=0, second=0, tick=0):
+        """The instant at a T-date and T-time of day (see t_date_to_ticks)."""
+        return cls(t_date_to_ticks(t_year, age, month, week, day, hour, minute, second, tick))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    __delattr__ = __setattr__
+
+    def __reduce__(self):
+        return (type(self), (self.ticks,))
+
+    # --- Fields (decomposed lazily) ---
+
+    def fields(self):
+        """Returns decompose_t_ticks(self.ticks), working it out on the first call."""
+        fields = self._fields
+        if fields is None:
+            fields = decompose_t_ticks(self.ticks)
+            object.__setattr__(self, '_fields', fields)
+        return fields
+
+    @property
+    def age_data(self):
+        """The TAHKMAHNELLE_AGE_CYCLE entry of the Age."""
+        return self.fields()[0]
+
+    @property
+    def year(self):
+        return self.fields()[1]
+
+    @property
+    def month(self):
+        """The T-Month within the Age (1-based, as in 'T-Month')."""
+        return self.fields()[2] + 1
+
+    @property
+    def week(self):
+        return self.fields()[3] + 1
+
+    @property
+    def day(self):
+        return self.fields()[4] + 1
+
+    # The time of day needs no Age lookup, so it is read straight off the tick count.
+
+    @property
+    def hour(self):
+        return self.ticks % T_TICKS_PER_DAY // T_TICKS_PER_HOUR
+
+    @property
+    def minute(self):
+        return self.ticks % T_TICKS_PER_HOUR // T_TICKS_PER_MINUTE
+
+    @property
+    def second(self):
+        return self.ticks % T_TICKS_PER_MINUTE // T_TICKS_PER_SECOND
+
+    @property
+    def tick(self):
+        return self.ticks % T_TICKS_PER_SECOND
+
+    @property
+    def age(self):
+        """The full name of the Age, as in 'T-Age'."""
+        return self.fields()[0]['name']
+
+    @property
+    def day_name(self):
+        return get_t_day_name(self.fields()[4])
+
+    @property
+    def week_name(self):
+        return get_t_week_name(self.fields()[3])
+
+    @property
+    def month_name(self):
+        return get_t_month_name(self.fields()[2])
+
+    @property
+    def day_number(self):
+        """Whole T-Days since the epoch; instants on the same T-Day share it."""
+        return self.ticks // T_TICKS_PER_DAY
+
+    @property
+    def ns(self):
+        """The first wall-clock nanosecond of this instant's T-Tick."""
+        return ns_from_t_ticks(self.ticks)
+
+    def floor(self, duration):
+        """Rounds down to a multiple of `duration` since the epoch, e.g. to bucket by T-Hour."""
+        return TInstant(self.ticks - self.ticks % duration.ticks)
+
+    def to_dict(self):
+        """Returns the T-time dictionary used by the displays (see get_tahkmahnelle_time)."""
+        return t_time_dict(self.fields())
+
+    def __repr__(self):
+        return f"TInstant({self.ticks})"
+
+    def __str__(self):
+        """Formats as e.g. '5849 The Age of Genesis M1 W2 D3 4:05:06.007'."""
+        return (f"{self.year} {self.age} M{self.month} W{self.week} D{self.day} "
+                f"{self.hour}:{self.minute:02d}:{self.second:02d}.{self.tick:03d}")
+
+    # --- Comparison and Arithmetic ---
+
+    def __eq__(self, other):
+        return type(other) is TInstant and self.ticks == other.ticks
+
+    def __lt__(self, other):
+        return self.ticks < other.ticks if type(other) is TInstant else NotImplemented
+
+    def __le__(self, other):
+        return self.ticks <= other.ticks if type(other) is TInstant else NotImplemented
+
+    def __gt__(self, other):
+        return self.ticks > other.ticks if type(other) is TInstant else NotImplemented
+
+    def __ge__(self, other):
+        return self.ticks >= other.ticks if type(other) is TInstant else NotImplemented
+
+    def __hash__(self):
+        return hash(self.ticks)
+
+    def __add__(self, other):
+        return TInstant(self.ticks + other.ticks) if type(other) is TDuration else NotImplemented
+
+    def __sub__(self, other):
+        """Instant - Duration is an earlier Instant; Instant - Instant is the Duration between them."""
+        if type(other) is TDuration:
+            return TInstant(self.ticks - other.ticks)
+        if type(other) is TInstant:
+            return TDuration(self.ticks - other.ticks)
+        return NotImplemented
+
+# --- Reverse Conversion and Boundary Enumeration ---
+
+# Ages can be named by key ('C') or by full name, as shown in 'T-Age'.
+_AGE_LOOKUP = {}
+for _age_data in TAHKMAHNELLE_AGE_CYCLE:
+    _AGE_LOOKUP[_age_data['key']] = _age_data
+    _AGE_LOOKUP[_age_data['name']] = _age_data
+
+T_BOUNDARY_STEPS = {'day': 1, 'week': T_DAYS_PER_WEEK, 'month': T_DAYS_PER_MONTH, 'age': None}
+
+def _check_t_unit(label, value, low, high):
+    """Raises ValueError unless low <= value <= high."""
+    if not low <= value <= high:
+        raise ValueError(f"{label} must be in {low}..{high}, got {value}")
+
+def t_date_to_ordinal(t_year, age, month, week, day):
+    """
+    Returns the proleptic day ordinal of a T-date (Month/Week/Day are 1-based,
+    as in get_tahkmahnelle_time). Raises ValueError for T-dates that do not
+    exist, e.g. a third Month in an Age shorter than 90 days.
+    """
+    if age not in _AGE_LOOKUP:
+        raise ValueError(f"Unknown T-Age: {age!r}")
+    _check_t_unit("T-Month", month, 1, T_MONTHS_PER_AGE)
+    _check_t_unit("T-Week", week, 1, T_WEEKS_PER_MONTH)
+    _check_t_unit("T-Day", day, 1, T_DAYS_PER_WEEK)
+
+    age_data = _AGE_LOOKUP[age]
+    age_month, age_day = age_data['date']
+    days_in_age = (month - 1) * T_DAYS_PER_MONTH + (week - 1) * T_DAYS_PER_WEEK + (day - 1)
+    year = t_year - YEAR_OFFSET
+
+    # The T-Year turns over on January 1st, so an Age that straddles New Year's
+    # Day (The Age of Transition) may have started in the previous real year.
+    for start_year in (year, year - 1):
+        age_start = datetime.date(start_year, age_month, age_day).toordinal()
+        ordinal = age_start + days_in_age
+        if datetime.date.fromordinal(ordinal).year == year and _AGE_CACHE.lookup_ordinal(ordinal)[1] == age_start:
+            return ordinal
+
+    raise ValueError(f"T-Year {t_year}, {age_data['name']} has no Month {month}, Week {week}, Day {day}")
+
+def t_date_to_ticks(t_year, age, month, week, day, hour=0, minute=0, second=0, tick=0):
+    """Returns the absolute T-Tick count of a T-date and T-time of day (the inverse of decompose_t_ticks)."""
+    _check_t_unit("T-Hour", hour, 0, T_HOURS_PER_DAY - 1)
+    _check_t_unit("T-Minute", minute, 0, T_MINUTES_PER_HOUR - 1)
+    _check_t_unit("T-Second", second, 0, T_SECONDS_PER_MINUTE - 1)
+    _check_t_unit("T-Tick", tick, 0, T_TICKS_PER_SECOND - 1)
+
+    day_number = t_date_to_ordinal(t_year, age, month, week, day) - EPOCH_ORDINAL
+    return (day_number * T_TICKS_PER_DAY + hour * T_TICKS_PER_HOUR + minute * T_TICKS_PER_MINUTE
+            + second * T_TICKS_PER_SECOND + tick)
+
+def ns_from_t_ticks(ticks):
+    """Returns the first wall-clock nanosecond of a T-Tick (the inverse of t_ticks_from_ns)."""
+    return -(-ticks * TICKS_PER_NS_DENOMINATOR // TICKS_PER_NS_NUMERATOR)
+
+def t_date_to_datetime(t_year, age, month, week, day, hour=0, minute=0, second=0, tick=0):
+    """
+    Converts a T-date and T-time of day to the naive (wall-clock) datetime at
+    which that T-Tick starts, rounded up to the next whole microsecond.
+    """
+    wall_ns = ns_from_t_ticks(t_date_to_ticks(t_year, age, month, week, day, hour, minute, second, tick))
+    days, micros = divmod(-(-wall_ns // 1000), MICROSECONDS_PER_DAY)
+    return datetime.datetime.fromordinal(days + EPOCH_ORDINAL) + datetime.timedelta(microseconds=micros)
+
+def t_date_to_utc(t_year, age, month, week, day, hour=0, minute=0, second=0, tick=0):
+    """Converts a T-date and T-time of day to an aware UTC datetime, using the local time zone."""
+    local = t_date_to_datetime(t_year, age, month, week, day, hour, minute, second, tick)
+    return local.astimezone(datetime.timezone.utc)
+
+def _iter_age_starts(year):
+    """Yields (start_ordinal, age_data) for every Age start from real year `year` onwards."""
+    while year <= datetime.MAXYEAR:
+        age_starts = sorted((datetime.date(year, *age_data['date']).toordinal(), i)
+                            for i, age_data in enumerate(TAHKMAHNELLE_AGE_CYCLE))
+        for start, i in age_starts:
+            yield start, TAHKMAHNELLE_AGE_CYCLE[i]
+        year += 1
+    yield datetime.date.max.toordinal() + 1, None
+
+def iter_t_boundary_ordinals(first_ordinal, end_ordinal, unit='day'):
+    """
+    Yields the day ordinal of every T-'day', 'week', 'month' or 'age' start in
+    [first_ordinal, end_ordinal). Weeks and Months restart with each Age, so
+    the generator walks the Age starts and jumps through each Age with range().
+    """
+    if unit not in T_BOUNDARY_STEPS:
+        raise ValueError(f"Unknown T-unit: {unit!r} (expected one of {', '.join(T_BOUNDARY_STEPS)})")
+    step = T_BOUNDARY_STEPS[unit]
+
+    age_starts = _iter_age_starts(datetime.date.fromordinal(first_ordinal).year - 1)
+    age_start, _ = next(age_starts)
+    for next_start, _ in age_starts:
+        if age_start >= end_ordinal:
+            return
+        if next_start > first_ordinal:
+            if step is None:
+                if age_start >= first_ordinal:
+                    yield age_start
+            else:
+                # First multiple of `step` days into the Age that is not before first_ordinal.
+                first = age_start + -(-max(first_ordinal - age_start, 0) // step) * step
+                yield from range(first, min(next_start, end_ordinal), step)
+        age_start = next_start
+
+def iter_t_boundaries(start, end, unit='day'):
+    """
+    Yields the naive (wall-clock) datetime of every T-'day', 'week', 'month'
+    or 'age' boundary in [start, end). All boundaries fall on real midnights.
+    """
+    first_ordinal = start.toordinal() + (start.time() != datetime.time.min)
+    end_ordinal = end.toordinal() + (end.time() != datetime.time.min)
+    fromordinal = datetime.datetime.fromordinal
+    for ordinal in iter_t_boundary_ordinals(first_ordinal, end_ordinal, unit):
+        yield fromordinal(ordinal)
+
+# --- Macro Cycles (Stahoy, Vraen, Tetnobausse) ---
+
+def calculate_long_term_cycles(t_year):
+    """Calculates the current Stahoy, Vraen, and Tetnobausse, and their governing 7 Sets."""
+    # Each cycle is numbered 1-based: Tetnobausse = 1000, Vraen = 100, Stahoy = 10 T-Years.
+    t_millennia = (t_year - 1) // 1000 + 1
+    t_century_total = (t_year - 1) // 100 + 1
+    t_decade_total = (t_year - 1) // 10 + 1
+
+    # Each cycle is governed by one of the 7 Sets, chosen by the number of cycles completed.
+    num_sets = len(LONG_TERM_SETS)
+    return {
+        'T_DECADE_TOTAL': t_decade_total,
+        'T_CENTURY_TOTAL': t_century_total,
+        'T_MILLENNIA': t_millennia,
+        'T_YEAR_IN_DECADE': (t_year - 1) % 10 + 1, # 1 to 10
+        'stahoy_set': LONG_TERM_SETS[(t_decade_total - 1) % num_sets],
+        'vraen_set': LONG_TERM_SETS[(t_century_total - 1) % num_sets],
+        'tetnobausse_set': LONG_TERM_SETS[(t_millennia - 1) % num_sets],
+    }
+
+def get_macro_cycle_name(t_year, cycle_length):
+    """Returns the Lenemkette name (Ariatnah, Batobwatchaeh, etc.) for a Stahoy, Vraen, or Tetnobausse."""
+    return CYCLE_SETS[(t_year // cycle_length) % 7].capitalize()
+
+# --- Reference Calendar (Lenemkette / LoA Index) ---
+
+# Lenemkette and the LoA Index run the 45-day T-Month continuously from a fixed
+# reference date instead of restarting it with each Age.
+T_YEAR_REFERENCE = 2025
+REFERENCE_YEAR_OFFSET = 5849 - T_YEAR_REFERENCE
+T_MONTHS_PER_YEAR = T_MONTHS_PER_AGE * len(TAHKMAHNELLE_AGE_CYCLE)
+REFERENCE_ORDINAL = datetime.date(T_YEAR_REFERENCE, 1, 1).toordinal()
+
+def reference_t_date(ordinal):
+    """
+    Returns (month_index, day_of_month_index, week_index, day_index) for a day
+    ordinal on the reference calendar: the T-Month (0-11), the day within it
+    (0-44), and the T-Week (0-8) and T-Day (0-4) within that.
+    """
+    t_month_index, day_of_month_index = divmod(ordinal - REFERENCE_ORDINAL, T_DAYS_PER_MONTH)
+    t_week_index, t_day_index = divmod(day_of_month_index, T_DAYS_PER_WEEK)
+    return t_month_index % T_MONTHS_PER_YEAR, day_of_month_index, t_week_index, t_day_index
+
+def next_reference_day(ordinal, day_of_month_index):
+    """Returns the first day ordinal after `ordinal` that is day `day_of_month_index` (0-44) of a reference T-Month."""
+    following = ordinal + 1
+    return following + (day_of_month_index - (following - REFERENCE_ORDINAL)) % T_DAYS_PER_MONTH
@@ -0,0 +1,167 @@
+"""
+Bulk Stahoy / Vraen / Tetnobausse tables for long-range chronicles.
+
+build_macro_cycle_table() computes every macro-cycle field for a range of
+T-Years as NumPy columns, and export_macro_cycles() streams a range to CSV
+or JSONL in fixed-size chunks, so 100k years are written without building a
+dict per row. Like the batch API, this module is imported explicitly:
+
+    python -m tahkmahnelle_calendar.macro 1 100001 jsonl > chronicle.jsonl
+"""
+
+import sys
+import json
+
+from .names import LONG_TERM_SETS, CYCLE_SETS
+
+# NumPy is only needed for the bulk tables; calculate_long_term_cycles() runs without it.
+try:
+    import numpy as np
+    _numpy_available = True
+except ImportError:
+    _numpy_available = False
+
+STAHOY_YEARS = 10
+VRAEN_YEARS = 100
+TETNOBAUSSE_YEARS = 1000
+
+# Columns of a MacroCycleTable, in export order. The *_set columns index
+# LONG_TERM_SETS (as calculate_long_term_cycles does); the *_cycle columns
+# index CYCLE_SETS (as get_macro_cycle_name does for Lenemkette).
+MACRO_CYCLE_COLUMNS = (
+    't_year', 't_decade_total', 't_century_total', 't_millennia', 't_year_in_decade',
+    'stahoy_set', 'vraen_set', 'tetnobausse_set',
+    'stahoy_cycle', 'vraen_cycle', 'tetnobausse_cycle',
+)
+_SET_COLUMNS = ('stahoy_set', 'vraen_set', 'tetnobausse_set')
+_CYCLE_COLUMNS = ('stahoy_cycle', 'vraen_cycle', 'tetnobausse_cycle')
+
+# Exported text for the set/cycle columns, looked up by index.
+SET_ROOTS = tuple(s['root'] for s in LONG_TERM_SETS)
+CYCLE_NAMES = tuple(name.capitalize() for name in CYCLE_SETS)
+
+DEFAULT_CHUNK_YEARS = 65536
+
+
+def _require_numpy():
+    """Raises a helpful error when the bulk API is used without NumPy installed."""
+    if not _numpy_available:
+        raise ImportError("The bulk macro-cycle API requires NumPy. Please install it using: pip install numpy")
+
+
+class MacroCycleTable:
+    """Macro-cycle fields for the T-Years start_year..stop_year-1, one NumPy column per field."""
+
+    def __init__(self, start_year, stop_year, columns):
+        self.start_year = start_year
+        self.stop_year = stop_year
+        self.columns = columns
+
+    def __len__(self):
+        return self.stop_year - self.start_year
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def long_term_cycles(self, t_year):
+        """Returns the same dict as calculate_long_term_cycles(t_year), read from the table."""
+        i = t_year - self.start_year
+        c = self.columns
+        return {
+            'T_DECADE_TOTAL': int(c['t_decade_total'][i]),
+            'T_CENTURY_TOTAL': int(c['t_century_total'][i]),
+            'T_MILLENNIA': int(c['t_millennia'][i]),
+            'T_YEAR_IN_DECADE': int(c['t_year_in_decade'][i]),
+            'stahoy_set': LONG_TERM_SETS[c['stahoy_set'][i]],
+            'vraen_set': LONG_TERM_SETS[c['vraen_set'][i]],
+            'tetnobausse_set': LONG_TERM_SETS[c['tetnobausse_set'][i]],
+        }
+
+
+def build_macro_cycle_table(start_year, stop_year):
+    """Computes every macro-cycle field for the T-Years start_year..stop_year-1 in one vectorized pass."""
+    _require_numpy()
+    t_year = np.arange(start_year, stop_year, dtype=np.int64)
+    elapsed = t_year - 1
+
+    # 1-based cycle numbers, as in calculate_long_term_cycles()
+    decade_total = elapsed // STAHOY_YEARS + 1
+    century_total = elapsed // VRAEN_YEARS + 1
+    millennia = elapsed // TETNOBAUSSE_YEARS + 1
+
+    num_sets = len(LONG_TERM_SETS)
+    num_cycles = len(CYCLE_SETS)
+    columns = {
+        't_year': t_year,
+        't_decade_total': decade_total,
+        't_century_total': century_total,
+        't_millennia': millennia,
+        't_year_in_decade': (elapsed % STAHOY_YEARS + 1).astype(np.int8),
+        'stahoy_set': ((decade_total - 1) % num_sets).astype(np.int8),
+        'vraen_set': ((century_total - 1) % num_sets).astype(np.int8),
+        'tetnobausse_set': ((millennia - 1) % num_sets).astype(np.int8),
+        # Lenemkette counts completed cycles from year 0, as in get_macro_cycle_name()
+        'stahoy_cycle': ((t_year // STAHOY_YEARS) % num_cycles).astype(np.int8),
+        'vraen_cycle': ((t_year // VRAEN_YEARS) % num_cycles).astype(np.int8),
+        'tetnobausse_cycle': ((t_year // TETNOBAUSSE_YEARS) % num_cycles).astype(np.int8),
+    }
+    return MacroCycleTable(start_year, stop_year, columns)
+
+
+# --- Streaming Export ---
+
+def _text_columns(table, set_text, cycle_text):
+    """Returns the table's columns as lists for formatting, with set/cycle indices replaced by their text."""
+    out = []
+    for name in MACRO_CYCLE_COLUMNS:
+        column = table[name]
+        if name in _SET_COLUMNS:
+            out.append(list(np.take(set_text, column)))
+        elif name in _CYCLE_COLUMNS:
+            out.append(list(np.take(cycle_text, column)))
+        else:
+            out.append(column.tolist())
+    return out
+
+
+def _csv_format():
+    return ",".join("{}" for _ in MACRO_CYCLE_COLUMNS) + "\n"
+
+
+def _jsonl_format():
+    # Keys are fixed, so each line is one str.format call; values are pre-encoded JSON.
+    fields = ", ".join(f'{json.dumps(name)}: {{}}' for name in MACRO_CYCLE_COLUMNS)
+    return "{{" + fields + "}}\n"
+
+
+def export_macro_cycles(out, start_year, stop_year, fmt="csv", chunk_years=DEFAULT_CHUNK_YEARS):
+    """
+    Writes the macro-cycle table for start_year..stop_year-1 to the text file
+    `out` as CSV (with a header row) or JSONL, one chunk of years at a time.
+    Returns the number of rows written.
+    """
+    _require_numpy()
+    if fmt == "csv":
+        row_format = _csv_format()
+        set_text = np.array(SET_ROOTS, dtype=object)
+        cycle_text = np.array(CYCLE_NAMES, dtype=object)
+        out.write(",".join(MACRO_CYCLE_COLUMNS) + "\n")
+    elif fmt == "jsonl":
+        row_format = _jsonl_format()
+        set_text = np.array([json.dumps(root) for root in SET_ROOTS], dtype=object)
+        cycle_text = np.array([json.dumps(name) for name in CYCLE_NAMES], dtype=object)
+    else:
+        raise ValueError(f"Unknown export format '{fmt}' (expected 'csv' or 'jsonl')")
+
+    for chunk_start in range(start_year, stop_year, chunk_years):
+        table = build_macro_cycle_table(chunk_start, min(chunk_start + chunk_years, stop_year))
+        out.write("".join(row_format.format(*row) for row in zip(*_text_columns(table, set_text, cycle_text))))
+    return max(stop_year - start_year, 0)
+
+
+# Usage: python -m tahkmahnelle_calendar.macro start_year stop_year [csv|jsonl]
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print("Usage: python -m tahkmahnelle_calendar.macro start_year stop_year [csv|jsonl]", file=sys.stderr)
+        sys.exit(2)
+    export_macro_cycles(sys.stdout, int(sys.argv[1]), int(sys.argv[2]), sys.argv[3] if len(sys.argv) > 3 else "csv")
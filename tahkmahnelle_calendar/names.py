@@ -0,0 +1,79 @@
+"""
+Tahkmahnelle name tables: the 26 Primal Roots and the cycle names derived from them.
+
+Every table is built once, when the package is imported, so naming a T-Day,
+T-Week or T-Month is a tuple index.
+"""
+
+# --- Tahkmahnelle Linguistic Database (LoA Index) ---
+
+# The 26 Primal Roots (Tkemnâti) which also name the cycles and periods of significance.
+TAHKMAHNELLE_DICTIONARY = {
+    'a': {'root': 'ariatnah', 'meaning': 'Root for \'Beginning,\' \'Dawn,\' or \'First Light.\'', 'age': 'The Age of Genesis'},
+    'b': {'root': 'batobwatchaeh', 'meaning': 'Root for \'Unfurling,\' \'Expansion,\' or \'To Become Vast.\'', 'age': 'The Age of Growth'},
+    'c': {'root': "c'illiatnah", 'meaning': 'Root for \'Consciousness,\' \'Inner Gaze,\' or \'Self-Awareness.\'', 'age': 'The Age of Sentience'},
+    'd': {'root': 'diadowatchaeh', 'meaning': 'Root for \'Structure,\' \'Foundation,\' or \'Binding Law.\'', 'age': 'The Age of Order'},
+    'e': {'root': 'eecheechuwah', 'meaning': 'Root for \'Flow,\' \'River,\' or \'Eternal Motion.\'', 'age': 'The Age of Continuity'},
+    'f': {'root': "f'illianarre", 'meaning': 'Root for \'Covenant,\' \'Sacred Duty,\' or \'Bound by Oath.\'', 'age': 'The Age of Oaths'},
+    'g': {'root': 'gagoikenne', 'meaning': 'Root for \'Gathering,\' \'Assembly,\' or \'Community.\'', 'age': 'The Age of Alliance'},
+    'h': {'root': "h'uilliatachaeh", 'meaning': 'Root for \'Echo,\' \'Reflection,\' or \'Memory of the Past.\'', 'age': 'The Age of Precedent'},
+    'i': {'root': 'illianarre', 'meaning': 'Root for \'Truth,\' \'Unveiling,\' or \'Revelation.\'', 'age': 'The Age of Clarity'},
+    'j': {'root': 'ampejinne', 'meaning': 'Root for \'Intervention,\' \'Sudden Change,\' or \'Catalyst.\'', 'age': 'The Age of Catalyst'},
+    'k': {'root': 'kajoinkenne', 'meaning': 'Root for \'Harmony,\' \'Balance,\' or \'The Midpoint.\'', 'age': 'The Age of Zenith'},
+    'l': {'root': 'lenemketobontette', 'meaning': 'Root for \'Long Journey,\' \'Exile,\' or \'Wandering.\'', 'age': 'The Age of Passage'},
+    'm': {'root': 'momaw', 'meaning': 'Root for \'Sustenance,\' \'Nourishment,\' or \'The Mother Principle.\'', 'age': 'The Age of Life'},
+    'n': {'root': 'nona, nano', 'meaning': 'Root for \'Negation,\' \'Void,\' or \'The Absence.\'', 'age': 'The Age of Silence'},
+    'o': {'root': 'oichenne', 'meaning': 'Root for \'Wisdom,\' \'Deep Understanding,\' or \'Enlightenment.\'', 'age': 'The Age of Enlightenment'},
+    'p': {'root': 'perfuvium', 'meaning': 'Root for \'Scattering,\' \'Fragmentation,\' or \'Dispersion.\'', 'age': 'The Age of Diaspora'},
+    'q': {'root': 'quaristenne', 'meaning': 'Root for \'Question,\' \'The Search,\' or \'Inquiry.\'', 'age': 'The Age of Inquiry'},
+    'r': {'root': 'roykenne', 'meaning': 'Root for \'Return,\' \'Recurrence,\' or \'The Cycle.\'', 'age': 'The Age of Cycles'},
+    's': {'root': 'stihuu, siataeh', 'meaning': 'Root for \'Vibration,\' \'Sound,\' or \'Spoken Word.\'', 'age': 'The Age of Voice'},
+    't': {'root': 'tetnobautte, tahkmahnelle', 'meaning': 'Root for \'Governance,\' \'System,\' or \'The People/Culture.\'', 'age': 'The Age of Culture'},
+    'u': {'root': 'uilliatachaeh', 'meaning': 'Root for \'Vision,\' \'Foresight,\' or \'The Future.\'', 'age': 'The Age of Destiny'},
+    'v': {'root': 'vraelvrae', 'meaning': 'Root for \'Convergence,\' \'The Meeting Place,\' or \'Unification.\'', 'age': 'The Age of Unity'},
+    'w': {'root': 'weetus', 'meaning': 'Root for \'Waiting,\' \'Anticipation,\' or \'Stasis.\'', 'age': 'The Age of Stasis'},
+    'x': {'root': 'xiangxong', 'meaning': 'Root for \'Fusion,\' \'Synthesis of Opposites,\' or \'Integration.\'', 'age': 'The Age of Integration'},
+    'y': {'root': "y'uilliatachaeh", 'meaning': 'Root for \'Culmination,\' \'The Final Seal,\' or \'End of an Era.\'', 'age': 'The Age of Ending'},
+    'z': {'root': 'zazoykenne', 'meaning': 'Root for \'Rebirth,\' \'The Renewal,\' or \'Restart.\'', 'age': 'The Age of Transition (Age-Reset)'}
+}
+
+# --- Naming Cycles based on Phonology (A-Z) ---
+
+ROOT_NAMES = tuple(d['root'] for k, d in sorted(TAHKMAHNELLE_DICTIONARY.items()))
+
+T_DAY_NAMES = ROOT_NAMES[0:5]     # Roots A-E
+T_WEEK_NAMES = ROOT_NAMES[5:14]   # Roots F-N
+T_MONTH_NAMES = ROOT_NAMES[14:17] # Roots O-Q
+
+# 7 Sets of Cycles for Decades, Centuries, Millennia
+# Indices 0-6 correspond to the first 7 letters (A-G)
+LONG_TERM_SETS = (
+    {'root': 'ariats', 'index': 0, 'meaning': 'Set of Genesis'},
+    {'root': 'batos', 'index': 1, 'meaning': 'Set of Expansion'},
+    {'root': "c'illias", 'index': 2, 'meaning': 'Set of Consciousness'},
+    {'root': 'diados', 'index': 3, 'meaning': 'Set of Structure'},
+    {'root': 'eechuwahs', 'index': 4, 'meaning': 'Set of Motion'},
+    {'root': "f'illias", 'index': 5, 'meaning': 'Set of Covenant'},
+    {'root': 'gagois', 'index': 6, 'meaning': 'Set of Alliance'}
+)
+
+# Lenemkette names the macro cycles after the first 7 Primal Roots themselves
+CYCLE_SETS = ROOT_NAMES[:7]
+
+def get_t_day_name(day_index):
+    """Names the 5 T-Days using roots A-E (0-4)."""
+    if 0 <= day_index < 5:
+        return T_DAY_NAMES[day_index]
+    return f"Day {day_index + 1}"
+
+def get_t_week_name(week_index):
+    """Names the 9 T-Weeks using roots F-N (0-8)."""
+    if 0 <= week_index < 9:
+        return T_WEEK_NAMES[week_index]
+    return f"Week {week_index + 1}"
+
+def get_t_month_name(month_index):
+    """Names the 3 T-Months using roots O-Q (0-2)."""
+    if 0 <= month_index < 3:
+        return T_MONTH_NAMES[month_index]
+    return f"Month {month_index + 1}"
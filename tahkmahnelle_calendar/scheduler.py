@@ -0,0 +1,232 @@
+"""
+Event-driven scheduler for rituals, seasons, holidays and lore events, and
+the frame clock that paces the live displays.
+
+Each event knows how to compute its next occurrence, so the scheduler keeps a
+heap of upcoming instants, sleeps until the earliest one, and fires each
+occurrence's callback exactly once, instead of polling the clock every frame.
+All event instants are POSIX nanoseconds, as returned by time.time_ns();
+frame deadlines use time.monotonic_ns() so they are immune to clock changes.
+"""
+
+import time
+import heapq
+import datetime
+
+
+def periodic_instants(origin_ns, period_ns, offset_ns=0):
+    """
+    Returns a next-occurrence function for an event that repeats every
+    `period_ns`, at `offset_ns` past `origin_ns` (and every period before or after).
+    """
+    def next_after(after_ns):
+        cycles = (after_ns - origin_ns - offset_ns) // period_ns + 1
+        return origin_ns + offset_ns + cycles * period_ns
+    return next_after
+
+
+def local_midnight_ns(ordinal):
+    """Returns the POSIX nanoseconds of local midnight at the start of a day ordinal."""
+    return int(datetime.datetime.fromordinal(ordinal).timestamp()) * 1000000000
+
+
+def local_midnight_instants(next_ordinal):
+    """
+    Returns a next-occurrence function for an event that starts at local
+    midnight. `next_ordinal(ordinal)` must return the first day ordinal after
+    `ordinal` on which the event happens (or None if it never happens again).
+    """
+    def next_after(after_ns):
+        # The local midnight of the day containing `after_ns` is never after it,
+        # so the next occurrence is on the first event day after that one.
+        today = datetime.datetime.fromtimestamp(after_ns // 1000000000).toordinal()
+        ordinal = next_ordinal(today)
+        return None if ordinal is None else local_midnight_ns(ordinal)
+    return next_after
+
+
+class FrameClock:
+    """
+    Fixed-rate frame deadlines on time.monotonic_ns().
+
+    Frame k is due at start + k * interval, so the period does not include
+    render time and never drifts. A frame that starts more than a whole
+    interval late skips the deadlines it missed (counted in `missed`) and the
+    loop stays on the original grid. Iterating waits for each frame:
+
+        for _ in FrameClock(0.046):
+            draw()
+    """
+
+    STATS_WINDOW_NS = 1000000000
+
+    def __init__(self, interval, clock=time.monotonic_ns, sleep=time.sleep):
+        self.period_ns = int(interval * 1000000000)
+        self.clock = clock
+        self.sleep = sleep
+        self.frames = 0
+        self.missed = 0
+        self.fps = 0.0
+        self.jitter_ms = 0.0
+        self.max_jitter_ms = 0.0
+        self._deadline = None  # When the next frame is due; None until the first frame
+        self._window_start = None
+        self._window_frames = 0
+        self._window_lateness = 0
+        self._window_max_lateness = 0
+
+    def remaining_ns(self):
+        """Nanoseconds until the next frame is due (zero or less when it is due now)."""
+        return 0 if self._deadline is None else self._deadline - self.clock()
+
+    def begin_frame(self):
+        """Records the start of a frame and schedules the next one; returns how many deadlines were skipped."""
+        now = self.clock()
+        if self._deadline is None:
+            self._deadline = self._window_start = now
+
+        lateness = now - self._deadline
+        skipped = max(lateness // self.period_ns, 0)
+        if skipped:
+            self.missed += skipped
+            self._deadline += skipped * self.period_ns
+            lateness -= skipped * self.period_ns
+        self._deadline += self.period_ns
+        self.frames += 1
+
+        # Jitter is how far frames start from their deadlines, averaged over about a second.
+        self._window_frames += 1
+        self._window_lateness += abs(lateness)
+        self._window_max_lateness = max(self._window_max_lateness, abs(lateness))
+        elapsed = now - self._window_start
+        if elapsed >= self.STATS_WINDOW_NS:
+            self.fps = self._window_frames * 1000000000 / elapsed
+            self.jitter_ms = self._window_lateness / self._window_frames / 1000000
+            self.max_jitter_ms = self._window_max_lateness / 1000000
+            self._window_start = now
+            self._window_frames = 0
+            self._window_lateness = 0
+            self._window_max_lateness = 0
+        return skipped
+
+    def wait(self):
+        """Sleeps until the next frame is due, then begins it; returns how many deadlines were skipped."""
+        remaining = self.remaining_ns()
+        if remaining > 0:
+            self.sleep(remaining / 1000000000)
+        return self.begin_frame()
+
+    def __iter__(self):
+        while True:
+            self.wait()
+            yield self.frames
+
+    def stats_text(self):
+        """A short summary of the achieved rate, jitter and missed deadlines."""
+        return (f"{self.fps:5.1f} fps | jitter {self.jitter_ms:5.2f} ms (max {self.max_jitter_ms:5.2f} ms) | "
+                f"missed {self.missed}")
+
+
+class ScheduledEvent:
+    """A named event, its next-occurrence function, and the callback fired at each occurrence."""
+
+    __slots__ = ('name', 'next_after', 'callback', 'payload')
+
+    def __init__(self, name, next_after, callback=None, payload=None):
+        self.name = name
+        self.next_after = next_after
+        self.callback = callback
+        self.payload = payload
+
+
+class EventScheduler:
+    """
+    Min-heap of upcoming event occurrences.
+
+    run_pending() fires every occurrence that is due, in time order, and
+    schedules each event's following occurrence strictly after the one that
+    fired, so no occurrence fires twice and none is skipped when the loop is late.
+    """
+
+    def __init__(self, clock=time.time_ns, sleep=time.sleep):
+        self.clock = clock
+        self.sleep = sleep
+        self._heap = []
+        self._sequence = 0
+
+    def _push(self, when_ns, event):
+        if when_ns is not None:
+            # The sequence number keeps ties in insertion order and never compares events.
+            heapq.heappush(self._heap, (when_ns, self._sequence, event))
+            self._sequence += 1
+
+    def add(self, name, next_after, callback=None, payload=None, start_ns=None):
+        """
+        Registers an event. Its first occurrence is the first one at or after
+        `start_ns` (default: now). The callback is called as callback(event, when_ns).
+        """
+        event = ScheduledEvent(name, next_after, callback, payload)
+        start_ns = self.clock() if start_ns is None else start_ns
+        self._push(next_after(start_ns - 1), event)
+        return event
+
+    def next_event_ns(self):
+        """Returns the instant of the earliest pending occurrence, or None when nothing is scheduled."""
+        return self._heap[0][0] if self._heap else None
+
+    def next_events(self, n):
+        """Returns the next `n` occurrences as (when_ns, name, payload) tuples without firing them."""
+        heap = list(self._heap)
+        sequence = self._sequence
+        upcoming = []
+        while heap and len(upcoming) < n:
+            when_ns, _, event = heapq.heappop(heap)
+            upcoming.append((when_ns, event.name, event.payload))
+            following = event.next_after(when_ns)
+            if following is not None:
+                heapq.heappush(heap, (following, sequence, event))
+                sequence += 1
+        return upcoming
+
+    def run_pending(self, now_ns=None):
+        """Fires every occurrence due at `now_ns` (default: now); returns how many fired."""
+        now_ns = self.clock() if now_ns is None else now_ns
+        fired = 0
+        while self._heap and self._heap[0][0] <= now_ns:
+            when_ns, _, event = heapq.heappop(self._heap)
+            self._push(event.next_after(when_ns), event)
+            if event.callback is not None:
+                event.callback(event, when_ns)
+            fired += 1
+        return fired
+
+    def run(self, until_ns=None, on_tick=None, tick_interval=None, frame_clock=None):
+        """
+        Sleeps until the earliest occurrence and fires it, forever or until
+        `until_ns`. With `on_tick`, also calls it on every frame of a
+        FrameClock (`frame_clock`, or a new one every `tick_interval` seconds)
+        to redraw a display; events still fire at their own instants.
+        """
+        if on_tick is not None and frame_clock is None:
+            frame_clock = FrameClock(tick_interval, sleep=self.sleep)
+
+        while True:
+            now_ns = self.clock()
+            if until_ns is not None and now_ns >= until_ns:
+                return
+
+            self.run_pending(now_ns)
+            if frame_clock is not None and frame_clock.remaining_ns() <= 0:
+                frame_clock.begin_frame()
+                on_tick()
+
+            now_ns = self.clock()
+            delays = [frame_clock.remaining_ns()] if frame_clock is not None else []
+            for deadline in (self.next_event_ns(), until_ns):
+                if deadline is not None:
+                    delays.append(deadline - now_ns)
+            if not delays:
+                return
+            delay_ns = min(delays)
+            if delay_ns > 0:
+                self.sleep(delay_ns / 1000000000)
@@ -0,0 +1,182 @@
+# tahkmahnelle_fuzz.py
+#
+# Fuzz check for the integer T-Tick engine.
+#
+# Run from the repository directory:
+# python tahkmahnelle_fuzz.py [samples] [seed]
+#
+# Random wall-clock instants are converted by the integer engine
+# (tahkmahnelle_calendar.get_tahkmahnelle_time and
+# Lenemkette.calculate_t_time_components) and by the original float
+# implementations kept below, which find the Age with the original uncached
+# search rather than the cached lookup under test. Results must agree everywhere except within
+# one microsecond of a T-Tick boundary, where the float versions could round
+# to the neighbouring tick. Every sample is also converted back with
+# t_date_to_datetime, which must land on the start of the same T-Tick.
+
+import sys
+import math
+import random
+import datetime
+
+import tahkmahnelle_calendar as tcal
+import Lenemkette as lenemkette
+
+BOUNDARY_MARGIN_US = 1
+T_TICK_LENGTH = datetime.timedelta(seconds=1.2 / 7)
+
+
+def legacy_get_current_t_age_and_year(now):
+    """The original per-call Age search: builds, sorts and scans eight Age starts."""
+    current_year = now.year
+    age_starts = []
+
+    for y in [current_year, current_year - 1]:
+        for age_data in tcal.TAHKMAHNELLE_AGE_CYCLE:
+            month, day = age_data['date']
+            age_starts.append((datetime.datetime(y, month, day), age_data))
+
+    age_starts.sort(key=lambda x: x[0])
+
+    current_age_data = None
+    age_start_date = None
+    for start_date, age_data in reversed(age_starts):
+        if start_date <= now:
+            current_age_data = age_data
+            age_start_date = start_date
+            break
+
+    t_year = current_year + tcal.YEAR_OFFSET
+    return current_age_data['name'], age_start_date, t_year
+
+
+def legacy_get_tahkmahnelle_time(now):
+    """The original float implementation of get_tahkmahnelle_time."""
+    current_age_name, age_start_date, t_year = legacy_get_current_t_age_and_year(now)
+
+    real_days_in_age = (now - age_start_date).total_seconds() / tcal.REAL_SECONDS_PER_DAY
+    days_in_month = tcal.T_WEEKS_PER_MONTH * tcal.T_DAYS_PER_WEEK
+
+    t_month_index = math.floor(real_days_in_age / days_in_month) % tcal.T_MONTHS_PER_AGE
+    days_since_month_start = real_days_in_age % days_in_month
+    t_week_index = math.floor(days_since_month_start / tcal.T_DAYS_PER_WEEK) % tcal.T_WEEKS_PER_MONTH
+    days_since_week_start = days_since_month_start % tcal.T_DAYS_PER_WEEK
+    t_day_index = math.floor(days_since_week_start) % tcal.T_DAYS_PER_WEEK
+
+    real_seconds_in_day = (now - now.replace(hour=0, minute=0, second=0, microsecond=0)).total_seconds()
+    total_t_index = (real_seconds_in_day * tcal.TOTAL_T_SECONDS_PER_DAY * tcal.T_TICKS_PER_SECOND) / tcal.REAL_SECONDS_PER_DAY
+
+    t_hour_divisor = tcal.T_MINUTES_PER_HOUR * tcal.T_SECONDS_PER_MINUTE * tcal.T_TICKS_PER_SECOND
+    t_hour = math.floor(total_t_index / t_hour_divisor) % tcal.T_HOURS_PER_DAY
+    remaining_index = total_t_index % t_hour_divisor
+    t_minute_divisor = tcal.T_SECONDS_PER_MINUTE * tcal.T_TICKS_PER_SECOND
+    t_minute = math.floor(remaining_index / t_minute_divisor) % tcal.T_MINUTES_PER_HOUR
+    remaining_index = remaining_index % t_minute_divisor
+    t_second = math.floor(remaining_index / tcal.T_TICKS_PER_SECOND) % tcal.T_SECONDS_PER_MINUTE
+    t_tick = math.floor(remaining_index % tcal.T_TICKS_PER_SECOND)
+
+    return {
+        'T-Tick': t_tick, 'T-Second': t_second, 'T-Minute': t_minute, 'T-Hour': t_hour,
+        'T-Day': t_day_index + 1, 'T-Week': t_week_index + 1, 'T-Month': t_month_index + 1,
+        'T-Age': current_age_name, 'T-Year': t_year,
+        'T-Day-Name': tcal.get_t_day_name(t_day_index),
+        'T-Week-Name': tcal.get_t_week_name(t_week_index),
+        'T-Month-Name': tcal.get_t_month_name(t_month_index)
+    }
+
+
+def legacy_calculate_t_time_components(now, current_t_year):
+    """The original float implementation of Lenemkette.calculate_t_time_components."""
+    real_seconds_of_day = (now - now.replace(hour=0, minute=0, second=0, microsecond=0)).total_seconds()
+    t_seconds_absolute = real_seconds_of_day / tcal.REAL_SECONDS_PER_T_SECOND
+
+    t_hour = math.floor(t_seconds_absolute / (tcal.T_MINUTES_PER_HOUR * tcal.T_SECONDS_PER_MINUTE)) % tcal.T_HOURS_PER_DAY
+    remaining_seconds = t_seconds_absolute % (tcal.T_MINUTES_PER_HOUR * tcal.T_SECONDS_PER_MINUTE)
+    t_minute = math.floor(remaining_seconds / tcal.T_SECONDS_PER_MINUTE) % tcal.T_MINUTES_PER_HOUR
+    remaining_seconds = remaining_seconds % tcal.T_SECONDS_PER_MINUTE
+    t_second = math.floor(remaining_seconds) % tcal.T_SECONDS_PER_MINUTE
+    t_tick = math.floor((remaining_seconds - t_second) * tcal.T_TICKS_PER_SECOND) % tcal.T_TICKS_PER_SECOND
+
+    reference_date = datetime.date(tcal.T_YEAR_REFERENCE, 1, 1)
+    total_days_since_reference = (now.date() - reference_date).days
+    t_month_index_absolute = math.floor(total_days_since_reference / tcal.T_DAYS_PER_MONTH) % 12
+    day_of_t_month_index = total_days_since_reference % tcal.T_DAYS_PER_MONTH
+    t_day_index = day_of_t_month_index % tcal.T_DAYS_PER_WEEK
+
+    return {
+        'T-H': t_hour, 'T-M': t_minute, 'T-S': t_second, 'T-TICK': t_tick,
+        'T-DayName': tcal.get_t_day_name(t_day_index).capitalize(), 'T-DayNum': day_of_t_month_index + 1,
+        'T-WkNum': math.floor(day_of_t_month_index / tcal.T_DAYS_PER_WEEK) + 1, 'T-WkMax': tcal.T_WEEKS_PER_MONTH,
+        'T-MonthName': tcal.get_t_month_name(t_month_index_absolute % 3).capitalize(), 'T-MonthAbs': t_month_index_absolute + 1,
+        'T-Y': current_t_year,
+        'T-Tetnobausse': tcal.get_macro_cycle_name(current_t_year, 1000),
+        'T-Vraen': tcal.get_macro_cycle_name(current_t_year, 100),
+        'T-Stahoy': tcal.get_macro_cycle_name(current_t_year, 10)
+    }
+
+
+def near_tick_boundary(now):
+    """True when `now` is within BOUNDARY_MARGIN_US of a T-Tick boundary."""
+    micros_in_day = ((now.hour * 60 + now.minute) * 60 + now.second) * 1000000 + now.microsecond
+    # A T-Tick lasts 1.2 / 7 real seconds: boundaries sit where micros * 7 is a multiple of 1,200,000.
+    offset = (micros_in_day * 7) % 1200000
+    margin = BOUNDARY_MARGIN_US * 7
+    return offset < margin or offset > 1200000 - margin
+
+
+def random_instant(rng):
+    """A random wall-clock instant between 1900 and 2100 with microsecond resolution."""
+    first = datetime.date(1900, 1, 1).toordinal()
+    last = datetime.date(2100, 12, 31).toordinal()
+    day = datetime.datetime.fromordinal(rng.randint(first, last))
+    return day + datetime.timedelta(microseconds=rng.randrange(86400 * 1000000))
+
+
+def round_trip_failure(now):
+    """Returns None if `now` survives T-time -> datetime -> T-time, otherwise the datetime it came back as."""
+    t_time = tcal.get_tahkmahnelle_time(now)
+    back = tcal.t_date_to_datetime(
+        t_time['T-Year'], t_time['T-Age'], t_time['T-Month'], t_time['T-Week'], t_time['T-Day'],
+        t_time['T-Hour'], t_time['T-Minute'], t_time['T-Second'], t_time['T-Tick'])
+    if not (back <= now < back + T_TICK_LENGTH and tcal.get_tahkmahnelle_time(back) == t_time):
+        return back
+    return None
+
+
+def run_fuzz(samples=200000, seed=None):
+    """Compares the integer engine with the float implementations; returns the mismatches."""
+    rng = random.Random(seed)
+    mismatches = []
+    skipped = 0
+
+    for _ in range(samples):
+        now = random_instant(rng)
+        back = round_trip_failure(now)
+        if back is not None:
+            mismatches.append(("t_date_to_datetime", now, back, "start of the same T-Tick"))
+
+        if near_tick_boundary(now):
+            skipped += 1
+            continue
+
+        pairs = [
+            ("get_tahkmahnelle_time", tcal.get_tahkmahnelle_time(now), legacy_get_tahkmahnelle_time(now)),
+            ("calculate_t_time_components", lenemkette.calculate_t_time_components(now, 5849),
+             legacy_calculate_t_time_components(now, 5849)),
+        ]
+        for name, new, old in pairs:
+            if new != old:
+                mismatches.append((name, now, new, old))
+
+    print(f"Checked {samples - skipped} instants ({skipped} skipped near tick boundaries): {len(mismatches)} mismatches.")
+    return mismatches
+
+
+if __name__ == "__main__":
+    sample_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    fuzz_seed = int(sys.argv[2]) if len(sys.argv) > 2 else None
+
+    found = run_fuzz(sample_count, fuzz_seed)
+    for name, now, new, old in found[:10]:
+        print(f"[Mismatch] {name} at {now.isoformat()}:\n  got:      {new}\n  expected: {old}")
+    sys.exit(1 if found else 0)
@@ -1,8 +1,13 @@
 import os
-import time
-import math
 from datetime import datetime, timedelta
 
+from tahkmahnelle_calendar import (
+    T_WEEKS_PER_MONTH, T_DAYS_PER_MONTH, T_TICKS_PER_DAY, T_DAY_NAMES as BASE_T_DAY_NAMES,
+    reference_t_date, next_reference_day, split_t_day_ticks, t_ticks_from_ns, wall_clock_ns,
+    EventScheduler, FrameClock, local_midnight_instants,
+)
+from frame_compositor import FrameCompositor
+
 # --- ANSI COLOR CODES ---
 class Color:
     HEADER = '\033[95m'
@@ -28,29 +33,11 @@ PHONOLOGY = {
     'x': 'xiangxong', 'y': "y'uilliatachaeh", 'z': 'zazoykenne'
 }
 
-# Time Conversion Ratios
-T_SECONDS_PER_MINUTE = 9
-T_MINUTES_PER_HOUR = 7
-T_HOURS_PER_DAY = 8  # 4 Day Hours, 4 Night Hours
-T_DAYS_PER_WEEK = 5
-T_WEEKS_PER_MONTH = 9
-DAYS_IN_T_MONTH = T_WEEKS_PER_MONTH * T_DAYS_PER_WEEK  # 45 Earth days
-
-T_SECONDS_PER_DAY = T_HOURS_PER_DAY * T_MINUTES_PER_HOUR * T_SECONDS_PER_MINUTE  # 504 T-Seconds
-EARTH_SECONDS_PER_DAY = 86400
-EARTH_SECONDS_PER_T_SECOND = EARTH_SECONDS_PER_DAY / T_SECONDS_PER_DAY # Approx. 171.428 seconds
+# Time Conversion Ratios (shared with every Tahkmahnelle clock)
+DAYS_IN_T_MONTH = T_DAYS_PER_MONTH  # 45 Earth days
 
 # T-Day Names (based on indices 0-4)
-T_DAY_NAMES = [
-    PHONOLOGY['a'].upper(),  # 0
-    PHONOLOGY['b'].upper(),  # 1
-    PHONOLOGY['c'].upper(),  # 2
-    PHONOLOGY['d'].upper(),  # 3
-    PHONOLOGY['e'].upper()   # 4
-]
-
-# T-Year Reference (used for calendar alignment)
-T_YEAR_REFERENCE = 2025 # The reference year for T-Day calculations
+T_DAY_NAMES = [name.upper() for name in BASE_T_DAY_NAMES]
 
 # --- II. HOLIDAYS AND RITUALS LORE ---
 
@@ -131,44 +118,22 @@ LORE_INDEX = f"""
 def calculate_t_time(now):
     """Calculates all T-Time components from the current system time."""
     
-    # 1. T-Time of Day
-    midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
-    real_seconds_of_day = (now - midnight).total_seconds()
-    
-    # Convert real seconds to Tahkmahnelle seconds
-    t_seconds_absolute = real_seconds_of_day / EARTH_SECONDS_PER_T_SECOND
-    
-    # H.M.S.
-    t_hour = math.floor(t_seconds_absolute / (T_MINUTES_PER_HOUR * T_SECONDS_PER_MINUTE)) % T_HOURS_PER_DAY
-    remaining_seconds = t_seconds_absolute % (T_MINUTES_PER_HOUR * T_SECONDS_PER_MINUTE)
-    
-    t_minute = math.floor(remaining_seconds / T_SECONDS_PER_MINUTE) % T_MINUTES_PER_HOUR
-    t_second = math.floor(remaining_seconds % T_SECONDS_PER_MINUTE)
-    
-    # T-Tick (for the decimal part)
-    t_tick_value = (remaining_seconds % T_SECONDS_PER_MINUTE) - t_second
-    t_tick_display = math.floor(t_tick_value * 1000 / T_SECONDS_PER_MINUTE)
+    # 1. T-Time of Day, from the shared integer tick engine
+    ticks_in_day = t_ticks_from_ns(wall_clock_ns(now)) % T_TICKS_PER_DAY
+    t_hour, t_minute, t_second, t_tick_display = split_t_day_ticks(ticks_in_day)
     
     # Day/Night Cycle
     day_night = PHONOLOGY['a'].upper() if t_hour < 4 else PHONOLOGY['siataeh'].upper()
 
-    # 2. T-Calendar Metrics (relative to T-Month 45-day cycle)
-    
-    # Use a fixed reference date (Jan 1, T_YEAR_REFERENCE)
-    reference_date = datetime(T_YEAR_REFERENCE, 1, 1)
-    
-    # Total days since reference date (with fraction for live update)
-    total_days_since_reference = (now - reference_date).total_seconds() / EARTH_SECONDS_PER_DAY
-    
-    # T-Day index (0-44) with fraction for progress
-    t_day_index_fractional = total_days_since_reference % DAYS_IN_T_MONTH
-    t_day_index = math.floor(t_day_index_fractional)
+    # 2. T-Calendar Metrics (relative to the T-Month 45-day cycle from Jan 1, T_YEAR_REFERENCE)
+    _, t_day_index, t_week_index, t_day_of_week = reference_t_date(now.toordinal())
 
-    # T-Day Name (0-4)
-    t_day_name = T_DAY_NAMES[t_day_index % T_DAYS_PER_WEEK]
+    # T-Day Name (0-4) and T-Week Number (1-9)
+    t_day_name = T_DAY_NAMES[t_day_of_week]
+    t_week = t_week_index + 1
     
-    # T-Week Number (1-9)
-    t_week = math.floor(t_day_index / T_DAYS_PER_WEEK) + 1
+    # T-Day index (0-44) with the fraction of the current day for live progress
+    t_day_index_fractional = t_day_index + ticks_in_day / T_TICKS_PER_DAY
     
     return {
         "T_H": t_hour, "T_M": t_minute, "T_S": t_second, "T_TICK": t_tick_display,
@@ -183,15 +148,32 @@ def get_active_holiday(t_day_index):
     """Checks if the current T-Day index corresponds to a known holiday."""
     return HOLIDAYS.get(t_day_index, None)
 
+# The holiday currently in effect, updated by the scheduler at local midnight.
+active_holiday_state = {'holiday': None}
+
+def begin_holiday(event, when_ns):
+    active_holiday_state['holiday'] = event.payload
+
+def end_holiday(event, when_ns):
+    if active_holiday_state['holiday'] is event.payload:
+        active_holiday_state['holiday'] = None
+
+def build_holiday_scheduler(now):
+    """Schedules the start and end of every holiday and seeds the state for today."""
+    scheduler = EventScheduler()
+    start_ns = int(now.timestamp() * 1000000) * 1000
+    for t_day_index, holiday in HOLIDAYS.items():
+        starts = lambda ordinal, index=t_day_index: next_reference_day(ordinal, index)
+        ends = lambda ordinal, index=t_day_index: next_reference_day(ordinal, (index + 1) % DAYS_IN_T_MONTH)
+        scheduler.add(holiday['name'], local_midnight_instants(starts), begin_holiday, holiday, start_ns)
+        scheduler.add(f"End of {holiday['name']}", local_midnight_instants(ends), end_holiday, holiday, start_ns)
+
+    active_holiday_state['holiday'] = get_active_holiday(reference_t_date(now.toordinal())[1])
+    return scheduler
+
 def draw_chronometer(td):
     """Renders the live chronometer status in the console."""
     
-    # Clear screen (only needed for the live clock loop)
-    if os.name == 'nt':
-        os.system('cls')
-    else:
-        os.system('clear')
-
     print(LORE_INDEX) # Print the static index
 
     print(f"\n{Color.WARNING}{Color.BOLD}================ LIVE CHRONOMETER STATUS ================{Color.ENDC}")
@@ -217,7 +199,7 @@ def draw_chronometer(td):
     print(f"  {Color.OKCYAN}T-Month Progress:{Color.ENDC} [{bar}] {progress:.2f}%")
 
     # --- HOLIDAY STATUS ---
-    active_holiday = get_active_holiday(td['T_DayIndex'])
+    active_holiday = active_holiday_state['holiday']
     
     print(f"\n{Color.BOLD}RITUAL LORE STATUS:{Color.ENDC}")
     
@@ -245,16 +227,22 @@ def main():
     print(LORE_INDEX)
     input(f"{Color.BOLD}Press ENTER to launch the live Tahkmahnelle Chronometer...{Color.ENDC}")
 
+    # The T-Tick is roughly 46ms, so the display refreshes faster than that for smoothness.
+    frame_clock = FrameClock(0.04)
+    compositor = FrameCompositor(frame_clock=frame_clock)
     try:
-        while True:
-            now = datetime.now()
-            td = calculate_t_time(now)
-            draw_chronometer(td)
-            
-            # The T-Tick is roughly 46ms. We'll refresh faster than that for smoothness.
-            time.sleep(0.04) 
+        scheduler = build_holiday_scheduler(datetime.now())
+
+        def draw_frame():
+            td = calculate_t_time(datetime.now())
+            with compositor.frame():
+                draw_chronometer(td)
+
+        # Holidays begin and end from the scheduler between frames.
+        scheduler.run(on_tick=draw_frame, frame_clock=frame_clock)
 
     except KeyboardInterrupt:
+        compositor.close()
         if os.name == 'nt':
             os.system('cls')
         else:
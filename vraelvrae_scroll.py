@@ -1,6 +1,9 @@
-import time
 from datetime import datetime
 
+from tahkmahnelle_calendar import EventScheduler, FrameClock, local_midnight_instants
+from frame_compositor import FrameCompositor
+from scroll_journal import ScrollJournal
+
 # Time units
 SECONDS_PER_MINUTE = 80
 MINUTES_PER_HOUR = 12
@@ -75,6 +78,19 @@ def get_day_index(now):
         new_year = datetime(year - 1, NEW_YEAR_MONTH, NEW_YEAR_DAY)
     return (now - new_year).days % DAYS_PER_YEAR
 
+def next_day_index_ordinal(ordinal, day_index):
+    """Returns the first day ordinal after `ordinal` whose get_day_index() is `day_index`."""
+    date = datetime.fromordinal(ordinal + 1)
+    year = date.year if date >= datetime(date.year, NEW_YEAR_MONTH, NEW_YEAR_DAY) else date.year - 1
+    while True:
+        new_year = datetime(year, NEW_YEAR_MONTH, NEW_YEAR_DAY).toordinal()
+        next_new_year = datetime(year + 1, NEW_YEAR_MONTH, NEW_YEAR_DAY).toordinal()
+        # The day index wraps every DAYS_PER_YEAR days, so it can recur before the next New Year.
+        for candidate in range(new_year + day_index, next_new_year, DAYS_PER_YEAR):
+            if candidate > ordinal:
+                return candidate
+        year += 1
+
 def get_calendar_position(day_index):
     month = day_index // DAYS_PER_MONTH
     week = (day_index % DAYS_PER_MONTH) // DAYS_PER_WEEK
@@ -90,14 +106,43 @@ def get_custom_time(now):
     whik = int((((rem / 3600) * MINUTES_PER_HOUR - minute) * SECONDS_PER_MINUTE - second) * WHIKS_PER_SECOND)
     return hour, minute, second, whik
 
-def log_to_scroll(text):
-    with open("vraelvrae_scroll.txt", "a", encoding="utf-8") as f:
-        f.write(text + "\n")
+def get_t_date(now):
+    """Returns the (lore year, month, day of month) of `now`, 1-based, for indexing the scroll."""
+    day_index = get_day_index(now)
+    return get_lore_year(now), day_index // DAYS_PER_MONTH + 1, day_index % DAYS_PER_MONTH + 1
+
+# The scroll is opened on first use and written in batches from a background thread.
+SCROLL_PATH = "vraelvrae_scroll.txt"
+_scroll = None
+
+def log_to_scroll(text, now=None):
+    global _scroll
+    if _scroll is None:
+        _scroll = ScrollJournal(SCROLL_PATH)
+    _scroll.write(text, get_t_date(now or datetime.now()))
+
+def announce(event, when_ns):
+    when = datetime.fromtimestamp(when_ns / 1e9)
+    log_to_scroll(f"{when.isoformat()} | {event.name} begins", when)
+
+def build_scheduler():
+    """Schedules every seasonal marker and lore event at the local midnight it begins."""
+    scheduler = EventScheduler()
+    for events in (SEASONAL_DAYS, LORE_EVENTS):
+        for day_index, name in events.items():
+            next_ordinal = lambda ordinal, day_index=day_index: next_day_index_ordinal(ordinal, day_index)
+            scheduler.add(name, local_midnight_instants(next_ordinal), announce)
+    return scheduler
 
 def display_clock():
     pulse = ["", "•", "◦", "∙", "✶", ""]  # Whik shimmer cycle
     pulse_index = 0
-    while True:
+    scheduler = build_scheduler()
+    frame_clock = FrameClock(0.5)
+    compositor = FrameCompositor(frame_clock=frame_clock)
+
+    def draw():
+        nonlocal pulse_index
         now = datetime.now()
         lore_year = get_lore_year(now)
         day_index = get_day_index(now)
@@ -109,27 +154,34 @@ def display_clock():
         rituals = ritual_trigger(day_index, whik)
 
         # Build display
-        print("\033c", end="")  # Clear screen
-        print(f"🌌 VraelvraeStihuu Year: {lore_year}")
-        print(f"📅 Date: Month {month}, Week {week}, Day {day}")
-        if season:
-            print(f"{season}")
-        if event:
-            print(f"{event}")
-        print(f"🕰️ Time: {hour:02d}:{minute:02d}:{second:02d}.{whik:03d}")
-        print(f"(24h • 12m/h • 80s/m • 999 whiks/s)")
-        print(f"💫 Whik Pulse: {pulse[pulse_index % len(pulse)]}")
-        if rituals:
-            print("🔮 Rituals:")
-            for r in rituals:
-                print(f"   {r}")
+        with compositor.frame():
+            print(f"🌌 VraelvraeStihuu Year: {lore_year}")
+            print(f"📅 Date: Month {month}, Week {week}, Day {day}")
+            if season:
+                print(f"{season}")
+            if event:
+                print(f"{event}")
+            print(f"🕰️ Time: {hour:02d}:{minute:02d}:{second:02d}.{whik:03d}")
+            print(f"(24h • 12m/h • 80s/m • 999 whiks/s)")
+            print(f"💫 Whik Pulse: {pulse[pulse_index % len(pulse)]}")
+            if rituals:
+                print("🔮 Rituals:")
+                for r in rituals:
+                    print(f"   {r}")
+            for when_ns, name, _ in scheduler.next_events(3):
+                print(f"⏳ {datetime.fromtimestamp(when_ns / 1e9):%Y-%m-%d}: {name}")
 
         # Log to scroll
         log_entry = f"{now.isoformat()} | Year {lore_year} | {month}/{week}/{day} | {hour}:{minute}:{second}.{whik} | Rituals: {', '.join(rituals) if rituals else '—'}"
-        log_to_scroll(log_entry)
+        log_to_scroll(log_entry, now)
 
         pulse_index += 1
-        time.sleep(0.5)
+
+    # Seasonal markers and lore events fire from the scheduler; the display redraws every 0.5 s.
+    try:
+        scheduler.run(on_tick=draw, frame_clock=frame_clock)
+    finally:
+        compositor.close()
 
 if __name__ == "__main__":
     display_clock()
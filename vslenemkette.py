@@ -1,5 +1,7 @@
-import time
-from datetime import datetime
+from datetime import datetime, timezone
+
+from tahkmahnelle_calendar import EventScheduler, periodic_instants
+from scroll_journal import ScrollJournal
 
 # Time structure
 MONTHS, WEEKS, DAYS = 14, 6, 5
@@ -40,10 +42,9 @@ rituals = {
 
 # Seasonal markers every 8h cycle
 seasons = ["🌗 Ariatnah Siataeh", "🌗 Ariatnah Stihuu", "🌗 Vraelvrae Siataeh", "🌗 Vraelvrae Stihuu"]
-last_trigger = {"ritual": None, "season": None}
 
-def get_ritual_time():
-    now = datetime.utcnow()
+def get_ritual_time(now=None):
+    now = now or datetime.utcnow()
     elapsed = (now - ANCHOR).total_seconds()
     whiks = int(elapsed * WHIKS_PER_SECOND)
 
@@ -68,8 +69,8 @@ def get_ritual_time():
     second = rem // WHIKS_PER_SECOND
     whik = rem % WHIKS_PER_SECOND
 
-    cycle = ((datetime.utcnow() - ANCHOR).total_seconds()) // (HOURS * MINUTES * SECONDS)
-    season = seasons[int(cycle) % 4]
+    cycle = int(elapsed // (HOURS * MINUTES * SECONDS))
+    season = seasons[cycle % 4]
 
     return {
         "year": year + 1,
@@ -83,52 +84,51 @@ def get_ritual_time():
         "season": season
     }
 
-# Display loop
-while True:
-    t = get_ritual_time()
-    line = (f"\rYear {t['year']} | Month: {t['month']} | Week: {t['week']} | Day: {t['day']} | "
-            f"{t['hour']:02}:{t['minute']:02}:{t['second']:02}:{t['whik']:03}")
-    print(line, end="")
-
-    # Ritual trigger
-    if t['minute'] == 0 and t['second'] == 0 and t['whik'] < 10:
-        if t['hour'] in rituals and last_trigger["ritual"] != t['hour']:
-            print(f"\n{rituals[t['hour']]} begins.")
-            last_trigger["ritual"] = t['hour']
-
-    # Season trigger
-    if t['hour'] == 0 and t['minute'] == 0 and t['second'] == 0 and t['whik'] < 10:
-        if last_trigger["season"] != t['season']:
-            print(f"\n{t['season']} begins.")
-            last_trigger["season"] = t['season']
-
-    time.sleep(0.05)# Logging function
-def log_event(message):
-    timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
-    with open("ritual_log.txt", "a") as f:
-        f.write(f"[{timestamp}] {message}\n")
-
-# Display loop with logging
-while True:
+def get_ritual_date(now):
+    """Returns the (year, month, day of month) of a naive UTC datetime, 1-based, for indexing the log."""
+    whiks = int((now - ANCHOR).total_seconds() * WHIKS_PER_SECOND)
+    year, rem = divmod(whiks, WHIKS_PER_YEAR)
+    month, rem = divmod(rem, WEEKS * DAYS * WHIKS_PER_DAY)
+    return year + 1, month + 1, rem // WHIKS_PER_DAY + 1
+
+# Logging function: the log is opened on first use and written in batches from a background thread.
+LOG_PATH = "ritual_log.txt"
+_log = None
+
+def log_event(message, now=None):
+    global _log
+    if _log is None:
+        _log = ScrollJournal(LOG_PATH)
+    now = now or datetime.utcnow()
+    _log.write(f"[{now:%Y-%m-%d %H:%M:%S}] {message}", get_ritual_date(now))
+
+# Event schedule: every ritual and season starts on an exact whik boundary, so
+# each one is scheduled at its real instant instead of being polled for.
+ANCHOR_NS = int(ANCHOR.replace(tzinfo=timezone.utc).timestamp()) * 1000000000
+RITUAL_HOUR_NS = WHIKS_PER_HOUR * 1000000000 // WHIKS_PER_SECOND
+RITUAL_DAY_NS = WHIKS_PER_DAY * 1000000000 // WHIKS_PER_SECOND
+
+def announce(event, when_ns):
+    msg = f"{event.name} begins."
+    print(f"\n{msg}")
+    log_event(msg, datetime.fromtimestamp(when_ns / 1e9, timezone.utc).replace(tzinfo=None))
+
+def build_scheduler():
+    scheduler = EventScheduler()
+    # Rituals start at the top of their hour, every day
+    for hour, ritual in rituals.items():
+        scheduler.add(ritual, periodic_instants(ANCHOR_NS, RITUAL_DAY_NS, hour * RITUAL_HOUR_NS), announce)
+    # Seasons rotate at the start of each day
+    for index, season in enumerate(seasons):
+        scheduler.add(season, periodic_instants(ANCHOR_NS, len(seasons) * RITUAL_DAY_NS, index * RITUAL_DAY_NS), announce)
+    return scheduler
+
+def draw_line():
     t = get_ritual_time()
     line = (f"\rYear {t['year']} | Month: {t['month']} | Week: {t['week']} | Day: {t['day']} | "
             f"{t['hour']:02}:{t['minute']:02}:{t['second']:02}:{t['whik']:03}")
     print(line, end="")
 
-    # Ritual trigger
-    if t['minute'] == 0 and t['second'] == 0 and t['whik'] < 10:
-        if t['hour'] in rituals and last_trigger["ritual"] != t['hour']:
-            msg = f"{rituals[t['hour']]} begins."
-            print(f"\n{msg}")
-            log_event(msg)
-            last_trigger["ritual"] = t['hour']
-
-    # Season trigger
-    if t['hour'] == 0 and t['minute'] == 0 and t['second'] == 0 and t['whik'] < 10:
-        if last_trigger["season"] != t['season']:
-            msg = f"{t['season']} begins."
-            print(f"\n{msg}")
-            log_event(msg)
-            last_trigger["season"] = t['season']
-
-    time.sleep(0.05)
+# Display loop
+if __name__ == "__main__":
+    build_scheduler().run(on_tick=draw_line, tick_interval=0.05)